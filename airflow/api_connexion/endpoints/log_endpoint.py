@@ -51,6 +51,7 @@ def get_log(
     full_content: bool = False,
     map_index: int = -1,
     token: str | None = None,
+    log_window: bool = False,
     session: Session = NEW_SESSION,
 ) -> APIResponse:
     """Get logs for specific task instance."""
@@ -103,11 +104,19 @@ def get_log(
     # return_type would be either the above two or None
     logs: Any
     if return_type == "application/json" or return_type is None:  # default
+        if log_window and not full_content:
+            # Only the last lines of the log are read first, then the lines added after each request
+            task_log_reader.set_log_window(metadata)
         logs, metadata = task_log_reader.read_log_chunks(ti, task_try_number, metadata)
         logs = logs[0] if task_try_number is not None else logs
         # we must have token here, so we can safely ignore it
         token = URLSafeSerializer(key).dumps(metadata)  # type: ignore[assignment]
         return logs_schema.dump(LogResponseObject(continuation_token=token, content=logs))
+    if log_window and not full_content:
+        # text/plain. The next window of the log, with the token to read the following one in a header
+        logs, metadata = task_log_reader.read_log_window(ti, task_try_number, metadata)
+        token = URLSafeSerializer(key).dumps(metadata)  # type: ignore[assignment]
+        return Response(logs, headers={"Content-Type": return_type, "Airflow-Continuation-Token": token})
     # text/plain. Stream
     logs = task_log_reader.read_log_stream(ti, task_try_number, metadata)
 
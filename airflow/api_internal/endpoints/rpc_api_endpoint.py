@@ -83,8 +83,10 @@ def _initialize_map() -> dict[str, Callable]:
         DagModel.get_paused_dag_ids,
         DagModel.get_current,
         DagFileProcessorManager.clear_nonexistent_import_errors,
+        DagFileProcessorManager.refresh_unchanged_dag_files,
         DagWarning.purge_inactive_dag_warnings,
         DatasetManager.register_dataset_change,
+        DatasetManager.register_dataset_changes,
         FileTaskHandler._render_filename_db_access,
         Job._add_to_db,
         Job._fetch_from_db,
@@ -121,6 +123,7 @@ def _initialize_map() -> dict[str, Callable]:
         Trigger.bulk_fetch,
         Trigger.clean_unused,
         Trigger.submit_event,
+        Trigger.submit_events,
         Trigger.submit_failure,
         Trigger.ids_for_triggerer,
         Trigger.assign_unassigned,
@@ -37,14 +37,16 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable, Iterator, NamedTuple, cast
 
 from setproctitle import setproctitle
-from sqlalchemy import delete, select, update
+from sqlalchemy import delete, func, select, update
 from tabulate import tabulate
 
 import airflow.models
 from airflow.api_internal.internal_api_call import internal_api_call
 from airflow.callbacks.callback_requests import CallbackRequest, SlaCallbackRequest
 from airflow.configuration import conf
+from airflow.dag_processing.parse_cache import DagFileParseCache
 from airflow.dag_processing.processor import DagFileProcessorProcess
+from airflow.dag_processing.processor_pool import DagFileProcessorWorkerPool
 from airflow.models.dag import DagModel
 from airflow.models.dagbag import DagPriorityParsingRequest
 from airflow.models.dagwarning import DagWarning
@@ -72,6 +74,8 @@ if TYPE_CHECKING:
 
     from sqlalchemy.orm import Session
 
+    from airflow.dag_processing.processor_pool import PooledDagFileProcessorProcess
+
 
 class DagParsingStat(NamedTuple):
     """Information on processing progress."""
@@ -405,7 +409,18 @@ class DagFileProcessorManager(LoggingMixin):
         self.print_stats_interval = conf.getint("scheduler", "print_stats_interval")
 
         # Map from file path to the processor
-        self._processors: dict[str, DagFileProcessorProcess] = {}
+        self._processors: dict[str, DagFileProcessorProcess | PooledDagFileProcessorProcess] = {}
+        # Long-lived workers to parse files on, if enabled
+        self._worker_pool: DagFileProcessorWorkerPool | None = None
+        if conf.getboolean("scheduler", "parsing_worker_pool"):
+            self._worker_pool = DagFileProcessorWorkerPool.from_config()
+
+        # Fingerprints of files and their local imports, to skip files that did not change, if enabled
+        self._parse_cache: DagFileParseCache | None = None
+        if conf.getboolean("scheduler", "skip_unchanged_dag_files"):
+            self._parse_cache = DagFileParseCache(dag_directory)
+        # Map from file path to the fingerprint it had when its processor was started
+        self._processor_fingerprints: dict[str, str | None] = {}
 
         self._num_run = 0
 
@@ -540,6 +555,44 @@ class DagFileProcessorManager(LoggingMixin):
                 SerializedDagModel.remove_dag(dag_id)
                 cls.logger().info("Deleted DAG %s in serialized_dag table", dag_id)
 
+    @classmethod
+    @internal_api_call
+    @provide_session
+    def refresh_unchanged_dag_files(
+        cls,
+        num_dags_by_fileloc: dict[str, int],
+        session: Session = NEW_SESSION,
+    ) -> list[str]:
+        """
+        Mark the DAGs of files skipped because they did not change as parsed now.
+
+        This keeps them from being deactivated as stale. Files whose DAGs are not all active anymore,
+        e.g. because they were deleted, are left alone so that they get parsed again.
+
+        :param num_dags_by_fileloc: Number of DAGs found in each file when it was last parsed
+        :return: the files whose DAGs were marked as parsed
+        """
+        num_active_dags = dict(
+            session.execute(
+                select(DagModel.fileloc, func.count())
+                .where(DagModel.is_active, DagModel.fileloc.in_(num_dags_by_fileloc))
+                .group_by(DagModel.fileloc)
+            ).all()
+        )
+        unchanged_filelocs = [
+            fileloc
+            for fileloc, num_dags in num_dags_by_fileloc.items()
+            if num_active_dags.get(fileloc, 0) == num_dags
+        ]
+        if num_active_dags and unchanged_filelocs:
+            session.execute(
+                update(DagModel)
+                .where(DagModel.is_active, DagModel.fileloc.in_(unchanged_filelocs))
+                .values(last_parsed_time=timezone.utcnow())
+                .execution_options(synchronize_session=False)
+            )
+        return unchanged_filelocs
+
     def _run_parsing_loop(self):
         # In sync mode we want timeout=None -- wait forever until a message is received
         if self._async_mode:
@@ -911,9 +964,12 @@ class DagFileProcessorManager(LoggingMixin):
         """
         Get all pids.
 
-        :return: a list of the PIDs for the processors that are running
+        :return: a list of the PIDs for the processors that are running, including idle pooled workers
         """
-        return [x.pid for x in self._processors.values()]
+        pids = [x.pid for x in self._processors.values()]
+        if self._worker_pool is not None:
+            pids.extend(self._worker_pool.get_all_pids())
+        return pids
 
     def get_last_runtime(self, file_path) -> float | None:
         """
@@ -1011,6 +1067,7 @@ class DagFileProcessorManager(LoggingMixin):
                 Stats.decr("dag_processing.processes", tags={"file_path": file_path, "action": "stop"})
                 processor.terminate()
                 self._file_stats.pop(file_path)
+                self._processor_fingerprints.pop(file_path, None)
 
         to_remove = set(self._file_stats).difference(self._file_paths)
         for key in to_remove:
@@ -1019,6 +1076,9 @@ class DagFileProcessorManager(LoggingMixin):
 
         self._processors = filtered_processors
 
+        if self._parse_cache is not None:
+            self._parse_cache.retain(new_file_paths)
+
     def wait_until_finished(self):
         """Sleeps until all the processors are done."""
         for processor in self._processors.values():
@@ -1039,6 +1099,13 @@ class DagFileProcessorManager(LoggingMixin):
             count_import_errors = -1
             num_dags = 0
 
+        if self._parse_cache is not None:
+            fingerprint = self._processor_fingerprints.pop(processor.file_path, None)
+            if processor.result is not None and count_import_errors == 0:
+                self._parse_cache.record(processor.file_path, fingerprint)
+            else:
+                self._parse_cache.forget(processor.file_path)
+
         last_duration = last_finish_time - processor.start_time
         stat = DagFileStat(
             num_dags=num_dags,
@@ -1093,17 +1160,30 @@ class DagFileProcessorManager(LoggingMixin):
                 continue
 
             callback_to_execute_for_file = self._callback_to_execute[file_path]
-            processor = self._create_process(
-                file_path,
-                self._pickle_dags,
-                self._dag_ids,
-                self.get_dag_directory(),
-                callback_to_execute_for_file,
-            )
+            if self._worker_pool is not None:
+                processor = self._worker_pool.create_processor(
+                    file_path,
+                    self._pickle_dags,
+                    self._dag_ids,
+                    self.get_dag_directory(),
+                    callback_to_execute_for_file,
+                )
+            else:
+                processor = self._create_process(
+                    file_path,
+                    self._pickle_dags,
+                    self._dag_ids,
+                    self.get_dag_directory(),
+                    callback_to_execute_for_file,
+                )
 
             del self._callback_to_execute[file_path]
             Stats.incr("dag_processing.processes", tags={"file_path": file_path, "action": "start"})
 
+            if self._parse_cache is not None:
+                # Fingerprint before parsing, so that changes made while parsing trigger another parse.
+                self._processor_fingerprints[file_path] = self._parse_cache.fingerprint(file_path)
+
             processor.start()
             self.log.debug("Started a process (PID: %s) to generate tasks for %s", processor.pid, file_path)
             self._processors[file_path] = processor
@@ -1210,9 +1290,41 @@ class DagFileProcessorManager(LoggingMixin):
 
         for file_path in files_paths_to_queue:
             self._file_stats.setdefault(file_path, DagFileProcessorManager.DEFAULT_FILE_STAT)
+        files_paths_to_queue = self._skip_unchanged_file_paths(files_paths_to_queue)
         self._add_paths_to_queue(files_paths_to_queue, False)
         Stats.incr("dag_processing.file_path_queue_update_count")
 
+    def _skip_unchanged_file_paths(self, file_paths: list[str]) -> list[str]:
+        """
+        Count files that did not change since they were last parsed as parsed, without parsing them.
+
+        :param file_paths: file paths about to be queued
+        :return: the file paths that still need to be parsed
+        """
+        if self._parse_cache is None:
+            return file_paths
+
+        num_dags_by_file_path = {
+            file_path: self._file_stats[file_path].num_dags
+            for file_path in file_paths
+            if file_path not in self._callback_to_execute and self._parse_cache.is_unchanged(file_path)
+        }
+        if not num_dags_by_file_path:
+            return file_paths
+
+        unchanged_file_paths = set(self.refresh_unchanged_dag_files(num_dags_by_file_path))
+        now = timezone.utcnow()
+        for file_path in num_dags_by_file_path:
+            if file_path not in unchanged_file_paths:
+                self._parse_cache.forget(file_path)
+                continue
+            stat = self._file_stats[file_path]
+            self._file_stats[file_path] = stat._replace(last_finish_time=now, run_count=stat.run_count + 1)
+
+        self.log.debug("Skipping %d unchanged files", len(unchanged_file_paths))
+        Stats.incr("dag_processing.unchanged_files_skipped", len(unchanged_file_paths))
+        return [file_path for file_path in file_paths if file_path not in unchanged_file_paths]
+
     def _kill_timed_out_processors(self):
         """Kill any file processors that timeout to defend against process hangs."""
         now = timezone.utcnow()
@@ -1231,6 +1343,9 @@ class DagFileProcessorManager(LoggingMixin):
                 # Deprecated; may be removed in a future Airflow release.
                 Stats.incr("dag_file_processor_timeouts")
                 processor.kill()
+                if self._parse_cache is not None:
+                    self._processor_fingerprints.pop(file_path, None)
+                    self._parse_cache.forget(file_path)
 
                 # Clean up processor references
                 self.waitables.pop(processor.waitable_handle)
@@ -1276,6 +1391,8 @@ class DagFileProcessorManager(LoggingMixin):
                 "dag_processing.processes", tags={"file_path": processor.file_path, "action": "terminate"}
             )
             processor.terminate()
+        if self._worker_pool is not None:
+            self._worker_pool.terminate()
 
     def end(self):
         """Kill all child processes on exit since we don't want to leave them as orphaned."""
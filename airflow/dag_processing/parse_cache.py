@@ -0,0 +1,170 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Fingerprints of DAG files and their local imports, used to skip re-parsing unchanged files."""
+
+from __future__ import annotations
+
+import ast
+import os
+import zipfile
+from typing import Iterator, NamedTuple
+
+from airflow.utils.hashlib_wrapper import md5
+from airflow.utils.log.logging_mixin import LoggingMixin
+
+# DAG files (or local modules they import) containing this marker are always re-parsed, for example
+# because they generate DAGs from Variables, external configuration or the current time.
+DYNAMIC_DAG_FILE_MARKER = b"airflow-dynamic-dag"
+
+
+class _FileInfo(NamedTuple):
+    """Content digest and local imports of a single file, valid for the given mtime and size."""
+
+    mtime_ns: int
+    size: int
+    digest: str
+    dynamic: bool
+    local_imports: tuple[str, ...]
+
+
+class DagFileParseCache(LoggingMixin):
+    """
+    Remember the inputs of the last successful parse of each DAG file.
+
+    The fingerprint of a file covers its own content and the content of the modules it imports from the DAG
+    folder, transitively. When the fingerprint did not change since the file was last parsed without errors,
+    parsing it again would produce the same DAGs, so the manager can skip it. Files are only read again when
+    their modification time or size changes.
+
+    :param dag_directory: Directory where DAG definitions are kept.
+    """
+
+    def __init__(self, dag_directory: str | os.PathLike[str]):
+        super().__init__()
+        self._dag_directory = os.path.realpath(dag_directory)
+        self._file_infos: dict[str, _FileInfo] = {}
+        self._parsed_fingerprints: dict[str, str] = {}
+
+    def fingerprint(self, file_path: str) -> str | None:
+        """
+        Compute the fingerprint of a DAG file and the DAG folder modules it imports.
+
+        :param file_path: Path to the DAG file.
+        :return: The fingerprint, or *None* if the file can't be read or is marked as dynamic.
+        """
+        hasher = md5()
+        seen: set[str] = set()
+        to_visit = [os.path.realpath(file_path)]
+        while to_visit:
+            path = to_visit.pop()
+            if path in seen:
+                continue
+            seen.add(path)
+            try:
+                info = self._get_file_info(path)
+            except OSError:
+                return None
+            if info.dynamic:
+                return None
+            hasher.update(path.encode())
+            hasher.update(info.digest.encode())
+            to_visit.extend(sorted(info.local_imports, reverse=True))
+        return hasher.hexdigest()
+
+    def is_unchanged(self, file_path: str) -> bool:
+        """Whether the file and its local imports are the same as when it was last parsed without errors."""
+        parsed_fingerprint = self._parsed_fingerprints.get(file_path)
+        return parsed_fingerprint is not None and parsed_fingerprint == self.fingerprint(file_path)
+
+    def record(self, file_path: str, fingerprint: str | None) -> None:
+        """Record the fingerprint the file had when it was last parsed without errors."""
+        if fingerprint is None:
+            self.forget(file_path)
+        else:
+            self._parsed_fingerprints[file_path] = fingerprint
+
+    def forget(self, file_path: str) -> None:
+        """Make sure the file is parsed the next time it is due."""
+        self._parsed_fingerprints.pop(file_path, None)
+
+    def retain(self, file_paths: list[str]) -> None:
+        """Drop what is known about DAG files that are no longer in the DAG folder."""
+        known = set(file_paths)
+        for file_path in [fp for fp in self._parsed_fingerprints if fp not in known]:
+            del self._parsed_fingerprints[file_path]
+        # Infos of local modules are cheap to rebuild, drop them all so they don't accumulate.
+        self._file_infos.clear()
+
+    def _get_file_info(self, path: str) -> _FileInfo:
+        stat = os.stat(path)
+        info = self._file_infos.get(path)
+        if info is not None and info.mtime_ns == stat.st_mtime_ns and info.size == stat.st_size:
+            return info
+
+        with open(path, "rb") as f:
+            content = f.read()
+        local_imports: tuple[str, ...] = ()
+        if not zipfile.is_zipfile(path):
+            local_imports = tuple(sorted(set(self._iter_local_imports(path, content))))
+        info = _FileInfo(
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+            digest=md5(content).hexdigest(),
+            dynamic=DYNAMIC_DAG_FILE_MARKER in content,
+            local_imports=local_imports,
+        )
+        self._file_infos[path] = info
+        return info
+
+    def _iter_local_imports(self, path: str, content: bytes) -> Iterator[str]:
+        """Yield the files in the DAG folder that the given Python source may import."""
+        try:
+            tree = ast.parse(content)
+        except (SyntaxError, ValueError):
+            # The parse fails in this case too, so the file is not recorded and always re-parsed.
+            return
+
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    yield from self._iter_module_files(self._dag_directory, alias.name.split("."))
+            elif isinstance(node, ast.ImportFrom):
+                base = self._dag_directory
+                if node.level:
+                    base = os.path.dirname(path)
+                    for _ in range(node.level - 1):
+                        base = os.path.dirname(base)
+                parts = node.module.split(".") if node.module else []
+                yield from self._iter_module_files(base, parts)
+                for alias in node.names:
+                    yield from self._iter_module_files(base, [*parts, alias.name], packages=False)
+
+    def _iter_module_files(self, base: str, parts: list[str], packages: bool = True) -> Iterator[str]:
+        """Yield the existing files in the DAG folder executed when importing the module ``parts``."""
+        if packages:
+            # Importing ``a.b.c`` also runs ``a/__init__.py`` and ``a/b/__init__.py``.
+            for i in range(1, len(parts)):
+                yield from self._existing_in_dag_folder(os.path.join(base, *parts[:i], "__init__.py"))
+        if parts:
+            yield from self._existing_in_dag_folder(os.path.join(base, *parts) + ".py")
+            yield from self._existing_in_dag_folder(os.path.join(base, *parts, "__init__.py"))
+
+    def _existing_in_dag_folder(self, path: str) -> Iterator[str]:
+        path = os.path.realpath(path)
+        if path.startswith(os.path.join(self._dag_directory, "")) and os.path.isfile(path):
+            yield path
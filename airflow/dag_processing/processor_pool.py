@@ -0,0 +1,546 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Long-lived DAG file processor workers, reused across many DAG files."""
+
+from __future__ import annotations
+
+import importlib
+import logging
+import os
+import signal
+import sys
+import threading
+import time
+from contextlib import redirect_stderr, redirect_stdout, suppress
+from typing import TYPE_CHECKING, Iterable
+
+import psutil
+from setproctitle import setproctitle
+
+from airflow import settings
+from airflow.configuration import conf
+from airflow.dag_processing.processor import DagFileProcessor
+from airflow.exceptions import AirflowException
+from airflow.stats import Stats
+from airflow.utils import timezone
+from airflow.utils.log.logging_mixin import LoggingMixin, StreamLogWriter, set_context
+from airflow.utils.mixins import MultiprocessingStartMethodMixin
+
+if TYPE_CHECKING:
+    import multiprocessing
+    from datetime import datetime
+    from multiprocessing.connection import Connection as MultiprocessingConnection
+
+    from airflow.callbacks.callback_requests import CallbackRequest
+
+
+def _import_modules(modules: Iterable[str], log: logging.Logger) -> None:
+    for module in modules:
+        try:
+            importlib.import_module(module)
+        except Exception as e:
+            log.warning("Error when trying to pre-import module '%s': %s", module, e)
+
+
+def _unload_dag_folder_modules(dag_directory: str, modules_before: set[str]) -> None:
+    """
+    Remove the modules imported while parsing a file that live in the DAG folder.
+
+    A worker parses many files over its life. Without this, local helper modules imported by a DAG file
+    would stay cached in ``sys.modules`` and changes to them would not be seen until the worker is recycled.
+    """
+    dag_directory = os.path.join(os.path.realpath(dag_directory), "")
+    for name in set(sys.modules).difference(modules_before):
+        module_file = getattr(sys.modules.get(name), "__file__", None)
+        if module_file and os.path.realpath(module_file).startswith(dag_directory):
+            del sys.modules[name]
+
+
+class DagFileProcessorWorker(LoggingMixin, MultiprocessingStartMethodMixin):
+    """
+    Long-lived process that parses the DAG files it receives over a pipe.
+
+    Unlike :class:`~airflow.dag_processing.processor.DagFileProcessorProcess`, which starts a process per
+    file, the worker pays the interpreter, import and ORM set-up cost once and then processes files until it
+    is told to stop or decides to retire itself after ``max_files`` files or once its memory grows above
+    ``max_memory_mb``.
+
+    :param max_files: Number of files after which the worker exits. 0 for no limit.
+    :param max_memory_mb: Resident memory (in MiB) above which the worker exits after the current file.
+        0 for no limit.
+    :param preload_modules: Modules imported once when the worker starts.
+    """
+
+    # Counter that increments every time an instance of this class is created
+    class_creation_counter = 0
+
+    def __init__(self, max_files: int, max_memory_mb: int, preload_modules: list[str]):
+        super().__init__()
+        self._max_files = max_files
+        self._max_memory_mb = max_memory_mb
+        self._preload_modules = preload_modules
+        self._process: multiprocessing.process.BaseProcess | None = None
+        self._parent_channel: MultiprocessingConnection | None = None
+        # Set once the worker reported that it exits after the file it just processed.
+        self.retiring = False
+        self._instance_id = DagFileProcessorWorker.class_creation_counter
+        DagFileProcessorWorker.class_creation_counter += 1
+
+    @staticmethod
+    def _run_worker(
+        channel: MultiprocessingConnection,
+        parent_channel: MultiprocessingConnection,
+        thread_name: str,
+        max_files: int,
+        max_memory_mb: int,
+        preload_modules: list[str],
+    ) -> None:
+        """
+        Process files received on ``channel`` until told to stop.
+
+        Every request is a ``(file_path, pickle_dags, dag_ids, dag_directory, callback_requests)`` tuple, and
+        every reply a ``(result, retiring)`` tuple, where ``result`` is the return value of
+        :meth:`~airflow.dag_processing.processor.DagFileProcessor.process_file` or *None* on error.
+        """
+        # This helper runs in the newly created process
+        log: logging.Logger = logging.getLogger("airflow.processor")
+
+        # Since we share all open FDs from the parent, we need to close the parent side of the pipe here in
+        # the child, else it won't get closed properly until we exit.
+        parent_channel.close()
+        del parent_channel
+
+        # Change the thread name to differentiate log lines. This is
+        # really a separate process, but changing the name of the
+        # process doesn't work, so changing the thread name instead.
+        threading.current_thread().name = thread_name
+        setproctitle("airflow scheduler - DagFileProcessor worker")
+        _import_modules(preload_modules, log)
+        # Re-configure the ORM engine as there are issues with multiple processes
+        settings.configure_orm()
+        current_process = psutil.Process()
+        log_to_stdout = conf.get_mandatory_value("logging", "DAG_PROCESSOR_LOG_TARGET") == "stdout"
+
+        num_processed = 0
+        try:
+            while True:
+                try:
+                    request = channel.recv()
+                except EOFError:
+                    break
+                if request is None:
+                    break
+                file_path, pickle_dags, dag_ids, dag_directory, callback_requests = request
+
+                set_context(log, file_path)
+                setproctitle(f"airflow scheduler - DagFileProcessor {file_path}")
+                log.info("Worker (PID=%s) started to work on %s", os.getpid(), file_path)
+
+                modules_before = set(sys.modules)
+                result: tuple[int, int] | None = None
+                try:
+                    dag_file_processor = DagFileProcessor(
+                        dag_ids=dag_ids, dag_directory=dag_directory, log=log
+                    )
+                    if log_to_stdout:
+                        with Stats.timer() as timer:
+                            result = dag_file_processor.process_file(
+                                file_path=file_path,
+                                pickle_dags=pickle_dags,
+                                callback_requests=callback_requests,
+                            )
+                    else:
+                        # The following line ensures that stdout goes to the same destination as the logs.
+                        with redirect_stdout(StreamLogWriter(log, logging.INFO)), redirect_stderr(
+                            StreamLogWriter(log, logging.WARNING)
+                        ), Stats.timer() as timer:
+                            result = dag_file_processor.process_file(
+                                file_path=file_path,
+                                pickle_dags=pickle_dags,
+                                callback_requests=callback_requests,
+                            )
+                    log.info("Processing %s took %.3f seconds", file_path, timer.duration)
+                except Exception:
+                    log.exception("Got an exception while processing %s", file_path)
+                finally:
+                    _unload_dag_folder_modules(dag_directory, modules_before)
+
+                num_processed += 1
+                retiring = bool(max_files and num_processed >= max_files) or bool(
+                    max_memory_mb and current_process.memory_info().rss > max_memory_mb * 1024 * 1024
+                )
+                channel.send((result, retiring))
+                if retiring:
+                    log.info("Recycling DAG file processor worker after processing %s files", num_processed)
+                    break
+                setproctitle("airflow scheduler - DagFileProcessor worker")
+        finally:
+            # We re-initialized the ORM within this Process above so we need to
+            # tear it down manually here
+            settings.dispose_orm()
+            channel.close()
+
+    def start(self) -> None:
+        """Launch the worker process."""
+        context = self._get_multiprocessing_context()
+
+        _parent_channel, _child_channel = context.Pipe(duplex=True)
+        process = context.Process(
+            target=type(self)._run_worker,
+            args=(
+                _child_channel,
+                _parent_channel,
+                f"DagFileProcessorWorker{self._instance_id}",
+                self._max_files,
+                self._max_memory_mb,
+                self._preload_modules,
+            ),
+            name=f"DagFileProcessorWorker{self._instance_id}-Process",
+        )
+        self._process = process
+        process.start()
+
+        # Close the child side of the pipe now the subprocess has started -- otherwise this would prevent it
+        # from closing in some cases
+        _child_channel.close()
+        del _child_channel
+
+        self._parent_channel = _parent_channel
+
+    @property
+    def channel(self) -> MultiprocessingConnection:
+        if self._parent_channel is None:
+            raise AirflowException("Tried to get the channel before starting!")
+        return self._parent_channel
+
+    @property
+    def pid(self) -> int:
+        """PID of the worker process."""
+        if self._process is None or self._process.pid is None:
+            raise AirflowException("Tried to get PID before starting!")
+        return self._process.pid
+
+    @property
+    def exit_code(self) -> int | None:
+        if self._process is None:
+            raise AirflowException("Tried to get exit code before starting!")
+        return self._process.exitcode
+
+    def is_alive(self) -> bool:
+        return self._process is not None and self._process.is_alive()
+
+    def join(self, timeout: float | None = None) -> None:
+        if self._process is not None:
+            self._process.join(timeout=timeout)
+
+    def process(
+        self,
+        file_path: str,
+        pickle_dags: bool,
+        dag_ids: list[str] | None,
+        dag_directory: str,
+        callback_requests: list[CallbackRequest],
+    ) -> None:
+        """Send a file to the worker; the result is received from :attr:`channel`."""
+        self.channel.send((file_path, pickle_dags, dag_ids, dag_directory, callback_requests))
+
+    def stop(self, timeout: float = 5) -> None:
+        """Ask the worker to exit once it is idle, terminating it if it does not."""
+        if self._process is None or self._parent_channel is None:
+            return
+        with suppress(BrokenPipeError, OSError):
+            self._parent_channel.send(None)
+        self._process.join(timeout=timeout)
+        if self._process.is_alive():
+            self.terminate()
+        self._parent_channel.close()
+
+    def terminate(self, sigkill: bool = False) -> None:
+        """
+        Terminate (and then kill) the worker.
+
+        :param sigkill: whether to issue a SIGKILL if SIGTERM doesn't work.
+        """
+        if self._process is None or self._parent_channel is None:
+            raise AirflowException("Tried to call terminate before starting!")
+
+        self._process.terminate()
+        # Arbitrarily wait 5s for the process to die
+        with suppress(TimeoutError):
+            self._process._popen.wait(5)  # type: ignore
+        if sigkill:
+            self.kill()
+        self._parent_channel.close()
+
+    def kill(self) -> None:
+        if self._process is None:
+            raise AirflowException("Tried to kill process before starting!")
+
+        if self._process.is_alive() and self._process.pid:
+            self.log.warning("Killing DagFileProcessorWorker (PID=%d)", self._process.pid)
+            os.kill(self._process.pid, signal.SIGKILL)
+
+            # Reap the spawned zombie. We active wait, because in Python 3.9 `waitpid` might lead to an
+            # exception, due to change in Python standard library and possibility of race condition
+            # see https://bugs.python.org/issue42558
+            while self._process._popen.poll() is None:  # type: ignore
+                time.sleep(0.001)
+        if self._parent_channel:
+            self._parent_channel.close()
+
+
+class PooledDagFileProcessorProcess(LoggingMixin):
+    """
+    Processes a single DAG file on a worker borrowed from a :class:`DagFileProcessorWorkerPool`.
+
+    It exposes the same interface as :class:`~airflow.dag_processing.processor.DagFileProcessorProcess`,
+    so that :class:`~airflow.dag_processing.manager.DagFileProcessorManager` can treat both the same way.
+
+    :param pool: the pool to borrow the worker from
+    :param file_path: a Python file containing Airflow DAG definitions
+    :param pickle_dags: whether to serialize the DAG objects to the DB
+    :param dag_ids: If specified, only look at these DAG ID's
+    :param callback_requests: failure callback to execute
+    """
+
+    def __init__(
+        self,
+        pool: DagFileProcessorWorkerPool,
+        file_path: str,
+        pickle_dags: bool,
+        dag_ids: list[str] | None,
+        dag_directory: str,
+        callback_requests: list[CallbackRequest],
+    ):
+        super().__init__()
+        self._pool = pool
+        self._file_path = file_path
+        self._pickle_dags = pickle_dags
+        self._dag_ids = dag_ids
+        self._dag_directory = dag_directory
+        self._callback_requests = callback_requests
+
+        self._worker: DagFileProcessorWorker | None = None
+        self._result: tuple[int, int] | None = None
+        self._done = False
+        self._start_time: datetime | None = None
+
+    @property
+    def file_path(self) -> str:
+        return self._file_path
+
+    def start(self) -> None:
+        """Hand the file over to a pooled worker."""
+        worker = self._pool.acquire()
+        self._worker = worker
+        self._start_time = timezone.utcnow()
+        try:
+            worker.process(
+                self._file_path,
+                self._pickle_dags,
+                self._dag_ids,
+                self._dag_directory,
+                self._callback_requests,
+            )
+        except (BrokenPipeError, OSError):
+            # The worker died while idle, the failure is picked up by ``done``.
+            self.log.warning("DAG file processor worker (PID=%s) is gone", worker.pid)
+
+    def kill(self) -> None:
+        """Kill the worker processing the file, and ensure consistent state."""
+        if self._worker is None:
+            raise AirflowException("Tried to kill before starting!")
+        self._worker.kill()
+        self._done = True
+        self._pool.discard(self._worker)
+
+    def terminate(self, sigkill: bool = False) -> None:
+        """
+        Terminate (and then kill) the worker processing the file.
+
+        :param sigkill: whether to issue a SIGKILL if SIGTERM doesn't work.
+        """
+        if self._worker is None:
+            raise AirflowException("Tried to call terminate before starting!")
+        self._worker.terminate(sigkill=sigkill)
+        self._done = True
+        self._pool.discard(self._worker)
+
+    @property
+    def pid(self) -> int:
+        """PID of the worker processing the given file."""
+        if self._worker is None:
+            raise AirflowException("Tried to get PID before starting!")
+        return self._worker.pid
+
+    @property
+    def exit_code(self) -> int | None:
+        """Exit code of the worker if it died while processing the file, *None* otherwise."""
+        if self._worker is None:
+            raise AirflowException("Tried to get exit code before starting!")
+        if not self._done:
+            raise AirflowException("Tried to call retcode before process was finished!")
+        return self._worker.exit_code
+
+    @property
+    def done(self) -> bool:
+        """
+        Check if the worker is done processing this file.
+
+        :return: whether the file is processed
+        """
+        if self._worker is None:
+            raise AirflowException("Tried to see if it's done before starting!")
+
+        if self._done:
+            return True
+
+        worker = self._worker
+        if worker.channel.poll():
+            try:
+                self._result, worker.retiring = worker.channel.recv()
+                self._done = True
+                self._pool.release(worker)
+                return True
+            except EOFError:
+                # The worker died while processing the file.
+                self._done = True
+                worker.join(timeout=5)
+                if worker.is_alive():
+                    worker.kill()
+                self._pool.discard(worker)
+                return True
+
+        if not worker.is_alive():
+            self._done = True
+            self._pool.discard(worker)
+            return True
+
+        return False
+
+    @property
+    def result(self) -> tuple[int, int] | None:
+        """Result of running ``DagFileProcessor.process_file()``."""
+        if not self.done:
+            raise AirflowException("Tried to get the result before it's done!")
+        return self._result
+
+    @property
+    def start_time(self) -> datetime:
+        """Time when this started to process the file."""
+        if self._start_time is None:
+            raise AirflowException("Tried to get start time before it started!")
+        return self._start_time
+
+    @property
+    def waitable_handle(self):
+        if self._worker is None:
+            raise AirflowException("Tried to get waitable handle before starting!")
+        return self._worker.channel
+
+
+class DagFileProcessorWorkerPool(LoggingMixin):
+    """
+    Pool of long-lived :class:`DagFileProcessorWorker` processes.
+
+    The manager asks for one processor per file with :meth:`create_processor`. Workers are started lazily,
+    handed back to the pool when they finished a file, and replaced when they die, time out or retire.
+    The modules in ``preload_modules`` are imported in the current process first, so that workers started
+    with the ``fork`` method inherit them instead of each importing them again.
+
+    :param max_files: Number of files after which a worker is recycled. 0 for no limit.
+    :param max_memory_mb: Resident memory (in MiB) above which a worker is recycled. 0 for no limit.
+    :param preload_modules: Modules imported once before workers are started.
+    """
+
+    def __init__(self, max_files: int = 0, max_memory_mb: int = 0, preload_modules: list[str] | None = None):
+        super().__init__()
+        self._max_files = max_files
+        self._max_memory_mb = max_memory_mb
+        self._preload_modules = preload_modules or []
+        self._idle_workers: list[DagFileProcessorWorker] = []
+        _import_modules(self._preload_modules, self.log)
+
+    @classmethod
+    def from_config(cls) -> DagFileProcessorWorkerPool:
+        preload_modules = conf.get("scheduler", "parsing_worker_preload_modules", fallback="")
+        return cls(
+            max_files=conf.getint("scheduler", "parsing_worker_max_files"),
+            max_memory_mb=conf.getint("scheduler", "parsing_worker_max_memory"),
+            preload_modules=[module.strip() for module in preload_modules.split(",") if module.strip()],
+        )
+
+    def create_processor(
+        self,
+        file_path: str,
+        pickle_dags: bool,
+        dag_ids: list[str] | None,
+        dag_directory: str,
+        callback_requests: list[CallbackRequest],
+    ) -> PooledDagFileProcessorProcess:
+        """Create a processor for the file that runs on a pooled worker once started."""
+        return PooledDagFileProcessorProcess(
+            pool=self,
+            file_path=file_path,
+            pickle_dags=pickle_dags,
+            dag_ids=dag_ids,
+            dag_directory=dag_directory,
+            callback_requests=callback_requests,
+        )
+
+    def acquire(self) -> DagFileProcessorWorker:
+        """Get an idle worker, starting a new one if there is none."""
+        while self._idle_workers:
+            worker = self._idle_workers.pop()
+            if worker.is_alive():
+                return worker
+            self.discard(worker)
+        worker = DagFileProcessorWorker(
+            max_files=self._max_files,
+            max_memory_mb=self._max_memory_mb,
+            preload_modules=self._preload_modules,
+        )
+        worker.start()
+        self.log.debug("Started DAG file processor worker (PID=%s)", worker.pid)
+        Stats.incr("dag_processing.worker_starts")
+        return worker
+
+    def release(self, worker: DagFileProcessorWorker) -> None:
+        """Give a worker back to the pool once it finished processing a file."""
+        if worker.retiring or not worker.is_alive():
+            self.discard(worker)
+        else:
+            self._idle_workers.append(worker)
+
+    def discard(self, worker: DagFileProcessorWorker) -> None:
+        """Drop a worker that exited, was killed or is retiring."""
+        with suppress(ValueError):
+            self._idle_workers.remove(worker)
+        worker.join(timeout=5)
+        if worker.is_alive():
+            worker.kill()
+        worker.channel.close()
+
+    def get_all_pids(self) -> list[int]:
+        """Get the PIDs of the idle workers."""
+        return [worker.pid for worker in self._idle_workers]
+
+    def terminate(self) -> None:
+        """Stop all idle workers."""
+        while self._idle_workers:
+            self._idle_workers.pop().stop()
@@ -17,7 +17,7 @@
 # under the License.
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from sqlalchemy import exc, select
 from sqlalchemy.orm import joinedload
@@ -34,7 +34,6 @@ from airflow.utils.session import NEW_SESSION, provide_session
 if TYPE_CHECKING:
     from sqlalchemy.orm.session import Session
 
-    from airflow.models.dag import DagModel
     from airflow.models.taskinstance import TaskInstance
 
 
@@ -77,38 +76,82 @@ class DatasetManager(LoggingMixin):
         the dataset event
         """
         # todo: add test so that all usages of internal_api_call are added to rpc endpoint
-        dataset_model = session.scalar(
-            select(DatasetModel)
-            .where(DatasetModel.uri == dataset.uri)
-            .options(joinedload(DatasetModel.consuming_dags).joinedload(DagScheduleDatasetReference.dag))
+        dataset_events = cls._register_dataset_changes(
+            task_instance=task_instance, dataset_changes=[(dataset, extra)], session=session
         )
-        if not dataset_model:
-            cls.logger().warning("DatasetModel %s not found", dataset)
-            return None
+        return dataset_events[0] if dataset_events else None
 
-        event_kwargs = {
-            "dataset_id": dataset_model.id,
-            "extra": extra,
+    @classmethod
+    @internal_api_call
+    @provide_session
+    def register_dataset_changes(
+        cls,
+        *,
+        task_instance: TaskInstance | None = None,
+        dataset_changes: list[tuple[Dataset, dict | None]],
+        session: Session = NEW_SESSION,
+    ) -> list[DatasetEvent]:
+        """
+        Register changes of many datasets at once.
+
+        This does what :meth:`register_dataset_change` does for each dataset, but looks the datasets up
+        with one query and queues the dagruns of all their consuming DAGs with one statement.
+
+        :param task_instance: The task instance that changed the datasets, if any.
+        :param dataset_changes: Each changed dataset, with the extra of its dataset event.
+        :return: The dataset events recorded, datasets that are not found are skipped.
+        """
+        return cls._register_dataset_changes(
+            task_instance=task_instance, dataset_changes=dataset_changes, session=session
+        )
+
+    @classmethod
+    def _register_dataset_changes(
+        cls,
+        *,
+        task_instance: TaskInstance | None,
+        dataset_changes: list[tuple[Dataset, dict | None]],
+        session: Session,
+    ) -> list[DatasetEvent]:
+        if not dataset_changes:
+            return []
+        dataset_models = {
+            dataset_model.uri: dataset_model
+            for dataset_model in session.scalars(
+                select(DatasetModel)
+                .where(DatasetModel.uri.in_({dataset.uri for dataset, _ in dataset_changes}))
+                .options(joinedload(DatasetModel.consuming_dags).joinedload(DagScheduleDatasetReference.dag))
+            ).unique()
         }
+
+        source_kwargs = {}
         if task_instance:
-            event_kwargs.update(
-                {
-                    "source_task_id": task_instance.task_id,
-                    "source_dag_id": task_instance.dag_id,
-                    "source_run_id": task_instance.run_id,
-                    "source_map_index": task_instance.map_index,
-                }
-            )
-        dataset_event = DatasetEvent(**event_kwargs)
-        session.add(dataset_event)
+            source_kwargs = {
+                "source_task_id": task_instance.task_id,
+                "source_dag_id": task_instance.dag_id,
+                "source_run_id": task_instance.run_id,
+                "source_map_index": task_instance.map_index,
+            }
+        changed: list[tuple[Dataset, DatasetModel, DatasetEvent]] = []
+        for dataset, extra in dataset_changes:
+            dataset_model = dataset_models.get(dataset.uri)
+            if not dataset_model:
+                cls.logger().warning("DatasetModel %s not found", dataset)
+                continue
+            dataset_event = DatasetEvent(dataset_id=dataset_model.id, extra=extra, **source_kwargs)
+            changed.append((dataset, dataset_model, dataset_event))
+        if not changed:
+            return []
+        session.add_all(dataset_event for _, _, dataset_event in changed)
         session.flush()
 
-        cls.notify_dataset_changed(dataset=dataset)
+        for dataset, _, _ in changed:
+            cls.notify_dataset_changed(dataset=dataset)
 
-        Stats.incr("dataset.updates")
-        cls._queue_dagruns(dataset_model, session)
+        Stats.incr("dataset.updates", len(changed))
+        cls._queue_dagruns_for_datasets([dataset_model for _, dataset_model, _ in changed], session)
         session.flush()
-        return dataset_event
+        return [dataset_event for _, _, dataset_event in changed]
 
     def notify_dataset_created(self, dataset: Dataset):
         """Run applicable notification actions when a dataset is created."""
@@ -121,25 +164,44 @@ class DatasetManager(LoggingMixin):
 
     @classmethod
     def _queue_dagruns(cls, dataset: DatasetModel, session: Session) -> None:
+        cls._queue_dagruns_for_datasets([dataset], session)
+
+    @classmethod
+    def _queue_dagruns_for_datasets(cls, datasets: list[DatasetModel], session: Session) -> None:
         # Possible race condition: if multiple dags or multiple (usually
         # mapped) tasks update the same dataset, this can fail with a unique
         # constraint violation.
         #
-        # If we support it, use ON CONFLICT to do nothing, otherwise
-        # "fallback" to running this in a nested transaction. This is needed
-        # so that the adding of these rows happens in the same transaction
-        # where `ti.state` is changed.
+        # If we support it, use ON CONFLICT to do nothing (or its MySQL
+        # equivalent), otherwise "fallback" to running this in a nested
+        # transaction. This is needed so that the adding of these rows happens
+        # in the same transaction where `ti.state` is changed.
 
-        if session.bind.dialect.name == "postgresql":
-            return cls._postgres_queue_dagruns(dataset, session)
-        return cls._slow_path_queue_dagruns(dataset, session)
+        dialect_name = session.bind.dialect.name
+        if dialect_name == "postgresql":
+            return cls._postgres_queue_dagruns(datasets, session)
+        if dialect_name == "mysql":
+            return cls._mysql_queue_dagruns(datasets, session)
+        if dialect_name == "sqlite":
+            return cls._sqlite_queue_dagruns(datasets, session)
+        return cls._slow_path_queue_dagruns(datasets, session)
+
+    @staticmethod
+    def _get_dagrun_queue_values(datasets: list[DatasetModel]) -> list[dict[str, Any]]:
+        """Get the queue rows of the active and unpaused DAGs consuming the datasets, without duplicates."""
+        keys = {
+            (ref.dag.dag_id, dataset.id)
+            for dataset in datasets
+            for ref in dataset.consuming_dags
+            if ref.dag.is_active and not ref.dag.is_paused
+        }
+        return [{"target_dag_id": dag_id, "dataset_id": dataset_id} for dag_id, dataset_id in sorted(keys)]
 
     @classmethod
-    def _slow_path_queue_dagruns(cls, dataset: DatasetModel, session: Session) -> None:
-        def _queue_dagrun_if_needed(dag: DagModel) -> str | None:
-            if not dag.is_active or dag.is_paused:
-                return None
-            item = DatasetDagRunQueue(target_dag_id=dag.dag_id, dataset_id=dataset.id)
+    def _slow_path_queue_dagruns(cls, datasets: list[DatasetModel], session: Session) -> None:
+        values = cls._get_dagrun_queue_values(datasets)
+        for value in values:
+            item = DatasetDagRunQueue(**value)
             # Don't error whole transaction when a single RunQueue item conflicts.
             # https://docs.sqlalchemy.org/en/14/orm/session_transaction.html#using-savepoint
             try:
@@ -147,24 +209,40 @@ class DatasetManager(LoggingMixin):
                     session.merge(item)
             except exc.IntegrityError:
                 cls.logger().debug("Skipping record %s", item, exc_info=True)
-            return dag.dag_id
 
-        queued_results = (_queue_dagrun_if_needed(ref.dag) for ref in dataset.consuming_dags)
-        if queued_dag_ids := [r for r in queued_results if r is not None]:
-            cls.logger().debug("consuming dag ids %s", queued_dag_ids)
+        if values:
+            cls.logger().debug("consuming dag ids %s", sorted({value["target_dag_id"] for value in values}))
 
     @classmethod
-    def _postgres_queue_dagruns(cls, dataset: DatasetModel, session: Session) -> None:
+    def _postgres_queue_dagruns(cls, datasets: list[DatasetModel], session: Session) -> None:
         from sqlalchemy.dialects.postgresql import insert
 
-        values = [
-            {"target_dag_id": dag.dag_id}
-            for dag in (r.dag for r in dataset.consuming_dags)
-            if dag.is_active and not dag.is_paused
-        ]
+        values = cls._get_dagrun_queue_values(datasets)
+        if not values:
+            return
+        stmt = insert(DatasetDagRunQueue).on_conflict_do_nothing()
+        session.execute(stmt, values)
+
+    @classmethod
+    def _mysql_queue_dagruns(cls, datasets: list[DatasetModel], session: Session) -> None:
+        from sqlalchemy.dialects.mysql import insert
+
+        values = cls._get_dagrun_queue_values(datasets)
+        if not values:
+            return
+        # Unlike INSERT IGNORE, this only ignores duplicate keys, and not other errors.
+        stmt = insert(DatasetDagRunQueue)
+        stmt = stmt.on_duplicate_key_update(target_dag_id=DatasetDagRunQueue.target_dag_id)
+        session.execute(stmt, values)
+
+    @classmethod
+    def _sqlite_queue_dagruns(cls, datasets: list[DatasetModel], session: Session) -> None:
+        from sqlalchemy.dialects.sqlite import insert
+
+        values = cls._get_dagrun_queue_values(datasets)
         if not values:
             return
-        stmt = insert(DatasetDagRunQueue).values(dataset_id=dataset.id).on_conflict_do_nothing()
+        stmt = insert(DatasetDagRunQueue).on_conflict_do_nothing()
         session.execute(stmt, values)
 
 
@@ -19,6 +19,7 @@
 from __future__ import annotations
 
 import logging
+import operator
 import sys
 import warnings
 from collections import defaultdict
@@ -32,6 +33,7 @@ from airflow.configuration import conf
 from airflow.exceptions import RemovedInAirflow3Warning
 from airflow.stats import Stats
 from airflow.utils.log.logging_mixin import LoggingMixin
+from airflow.utils.priority_dict import PriorityDict
 from airflow.utils.state import TaskInstanceState
 
 PARALLELISM: int = conf.getint("core", "PARALLELISM")
@@ -126,7 +128,9 @@ class BaseExecutor(LoggingMixin):
     def __init__(self, parallelism: int = PARALLELISM):
         super().__init__()
         self.parallelism: int = parallelism
-        self.queued_tasks: dict[TaskInstanceKey, QueuedTaskInstanceType] = {}
+        self.queued_tasks: PriorityDict[TaskInstanceKey, QueuedTaskInstanceType] = PriorityDict(
+            priority=operator.itemgetter(1)
+        )
         self.running: set[TaskInstanceKey] = set()
         self.event_buffer: dict[TaskInstanceKey, EventBufferValueType] = {}
         self.attempts: dict[TaskInstanceKey, RunningRetryAttemptType] = defaultdict(RunningRetryAttemptType)
@@ -243,17 +247,16 @@ class BaseExecutor(LoggingMixin):
         self.log.debug("Calling the %s sync method", self.__class__)
         self.sync()
 
-    def order_queued_tasks_by_priority(self) -> list[tuple[TaskInstanceKey, QueuedTaskInstanceType]]:
+    def order_queued_tasks_by_priority(
+        self, limit: int | None = None
+    ) -> list[tuple[TaskInstanceKey, QueuedTaskInstanceType]]:
         """
         Orders the queued tasks by priority.
 
+        :param limit: The maximum number of tasks returned, all of them by default.
         :return: List of tuples from the queued_tasks according to the priority.
         """
-        return sorted(
-            self.queued_tasks.items(),
-            key=lambda x: x[1][1],
-            reverse=True,
-        )
+        return self.queued_tasks.peek(len(self.queued_tasks) if limit is None else limit)
 
     def trigger_tasks(self, open_slots: int) -> None:
         """
@@ -261,12 +264,10 @@ class BaseExecutor(LoggingMixin):
 
         :param open_slots: Number of open slots
         """
-        sorted_queue = self.order_queued_tasks_by_priority()
+        sorted_queue = self.order_queued_tasks_by_priority(limit=open_slots)
         task_tuples = []
 
-        for _ in range(min((open_slots, len(self.queued_tasks)))):
-            key, (command, _, queue, ti) = sorted_queue.pop(0)
-
+        for key, (command, _, queue, ti) in sorted_queue:
             # If a task makes it here but is still understood by the executor
             # to be running, it generally means that the task has been killed
             # externally and not yet been marked as failed.
@@ -44,9 +44,10 @@ from airflow.exceptions import RemovedInAirflow3Warning
 from airflow.executors.executor_loader import ExecutorLoader
 from airflow.jobs.base_job_runner import BaseJobRunner
 from airflow.jobs.job import Job, perform_heartbeat
+from airflow.jobs.scheduler_ready_queue import SchedulerReadyQueue
 from airflow.models.dag import DAG, DagModel
 from airflow.models.dagbag import DagBag
-from airflow.models.dagrun import DagRun
+from airflow.models.dagrun import DagRun, DagTaskDiff
 from airflow.models.dataset import (
     DagScheduleDatasetReference,
     DatasetDagRunQueue,
@@ -85,6 +86,7 @@ if TYPE_CHECKING:
     from airflow.dag_processing.manager import DagFileProcessorAgent
     from airflow.executors.base_executor import BaseExecutor
     from airflow.models.taskinstance import TaskInstanceKey
+    from airflow.timetables.base import DataInterval
     from airflow.utils.sqlalchemy import (
         CommitProhibitorGuard,
     )
@@ -116,6 +118,29 @@ class ConcurrencyMap:
             instance.task_concurrency_map[(d, t)] += c
         return instance
 
+    def increment(self, dag_id: str, run_id: str, task_id: str) -> None:
+        """Account for one more active task instance."""
+        self.dag_active_tasks_map[dag_id] += 1
+        self.task_concurrency_map[(dag_id, task_id)] += 1
+        self.task_dagrun_concurrency_map[(dag_id, run_id, task_id)] += 1
+
+    def copy(self) -> ConcurrencyMap:
+        return ConcurrencyMap(
+            Counter(self.dag_active_tasks_map),
+            Counter(self.task_concurrency_map),
+            Counter(self.task_dagrun_concurrency_map),
+        )
+
+    def decrement(self, dag_id: str, run_id: str, task_id: str) -> None:
+        """Account for one less active task instance, never going below zero."""
+        for mapping, key in (
+            (self.dag_active_tasks_map, dag_id),
+            (self.task_concurrency_map, (dag_id, task_id)),
+            (self.task_dagrun_concurrency_map, (dag_id, run_id, task_id)),
+        ):
+            if mapping.get(key, 0) > 0:
+                mapping[key] -= 1
+
 
 def _is_parent_process() -> bool:
     """
@@ -235,7 +260,28 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         # Dag Processor agent - not used in Dag Processor standalone mode.
         self.processor_agent: DagFileProcessorAgent | None = None
 
-        self.dagbag = DagBag(dag_folder=self.subdir, read_dags_from_db=True, load_op_links=False)
+        self._bulk_create_dag_runs = conf.getboolean("scheduler", "bulk_create_dag_runs")
+        self._verify_integrity_from_task_diff = conf.getboolean(
+            "scheduler", "verify_integrity_from_task_diff"
+        )
+        self.dagbag = DagBag(
+            dag_folder=self.subdir,
+            read_dags_from_db=True,
+            load_op_links=False,
+            keep_previous_versions=self._verify_integrity_from_task_diff,
+        )
+        self._concurrency_map_refresh_interval = conf.getfloat(
+            "scheduler", "concurrency_map_refresh_interval"
+        )
+        self._cached_concurrency_map: ConcurrencyMap | None = None
+        # Copy of the cached concurrency map counting the task instances being queued, until they are committed
+        self._queued_concurrency_map: ConcurrencyMap | None = None
+        self._concurrency_map_refreshed_at = 0.0
+        self._ready_queue: SchedulerReadyQueue | None = None
+        if conf.getboolean("scheduler", "use_incremental_ready_queue"):
+            self._ready_queue = SchedulerReadyQueue(
+                reconcile_interval=conf.getfloat("scheduler", "ready_queue_reconcile_interval")
+            )
         self._task_context_logger: TaskContextLogger = TaskContextLogger(
             component_name=self.job_type,
             call_site_logger=self.log,
@@ -295,6 +341,37 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             {(dag_id, run_id, task_id): count for task_id, run_id, dag_id, count in ti_concurrency_query}
         )
 
+    def _get_concurrency_map(self, session: Session) -> ConcurrencyMap:
+        """
+        Get the concurrency map of the task instances in execution states.
+
+        If ``[scheduler] concurrency_map_refresh_interval`` is set, the map is kept between scheduler loops
+        and only recomputed from the DB once that interval elapsed. In between, it is adjusted when this
+        scheduler queues task instances and when the executor reports them as finished. The task instances
+        queued are counted in a copy of the map, which replaces it once they are committed, see
+        :meth:`_apply_queued_concurrency_map`.
+        """
+        if not self._concurrency_map_refresh_interval:
+            return self.__get_concurrency_maps(states=EXECUTION_STATES, session=session)
+
+        now = time.monotonic()
+        if (
+            self._cached_concurrency_map is None
+            or now - self._concurrency_map_refreshed_at >= self._concurrency_map_refresh_interval
+        ):
+            self._cached_concurrency_map = self.__get_concurrency_maps(
+                states=EXECUTION_STATES, session=session
+            )
+            self._concurrency_map_refreshed_at = now
+        self._queued_concurrency_map = self._cached_concurrency_map.copy()
+        return self._queued_concurrency_map
+
+    def _apply_queued_concurrency_map(self) -> None:
+        """Count the task instances queued in the cached concurrency map, once they are committed."""
+        if self._queued_concurrency_map is not None:
+            self._cached_concurrency_map = self._queued_concurrency_map
+            self._queued_concurrency_map = None
+
     def _executable_task_instances_to_queued(self, max_tis: int, session: Session) -> list[TI]:
         """
         Find TIs that are ready for execution based on conditions.
@@ -315,6 +392,11 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
 
         executable_tis: list[TI] = []
 
+        if self._ready_queue is not None:
+            # Pick up the task instances that changed since the last loop before entering the critical
+            # section, so the pool lock is only held while confirming candidates.
+            self._ready_queue.refresh(session=session)
+
         if session.get_bind().dialect.name == "postgresql":
             # Optimization: to avoid littering the DB errors of "ERROR: canceling statement due to lock
             # timeout", try to take out a transactional advisory lock (unlocks automatically on
@@ -347,7 +429,7 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         starved_pools = {pool_name for pool_name, stats in pools.items() if stats["open"] <= 0}
 
         # dag_id to # of running tasks and (dag_id, task_id) to # of running tasks.
-        concurrency_map = self.__get_concurrency_maps(states=EXECUTION_STATES, session=session)
+        concurrency_map = self._get_concurrency_map(session=session)
 
         # Number of tasks that cannot be scheduled because of no open slot in pool
         num_starving_tasks_total = 0
@@ -370,7 +452,6 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             # and the dag is not paused
             query = (
                 select(TI)
-                .with_hint(TI, "USE INDEX (ti_state)", dialect_name="mysql")
                 .join(TI.dag_run)
                 .where(DR.run_type != DagRunType.BACKFILL_JOB, DR.state == DagRunState.RUNNING)
                 .join(TI.dag_model)
@@ -380,24 +461,40 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                 .order_by(-TI.priority_weight, DR.execution_date, TI.map_index)
             )
 
-            if starved_pools:
-                query = query.where(not_(TI.pool.in_(starved_pools)))
+            if self._ready_queue is not None:
+                # The candidates come from memory, the DB is only asked to confirm and lock them.
+                candidates = self._ready_queue.candidates(
+                    max_tis,
+                    starved_pools=starved_pools,
+                    starved_dags=starved_dags,
+                    starved_tasks=starved_tasks,
+                    starved_tasks_task_dagrun_concurrency=starved_tasks_task_dagrun_concurrency,
+                )
+                if not candidates:
+                    self.log.debug("No tasks to consider for execution.")
+                    break
+                query = query.where(TI.filter_for_tis(candidates))
+            else:
+                query = query.with_hint(TI, "USE INDEX (ti_state)", dialect_name="mysql")
 
-            if starved_dags:
-                query = query.where(not_(TI.dag_id.in_(starved_dags)))
+                if starved_pools:
+                    query = query.where(not_(TI.pool.in_(starved_pools)))
 
-            if starved_tasks:
-                task_filter = tuple_in_condition((TI.dag_id, TI.task_id), starved_tasks)
-                query = query.where(not_(task_filter))
+                if starved_dags:
+                    query = query.where(not_(TI.dag_id.in_(starved_dags)))
 
-            if starved_tasks_task_dagrun_concurrency:
-                task_filter = tuple_in_condition(
-                    (TI.dag_id, TI.run_id, TI.task_id),
-                    starved_tasks_task_dagrun_concurrency,
-                )
-                query = query.where(not_(task_filter))
+                if starved_tasks:
+                    task_filter = tuple_in_condition((TI.dag_id, TI.task_id), starved_tasks)
+                    query = query.where(not_(task_filter))
 
-            query = query.limit(max_tis)
+                if starved_tasks_task_dagrun_concurrency:
+                    task_filter = tuple_in_condition(
+                        (TI.dag_id, TI.run_id, TI.task_id),
+                        starved_tasks_task_dagrun_concurrency,
+                    )
+                    query = query.where(not_(task_filter))
+
+                query = query.limit(max_tis)
 
             timer = Stats.timer("scheduler.critical_section_query_duration")
             timer.start()
@@ -414,6 +511,18 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             # TODO[HA]: This was wrong before anyway, as it only looked at a sub-set of dags, not everything.
             # Stats.gauge('scheduler.tasks.pending', len(task_instances_to_examine))
 
+            num_unconfirmed = 0
+            if self._ready_queue is not None:
+                # Candidates that are no longer schedulable (or are locked by another scheduler) are dropped;
+                # they come back with the next delta or reconciliation if they become schedulable again.
+                confirmed = {ti.key.primary for ti in task_instances_to_examine}
+                for candidate in candidates:
+                    if candidate.primary not in confirmed:
+                        self._ready_queue.discard(candidate.primary)
+                        num_unconfirmed += 1
+                if num_unconfirmed and not task_instances_to_examine:
+                    continue
+
             if not task_instances_to_examine:
                 self.log.debug("No tasks to consider for execution.")
                 break
@@ -563,21 +672,19 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
 
                 executable_tis.append(task_instance)
                 open_slots -= task_instance.pool_slots
-                concurrency_map.dag_active_tasks_map[dag_id] += 1
-                concurrency_map.task_concurrency_map[(task_instance.dag_id, task_instance.task_id)] += 1
-                concurrency_map.task_dagrun_concurrency_map[
-                    (task_instance.dag_id, task_instance.run_id, task_instance.task_id)
-                ] += 1
+                concurrency_map.increment(dag_id, task_instance.run_id, task_instance.task_id)
 
                 pool_stats["open"] = open_slots
 
-            is_done = executable_tis or len(task_instances_to_examine) < max_tis
+            num_examined = len(task_instances_to_examine) + num_unconfirmed
+            is_done = executable_tis or num_examined < max_tis
             # Check this to avoid accidental infinite loops
             found_new_filters = (
                 len(starved_pools) > num_starved_pools
                 or len(starved_dags) > num_starved_dags
                 or len(starved_tasks) > num_starved_tasks
                 or len(starved_tasks_task_dagrun_concurrency) > num_starved_tasks_task_dagrun_concurrency
+                or num_unconfirmed > 0
             )
 
             if is_done or not found_new_filters:
@@ -618,6 +725,8 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
 
             for ti in executable_tis:
                 ti.emit_state_change_metric(TaskInstanceState.QUEUED)
+                if self._ready_queue is not None:
+                    self._ready_queue.discard(ti.key.primary)
 
         for ti in executable_tis:
             make_transient(ti)
@@ -693,6 +802,11 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             ti_primary_key_to_try_number_map[ti_key.primary] = ti_key.try_number
 
             self.log.info("Received executor event with state %s for task instance %s", state, ti_key)
+            if self._cached_concurrency_map is not None and state in (
+                TaskInstanceState.FAILED,
+                TaskInstanceState.SUCCESS,
+            ):
+                self._cached_concurrency_map.decrement(ti_key.dag_id, ti_key.run_id, ti_key.task_id)
             if state in (
                 TaskInstanceState.FAILED,
                 TaskInstanceState.SUCCESS,
@@ -1089,6 +1203,9 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             session.expunge_all()
             # END: schedule TIs
 
+            # Task instances counted by a critical section that was rolled back were not queued
+            self._queued_concurrency_map = None
+
             if self.job.executor.slots_available <= 0:
                 # We know we can't do anything here, so don't even try!
                 self.log.debug("Executor full, skipping critical section")
@@ -1115,6 +1232,7 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                     raise
 
             guard.commit()
+            self._apply_queued_concurrency_map()
 
         return num_queued_tis
 
@@ -1165,6 +1283,9 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             DagRun.active_runs_of_dags(dag_ids=(dm.dag_id for dm in dag_models), session=session),
         )
 
+        # With [scheduler] bulk_create_dag_runs, the DAG runs are inserted together after the loop
+        new_dag_runs: list[DagRun] = []
+        dags_to_update: list[tuple[DAG, DagModel, DataInterval | None]] = []
         for dag_model in dag_models:
             dag = self.dagbag.get_dag(dag_model.dag_id, session=session)
             if not dag:
@@ -1184,16 +1305,38 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             # instead of falling in a loop of Integrity Error.
             if (dag.dag_id, dag_model.next_dagrun) not in existing_dagruns:
                 try:
-                    dag.create_dagrun(
-                        run_type=DagRunType.SCHEDULED,
-                        execution_date=dag_model.next_dagrun,
-                        state=DagRunState.QUEUED,
-                        data_interval=data_interval,
-                        external_trigger=False,
-                        session=session,
-                        dag_hash=dag_hash,
-                        creating_job_id=self.job.id,
-                    )
+                    if self._bulk_create_dag_runs:
+                        run_id, run_type, logical_date, _ = dag._get_dagrun_creation_args(
+                            execution_date=dag_model.next_dagrun,
+                            run_id=None,
+                            run_type=DagRunType.SCHEDULED,
+                            conf=None,
+                            data_interval=data_interval,
+                        )
+                        dag_run = DagRun(
+                            dag_id=dag.dag_id,
+                            run_id=run_id,
+                            execution_date=logical_date,
+                            state=DagRunState.QUEUED,
+                            run_type=run_type,
+                            external_trigger=False,
+                            dag_hash=dag_hash,
+                            creating_job_id=self.job.id,
+                            data_interval=data_interval,
+                        )
+                        dag_run.dag = dag
+                        new_dag_runs.append(dag_run)
+                    else:
+                        dag.create_dagrun(
+                            run_type=DagRunType.SCHEDULED,
+                            execution_date=dag_model.next_dagrun,
+                            state=DagRunState.QUEUED,
+                            data_interval=data_interval,
+                            external_trigger=False,
+                            session=session,
+                            dag_hash=dag_hash,
+                            creating_job_id=self.job.id,
+                        )
                     active_runs_of_dags[dag.dag_id] += 1
                 # Exceptions like ValueError, ParamValidationError, etc. are raised by
                 # dag.create_dagrun() when dag is misconfigured. The scheduler should not
@@ -1202,6 +1345,22 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                 except Exception:
                     self.log.exception("Failed creating DagRun for %s", dag.dag_id)
                     continue
+            dags_to_update.append((dag, dag_model, data_interval))
+
+        if new_dag_runs:
+            created_dag_runs = DagRun.create_dag_runs_with_task_instances(new_dag_runs, session=session)
+            # The next DAG run fields of the DAGs whose run could not be inserted are left as they are,
+            # like when create_dagrun fails, so that the run is created by a later scheduling loop
+            failed_dag_ids = {dr.dag_id for dr in new_dag_runs}.difference(
+                dr.dag_id for dr in created_dag_runs
+            )
+            dags_to_update = [
+                (dag, dag_model, data_interval)
+                for dag, dag_model, data_interval in dags_to_update
+                if dag.dag_id not in failed_dag_ids
+            ]
+
+        for dag, dag_model, data_interval in dags_to_update:
             if self._should_update_dag_next_dagruns(
                 dag,
                 dag_model,
@@ -1503,6 +1662,10 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             self.log.debug("DAG %s not changed structure, skipping dagrun.verify_integrity", dag_run.dag_id)
             return True
 
+        previous_dag = None
+        if self._verify_integrity_from_task_diff and dag_run.dag_hash is not None:
+            previous_dag = self.dagbag.get_dag_version(dag_run.dag_id, dag_run.dag_hash)
+
         dag_run.dag_hash = latest_version
 
         # Refresh the DAG
@@ -1510,8 +1673,13 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         if not dag_run.dag:
             return False
 
+        # Only diff against the DAG if it is the latest version, else verify all the tasks
+        task_diff = None
+        if previous_dag is not None and self.dagbag.dags_hash.get(dag_run.dag_id) == latest_version:
+            task_diff = DagTaskDiff.from_dags(previous_dag, dag_run.dag)
+
         # Verify integrity also takes care of session.flush
-        dag_run.verify_integrity(session=session)
+        dag_run.verify_integrity(task_diff=task_diff, session=session)
         return True
 
     def _send_dag_callbacks_to_processor(self, dag: DAG, callback: DagCallbackRequest | None = None) -> None:
@@ -0,0 +1,238 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""In-memory, incrementally maintained queue of SCHEDULED task instances for the scheduler."""
+
+from __future__ import annotations
+
+import bisect
+import heapq
+import time
+from collections import defaultdict
+from datetime import timedelta
+from itertools import islice
+from typing import TYPE_CHECKING, Collection, Iterable, Iterator, NamedTuple
+
+from sqlalchemy import not_, select
+
+from airflow.models.dag import DagModel
+from airflow.models.dagrun import DagRun
+from airflow.models.taskinstance import TaskInstance
+from airflow.stats import Stats
+from airflow.utils import timezone
+from airflow.utils.log.logging_mixin import LoggingMixin
+from airflow.utils.state import DagRunState, TaskInstanceState
+from airflow.utils.types import DagRunType
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from sqlalchemy.orm import Session
+    from sqlalchemy.sql import Select
+
+TI = TaskInstance
+DR = DagRun
+DM = DagModel
+
+# Transactions committed after we read the watermark can carry an ``updated_at`` that is slightly older
+# than it, so every delta query looks back a little further than the last read.
+DELTA_LOOKBACK = timedelta(seconds=10)
+
+
+class ReadyTaskInstance(NamedTuple):
+    """
+    Light-weight, DB-detached description of a SCHEDULED task instance.
+
+    It carries just enough to order candidates the same way the scheduler's critical section query does
+    and to build a filter for them with :meth:`~airflow.models.taskinstance.TaskInstance.filter_for_tis`.
+    """
+
+    dag_id: str
+    task_id: str
+    run_id: str
+    map_index: int
+    pool: str
+    pool_slots: int
+    priority_weight: int
+    execution_date: datetime
+
+    @property
+    def primary(self) -> tuple[str, str, str, int]:
+        """Return the task instance primary key part of the entry."""
+        return self.dag_id, self.task_id, self.run_id, self.map_index
+
+    @property
+    def sort_key(self) -> tuple:
+        """Mirror ``ORDER BY -priority_weight, execution_date, map_index`` of the critical section."""
+        return -self.priority_weight, self.execution_date, self.map_index, self.primary
+
+
+class SchedulerReadyQueue(LoggingMixin):
+    """
+    Priority-ordered, per-pool queue of SCHEDULED task instances kept in scheduler memory.
+
+    Instead of re-discovering candidates with a full SCHEDULED query on every critical section (and again for
+    every starvation iteration), the queue is loaded once and then only the task instances whose
+    ``updated_at`` moved since the previous loop are read back. Candidates are then handed out in the same
+    order as the regular query and confirmed (and locked) against the DB by the caller; entries that fail
+    confirmation are dropped. A full reload happens every ``reconcile_interval`` seconds to pick up changes
+    that do not touch the task instance row, such as a DAG being unpaused.
+
+    :param reconcile_interval: How often (in seconds) the queue is fully rebuilt from the DB.
+    """
+
+    def __init__(self, reconcile_interval: float) -> None:
+        super().__init__()
+        self.reconcile_interval = reconcile_interval
+        self._entries: dict[tuple[str, str, str, int], ReadyTaskInstance] = {}
+        # Each pool holds a sorted list of (sort_key, entry); removed entries are dropped lazily.
+        self._pools: dict[str, list[tuple[tuple, ReadyTaskInstance]]] = defaultdict(list)
+        self._stale_count = 0
+        self._watermark: datetime | None = None
+        self._last_reconcile: float | None = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def add(self, entry: ReadyTaskInstance) -> None:
+        """Add an entry, replacing an existing one for the same task instance."""
+        existing = self._entries.get(entry.primary)
+        if existing == entry:
+            return
+        if existing is not None:
+            self._stale_count += 1
+        self._entries[entry.primary] = entry
+        bisect.insort(self._pools[entry.pool], (entry.sort_key, entry))
+
+    def discard(self, key: tuple[str, str, str, int]) -> None:
+        """Remove the entry for the given task instance primary key, if present."""
+        if self._entries.pop(key, None) is not None:
+            self._stale_count += 1
+            if self._stale_count > max(1024, len(self._entries)):
+                self._compact()
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._pools.clear()
+        self._stale_count = 0
+
+    def _compact(self) -> None:
+        for pool, entries in self._pools.items():
+            self._pools[pool] = [item for item in entries if self._entries.get(item[1].primary) is item[1]]
+        self._stale_count = 0
+
+    def _iter_pool(self, pool: str) -> Iterator[tuple[tuple, ReadyTaskInstance]]:
+        for item in self._pools.get(pool, ()):
+            if self._entries.get(item[1].primary) is item[1]:
+                yield item
+
+    def candidates(
+        self,
+        limit: int,
+        *,
+        starved_pools: Collection[str] = (),
+        starved_dags: Collection[str] = (),
+        starved_tasks: Collection[tuple[str, str]] = (),
+        starved_tasks_task_dagrun_concurrency: Collection[tuple[str, str, str]] = (),
+    ) -> list[ReadyTaskInstance]:
+        """
+        Return up to ``limit`` entries in scheduling priority order, skipping starved pools, DAGs and tasks.
+
+        This is the in-memory equivalent of the filters applied to the critical section query.
+        """
+        merged = heapq.merge(*(self._iter_pool(pool) for pool in self._pools if pool not in starved_pools))
+        return list(
+            islice(
+                (
+                    entry
+                    for _, entry in merged
+                    if entry.dag_id not in starved_dags
+                    and (entry.dag_id, entry.task_id) not in starved_tasks
+                    and (entry.dag_id, entry.run_id, entry.task_id)
+                    not in starved_tasks_task_dagrun_concurrency
+                ),
+                limit,
+            )
+        )
+
+    @staticmethod
+    def _base_query() -> Select:
+        return (
+            select(
+                TI.dag_id,
+                TI.task_id,
+                TI.run_id,
+                TI.map_index,
+                TI.pool,
+                TI.pool_slots,
+                TI.priority_weight,
+                DR.execution_date,
+            )
+            .join(TI.dag_run)
+            .where(DR.run_type != DagRunType.BACKFILL_JOB, DR.state == DagRunState.RUNNING)
+            .join(TI.dag_model)
+            .where(not_(DM.is_paused))
+            .where(TI.state == TaskInstanceState.SCHEDULED)
+        )
+
+    def _load(self, rows: Iterable) -> int:
+        count = 0
+        for dag_id, task_id, run_id, map_index, pool, pool_slots, priority_weight, execution_date in rows:
+            self.add(
+                ReadyTaskInstance(
+                    dag_id=dag_id,
+                    task_id=task_id,
+                    run_id=run_id,
+                    map_index=map_index,
+                    pool=pool,
+                    pool_slots=pool_slots,
+                    priority_weight=priority_weight or 0,
+                    execution_date=execution_date,
+                )
+            )
+            count += 1
+        return count
+
+    def refresh(self, session: Session) -> None:
+        """
+        Bring the queue up to date with the DB.
+
+        Performs a full reload if the queue was never loaded or ``reconcile_interval`` has elapsed, otherwise
+        only reads the SCHEDULED task instances that changed since the previous refresh.
+        """
+        now = time.monotonic()
+        read_at = timezone.utcnow()
+        if (
+            self._watermark is None
+            or self._last_reconcile is None
+            or now - self._last_reconcile >= self.reconcile_interval
+        ):
+            self.clear()
+            with Stats.timer("scheduler.ready_queue.reconcile_duration"):
+                loaded = self._load(session.execute(self._base_query()))
+            self._last_reconcile = now
+            self.log.debug("Reconciled ready queue with %s scheduled task instances", loaded)
+        else:
+            with Stats.timer("scheduler.ready_queue.delta_duration"):
+                query = self._base_query().where(TI.updated_at >= self._watermark - DELTA_LOOKBACK)
+                loaded = self._load(session.execute(query))
+            self.log.debug("Applied %s task instance changes to the ready queue", loaded)
+        self._watermark = read_at
+        Stats.gauge("scheduler.ready_queue.size", len(self._entries))
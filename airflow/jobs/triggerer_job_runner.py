@@ -17,6 +17,7 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
 import os
 import signal
@@ -267,6 +268,9 @@ class TriggererJobRunner(BaseJobRunner, LoggingMixin):
             raise ValueError(f"Capacity number {capacity} is invalid")
 
         self.health_check_threshold = conf.getint("triggerer", "triggerer_health_check_threshold")
+        self.max_events_per_transaction = max(
+            conf.getint("triggerer", "max_events_per_transaction", fallback=500), 1
+        )
 
         should_queue = True
         if DISABLE_WRAPPER:
@@ -383,14 +387,53 @@ class TriggererJobRunner(BaseJobRunner, LoggingMixin):
         self.trigger_runner.update_triggers(set(ids))
 
     def handle_events(self):
-        """Dispatch outbound events to the Trigger model which pushes them to the relevant task instances."""
+        """
+        Dispatch outbound events to the Trigger model which pushes them to the relevant task instances.
+
+        Events are submitted in batches of up to ``[triggerer] max_events_per_transaction``, each in
+        a single transaction. If a batch fails, its events are submitted one by one, so that one event
+        failing does not drop the others.
+        """
+        Stats.gauge("triggers.event_queue_size", len(self.trigger_runner.events))
         while self.trigger_runner.events:
-            # Get the event and its trigger ID
-            trigger_id, event = self.trigger_runner.events.popleft()
-            # Tell the model to wake up its tasks
-            Trigger.submit_event(trigger_id=trigger_id, event=event)
-            # Emit stat event
-            Stats.incr("triggers.succeeded")
+            # Get a batch of events and their trigger IDs
+            events = []
+            while self.trigger_runner.events and len(events) < self.max_events_per_transaction:
+                events.append(self.trigger_runner.events.popleft())
+            # Tell the model to wake up their tasks
+            try:
+                with Stats.timer("triggers.event_flush_duration"):
+                    Trigger.submit_events(events=events)
+            except Exception:
+                self.log.exception(
+                    "Failed to submit a batch of %d trigger events, submitting them one by one", len(events)
+                )
+                self._submit_events_one_by_one(events)
+            else:
+                # Emit stat event
+                Stats.incr("triggers.succeeded", len(events))
+
+    def _submit_events_one_by_one(self, events: list[tuple[int, TriggerEvent]]) -> None:
+        """
+        Submit events each in its own transaction.
+
+        The tasks deferred on a trigger whose event can not be submitted are failed, like when the trigger
+        fails. If that fails too, e.g. when the database is unavailable, the events not submitted yet are
+        put back in the queue and the error is raised.
+        """
+        for index, (trigger_id, event) in enumerate(events):
+            try:
+                Trigger.submit_event(trigger_id=trigger_id, event=event)
+            except Exception as e:
+                self.log.exception("Failed to submit the event of trigger %s", trigger_id)
+                try:
+                    Trigger.submit_failure(trigger_id=trigger_id, exc=e)
+                except Exception:
+                    self.trigger_runner.events.extendleft(reversed(events[index:]))
+                    raise
+                Stats.incr("triggers.failed")
+            else:
+                Stats.incr("triggers.succeeded")
 
     def handle_failed_triggers(self):
         """
@@ -448,6 +491,12 @@ class TriggerRunner(threading.Thread, LoggingMixin):
     # Outbound queue of failed triggers
     failed_triggers: deque[tuple[int, BaseException]]
 
+    # Maps the key of identical triggers to the IDs of the triggers sharing one running task
+    trigger_groups: dict[str, list[int]]
+
+    # Maps the IDs of triggers sharing a running task to their key
+    trigger_keys: dict[int, str]
+
     # Should-we-stop flag
     stop: bool = False
 
@@ -459,6 +508,9 @@ class TriggerRunner(threading.Thread, LoggingMixin):
         self.to_cancel = deque()
         self.events = deque()
         self.failed_triggers = deque()
+        self.trigger_groups = {}
+        self.trigger_keys = {}
+        self.deduplicate_triggers = conf.getboolean("triggerer", "deduplicate_triggers", fallback=False)
         self.job_id = None
 
     def run(self):
@@ -498,16 +550,60 @@ class TriggerRunner(threading.Thread, LoggingMixin):
             trigger_id, trigger_instance = self.to_create.popleft()
             if trigger_id not in self.triggers:
                 ti: TaskInstance = trigger_instance.task_instance
-                self.triggers[trigger_id] = {
-                    "task": asyncio.create_task(self.run_trigger(trigger_id, trigger_instance)),
-                    "name": f"{ti.dag_id}/{ti.run_id}/{ti.task_id}/{ti.map_index}/{ti.try_number} "
-                    f"(ID {trigger_id})",
-                    "events": 0,
-                }
+                name = (
+                    f"{ti.dag_id}/{ti.run_id}/{ti.task_id}/{ti.map_index}/{ti.try_number} (ID {trigger_id})"
+                )
+                key = self.get_trigger_key(trigger_instance) if self.deduplicate_triggers else None
+                group = None if key is None else self.trigger_groups.get(key)
+                if group is not None and self._can_join_group(group):
+                    # An identical trigger is already running, share its task
+                    task = self.triggers[group[0]]["task"]
+                    group.append(trigger_id)
+                    self.trigger_keys[trigger_id] = key
+                    self.log.info("Trigger %s shares the running task of trigger %s", name, group[0])
+                    Stats.incr("triggers.deduplicated")
+                elif key is not None and group is None:
+                    group = self.trigger_groups[key] = [trigger_id]
+                    self.trigger_keys[trigger_id] = key
+                    task = asyncio.create_task(self.run_trigger(trigger_id, trigger_instance, group))
+                else:
+                    # Not shared, or the identical triggers already fired events this one would miss
+                    task = asyncio.create_task(self.run_trigger(trigger_id, trigger_instance))
+                self.triggers[trigger_id] = {"task": task, "name": name, "events": 0}
             else:
                 self.log.warning("Trigger %s had insertion attempted twice", trigger_id)
             await asyncio.sleep(0)
 
+    @staticmethod
+    def get_trigger_key(trigger: BaseTrigger) -> str | None:
+        """
+        Get the key identifying identical triggers, made of their classpath and kwargs.
+
+        Returns None if the kwargs cannot be serialized, in which case the trigger is not shared.
+        """
+        from airflow.serialization.serialized_objects import BaseSerialization
+
+        try:
+            classpath, kwargs = trigger.serialize()
+            return json.dumps([classpath, BaseSerialization.serialize(kwargs)], sort_keys=True)
+        except Exception:
+            return None
+
+    def _can_join_group(self, group: list[int]) -> bool:
+        """Whether a new trigger can share the task of a group of identical triggers."""
+        # Once an event was fired, a new trigger would miss it
+        details = self.triggers[group[0]]
+        return not details["task"].done() and details["events"] == 0
+
+    def _remove_trigger(self, trigger_id: int) -> None:
+        del self.triggers[trigger_id]
+        key = self.trigger_keys.pop(trigger_id, None)
+        if key is not None:
+            group = self.trigger_groups[key]
+            group.remove(trigger_id)
+            if not group:
+                del self.trigger_groups[key]
+
     async def cancel_triggers(self):
         """
         Drain the to_cancel queue and ensure all triggers that are not in the DB are cancelled.
@@ -517,8 +613,14 @@ class TriggerRunner(threading.Thread, LoggingMixin):
         while self.to_cancel:
             trigger_id = self.to_cancel.popleft()
             if trigger_id in self.triggers:
-                # We only delete if it did not exit already
-                self.triggers[trigger_id]["task"].cancel()
+                task = self.triggers[trigger_id]["task"]
+                key = self.trigger_keys.get(trigger_id)
+                if key is not None and len(self.trigger_groups[key]) > 1 and not task.done():
+                    # Other triggers still wait on the shared task, so only unsubscribe this one
+                    self._remove_trigger(trigger_id)
+                else:
+                    # We only delete if it did not exit already
+                    task.cancel()
             await asyncio.sleep(0)
 
     async def cleanup_finished_triggers(self):
@@ -537,7 +639,7 @@ class TriggerRunner(threading.Thread, LoggingMixin):
                     # These are "expected" exceptions and we stop processing here
                     # If we don't, then the system requesting a trigger be removed -
                     # which turns into CancelledError - results in a failure.
-                    del self.triggers[trigger_id]
+                    self._remove_trigger(trigger_id)
                     continue
                 except BaseException as e:
                     # This is potentially bad, so log it.
@@ -557,7 +659,7 @@ class TriggerRunner(threading.Thread, LoggingMixin):
                         details["name"],
                     )
                     self.failed_triggers.append((trigger_id, saved_exc))
-                del self.triggers[trigger_id]
+                self._remove_trigger(trigger_id)
             await asyncio.sleep(0)
 
     async def block_watchdog(self):
@@ -598,16 +700,24 @@ class TriggerRunner(threading.Thread, LoggingMixin):
         # mark that we're in the context of an individual trigger so log records can be filtered
         ctx_indiv_trigger.set(True)
 
-    async def run_trigger(self, trigger_id, trigger):
-        """Run a trigger (they are async generators) and push their events into our outbound event deque."""
+    async def run_trigger(self, trigger_id, trigger, subscriber_ids: list[int] | None = None):
+        """
+        Run a trigger (they are async generators) and push their events into our outbound event deque.
+
+        :param trigger_id: The ID of the trigger.
+        :param trigger: The trigger to run.
+        :param subscriber_ids: The IDs of all the identical triggers sharing this run, which all
+            receive its events. Only this trigger if not set.
+        """
         name = self.triggers[trigger_id]["name"]
         self.log.info("trigger %s starting", name)
         try:
             self.set_individual_trigger_logging(trigger)
             async for event in trigger.run():
-                self.log.info("Trigger %s fired: %s", self.triggers[trigger_id]["name"], event)
-                self.triggers[trigger_id]["events"] += 1
-                self.events.append((trigger_id, event))
+                for subscriber_id in list(subscriber_ids or [trigger_id]):
+                    self.log.info("Trigger %s fired: %s", self.triggers[subscriber_id]["name"], event)
+                    self.triggers[subscriber_id]["events"] += 1
+                    self.events.append((subscriber_id, event))
         except asyncio.CancelledError:
             if timeout := trigger.task_instance.trigger_timeout:
                 timeout = timeout.replace(tzinfo=timezone.utc) if not timeout.tzinfo else timeout
@@ -2634,6 +2634,8 @@ class DAG(LoggingMixin):
                 else:
                     value = copy.deepcopy(value, memo)
                 copied.__dict__[attr] = value
+            # The order stored by the DAG serialization is the one of the unfiltered children
+            copied._topological_order = None
 
             proxy = weakref.proxy(copied)
 
@@ -3069,6 +3071,46 @@ class DAG(LoggingMixin):
         :param dag_hash: Hash of Serialized DAG
         :param data_interval: Data interval of the DagRun
         """
+        run_id, run_type, logical_date, data_interval = self._get_dagrun_creation_args(
+            execution_date=execution_date,
+            run_id=run_id,
+            run_type=run_type,
+            conf=conf,
+            data_interval=data_interval,
+        )
+
+        run = _create_orm_dagrun(
+            dag=self,
+            dag_id=self.dag_id,
+            run_id=run_id,
+            logical_date=logical_date,
+            start_date=start_date,
+            external_trigger=external_trigger,
+            conf=conf,
+            state=state,
+            run_type=run_type,
+            dag_hash=dag_hash,
+            creating_job_id=creating_job_id,
+            data_interval=data_interval,
+            session=session,
+        )
+        return run
+
+    def _get_dagrun_creation_args(
+        self,
+        *,
+        execution_date: datetime | None,
+        run_id: str | None,
+        run_type: DagRunType | None,
+        conf: dict | None,
+        data_interval: tuple[datetime, datetime] | None,
+    ) -> tuple[str, DagRunType | None, datetime | None, DataInterval | None]:
+        """
+        Validate the arguments of a new DAG run and fill in the ones that can be inferred.
+
+        :meta private:
+        :return: The run ID, run type, logical date and data interval of the DAG run.
+        """
         logical_date = timezone.coerce_datetime(execution_date)
 
         if data_interval and not isinstance(data_interval, DataInterval):
@@ -3078,7 +3120,7 @@ class DAG(LoggingMixin):
             warnings.warn(
                 "Calling `DAG.create_dagrun()` without an explicit data interval is deprecated",
                 RemovedInAirflow3Warning,
-                stacklevel=3,
+                stacklevel=4,
             )
             if run_type == DagRunType.MANUAL:
                 data_interval = self.timetable.infer_manual_data_interval(run_after=logical_date)
@@ -3128,22 +3170,7 @@ class DAG(LoggingMixin):
         copied_params.update(conf or {})
         copied_params.validate()
 
-        run = _create_orm_dagrun(
-            dag=self,
-            dag_id=self.dag_id,
-            run_id=run_id,
-            logical_date=logical_date,
-            start_date=start_date,
-            external_trigger=external_trigger,
-            conf=conf,
-            state=state,
-            run_type=run_type,
-            dag_hash=dag_hash,
-            creating_job_id=creating_job_id,
-            data_interval=data_interval,
-            session=session,
-        )
-        return run
+        return run_id, run_type, logical_date, data_interval
 
     @classmethod
     @provide_session
@@ -3932,42 +3959,25 @@ class DagModel(Base):
         you should ensure that any scheduling decisions are made in a single transaction -- as soon as the
         transaction is committed it will be unlocked.
         """
-        from airflow.models.serialized_dag import SerializedDagModel
-
-        def dag_ready(dag_id: str, cond: BaseDataset, statuses: dict) -> bool | None:
-            # if dag was serialized before 2.9 and we *just* upgraded,
-            # we may be dealing with old version.  In that case,
-            # just wait for the dag to be reserialized.
-            try:
-                return cond.evaluate(statuses)
-            except AttributeError:
-                log.warning("dag '%s' has old serialization; skipping DAG run creation.", dag_id)
-                return None
+        from airflow.models.dataset_condition_cache import get_dataset_condition_cache
 
         # this loads all the DDRQ records.... may need to limit num dags
-        all_records = session.scalars(select(DatasetDagRunQueue)).all()
-        by_dag = defaultdict(list)
-        for r in all_records:
-            by_dag[r.target_dag_id].append(r)
-        del all_records
-        dag_statuses = {}
-        for dag_id, records in by_dag.items():
-            dag_statuses[dag_id] = {x.dataset.uri: True for x in records}
-        ser_dags = session.scalars(
-            select(SerializedDagModel).where(SerializedDagModel.dag_id.in_(dag_statuses.keys()))
-        ).all()
-        for ser_dag in ser_dags:
-            dag_id = ser_dag.dag_id
-            statuses = dag_statuses[dag_id]
-            if not dag_ready(dag_id, cond=ser_dag.dag.timetable.dataset_condition, statuses=statuses):
-                del by_dag[dag_id]
-                del dag_statuses[dag_id]
-        del dag_statuses
+        queued_uris: dict[str, set[str]] = defaultdict(set)
+        queued_times: dict[str, list[datetime]] = defaultdict(list)
+        for dag_id, uri, created_at in session.execute(
+            select(DatasetDagRunQueue.target_dag_id, DatasetModel.uri, DatasetDagRunQueue.created_at).join(
+                DatasetModel, DatasetModel.id == DatasetDagRunQueue.dataset_id
+            )
+        ):
+            queued_uris[dag_id].add(uri)
+            queued_times[dag_id].append(created_at)
+        ready_dag_ids = get_dataset_condition_cache().get_ready_dag_ids(queued_uris, session=session)
+        del queued_uris
         dataset_triggered_dag_info = {}
-        for dag_id, records in by_dag.items():
-            times = sorted(x.created_at for x in records)
+        for dag_id in ready_dag_ids:
+            times = sorted(queued_times[dag_id])
             dataset_triggered_dag_info[dag_id] = (times[0], times[-1])
-        del by_dag
+        del queued_times
         dataset_triggered_dag_ids = set(dataset_triggered_dag_info.keys())
         if dataset_triggered_dag_ids:
             exclusion_list = set(
@@ -26,10 +26,11 @@ import sys
 import textwrap
 import traceback
 import warnings
+import weakref
 import zipfile
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import TYPE_CHECKING, NamedTuple
+from typing import TYPE_CHECKING, MutableMapping, NamedTuple
 
 from sqlalchemy import (
     Column,
@@ -49,6 +50,7 @@ from airflow.exceptions import (
     RemovedInAirflow3Warning,
 )
 from airflow.models.base import Base
+from airflow.models.serialized_dag_cache import get_serialized_dag_cache
 from airflow.stats import Stats
 from airflow.utils import timezone
 from airflow.utils.dag_cycle_tester import check_cycle
@@ -116,6 +118,12 @@ class DagBag(LoggingMixin):
         de-serializing the DAG? This flag is set to False in Scheduler so that Extra Operator links
         are not loaded to not run User code in Scheduler.
     :param collect_dags: when True, collects dags during class initialization.
+    :param keep_previous_versions: When reading DAGs from the DB, also keep the version of each DAG that
+        was replaced by the latest one, so it can be retrieved with :meth:`get_dag_version`.
+
+    When reading DAGs from the DB and ``[core] serialized_dag_cache_max_memory_mb`` is set, the DAGs are
+    kept in a cache shared by all the DagBags of the process, and the DagBag only holds weak references
+    to them.
     """
 
     def __init__(
@@ -127,6 +135,7 @@ class DagBag(LoggingMixin):
         store_serialized_dags: bool | None = None,
         load_op_links: bool = True,
         collect_dags: bool = True,
+        keep_previous_versions: bool = False,
     ):
         # Avoid circular import
 
@@ -152,7 +161,8 @@ class DagBag(LoggingMixin):
 
         dag_folder = dag_folder or settings.DAGS_FOLDER
         self.dag_folder = dag_folder
-        self.dags: dict[str, DAG] = {}
+        self._dag_cache = get_serialized_dag_cache() if read_dags_from_db else None
+        self.dags: MutableMapping[str, DAG] = {} if self._dag_cache is None else weakref.WeakValueDictionary()
         # the file's last modified timestamp when we last read it
         self.file_last_changed: dict[str, datetime] = {}
         self.import_errors: dict[str, str] = {}
@@ -163,6 +173,9 @@ class DagBag(LoggingMixin):
         self.dags_last_fetched: dict[str, datetime] = {}
         # Only used by SchedulerJob to compare the dag_hash to identify change in DAGs
         self.dags_hash: dict[str, str] = {}
+        # Only used by read_dags_from_db=True and keep_previous_versions=True
+        self.keep_previous_versions = keep_previous_versions
+        self.previous_dags: dict[str, tuple[str, DAG]] = {}
 
         self.dagbag_import_error_tracebacks = conf.getboolean("core", "dagbag_import_error_tracebacks")
         self.dagbag_import_error_traceback_depth = conf.getint("core", "dagbag_import_error_traceback_depth")
@@ -237,9 +250,11 @@ class DagBag(LoggingMixin):
                 )
                 if not sd_latest_version_and_updated_datetime:
                     self.log.warning("Serialized DAG %s no longer exists", dag_id)
-                    del self.dags[dag_id]
+                    # The DAG may already have been evicted from the shared cache
+                    self.dags.pop(dag_id, None)
                     del self.dags_last_fetched[dag_id]
                     del self.dags_hash[dag_id]
+                    self.previous_dags.pop(dag_id, None)
                     return None
 
                 sd_latest_version, sd_last_updated_datetime = sd_latest_version_and_updated_datetime
@@ -288,6 +303,26 @@ class DagBag(LoggingMixin):
                 del self.dags[dag_id]
         return self.dags.get(dag_id)
 
+    def get_dag_version(self, dag_id: str, dag_hash: str) -> DAG | None:
+        """
+        Get a DAG already read from the DB if it has the given version, without refreshing it.
+
+        This finds the latest version of the DAG, the version it replaced if ``keep_previous_versions``
+        is set, and the versions kept in the shared cache of deserialized DAGs.
+
+        :param dag_id: DAG ID
+        :param dag_hash: Hash of the serialized DAG
+        :return: The DAG, or None if this version is not known.
+        """
+        if self.dags_hash.get(dag_id) == dag_hash:
+            return self.dags.get(dag_id)
+        previous_hash, previous_dag = self.previous_dags.get(dag_id, (None, None))
+        if previous_hash == dag_hash:
+            return previous_dag
+        if self._dag_cache is not None:
+            return self._dag_cache.get(dag_id, dag_hash, self.load_op_links)
+        return None
+
     def _add_dag_from_db(self, dag_id: str, session: Session):
         """Add DAG to DagBag from DB."""
         from airflow.models.serialized_dag import SerializedDagModel
@@ -296,8 +331,19 @@ class DagBag(LoggingMixin):
         if not row:
             return None
 
-        row.load_op_links = self.load_op_links
-        dag = row.dag
+        dag = None
+        if self._dag_cache is not None:
+            dag = self._dag_cache.get(row.dag_id, row.dag_hash, self.load_op_links)
+        if dag is None:
+            row.load_op_links = self.load_op_links
+            dag = row.dag
+            if self._dag_cache is not None:
+                self._dag_cache.put(row.dag_id, row.dag_hash, dag, self.load_op_links)
+        if self.keep_previous_versions:
+            previous_hash = self.dags_hash.get(dag.dag_id)
+            previous_dag = self.dags.get(dag.dag_id)
+            if previous_hash is not None and previous_dag is not None and previous_hash != row.dag_hash:
+                self.previous_dags[dag.dag_id] = (previous_hash, previous_dag)
         for subdag in dag.subdags:
             self.dags[subdag.dag_id] = subdag
         self.dags[dag.dag_id] = dag
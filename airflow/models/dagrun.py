@@ -98,6 +98,59 @@ class TISchedulingDecision(NamedTuple):
     finished_tis: list[TI]
 
 
+def _get_task_integrity_fingerprint(task: Operator) -> tuple:
+    """Get the attributes of a task that decide which task instances a DAG run should have."""
+    from airflow.models.mappedoperator import MappedOperator
+
+    try:
+        mapped: tuple = (task.get_parse_time_mapped_ti_count(),)
+    except NotMapped:
+        mapped = ()
+    except NotFullyPopulated:
+        mapped = (None, sorted(task.upstream_task_ids))
+    return (
+        isinstance(task, MappedOperator),
+        tuple(group.group_id for group in task.iter_mapped_task_groups()),
+        mapped,
+        task.start_date,
+        task.end_date,
+    )
+
+
+class DagTaskDiff(NamedTuple):
+    """
+    Tasks that differ between two versions of a DAG, as far as the integrity of a DAG run is concerned.
+
+    :param added: IDs of the tasks only in the new version.
+    :param removed: IDs of the tasks only in the old version.
+    :param changed: IDs of the tasks in both versions whose mapping or start and end dates changed.
+    """
+
+    added: set[str]
+    removed: set[str]
+    changed: set[str]
+
+    @classmethod
+    def from_dags(cls, old_dag: DAG, new_dag: DAG) -> DagTaskDiff:
+        """Compare the tasks of two versions of a DAG."""
+        old_tasks, new_tasks = old_dag.task_dict, new_dag.task_dict
+        return cls(
+            added=new_tasks.keys() - old_tasks.keys(),
+            removed=old_tasks.keys() - new_tasks.keys(),
+            changed={
+                task_id
+                for task_id in old_tasks.keys() & new_tasks.keys()
+                if _get_task_integrity_fingerprint(old_tasks[task_id])
+                != _get_task_integrity_fingerprint(new_tasks[task_id])
+            },
+        )
+
+    @property
+    def task_ids(self) -> set[str]:
+        """IDs of all the tasks that differ."""
+        return self.added | self.removed | self.changed
+
+
 def _creator_note(val):
     """Creator the ``note`` association proxy."""
     if isinstance(val, str):
@@ -1170,13 +1223,17 @@ class DagRun(Base, LoggingMixin):
         Stats.timing(f"dagrun.duration.{self.state}", **timer_params)
 
     @provide_session
-    def verify_integrity(self, *, session: Session = NEW_SESSION) -> None:
+    def verify_integrity(
+        self, *, task_diff: DagTaskDiff | None = None, session: Session = NEW_SESSION
+    ) -> None:
         """
         Verify the DagRun by checking for removed tasks or tasks that are not in the database yet.
 
         It will set state to removed or add the task if required.
 
         :missing_indexes: A dictionary of task vs indexes that are missing.
+        :param task_diff: The tasks that changed since the version of the DAG this run was last verified
+            against. If given, only the task instances of these tasks are checked and created.
         :param session: Sqlalchemy ORM Session
         """
         from airflow.settings import task_instance_mutation_hook
@@ -1186,39 +1243,141 @@ class DagRun(Base, LoggingMixin):
         hook_is_noop: Literal[True, False] = getattr(task_instance_mutation_hook, "is_noop", False)
 
         dag = self.get_dag()
+        if task_diff is not None and not task_diff.task_ids:
+            return
         task_ids = self._check_for_removed_or_restored_tasks(
-            dag, task_instance_mutation_hook, session=session
+            dag,
+            task_instance_mutation_hook,
+            only_task_ids=None if task_diff is None else task_diff.task_ids,
+            session=session,
         )
 
         def task_filter(task: Operator) -> bool:
-            return task.task_id not in task_ids and (
-                self.is_backfill
-                or (task.start_date is None or task.start_date <= self.execution_date)
-                and (task.end_date is None or self.execution_date <= task.end_date)
-            )
+            return task.task_id not in task_ids and self._is_task_in_run_dates(task)
 
         created_counts: dict[str, int] = defaultdict(int)
         task_creator = self._get_task_creator(created_counts, task_instance_mutation_hook, hook_is_noop)
 
         # Create the missing tasks, including mapped tasks
-        tasks_to_create = (task for task in dag.task_dict.values() if task_filter(task))
+        if task_diff is None:
+            tasks: Iterable[Operator] = dag.task_dict.values()
+        else:
+            tasks = (dag.task_dict[task_id] for task_id in sorted(task_diff.task_ids & dag.task_dict.keys()))
+        tasks_to_create = (task for task in tasks if task_filter(task))
         tis_to_create = self._create_tasks(tasks_to_create, task_creator, session=session)
         self._create_task_instances(self.dag_id, tis_to_create, created_counts, hook_is_noop, session=session)
 
+    def _is_task_in_run_dates(self, task: Operator) -> bool:
+        """Whether the task should run in this DAG run, given its start and end dates."""
+        return (
+            self.is_backfill
+            or (task.start_date is None or task.start_date <= self.execution_date)
+            and (task.end_date is None or self.execution_date <= task.end_date)
+        )
+
+    @classmethod
+    def create_dag_runs_with_task_instances(
+        cls, dag_runs: Sequence[DagRun], *, session: Session
+    ) -> list[DagRun]:
+        """
+        Insert new DAG runs and the task instances of their DAGs, in one batch per table.
+
+        This is what ``verify_integrity`` does for each new DAG run, without checking for existing task
+        instances, since new DAG runs have none. The ``dag`` of each DAG run must be set.
+
+        The batch is inserted in a SAVEPOINT. If it fails, for example because the task instance mutation
+        hook raises for one of the DAG runs or one of them already exists, the DAG runs are inserted one at
+        a time, each in its own SAVEPOINT, so that only the failing ones are left out.
+
+        :param dag_runs: The DAG runs to insert, not yet added to the session
+        :param session: Sqlalchemy ORM Session
+        :return: The DAG runs that were inserted
+        """
+        try:
+            with session.begin_nested():
+                cls._insert_dag_runs_with_task_instances(dag_runs, session=session)
+            return list(dag_runs)
+        except Exception:
+            if len(dag_runs) == 1:
+                cls.logger().exception("Failed creating DagRun for %s", dag_runs[0].dag_id)
+                return []
+            cls.logger().warning(
+                "Failed inserting %d DAG runs together, inserting them one at a time",
+                len(dag_runs),
+                exc_info=True,
+            )
+
+        created = []
+        for dag_run in dag_runs:
+            try:
+                with session.begin_nested():
+                    cls._insert_dag_runs_with_task_instances([dag_run], session=session)
+            except Exception:
+                cls.logger().exception("Failed creating DagRun for %s", dag_run.dag_id)
+            else:
+                created.append(dag_run)
+        return created
+
+    @classmethod
+    def _insert_dag_runs_with_task_instances(cls, dag_runs: Sequence[DagRun], *, session: Session) -> None:
+        from airflow.settings import task_instance_mutation_hook
+
+        # Note: Literal[True, False] instead of bool because otherwise it doesn't correctly find the overload.
+        hook_is_noop: Literal[True, False] = getattr(task_instance_mutation_hook, "is_noop", False)
+
+        # DAG runs rolled back with a SAVEPOINT keep the primary key they were given by their INSERT
+        for dag_run in dag_runs:
+            dag_run.id = None
+        session.add_all(dag_runs)
+        session.flush()
+
+        tis_to_create: list = []
+        created_counts_per_run: list[tuple[DagRun, dict[str, int]]] = []
+        for dag_run in dag_runs:
+            created_counts: dict[str, int] = defaultdict(int)
+            task_creator = dag_run._get_task_creator(
+                created_counts, task_instance_mutation_hook, hook_is_noop
+            )
+            tasks = (
+                task for task in dag_run.get_dag().task_dict.values() if dag_run._is_task_in_run_dates(task)
+            )
+            tis_to_create.extend(dag_run._create_tasks(tasks, task_creator, session=session))
+            created_counts_per_run.append((dag_run, created_counts))
+
+        if hook_is_noop:
+            session.bulk_insert_mappings(TI, tis_to_create)
+        else:
+            session.bulk_save_objects(tis_to_create)
+        session.flush()
+
+        for dag_run, created_counts in created_counts_per_run:
+            for task_type, count in created_counts.items():
+                Stats.incr(f"task_instance_created_{task_type}", count, tags=dag_run.stats_tags)
+                # Same metric with tagging
+                Stats.incr(
+                    "task_instance_created", count, tags={**dag_run.stats_tags, "task_type": task_type}
+                )
+
     def _check_for_removed_or_restored_tasks(
-        self, dag: DAG, ti_mutation_hook, *, session: Session
+        self, dag: DAG, ti_mutation_hook, *, only_task_ids: set[str] | None = None, session: Session
     ) -> set[str]:
         """
         Check for removed tasks/restored/missing tasks.
 
         :param dag: DAG object corresponding to the dagrun
         :param ti_mutation_hook: task_instance_mutation_hook function
+        :param only_task_ids: If given, only check the task instances of these tasks
         :param session: Sqlalchemy ORM Session
 
         :return: Task IDs in the DAG run
 
         """
-        tis = self.get_task_instances(session=session)
+        if only_task_ids is None:
+            tis = self.get_task_instances(session=session)
+        else:
+            tis = DagRun.fetch_task_instances(
+                dag_id=self.dag_id, run_id=self.run_id, task_ids=sorted(only_task_ids), session=session
+            )
 
         # check for removed or restored tasks
         task_ids = set()
@@ -0,0 +1,139 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Process-wide cache of the dataset conditions of dataset-triggered DAGs, compiled once per DAG version."""
+
+from __future__ import annotations
+
+import functools
+import logging
+import threading
+from typing import TYPE_CHECKING, AbstractSet, Callable, Collection, Mapping
+
+from sqlalchemy import select
+
+from airflow.datasets import BaseDataset, Dataset, DatasetAll, DatasetAny
+
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+
+log = logging.getLogger(__name__)
+
+DatasetConditionEvaluator = Callable[[AbstractSet[str]], bool]
+
+
+def compile_dataset_condition(condition: BaseDataset) -> DatasetConditionEvaluator:
+    """
+    Compile a dataset condition into a function telling whether it is met by the given dataset URIs.
+
+    The result is equivalent to ``condition.evaluate`` with the given URIs as true statuses, but
+    conditions that only combine datasets are evaluated as a single set operation.
+    """
+    if isinstance(condition, Dataset):
+        uri = condition.uri
+        return lambda uris: uri in uris
+    if isinstance(condition, (DatasetAny, DatasetAll)):
+        is_any = isinstance(condition, DatasetAny)
+        if all(isinstance(obj, Dataset) for obj in condition.objects):
+            condition_uris = frozenset(obj.uri for obj in condition.objects)
+            if is_any:
+                return lambda uris: not condition_uris.isdisjoint(uris)
+            return lambda uris: condition_uris.issubset(uris)
+        evaluators = [compile_dataset_condition(obj) for obj in condition.objects]
+        aggregate = any if is_any else all
+        return lambda uris: aggregate(evaluate(uris) for evaluate in evaluators)
+    return lambda uris: condition.evaluate(dict.fromkeys(uris, True))
+
+
+class DatasetConditionCache:
+    """
+    Compiled dataset conditions of DAGs, keyed on the DAG ID and the hash of its serialized version.
+
+    Only the hash of the serialized DAGs is read from the database to check that the cached conditions are
+    up-to-date; a DAG is only deserialized, without its tasks, when a new version is seen.
+    """
+
+    def __init__(self) -> None:
+        self._conditions: dict[str, tuple[str, DatasetConditionEvaluator]] = {}
+        self._lock = threading.Lock()
+
+    def get_ready_dag_ids(self, queued_uris: Mapping[str, AbstractSet[str]], *, session: Session) -> set[str]:
+        """
+        Get the IDs of the DAGs whose dataset condition is met by their queued datasets.
+
+        DAGs that are not serialized are considered ready, and DAGs whose condition cannot be evaluated
+        because they were serialized by an older version of Airflow are not.
+
+        :param queued_uris: The URIs of the queued datasets of each DAG.
+        :param session: ORM Session
+        """
+        from airflow.models.serialized_dag import SerializedDagModel
+
+        dag_hashes = dict(
+            session.execute(
+                select(SerializedDagModel.dag_id, SerializedDagModel.dag_hash).where(
+                    SerializedDagModel.dag_id.in_(queued_uris)
+                )
+            ).all()
+        )
+        with self._lock:
+            outdated = [
+                dag_id
+                for dag_id, dag_hash in dag_hashes.items()
+                if self._conditions.get(dag_id, (None,))[0] != dag_hash
+            ]
+            if outdated:
+                self._load(outdated, session=session)
+            for dag_id in queued_uris:
+                if dag_id not in dag_hashes:
+                    self._conditions.pop(dag_id, None)
+            conditions = dict(self._conditions)
+
+        ready_dag_ids = set()
+        for dag_id, uris in queued_uris.items():
+            if dag_id not in conditions:
+                ready_dag_ids.add(dag_id)
+                continue
+            try:
+                if conditions[dag_id][1](uris):
+                    ready_dag_ids.add(dag_id)
+            except AttributeError:
+                # if dag was serialized before 2.9 and we *just* upgraded,
+                # we may be dealing with old version.  In that case,
+                # just wait for the dag to be reserialized.
+                log.warning("dag '%s' has old serialization; skipping DAG run creation.", dag_id)
+        return ready_dag_ids
+
+    def _load(self, dag_ids: Collection[str], *, session: Session) -> None:
+        from airflow.models.serialized_dag import SerializedDagModel
+
+        for ser_dag in session.scalars(
+            select(SerializedDagModel).where(SerializedDagModel.dag_id.in_(dag_ids))
+        ):
+            condition = ser_dag.lazy_dag.timetable.dataset_condition
+            self._conditions[ser_dag.dag_id] = (ser_dag.dag_hash, compile_dataset_condition(condition))
+
+    def clear(self) -> None:
+        """Remove all the cached conditions."""
+        with self._lock:
+            self._conditions.clear()
+
+
+@functools.lru_cache(maxsize=None)
+def get_dataset_condition_cache() -> DatasetConditionCache:
+    """Get the cache shared by this process."""
+    return DatasetConditionCache()
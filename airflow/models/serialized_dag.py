@@ -35,8 +35,20 @@ from airflow.models.base import ID_LEN, Base
 from airflow.models.dag import DagModel
 from airflow.models.dagcode import DagCode
 from airflow.models.dagrun import DagRun
+from airflow.serialization.indexed_dag_data import (
+    IndexedDagData,
+    decode_dag_dependencies,
+    encode_indexed_dag_data,
+    get_dag_dependencies_end,
+    is_indexed_dag_data,
+)
 from airflow.serialization.serialized_objects import DagDependency, SerializedDAG
-from airflow.settings import COMPRESS_SERIALIZED_DAGS, MIN_SERIALIZED_DAG_UPDATE_INTERVAL, json
+from airflow.settings import (
+    COMPRESS_SERIALIZED_DAGS,
+    MIN_SERIALIZED_DAG_UPDATE_INTERVAL,
+    SERIALIZED_DAG_STORAGE_FORMAT,
+    json,
+)
 from airflow.utils import timezone
 from airflow.utils.hashlib_wrapper import md5
 from airflow.utils.session import NEW_SESSION, provide_session
@@ -52,6 +64,9 @@ if TYPE_CHECKING:
 
 log = logging.getLogger(__name__)
 
+# Number of bytes read from the start of DAGs stored in the indexed format to get their dependencies.
+_DAG_DEPENDENCIES_PREFIX_SIZE = 4096
+
 
 class SerializedDagModel(Base):
     """A table for serialized DAGs.
@@ -67,6 +82,8 @@ class SerializedDagModel(Base):
       to use a smaller interval such as 60
     * ``[core] compress_serialized_dags``:
       whether compressing the dag data to the Database.
+    * ``[core] serialized_dag_storage_format``:
+      ``indexed`` to store the dag data in a binary format where its parts can be read separately.
 
     It is used by webserver to load dags
     because reading from database is lightweight compared to importing from files,
@@ -116,7 +133,10 @@ class SerializedDagModel(Base):
 
         self.dag_hash = md5(dag_data_json).hexdigest()
 
-        if COMPRESS_SERIALIZED_DAGS:
+        if SERIALIZED_DAG_STORAGE_FORMAT == "indexed":
+            self._data = None
+            self._data_compressed = encode_indexed_dag_data(dag_data)
+        elif COMPRESS_SERIALIZED_DAGS:
             self._data = None
             self._data_compressed = zlib.compress(dag_data_json)
         else:
@@ -212,7 +232,9 @@ class SerializedDagModel(Base):
     def data(self) -> dict | None:
         # use __data_cache to avoid decompress and loads
         if not hasattr(self, "__data_cache") or self.__data_cache is None:
-            if self._data_compressed:
+            if is_indexed_dag_data(self._data_compressed):
+                self.__data_cache = IndexedDagData(self._data_compressed).to_dict()
+            elif self._data_compressed:
                 self.__data_cache = json.loads(zlib.decompress(self._data_compressed))
             else:
                 self.__data_cache = self._data
@@ -222,14 +244,27 @@ class SerializedDagModel(Base):
     @property
     def dag(self) -> SerializedDAG:
         """The DAG deserialized from the ``data`` column."""
+        return self._deserialize_dag(lazy=False)
+
+    @property
+    def lazy_dag(self) -> SerializedDAG:
+        """The DAG deserialized from the ``data`` column, deserializing its operators only when accessed."""
+        return self._deserialize_dag(lazy=True)
+
+    def _deserialize_dag(self, lazy: bool) -> SerializedDAG:
         SerializedDAG._load_operator_extra_links = self.load_op_links
+        if lazy and is_indexed_dag_data(self._data_compressed):
+            # Tasks are only decoded once they are accessed.
+            return SerializedDAG.from_dict(
+                IndexedDagData(self._data_compressed).to_dict(decode_tasks=False), lazy=True
+            )
         if isinstance(self.data, dict):
             data = self.data
         elif isinstance(self.data, str):
             data = json.loads(self.data)
         else:
             raise ValueError("invalid or missing serialized DAG data")
-        return SerializedDAG.from_dict(data)
+        return SerializedDAG.from_dict(data, lazy=lazy)
 
     @classmethod
     @provide_session
@@ -408,7 +443,32 @@ class SerializedDagModel(Base):
             iterator = session.execute(
                 select(cls.dag_id, func.json_extract_path(cls._data, "dag", "dag_dependencies"))
             )
-        return {dag_id: [DagDependency(**d) for d in (deps_data or [])] for dag_id, deps_data in iterator}
+        dependencies = {
+            dag_id: [DagDependency(**d) for d in (deps_data or [])] for dag_id, deps_data in iterator
+        }
+        # Rows in the indexed format can be there whatever the configured format. Their dependencies come
+        # first, so only the start of the data is read, unless the dependencies do not fit in it.
+        truncated_dag_ids = []
+        for dag_id, data_prefix in session.execute(
+            select(
+                cls.dag_id,
+                func.substr(cls._data_compressed, 1, _DAG_DEPENDENCIES_PREFIX_SIZE, type_=LargeBinary),
+            ).where(cls._data_compressed.is_not(None))
+        ):
+            if not is_indexed_dag_data(data_prefix):
+                continue
+            if get_dag_dependencies_end(data_prefix) > len(data_prefix):
+                truncated_dag_ids.append(dag_id)
+                continue
+            deps_data = decode_dag_dependencies(data_prefix)
+            dependencies[dag_id] = [DagDependency(**d) for d in (deps_data or [])]
+        if truncated_dag_ids:
+            for dag_id, data_compressed in session.execute(
+                select(cls.dag_id, cls._data_compressed).where(cls.dag_id.in_(truncated_dag_ids))
+            ):
+                deps_data = decode_dag_dependencies(data_compressed)
+                dependencies[dag_id] = [DagDependency(**d) for d in (deps_data or [])]
+        return dependencies
 
     @staticmethod
     @internal_api_call
@@ -419,7 +479,7 @@ class SerializedDagModel(Base):
         try:
             model = session.get(SerializedDagModel, dag_id)
             if model:
-                return model.dag.get_task(task_id)
+                return model.lazy_dag.get_task(task_id)
         except (exc.NoResultFound, TaskNotFound):
             return None
 
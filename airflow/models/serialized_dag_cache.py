@@ -0,0 +1,169 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Process-wide cache of DAGs deserialized from the ``serialized_dag`` table."""
+
+from __future__ import annotations
+
+import functools
+import sys
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Iterable, NamedTuple
+
+from airflow.configuration import conf
+from airflow.stats import Stats
+
+if TYPE_CHECKING:
+    from airflow.models.dag import DAG
+
+
+class SerializedDagCacheStats(NamedTuple):
+    """
+    Statistics of a :class:`SerializedDagCache`.
+
+    :param hits: Number of lookups that found a DAG.
+    :param misses: Number of lookups that did not find a DAG.
+    :param evictions: Number of DAGs evicted to stay under the memory limit.
+    :param size: Number of cached DAGs.
+    :param memory: Estimated memory used by the cached DAGs, in bytes.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    memory: int
+
+
+def _shallow_size(obj: Any) -> int:
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(sys.getsizeof(key) + sys.getsizeof(value) for key, value in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(sys.getsizeof(item) for item in obj)
+    return size
+
+
+def _attribute_values(obj: Any) -> Iterable[Any]:
+    try:
+        return vars(obj).values()
+    except TypeError:  # attrs classes such as MappedOperator use slots
+        return [
+            getattr(obj, name, None) for cls in type(obj).__mro__ for name in getattr(cls, "__slots__", ())
+        ]
+
+
+def estimate_dag_size(dag: DAG) -> int:
+    """
+    Estimate the memory used by a deserialized DAG, in bytes.
+
+    This sums the size of the DAG and its tasks, their attributes and the items of the attributes that
+    are containers. Deeper objects are not followed, so this is a cheap approximation rather than an
+    exact measure.
+    """
+    size = 0
+    for obj in (dag, *dag.task_dict.values()):
+        size += sys.getsizeof(obj)
+        size += sum(_shallow_size(value) for value in _attribute_values(obj))
+    return size
+
+
+class SerializedDagCache:
+    """
+    Least recently used cache of deserialized DAGs, bounded by an estimate of their memory usage.
+
+    DAGs are keyed on their ID, the hash of their serialized version and whether their operator extra
+    links were loaded, so identical versions of a DAG are only deserialized once per process. The most
+    recently added DAG is always kept, even if it alone exceeds the limit.
+
+    :param max_memory: Maximum estimated memory used by the cached DAGs, in bytes.
+    """
+
+    def __init__(self, max_memory: int):
+        self.max_memory = max_memory
+        self._dags: OrderedDict[tuple[str, str, bool], tuple[DAG, int]] = OrderedDict()
+        self._memory = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def get(self, dag_id: str, dag_hash: str, load_op_links: bool = True) -> DAG | None:
+        """Get the DAG with the given version, or None if it is not cached."""
+        with self._lock:
+            entry = self._dags.get((dag_id, dag_hash, load_op_links))
+            if entry is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+                self._dags.move_to_end((dag_id, dag_hash, load_op_links))
+        Stats.incr("serialized_dag_cache.misses" if entry is None else "serialized_dag_cache.hits")
+        return None if entry is None else entry[0]
+
+    def put(self, dag_id: str, dag_hash: str, dag: DAG, load_op_links: bool = True) -> None:
+        """Add a DAG, evicting the least recently used DAGs if the memory limit is exceeded."""
+        dag_size = estimate_dag_size(dag)
+        key = (dag_id, dag_hash, load_op_links)
+        evictions = 0
+        with self._lock:
+            previous = self._dags.pop(key, None)
+            if previous is not None:
+                self._memory -= previous[1]
+            self._dags[key] = (dag, dag_size)
+            self._memory += dag_size
+            while self._memory > self.max_memory and len(self._dags) > 1:
+                _, (_, evicted_size) = self._dags.popitem(last=False)
+                self._memory -= evicted_size
+                evictions += 1
+            self._evictions += evictions
+            size, memory = len(self._dags), self._memory
+        if evictions:
+            Stats.incr("serialized_dag_cache.evictions", evictions)
+        Stats.gauge("serialized_dag_cache.size", size)
+        Stats.gauge("serialized_dag_cache.memory", memory)
+
+    def clear(self) -> None:
+        """Remove all the DAGs and reset the statistics."""
+        with self._lock:
+            self._dags.clear()
+            self._memory = self._hits = self._misses = self._evictions = 0
+
+    @property
+    def stats(self) -> SerializedDagCacheStats:
+        """The statistics of the cache."""
+        with self._lock:
+            return SerializedDagCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._dags),
+                memory=self._memory,
+            )
+
+
+@functools.lru_cache(maxsize=None)
+def get_serialized_dag_cache() -> SerializedDagCache | None:
+    """
+    Get the cache shared by the DagBags of this process, or None if it is disabled.
+
+    It is configured with ``[core] serialized_dag_cache_max_memory_mb``.
+    """
+    max_memory_mb = conf.getint("core", "serialized_dag_cache_max_memory_mb", fallback=0)
+    if max_memory_mb <= 0:
+        return None
+    return SerializedDagCache(max_memory_mb * 1024 * 1024)
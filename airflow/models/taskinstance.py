@@ -72,7 +72,7 @@ from airflow.api_internal.internal_api_call import InternalApiConfig, internal_a
 from airflow.compat.functools import cache
 from airflow.configuration import conf
 from airflow.datasets import Dataset
-from airflow.datasets.manager import dataset_manager
+from airflow.datasets.manager import DatasetManager, dataset_manager
 from airflow.exceptions import (
     AirflowException,
     AirflowFailException,
@@ -2922,16 +2922,33 @@ class TaskInstance(Base, LoggingMixin):
         if TYPE_CHECKING:
             assert self.task
 
+        dataset_changes = []
         for obj in self.task.outlets or []:
             self.log.debug("outlet obj %s", obj)
             # Lineage can have other types of objects besides datasets
             if isinstance(obj, Dataset):
-                dataset_manager.register_dataset_change(
-                    task_instance=self,
-                    dataset=obj,
-                    extra=events[obj].extra,
-                    session=session,
-                )
+                dataset_changes.append((obj, events[obj].extra))
+        if not dataset_changes:
+            return
+        # Dataset managers overriding register_dataset_change, which is their documented extension point,
+        # are still called for each dataset
+        if (
+            type(dataset_manager).register_dataset_change.__func__
+            is DatasetManager.register_dataset_change.__func__
+        ):
+            dataset_manager.register_dataset_changes(
+                task_instance=self,
+                dataset_changes=dataset_changes,
+                session=session,
+            )
+            return
+        for dataset, extra in dataset_changes:
+            dataset_manager.register_dataset_change(
+                task_instance=self,
+                dataset=dataset,
+                extra=extra,
+                session=session,
+            )
 
     def _execute_task_with_callbacks(self, context: Context, test_mode: bool = False, *, session: Session):
         """Prepare Task for Execution."""
@@ -37,7 +37,7 @@ if TYPE_CHECKING:
     from sqlalchemy.orm import Session
     from sqlalchemy.sql import Select
 
-    from airflow.triggers.base import BaseTrigger
+    from airflow.triggers.base import BaseTrigger, TriggerEvent
 
 
 class Trigger(Base):
@@ -202,14 +202,47 @@ class Trigger(Base):
                 TaskInstance.trigger_id == trigger_id, TaskInstance.state == TaskInstanceState.DEFERRED
             )
         ):
-            # Add the event's payload into the kwargs for the task
-            next_kwargs = task_instance.next_kwargs or {}
-            next_kwargs["event"] = event.payload
-            task_instance.next_kwargs = next_kwargs
-            # Remove ourselves as its trigger
-            task_instance.trigger_id = None
-            # Finally, mark it as scheduled so it gets re-queued
-            task_instance.state = TaskInstanceState.SCHEDULED
+            cls._resume_task_instance(task_instance, event.payload)
+
+    @classmethod
+    @internal_api_call
+    @provide_session
+    def submit_events(
+        cls, events: Iterable[tuple[int, TriggerEvent]], session: Session = NEW_SESSION
+    ) -> None:
+        """
+        Take a batch of events from triggers, and resume all dependent tasks in a single transaction.
+
+        This is equivalent to calling :meth:`submit_event` for each event, but loads the task
+        instances of all the triggers with one query. If a trigger fired several events, only the
+        first one resumes its tasks, as the following ones would find no task deferred on it.
+
+        :param events: Pairs of trigger ID and event.
+        :param session: The database session.
+        """
+        payloads: dict[int, Any] = {}
+        for trigger_id, event in events:
+            payloads.setdefault(trigger_id, event.payload)
+        if not payloads:
+            return
+        for task_instance in session.scalars(
+            select(TaskInstance).where(
+                TaskInstance.trigger_id.in_(payloads), TaskInstance.state == TaskInstanceState.DEFERRED
+            )
+        ):
+            cls._resume_task_instance(task_instance, payloads[task_instance.trigger_id])
+
+    @staticmethod
+    def _resume_task_instance(task_instance: TaskInstance, payload: Any) -> None:
+        """Resume a task instance deferred on a trigger with the payload of the event the trigger fired."""
+        # Add the event's payload into the kwargs for the task
+        next_kwargs = task_instance.next_kwargs or {}
+        next_kwargs["event"] = payload
+        task_instance.next_kwargs = next_kwargs
+        # Remove ourselves as its trigger
+        task_instance.trigger_id = None
+        # Finally, mark it as scheduled so it gets re-queued
+        task_instance.state = TaskInstanceState.SCHEDULED
 
     @classmethod
     @internal_api_call
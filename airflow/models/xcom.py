@@ -23,7 +23,7 @@ import logging
 import pickle
 import warnings
 from functools import wraps
-from typing import TYPE_CHECKING, Any, Iterable, cast, overload
+from typing import TYPE_CHECKING, Any, Iterable, Sequence, cast, overload
 
 from sqlalchemy import (
     Column,
@@ -704,6 +704,28 @@ class BaseXCom(TaskInstanceDependencies, LoggingMixin):
         """Deserialize XCom value from str or pickle object."""
         return BaseXCom._deserialize_value(result, False)
 
+    @classmethod
+    def deserialize_values(cls, results: Sequence[XCom]) -> list[Any]:
+        """
+        Deserialize the values of many XComs at once.
+
+        Unless :meth:`deserialize_value` is overridden, e.g. by a custom XCom backend, or XCom pickling is
+        enabled, the JSON documents of all the values are decoded together with a single ``json.loads``.
+        Otherwise, this calls :meth:`deserialize_value` on each result.
+        """
+        if cls.deserialize_value is BaseXCom.deserialize_value and not conf.getboolean(
+            "core", "enable_xcom_pickling"
+        ):
+            document = b",".join(b"null" if result.value is None else result.value for result in results)
+            try:
+                values = json.loads(b"[%s]" % document, cls=XComDecoder)
+            except ValueError:
+                pass  # Let the malformed value raise below
+            else:
+                if len(values) == len(results):
+                    return values
+        return [cls.deserialize_value(result) for result in results]
+
     def orm_deserialize_value(self) -> Any:
         """
         Deserialize method which is used to reconstruct ORM XCom object.
@@ -730,6 +752,10 @@ class LazyXComSelectSequence(LazySelectSequence[Any]):
     def _process_row(row: Row) -> Any:
         return XCom.deserialize_value(row)
 
+    @classmethod
+    def _process_rows(cls, rows: Sequence[Row]) -> list[Any]:
+        return XCom.deserialize_values(rows)
+
 
 def _patch_outdated_serializer(clazz: type[BaseXCom], params: Iterable[str]) -> None:
     """Patch a custom ``serialize_value`` to accept the modern signature.
@@ -216,21 +216,27 @@ class KubernetesExecutor(BaseExecutor):
             if not queued_tis:
                 return
 
-            # airflow worker label selector batch call
-            kwargs = {"label_selector": f"airflow-worker={self._make_safe_label_value(str(self.job_id))}"}
-            if self.kube_config.kube_client_request_args:
-                kwargs.update(self.kube_config.kube_client_request_args)
-            pod_list = self._list_pods(kwargs)
+            if self.kube_scheduler and self.kube_scheduler.pod_cache.synced:
+                # The pods of this scheduler are known from the watchers, only the ones marked as done are
+                # missing, and those are not pods of queued task instances.
+                self.log.debug("Reading the pods of this scheduler from the pod cache")
+                pod_labels = [pod.labels for pod in self.kube_scheduler.pod_cache.pods()]
+            else:
+                # airflow worker label selector batch call
+                kwargs = {"label_selector": f"airflow-worker={self._make_safe_label_value(str(self.job_id))}"}
+                if self.kube_config.kube_client_request_args:
+                    kwargs.update(self.kube_config.kube_client_request_args)
+                pod_labels = [pod.metadata.labels for pod in self._list_pods(kwargs)]
 
             # create a set against pod query label fields
             label_search_set = set()
-            for pod in pod_list:
-                dag_id = pod.metadata.labels.get("dag_id", None)
-                task_id = pod.metadata.labels.get("task_id", None)
-                airflow_worker = pod.metadata.labels.get("airflow-worker", None)
-                map_index = pod.metadata.labels.get("map_index", None)
-                run_id = pod.metadata.labels.get("run_id", None)
-                execution_date = pod.metadata.labels.get("execution_date", None)
+            for labels in pod_labels:
+                dag_id = labels.get("dag_id", None)
+                task_id = labels.get("task_id", None)
+                airflow_worker = labels.get("airflow-worker", None)
+                map_index = labels.get("map_index", None)
+                run_id = labels.get("run_id", None)
+                execution_date = labels.get("execution_date", None)
                 if dag_id is None or task_id is None or airflow_worker is None:
                     continue
                 label_search_base_str = f"dag_id={dag_id},task_id={task_id},airflow-worker={airflow_worker}"
@@ -389,61 +395,80 @@ class KubernetesExecutor(BaseExecutor):
                 last_resource_version[ns] or resource_instance.resource_version[ns]
             )
 
-        from kubernetes.client.rest import ApiException
-
+        next_jobs: list[KubernetesJobType] = []
         with contextlib.suppress(Empty):
             for _ in range(self.kube_config.worker_pods_creation_batch_size):
-                task = self.task_queue.get_nowait()
-
-                try:
-                    key, command, kube_executor_config, pod_template_file = task
-                    self.kube_scheduler.run_next(task)
-                    self.task_publish_retries.pop(key, None)
-                except PodReconciliationError as e:
-                    self.log.exception(
-                        "Pod reconciliation failed, likely due to kubernetes library upgrade. "
-                        "Try clearing the task to re-run.",
-                    )
-                    self.fail(task[0], e)
-                except ApiException as e:
-                    body = json.loads(e.body)
-                    retries = self.task_publish_retries[key]
-                    # In case of exceeded quota errors, requeue the task as per the task_publish_max_retries
-                    if (
-                        str(e.status) == "403"
-                        and "exceeded quota" in body["message"]
-                        and (self.task_publish_max_retries == -1 or retries < self.task_publish_max_retries)
-                    ):
-                        self.log.warning(
-                            "[Try %s of %s] Kube ApiException for Task: (%s). Reason: %r. Message: %s",
-                            self.task_publish_retries[key] + 1,
-                            self.task_publish_max_retries,
-                            key,
-                            e.reason,
-                            body["message"],
-                        )
-                        self.task_queue.put(task)
-                        self.task_publish_retries[key] = retries + 1
-                    else:
-                        self.log.error("Pod creation failed with reason %r. Failing task", e.reason)
+                next_jobs.append(self.task_queue.get_nowait())
+        if next_jobs:
+            errors = self.kube_scheduler.create_pods(next_jobs)
+            unexpected_errors: list[Exception] = []
+            try:
+                # The result of each job is handled before an unexpected error is raised, so the jobs
+                # after it, already taken from the task queue, are still requeued or failed
+                for task, error in zip(next_jobs, errors):
+                    try:
+                        self._handle_pod_creation_result(task, error)
+                    except Exception as e:
                         key, _, _, _ = task
+                        self.log.exception("Pod creation failed for the task %s. Failing task", key)
                         self.fail(key, e)
                         self.task_publish_retries.pop(key, None)
-                except PodMutationHookException as e:
-                    key, _, _, _ = task
-                    self.log.error(
-                        "Pod Mutation Hook failed for the task %s. Failing task. Details: %s",
-                        key,
-                        e.__cause__,
-                    )
-                    self.fail(key, e)
-                finally:
+                        unexpected_errors.append(e)
+            finally:
+                for _ in next_jobs:
                     self.task_queue.task_done()
+            if unexpected_errors:
+                raise unexpected_errors[0]
 
         # Run any pending timed events
         next_event = self.event_scheduler.run(blocking=False)
         self.log.debug("Next timed event is in %f", next_event)
 
+    def _handle_pod_creation_result(self, task: KubernetesJobType, error: Exception | None) -> None:
+        from kubernetes.client.rest import ApiException
+
+        key, _, _, _ = task
+        try:
+            if error is not None:
+                raise error
+            self.task_publish_retries.pop(key, None)
+        except PodReconciliationError as e:
+            self.log.exception(
+                "Pod reconciliation failed, likely due to kubernetes library upgrade. "
+                "Try clearing the task to re-run.",
+            )
+            self.fail(key, e)
+        except ApiException as e:
+            body = json.loads(e.body)
+            retries = self.task_publish_retries[key]
+            # In case of exceeded quota errors, requeue the task as per the task_publish_max_retries
+            if (
+                str(e.status) == "403"
+                and "exceeded quota" in body["message"]
+                and (self.task_publish_max_retries == -1 or retries < self.task_publish_max_retries)
+            ):
+                self.log.warning(
+                    "[Try %s of %s] Kube ApiException for Task: (%s). Reason: %r. Message: %s",
+                    self.task_publish_retries[key] + 1,
+                    self.task_publish_max_retries,
+                    key,
+                    e.reason,
+                    body["message"],
+                )
+                self.task_queue.put(task)
+                self.task_publish_retries[key] = retries + 1
+            else:
+                self.log.error("Pod creation failed with reason %r. Failing task", e.reason)
+                self.fail(key, e)
+                self.task_publish_retries.pop(key, None)
+        except PodMutationHookException as e:
+            self.log.error(
+                "Pod Mutation Hook failed for the task %s. Failing task. Details: %s",
+                key,
+                e.__cause__,
+            )
+            self.fail(key, e)
+
     @provide_session
     def _change_state(
         self,
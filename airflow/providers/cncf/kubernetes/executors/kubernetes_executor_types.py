@@ -33,5 +33,9 @@ if TYPE_CHECKING:
     # pod_name, namespace, pod state, annotations, resource_version
     KubernetesWatchType = Tuple[str, str, Optional[Union[TaskInstanceState, str]], Dict[str, str], str]
 
+    # event type, watched namespace, pod (or all the pods for a POD_CACHE_SYNCED event)
+    PodCacheUpdateType = Tuple[str, str, Any]
+
 ALL_NAMESPACES = "ALL_NAMESPACES"
 POD_EXECUTOR_DONE_KEY = "airflow_executor_done"
+POD_CACHE_SYNCED = "SYNCED"
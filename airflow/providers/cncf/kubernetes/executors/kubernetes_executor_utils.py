@@ -20,9 +20,11 @@ import contextlib
 import json
 import multiprocessing
 import time
+from concurrent.futures import ThreadPoolExecutor
 from queue import Empty, Queue
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Iterable, NamedTuple
 
+import tenacity
 from kubernetes import client, watch
 from kubernetes.client.rest import ApiException
 from urllib3.exceptions import ReadTimeoutError
@@ -35,6 +37,7 @@ from airflow.providers.cncf.kubernetes.kubernetes_helper_functions import (
     create_unique_id,
 )
 from airflow.providers.cncf.kubernetes.pod_generator import PodGenerator
+from airflow.stats import Stats
 from airflow.utils.log.logging_mixin import LoggingMixin
 from airflow.utils.singleton import Singleton
 from airflow.utils.state import TaskInstanceState
@@ -43,6 +46,7 @@ try:
     from airflow.providers.cncf.kubernetes.executors.kubernetes_executor_types import (
         ADOPTED,
         ALL_NAMESPACES,
+        POD_CACHE_SYNCED,
         POD_EXECUTOR_DONE_KEY,
     )
 except ImportError:
@@ -59,17 +63,100 @@ if TYPE_CHECKING:
         KubernetesJobType,
         KubernetesResultsType,
         KubernetesWatchType,
+        PodCacheUpdateType,
     )
 
 
+# Pod creation calls rejected because the Kubernetes API is overloaded, or because of a conflict with an
+# existing pod, are retried. The pod is generated again, with a new name.
+POD_CREATION_RETRY_STATUSES = frozenset({"409", "429"})
+POD_CREATION_MAX_ATTEMPTS = 3
+
+
+def should_retry_pod_creation(exception: BaseException) -> bool:
+    """Check if the exception of a pod creation call indicates a transient error and warrants retrying."""
+    return isinstance(exception, ApiException) and str(exception.status) in POD_CREATION_RETRY_STATUSES
+
+
 class ResourceVersion(metaclass=Singleton):
     """Singleton for tracking resourceVersion from Kubernetes."""
 
     resource_version: dict[str, str] = {}
 
 
+class CachedPod(NamedTuple):
+    """The fields of a pod kept in the :class:`PodCache`."""
+
+    namespace: str
+    name: str
+    labels: dict[str, str]
+    annotations: dict[str, str]
+    phase: str | None
+    resource_version: str | None
+
+    @classmethod
+    def from_pod(cls, pod: k8s.V1Pod) -> CachedPod:
+        return cls(
+            namespace=pod.metadata.namespace,
+            name=pod.metadata.name,
+            labels=pod.metadata.labels or {},
+            annotations=pod.metadata.annotations or {},
+            phase=pod.status.phase if pod.status else None,
+            resource_version=pod.metadata.resource_version,
+        )
+
+
+class PodCache:
+    """
+    Pods of the executor, kept up to date from the events of the ``KubernetesJobWatcher`` processes.
+
+    Like the informers of the Kubernetes clients, each watcher lists the pods it watches when it starts,
+    and then sends the changes it is notified of, so that the pods can be queried without calling the
+    Kubernetes API. These are the pods of this scheduler which are not marked as done.
+
+    :param namespaces: The namespaces watched by the watchers, or ``ALL_NAMESPACES``.
+    """
+
+    def __init__(self, namespaces: Iterable[str]):
+        self.namespaces = set(namespaces)
+        self._pods: dict[str, dict[tuple[str, str], CachedPod]] = {}
+
+    @property
+    def synced(self) -> bool:
+        """Whether all the watched namespaces were listed, and their pods can be read from the cache."""
+        return self.namespaces.issubset(self._pods)
+
+    def apply(self, update: PodCacheUpdateType) -> None:
+        """Apply a snapshot or an event sent by a watcher."""
+        event_type, watched_namespace, value = update
+        if event_type == POD_CACHE_SYNCED:
+            self._pods[watched_namespace] = {(pod.namespace, pod.name): pod for pod in value}
+            return
+        pods = self._pods.get(watched_namespace)
+        if pods is None:
+            # Events received before the namespace was listed are part of the next snapshot
+            return
+        if event_type == "DELETED":
+            pods.pop((value.namespace, value.name), None)
+        else:
+            pods[(value.namespace, value.name)] = value
+
+    def invalidate(self, watched_namespace: str) -> None:
+        """Forget the pods of a namespace, until its watcher lists them again."""
+        self._pods.pop(watched_namespace, None)
+
+    def pods(self) -> list[CachedPod]:
+        """Get the cached pods of all namespaces."""
+        return [pod for pods in self._pods.values() for pod in pods.values()]
+
+
 class KubernetesJobWatcher(multiprocessing.Process, LoggingMixin):
-    """Watches for Kubernetes jobs."""
+    """
+    Watches for Kubernetes jobs.
+
+    :param pod_cache_queue: If set, the watched pods are listed when the watch starts from scratch, and
+        the list and the following events are sent to this queue to keep a :class:`PodCache` up to date.
+    """
 
     def __init__(
         self,
@@ -78,6 +165,7 @@ class KubernetesJobWatcher(multiprocessing.Process, LoggingMixin):
         resource_version: str | None,
         scheduler_job_id: str,
         kube_config: Configuration,
+        pod_cache_queue: Queue[PodCacheUpdateType] | None = None,
     ):
         super().__init__()
         self.namespace = namespace
@@ -85,6 +173,7 @@ class KubernetesJobWatcher(multiprocessing.Process, LoggingMixin):
         self.watcher_queue = watcher_queue
         self.resource_version = resource_version
         self.kube_config = kube_config
+        self.pod_cache_queue = pod_cache_queue
 
     def run(self) -> None:
         """Perform watching."""
@@ -130,6 +219,40 @@ class KubernetesJobWatcher(multiprocessing.Process, LoggingMixin):
             else:
                 raise
 
+    def _list_pods(self, kube_client: client.CoreV1Api, query_kwargs: dict) -> str | None:
+        """
+        List the watched pods, send them to the pod cache and process them like the events of a new watch.
+
+        :return: The resource version of the list, from which the watch starts.
+        """
+        if TYPE_CHECKING:
+            assert self.pod_cache_queue
+        if self.namespace == ALL_NAMESPACES:
+            pod_list = kube_client.list_pod_for_all_namespaces(**query_kwargs)
+        else:
+            pod_list = kube_client.list_namespaced_pod(self.namespace, **query_kwargs)
+        resource_version = pod_list.metadata.resource_version
+        self.log.info(
+            "Listed %s pods at resource_version %s for the pod cache", len(pod_list.items), resource_version
+        )
+        self.pod_cache_queue.put(
+            (
+                POD_CACHE_SYNCED,
+                self.namespace,
+                [CachedPod.from_pod(pod) for pod in pod_list.items],
+            )
+        )
+        # A watch starting from resource version 0 sends an ADDED event for every existing pod first
+        for pod in pod_list.items:
+            self._process_event(
+                {
+                    "type": "ADDED",
+                    "object": pod,
+                    "raw_object": kube_client.api_client.sanitize_for_serialization(pod),
+                }
+            )
+        return resource_version
+
     def _run(
         self,
         kube_client: client.CoreV1Api,
@@ -150,6 +273,11 @@ class KubernetesJobWatcher(multiprocessing.Process, LoggingMixin):
 
         last_resource_version: str | None = None
 
+        if self.pod_cache_queue is not None and resource_version in (None, "0"):
+            # Like an informer, start with a list; a resumed watch keeps the pods the cache already has
+            last_resource_version = self._list_pods(kube_client, dict(kwargs))
+            kwargs["resource_version"] = last_resource_version
+
         # For info about k8s timeout settings see
         # https://github.com/kubernetes-client/python/blob/v29.0.0/examples/watch/timeout-settings.md
         # and https://github.com/kubernetes-client/python/blob/v29.0.0/kubernetes/client/api_client.py#L336-L339
@@ -163,30 +291,36 @@ class KubernetesJobWatcher(multiprocessing.Process, LoggingMixin):
             self.log.debug("Event: %s had an event of type %s", task.metadata.name, event["type"])
             if event["type"] == "ERROR":
                 return self.process_error(event)
-            annotations = task.metadata.annotations
-            task_instance_related_annotations = {
-                "dag_id": annotations["dag_id"],
-                "task_id": annotations["task_id"],
-                "execution_date": annotations.get("execution_date"),
-                "run_id": annotations.get("run_id"),
-                "try_number": annotations["try_number"],
-            }
-            map_index = annotations.get("map_index")
-            if map_index is not None:
-                task_instance_related_annotations["map_index"] = map_index
-
-            self.process_status(
-                pod_name=task.metadata.name,
-                namespace=task.metadata.namespace,
-                status=task.status.phase,
-                annotations=task_instance_related_annotations,
-                resource_version=task.metadata.resource_version,
-                event=event,
-            )
+            self._process_event(event)
             last_resource_version = task.metadata.resource_version
 
         return last_resource_version
 
+    def _process_event(self, event: Any) -> None:
+        task = event["object"]
+        if self.pod_cache_queue is not None:
+            self.pod_cache_queue.put((event["type"], self.namespace, CachedPod.from_pod(task)))
+        annotations = task.metadata.annotations
+        task_instance_related_annotations = {
+            "dag_id": annotations["dag_id"],
+            "task_id": annotations["task_id"],
+            "execution_date": annotations.get("execution_date"),
+            "run_id": annotations.get("run_id"),
+            "try_number": annotations["try_number"],
+        }
+        map_index = annotations.get("map_index")
+        if map_index is not None:
+            task_instance_related_annotations["map_index"] = map_index
+
+        self.process_status(
+            pod_name=task.metadata.name,
+            namespace=task.metadata.namespace,
+            status=task.status.phase,
+            annotations=task_instance_related_annotations,
+            resource_version=task.metadata.resource_version,
+            event=event,
+        )
+
     def process_error(self, event: Any) -> str:
         """Process error response."""
         self.log.error("Encountered Error response from k8s list namespaced pod stream => %s", event)
@@ -328,8 +462,11 @@ class AirflowKubernetesScheduler(LoggingMixin):
         self.kube_client = kube_client
         self._manager = multiprocessing.Manager()
         self.watcher_queue = self._manager.Queue()
+        self.pod_cache_queue: Queue[PodCacheUpdateType] = self._manager.Queue()
         self.scheduler_job_id = scheduler_job_id
         self.kube_watchers = self._make_kube_watchers()
+        self.pod_cache = PodCache(self.kube_watchers)
+        self._pod_creation_pool: ThreadPoolExecutor | None = None
 
     def run_pod_async(self, pod: k8s.V1Pod, **kwargs):
         """Run POD asynchronously."""
@@ -355,6 +492,7 @@ class AirflowKubernetesScheduler(LoggingMixin):
             resource_version=resource_version,
             scheduler_job_id=self.scheduler_job_id,
             kube_config=self.kube_config,
+            pod_cache_queue=self.pod_cache_queue,
         )
         watcher.start()
         return watcher
@@ -387,6 +525,7 @@ class AirflowKubernetesScheduler(LoggingMixin):
                     namespace,
                 )
                 ResourceVersion().resource_version[namespace] = "0"
+                self.pod_cache.invalidate(namespace)
                 self.kube_watchers[namespace] = self._make_kube_watcher(namespace)
 
     def run_next(self, next_job: KubernetesJobType) -> None:
@@ -436,6 +575,46 @@ class AirflowKubernetesScheduler(LoggingMixin):
         self.run_pod_async(pod, **self.kube_config.kube_client_request_args)
         self.log.debug("Kubernetes Job created!")
 
+    def create_pods(self, next_jobs: list[KubernetesJobType]) -> list[Exception | None]:
+        """
+        Create the pods of several jobs, with ``worker_pods_creation_concurrency`` creation calls at a time.
+
+        :return: The exception raised when creating the pod of each job, or None if it was created.
+        """
+        concurrency = self.kube_config.worker_pods_creation_concurrency
+        if concurrency <= 1 or len(next_jobs) <= 1:
+            return [self._create_pod(next_job) for next_job in next_jobs]
+        if self._pod_creation_pool is None:
+            self._pod_creation_pool = ThreadPoolExecutor(
+                max_workers=concurrency, thread_name_prefix="kubernetes-pod-creation"
+            )
+        return list(self._pod_creation_pool.map(self._create_pod, next_jobs))
+
+    def _create_pod(self, next_job: KubernetesJobType) -> Exception | None:
+        def log_retry(retry_state: tenacity.RetryCallState) -> None:
+            Stats.incr("kubernetes_executor.pod_creation.retries")
+            self.log.warning(
+                "Pod creation for %s failed with %s, retrying in %.1fs",
+                next_job[0],
+                retry_state.outcome.exception() if retry_state.outcome else None,
+                retry_state.next_action.sleep if retry_state.next_action else 0,
+            )
+
+        try:
+            with Stats.timer("kubernetes_executor.pod_creation.duration"):
+                for attempt in tenacity.Retrying(
+                    stop=tenacity.stop_after_attempt(POD_CREATION_MAX_ATTEMPTS),
+                    wait=tenacity.wait_random_exponential(max=10),
+                    retry=tenacity.retry_if_exception(should_retry_pod_creation),
+                    before_sleep=log_retry,
+                    reraise=True,
+                ):
+                    with attempt:
+                        self.run_next(next_job)
+        except Exception as e:
+            return e
+        return None
+
     def delete_pod(self, pod_name: str, namespace: str) -> None:
         """Delete Pod from a namespace; does not raise if it does not exist."""
         try:
@@ -470,6 +649,8 @@ class AirflowKubernetesScheduler(LoggingMixin):
         If a job is completed, its status is placed in the result queue to be sent back to the scheduler.
         """
         self.log.debug("Syncing KubernetesExecutor")
+        # Before the health check, so that the updates of a dead watcher do not outlive its invalidation
+        self._sync_pod_cache()
         self._health_check_kube_watchers()
         with contextlib.suppress(Empty):
             while True:
@@ -480,6 +661,11 @@ class AirflowKubernetesScheduler(LoggingMixin):
                 finally:
                     self.watcher_queue.task_done()
 
+    def _sync_pod_cache(self) -> None:
+        with contextlib.suppress(Empty):
+            while True:
+                self.pod_cache.apply(self.pod_cache_queue.get_nowait())
+
     def process_watcher_task(self, task: KubernetesWatchType) -> None:
         """Process the task by watcher."""
         pod_name, namespace, state, annotations, resource_version = task
@@ -516,6 +702,8 @@ class AirflowKubernetesScheduler(LoggingMixin):
         self.watcher_queue.join()
         self.log.debug("Shutting down manager...")
         self._manager.shutdown()
+        if self._pod_creation_pool:
+            self._pod_creation_pool.shutdown()
 
 
 def get_base_pod_from_template(pod_template_file: str | None, kube_config: Any) -> k8s.V1Pod:
@@ -17,9 +17,11 @@
 from __future__ import annotations
 
 import contextlib
+import functools
 import json
+import sys
 import uuid
-from typing import TYPE_CHECKING, Any, TypeVar
+from typing import IO, TYPE_CHECKING, Any, Iterator, TypeVar
 from urllib.parse import urlsplit
 
 import fsspec.utils
@@ -31,14 +33,20 @@ from airflow.models.xcom import BaseXCom
 from airflow.utils.json import XComDecoder, XComEncoder
 
 if TYPE_CHECKING:
+    import pyarrow
     from sqlalchemy.orm import Session
 
     from airflow.models import XCom
 
 T = TypeVar("T")
 
+_NO_ITEM = object()
+
 SECTION = "common.io"
 
+# Suffixes of the files of values stored in another format than JSON, see ``xcom_objectstorage_streaming``
+_FORMAT_SUFFIXES = {"ndjson": ".ndjson", "bytes": ".bin", "parquet": ".parquet"}
+
 
 def _is_relative_to(o: ObjectStoragePath, other: ObjectStoragePath) -> bool:
     """Return whether or not this path is relative to the other path.
@@ -82,6 +90,67 @@ def _get_threshold() -> int:
     return conf.getint(SECTION, "xcom_objectstorage_threshold", fallback=-1)
 
 
+@cache
+def _get_streaming() -> bool:
+    return conf.getboolean(SECTION, "xcom_objectstorage_streaming", fallback=False)
+
+
+def _is_dataframe(value: Any) -> bool:
+    # pandas is only imported if the value may be a DataFrame
+    return "pandas" in sys.modules and isinstance(value, sys.modules["pandas"].DataFrame)
+
+
+class StoredXComValue:
+    """Handle to an XCom value stored in object storage, to read it without loading it all in memory.
+
+    The format of the value is inferred from the file extension: values stored with
+    ``xcom_objectstorage_streaming`` can be ``ndjson`` (lists), ``bytes`` or ``parquet`` (DataFrames),
+    and other values are ``json``.
+
+    :param path: The path of the value in object storage.
+    """
+
+    def __init__(self, path: ObjectStoragePath):
+        self.path = path
+        self.format = next(
+            (fmt for fmt, suffix in _FORMAT_SUFFIXES.items() if suffix in path.suffixes), "json"
+        )
+
+    def open(self) -> IO[bytes]:
+        """Open the stored value for reading. Compression is inferred from the file extension."""
+        return self.path.open(mode="rb", compression="infer")
+
+    def iter_items(self) -> Iterator[Any]:
+        """Iterate over the items of a list stored as ``ndjson``, decoding one item at a time."""
+        if self.format != "ndjson":
+            raise TypeError(f"Cannot iterate over the items of a value stored as {self.format}")
+        with self.open() as f:
+            for line in f:
+                yield json.loads(line, cls=XComDecoder)
+
+    def read_arrow(self) -> pyarrow.Table:
+        """Read a DataFrame stored as ``parquet`` as an Arrow table, memory-mapping local files."""
+        import pyarrow.parquet as pq
+
+        if self.format != "parquet":
+            raise TypeError(f"Cannot read a value stored as {self.format} as an Arrow table")
+        if self.path.protocol == "file":
+            return pq.read_table(self.path.path, memory_map=True)
+        with self.path.open(mode="rb") as f:
+            return pq.read_table(f)
+
+    def load(self) -> Any:
+        """Load the whole value."""
+        if self.format == "ndjson":
+            return list(self.iter_items())
+        if self.format == "parquet":
+            return self.read_arrow().to_pandas()
+        with self.open() as f:
+            if self.format == "bytes":
+                return f.read()
+            return json.load(f, cls=XComDecoder)
+
+
 class XComObjectStorageBackend(BaseXCom):
     """XCom backend that stores data in an object store or database depending on the size of the data.
 
@@ -113,6 +182,83 @@ class XComObjectStorageBackend(BaseXCom):
 
         raise ValueError(f"Not a valid url: {data}")
 
+    @staticmethod
+    def _get_new_path(
+        dag_id: str | None, run_id: str | None, task_id: str | None, suffix: str
+    ) -> ObjectStoragePath:
+        base_path = _get_base_path()
+        while True:  # Safeguard against collisions.
+            p = base_path.joinpath(dag_id, run_id, task_id, f"{uuid.uuid4()}{suffix}")
+            if not p.exists():
+                break
+        p.parent.mkdir(parents=True, exist_ok=True)
+        return p
+
+    @staticmethod
+    def _serialize_streaming(
+        value: Any, *, dag_id: str | None, run_id: str | None, task_id: str | None
+    ) -> bytes | str | None:
+        """Write lists, bytes and DataFrames to object storage in a format suited to their type.
+
+        Lists are encoded one item at a time and, as soon as they reach the threshold, streamed to
+        object storage as NDJSON, so they are never encoded as a whole in memory. Bytes are written
+        as they are; as the database only holds JSON, they always go to object storage. DataFrames
+        whose in-memory size reaches the threshold are written as Parquet.
+
+        :return: The value to store in the database, or None if the value is not handled here.
+        """
+        threshold = _get_threshold()
+        if threshold < 0:
+            return None
+        if compression := _get_compression():
+            compression_suffix = f".{_get_compression_suffix(compression)}"
+        else:
+            compression_suffix = ""
+
+        if isinstance(value, (bytes, bytearray)):
+            p = XComObjectStorageBackend._get_new_path(
+                dag_id, run_id, task_id, f"{_FORMAT_SUFFIXES['bytes']}{compression_suffix}"
+            )
+            with p.open(mode="wb", compression=compression) as f:
+                f.write(value)
+            return BaseXCom.serialize_value(str(p))
+
+        if _is_dataframe(value):
+            if value.memory_usage(deep=True).sum() < threshold:
+                return None
+            # Parquet is already compressed
+            p = XComObjectStorageBackend._get_new_path(dag_id, run_id, task_id, _FORMAT_SUFFIXES["parquet"])
+            with p.open(mode="wb") as f:
+                value.to_parquet(f)
+            return BaseXCom.serialize_value(str(p))
+
+        if not isinstance(value, list):
+            return None
+        # Encode items like json.dumps encodes the items of a list
+        encode = functools.partial(json.JSONEncoder.encode, XComEncoder())
+        items = iter(value)
+        chunks: list[bytes] = []
+        size = len(b"[]")
+        while size < threshold:
+            item = next(items, _NO_ITEM)
+            if item is _NO_ITEM:
+                # The whole list is below the threshold, store it in the database like json.dumps would
+                return b"[" + b", ".join(chunks) + b"]"
+            chunk = encode(item).encode("utf-8")
+            size += len(chunk) + (len(b", ") if chunks else 0)
+            chunks.append(chunk)
+
+        p = XComObjectStorageBackend._get_new_path(
+            dag_id, run_id, task_id, f"{_FORMAT_SUFFIXES['ndjson']}{compression_suffix}"
+        )
+        with p.open(mode="wb", compression=compression) as f:
+            for chunk in chunks:
+                f.write(chunk + b"\n")
+            del chunks
+            for item in items:
+                f.write(encode(item).encode("utf-8") + b"\n")
+        return BaseXCom.serialize_value(str(p))
+
     @staticmethod
     def serialize_value(
         value: T,
@@ -123,6 +269,13 @@ class XComObjectStorageBackend(BaseXCom):
         run_id: str | None = None,
         map_index: int | None = None,
     ) -> bytes | str:
+        if _get_streaming():
+            stored = XComObjectStorageBackend._serialize_streaming(
+                value, dag_id=dag_id, run_id=run_id, task_id=task_id
+            )
+            if stored is not None:
+                return stored
+
         # we will always serialize ourselves and not by BaseXCom as the deserialize method
         # from BaseXCom accepts only XCom objects and not the value directly
         s_val = json.dumps(value, cls=XComEncoder).encode("utf-8")
@@ -136,13 +289,7 @@ class XComObjectStorageBackend(BaseXCom):
         if threshold < 0 or len(s_val) < threshold:  # Either no threshold or value is small enough.
             return s_val
 
-        base_path = _get_base_path()
-        while True:  # Safeguard against collisions.
-            p = base_path.joinpath(dag_id, run_id, task_id, f"{uuid.uuid4()}{suffix}")
-            if not p.exists():
-                break
-        p.parent.mkdir(parents=True, exist_ok=True)
-
+        p = XComObjectStorageBackend._get_new_path(dag_id, run_id, task_id, suffix)
         with p.open(mode="wb", compression=compression) as f:
             f.write(s_val)
         return BaseXCom.serialize_value(str(p))
@@ -151,7 +298,7 @@ class XComObjectStorageBackend(BaseXCom):
     def deserialize_value(result: XCom) -> Any:
         """Deserializes the value from the database or object storage.
 
-        Compression is inferred from the file extension.
+        Compression and format are inferred from the file extension.
         """
         data = BaseXCom.deserialize_value(result)
         try:
@@ -159,11 +306,23 @@ class XComObjectStorageBackend(BaseXCom):
         except (TypeError, ValueError):  # Likely value stored directly in the database.
             return data
         try:
-            with path.open(mode="rb", compression="infer") as f:
-                return json.load(f, cls=XComDecoder)
+            return StoredXComValue(path).load()
         except (TypeError, ValueError):
             return data
 
+    @staticmethod
+    def get_stored_value(result: XCom) -> StoredXComValue | None:
+        """Get a handle to the value of the XCom if it is stored in object storage, else None.
+
+        Unlike :meth:`deserialize_value`, this does not load the value, so that large values can be
+        streamed or memory-mapped.
+        """
+        data = BaseXCom.deserialize_value(result)
+        try:
+            return StoredXComValue(XComObjectStorageBackend._get_full_path(data))
+        except (TypeError, ValueError):
+            return None
+
     @staticmethod
     def purge(xcom: XCom, session: Session) -> None:
         if not isinstance(xcom.value, str):
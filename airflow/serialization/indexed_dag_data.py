@@ -0,0 +1,244 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Indexed binary storage format of serialized DAGs.
+
+The serialized DAG dict is split into sections that are compressed separately: the DAG-level attributes,
+the DAG dependencies and every task. A header maps each section to its position in the blob, so one task,
+the DAG attributes or the DAG dependencies can be read without decompressing and parsing the rest::
+
+    b"AFSD" | format version (1 byte) | dag dependencies length (4 bytes, big endian)
+        | header length (4 bytes, big endian) | zlib(dag dependencies) | zlib(header) | sections...
+
+The DAG dependencies come first, so they can be decoded from the beginning of the blob alone, without
+reading the rest from the database. The header is a JSON document holding the serializer version, the
+position of the ``dag`` section, and for each task its ID, position and downstream task IDs. Sections are
+small, so they are compressed with a preset dictionary made of the first tasks, stored compressed before
+the sections, which makes the blob almost as small as the whole document compressed at once.
+"""
+
+from __future__ import annotations
+
+import struct
+import zlib
+from typing import Any, Iterator
+
+from airflow.serialization.enums import DagAttributeTypes as DAT, Encoding
+from airflow.settings import json
+
+MAGIC = b"AFSD"
+FORMAT_VERSION = 1
+
+_PREAMBLE = struct.Struct(">4sBII")
+
+# Size limit of the preset dictionary, zlib only uses the last 32 KiB of it.
+_ZDICT_SIZE = 32 * 1024
+
+
+def is_indexed_dag_data(blob: bytes | None) -> bool:
+    """Whether the blob is a serialized DAG stored in the indexed format."""
+    return bool(blob) and bytes(blob[: len(MAGIC)]) == MAGIC
+
+
+def _unpack_preamble(data: bytes) -> tuple[int, int]:
+    """Return the lengths of the DAG dependencies and of the header."""
+    magic, version, dag_dependencies_length, header_length = _PREAMBLE.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("Serialized DAG is not in the indexed format")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsure how to read indexed serialized DAG format version {version!r}")
+    return dag_dependencies_length, header_length
+
+
+def get_dag_dependencies_end(data: bytes) -> int:
+    """
+    Get the number of bytes at the beginning of a blob needed to decode its DAG dependencies.
+
+    :param data: The blob, or a prefix of it of at least 13 bytes.
+    """
+    dag_dependencies_length, _ = _unpack_preamble(data)
+    return _PREAMBLE.size + dag_dependencies_length
+
+
+def decode_dag_dependencies(data: bytes) -> list[dict[str, Any]] | None:
+    """
+    Decode the serialized DAG dependencies of a blob.
+
+    :param data: The blob, or a prefix of it of at least :func:`get_dag_dependencies_end` bytes.
+    """
+    end = get_dag_dependencies_end(data)
+    if len(data) < end:
+        raise ValueError("Serialized DAG is truncated before the end of its DAG dependencies")
+    return json.loads(zlib.decompress(memoryview(data)[_PREAMBLE.size : end]))
+
+
+def _encode_section(obj: Any, zdict: bytes = b"") -> bytes:
+    compressor = zlib.compressobj(zdict=zdict) if zdict else zlib.compressobj()
+    return compressor.compress(json.dumps(obj).encode("utf-8")) + compressor.flush()
+
+
+def _make_zdict(tasks: list[dict[str, Any]]) -> bytes:
+    """Build a preset dictionary from the first tasks, most common strings last as zlib prefers."""
+    samples = []
+    size = 0
+    for obj in tasks:
+        sample = json.dumps(obj).encode("utf-8")
+        if size + len(sample) > _ZDICT_SIZE:
+            break
+        samples.append(sample)
+        size += len(sample)
+    return b"".join(reversed(samples))
+
+
+def _get_encoded_task_fields(obj: dict[str, Any]) -> dict[str, Any]:
+    if obj.get(Encoding.TYPE) == DAT.OP:
+        return obj[Encoding.VAR]
+    return obj  # todo: remove in Airflow 3.0 (backcompat for pre-2.10)
+
+
+def encode_indexed_dag_data(dag_data: dict[str, Any]) -> bytes:
+    """
+    Encode a serialized DAG, as returned by ``SerializedDAG.to_dict``, in the indexed format.
+
+    :param dag_data: The serialized DAG.
+    :return: The encoded blob.
+    """
+    dag_attributes = dict(dag_data["dag"])
+    tasks = dag_attributes.pop("tasks", [])
+    dag_dependencies = dag_attributes.pop("dag_dependencies", None)
+
+    sections: list[bytes] = []
+    offset = 0
+    zdict = _make_zdict(tasks)
+
+    def add_section(obj: Any, compress_with_zdict: bool = True) -> list[int]:
+        nonlocal offset
+        section = _encode_section(obj, zdict if compress_with_zdict else b"")
+        sections.append(section)
+        position = [offset, len(section)]
+        offset += len(section)
+        return position
+
+    header: dict[str, Any] = {
+        "__version": dag_data.get("__version"),
+        "zdict": add_section(zdict.decode("utf-8"), compress_with_zdict=False),
+        "dag": add_section(dag_attributes),
+        "tasks": [],
+    }
+    for obj in tasks:
+        fields = _get_encoded_task_fields(obj)
+        header["tasks"].append(
+            [fields["task_id"], *add_section(obj), sorted(fields.get("downstream_task_ids", ()))]
+        )
+
+    encoded_dag_dependencies = _encode_section(dag_dependencies)
+    encoded_header = _encode_section(header)
+    preamble = _PREAMBLE.pack(MAGIC, FORMAT_VERSION, len(encoded_dag_dependencies), len(encoded_header))
+    return b"".join([preamble, encoded_dag_dependencies, encoded_header, *sections])
+
+
+class IndexedTasks:
+    """
+    Tasks of an indexed serialized DAG, decoded one at a time.
+
+    Iterating yields the encoded tasks in their original order, like the ``tasks`` list of the serialized
+    DAG. :meth:`get` and :meth:`iter_downstream_task_ids` only decode what they return.
+    """
+
+    def __init__(self, indexed_dag_data: IndexedDagData, index: list[list[Any]]):
+        self._data = indexed_dag_data
+        self._index = {task_id: (offset, length, downstream) for task_id, offset, length, downstream in index}
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        for offset, length, _ in self._index.values():
+            yield self._data._decode_section(offset, length)
+
+    @property
+    def task_ids(self) -> list[str]:
+        return list(self._index)
+
+    def get(self, task_id: str) -> dict[str, Any]:
+        """Decode the encoded task with the given ID."""
+        offset, length, _ = self._index[task_id]
+        return self._data._decode_section(offset, length)
+
+    def iter_downstream_task_ids(self) -> Iterator[tuple[str, list[str]]]:
+        """Yield each task ID with the IDs of its downstream tasks, without decoding any task."""
+        for task_id, (_, _, downstream) in self._index.items():
+            yield task_id, downstream
+
+
+class IndexedDagData:
+    """
+    Read access to a serialized DAG stored in the indexed format.
+
+    Only the header is decoded up front; sections are decoded when they are accessed.
+
+    :param blob: The encoded serialized DAG.
+    """
+
+    def __init__(self, blob: bytes):
+        self._blob = memoryview(blob)
+        dag_dependencies_length, header_length = _unpack_preamble(self._blob)
+        header_start = _PREAMBLE.size + dag_dependencies_length
+        self._sections_start = header_start + header_length
+        self._header = json.loads(zlib.decompress(self._blob[header_start : self._sections_start]))
+        self._zdict: bytes | None = None
+
+    def _decode_section(self, offset: int, length: int, use_zdict: bool = True) -> Any:
+        start = self._sections_start + offset
+        section = self._blob[start : start + length]
+        if not use_zdict:
+            return json.loads(zlib.decompress(section))
+        if self._zdict is None:
+            self._zdict = self._decode_section(*self._header["zdict"], use_zdict=False).encode("utf-8")
+        decompressor = zlib.decompressobj(zdict=self._zdict) if self._zdict else zlib.decompressobj()
+        return json.loads(decompressor.decompress(section) + decompressor.flush())
+
+    @property
+    def dag_attributes(self) -> dict[str, Any]:
+        """The DAG-level attributes, i.e. the serialized DAG without its tasks and DAG dependencies."""
+        return self._decode_section(*self._header["dag"])
+
+    @property
+    def dag_dependencies(self) -> list[dict[str, Any]] | None:
+        """The serialized DAG dependencies."""
+        return decode_dag_dependencies(self._blob)
+
+    @property
+    def tasks(self) -> IndexedTasks:
+        """The encoded tasks of the DAG."""
+        return IndexedTasks(self, self._header["tasks"])
+
+    def to_dict(self, decode_tasks: bool = True) -> dict[str, Any]:
+        """
+        Rebuild the serialized DAG, as returned by ``SerializedDAG.to_dict``.
+
+        :param decode_tasks: Whether to decode the tasks. If not, ``tasks`` is an :class:`IndexedTasks`
+            that decodes them when they are needed.
+        """
+        dag_data = self.dag_attributes
+        tasks = self.tasks
+        dag_data["tasks"] = list(tasks) if decode_tasks else tasks
+        dag_dependencies = self.dag_dependencies
+        if dag_dependencies is not None:
+            dag_data["dag_dependencies"] = dag_dependencies
+        return {"__version": self._header["__version"], "dag": dag_data}
@@ -19,6 +19,7 @@
 from __future__ import annotations
 
 import collections.abc
+import contextlib
 import datetime
 import enum
 import inspect
@@ -28,7 +29,7 @@ import weakref
 from dataclasses import dataclass
 from inspect import signature
 from textwrap import dedent
-from typing import TYPE_CHECKING, Any, Collection, Iterable, Mapping, NamedTuple, Union
+from typing import TYPE_CHECKING, Any, Collection, Iterable, Iterator, Mapping, NamedTuple, Union, cast
 
 import attrs
 import lazy_object_proxy
@@ -38,7 +39,13 @@ from pendulum.tz.timezone import FixedTimezone, Timezone
 from airflow.compat.functools import cache
 from airflow.configuration import conf
 from airflow.datasets import BaseDataset, Dataset, DatasetAll, DatasetAny
-from airflow.exceptions import AirflowException, RemovedInAirflow3Warning, SerializationError, TaskDeferred
+from airflow.exceptions import (
+    AirflowDagCycleException,
+    AirflowException,
+    RemovedInAirflow3Warning,
+    SerializationError,
+    TaskDeferred,
+)
 from airflow.jobs.job import Job
 from airflow.models.baseoperator import BaseOperator
 from airflow.models.connection import Connection
@@ -53,6 +60,7 @@ from airflow.models.xcom_arg import XComArg, deserialize_xcom_arg, serialize_xco
 from airflow.providers_manager import ProvidersManager
 from airflow.serialization.enums import DagAttributeTypes as DAT, Encoding
 from airflow.serialization.helpers import serialize_template_field
+from airflow.serialization.indexed_dag_data import IndexedTasks
 from airflow.serialization.json_schema import load_dag_schema
 from airflow.serialization.pydantic.dag import DagModelPydantic
 from airflow.serialization.pydantic.dag_run import DagRunPydantic
@@ -69,6 +77,7 @@ from airflow.task.priority_strategy import (
 from airflow.triggers.base import BaseTrigger, StartTriggerArgs
 from airflow.utils.code_utils import get_python_source
 from airflow.utils.context import Context, OutletEventAccessor, OutletEventAccessors
+from airflow.utils.dag_edges import dag_edges
 from airflow.utils.docs import get_docs_url
 from airflow.utils.module_loading import import_string, qualname
 from airflow.utils.operator_resources import Resources
@@ -1248,6 +1257,11 @@ class SerializedBaseOperator(BaseOperator, BaseSerialization):
             if isinstance(kwargs_ref := getattr(task, k, None), _ExpandInputRef):
                 setattr(task, k, kwargs_ref.deref(dag))
 
+        if isinstance(dag.task_dict, _LazyTaskDict):
+            # Other tasks may not be deserialized yet, take the edges from the encoded tasks instead.
+            task.upstream_task_ids.update(dag.task_dict.get_upstream_task_ids(task.task_id))
+            return
+
         for task_id in task.downstream_task_ids:
             # Bypass set_upstream etc here - it does more than we want
             dag.task_dict[task_id].upstream_task_ids.add(task.task_id)
@@ -1460,6 +1474,155 @@ class SerializedBaseOperator(BaseOperator, BaseSerialization):
         return BaseSerialization.deserialize(encoded_var=encoded_var, use_pydantic_models=use_pydantic_models)
 
 
+def _get_encoded_operator(obj: dict[str, Any]) -> dict[str, Any]:
+    if obj.get(Encoding.TYPE) == DAT.OP:
+        return obj[Encoding.VAR]
+    return obj  # todo: remove in Airflow 3.0 (backcompat for pre-2.10)
+
+
+class _LazyTaskDict(collections.abc.MutableMapping):
+    """
+    Task dict of a DAG deserialized with ``lazy=True``.
+
+    Operators are kept in their encoded form and only deserialized when first accessed. The upstream and
+    downstream task IDs of every task are indexed from the encoded tasks, so the edges of the task graph
+    are available without deserializing any operator. With tasks read from the indexed storage format,
+    a task is not even decoded until its operator is needed.
+    """
+
+    def __init__(self, dag: SerializedDAG, encoded_tasks: list[dict[str, Any]] | IndexedTasks):
+        self._dag = dag
+        self._load_operator_extra_links = dag._load_operator_extra_links
+        self._tasks: dict[str, Operator | None] = {}
+        # Encoded tasks not deserialized yet, None for the ones still to be decoded from _indexed_tasks
+        self._encoded_tasks: dict[str, dict[str, Any] | None] = {}
+        self._indexed_tasks: IndexedTasks | None = None
+        self._downstream_task_ids: dict[str, set[str]] = {}
+        self._upstream_task_ids: dict[str, set[str]] = collections.defaultdict(set)
+        self._task_groups: dict[str, TaskGroup] = {}
+
+        edges: Iterable[tuple[str, Iterable[str]]]
+        if isinstance(encoded_tasks, IndexedTasks):
+            self._indexed_tasks = encoded_tasks
+            edges = encoded_tasks.iter_downstream_task_ids()
+        else:
+            edges = self._index_encoded_tasks(encoded_tasks)
+        for task_id, downstream_task_ids in edges:
+            self._tasks[task_id] = None
+            self._encoded_tasks.setdefault(task_id, None)
+            self._downstream_task_ids[task_id] = set(downstream_task_ids)
+            for downstream_task_id in downstream_task_ids:
+                self._upstream_task_ids[downstream_task_id].add(task_id)
+
+    def _index_encoded_tasks(self, encoded_tasks: list[dict[str, Any]]) -> Iterator[tuple[str, list[str]]]:
+        for obj in encoded_tasks:
+            encoded_op = _get_encoded_operator(obj)
+            task_id = encoded_op["task_id"]
+            self._encoded_tasks[task_id] = encoded_op
+            yield task_id, encoded_op.get("downstream_task_ids", encoded_op.get("_downstream_task_ids", ()))
+
+    def __getitem__(self, task_id: str) -> Operator:
+        task = self._tasks[task_id]
+        if task is None:
+            task = self._deserialize_task(task_id)
+        return task
+
+    def __setitem__(self, task_id: str, task: Operator) -> None:
+        self._tasks[task_id] = task
+        self._encoded_tasks.pop(task_id, None)
+
+    def __delitem__(self, task_id: str) -> None:
+        del self._tasks[task_id]
+        self._encoded_tasks.pop(task_id, None)
+
+    def __iter__(self):
+        return iter(self._tasks)
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def __contains__(self, task_id: object) -> bool:
+        return task_id in self._tasks
+
+    def __copy__(self) -> dict[str, Operator]:
+        return dict(self.items())
+
+    @property
+    def num_deserialized_tasks(self) -> int:
+        """Number of operators deserialized so far."""
+        return len(self._tasks) - len(self._encoded_tasks)
+
+    def get_upstream_task_ids(self, task_id: str) -> set[str]:
+        """IDs of the tasks directly upstream of the given task, as stored in the serialized DAG."""
+        if task_id not in self._tasks:
+            raise KeyError(task_id)
+        return set(self._upstream_task_ids.get(task_id, ()))
+
+    def get_downstream_task_ids(self, task_id: str) -> set[str]:
+        """IDs of the tasks directly downstream of the given task, as stored in the serialized DAG."""
+        if task_id not in self._tasks:
+            raise KeyError(task_id)
+        return set(self._downstream_task_ids[task_id])
+
+    def set_task_group(self, task_id: str, task_group: TaskGroup) -> None:
+        """Record the task group a task belongs to, to be set on the operator once deserialized."""
+        self._task_groups[task_id] = task_group
+        task = self._tasks.get(task_id)
+        if task is not None:
+            task.task_group = weakref.proxy(task_group)
+
+    def _deserialize_task(self, task_id: str) -> Operator:
+        SerializedBaseOperator._load_operator_extra_links = self._load_operator_extra_links
+        encoded_op = self._encoded_tasks.pop(task_id)
+        if encoded_op is None:
+            encoded_op = _get_encoded_operator(cast(IndexedTasks, self._indexed_tasks).get(task_id))
+        task = SerializedBaseOperator.deserialize_operator(encoded_op)
+        self._tasks[task_id] = task
+        if task_id in self._task_groups:
+            task.task_group = weakref.proxy(self._task_groups[task_id])
+        SerializedBaseOperator.set_task_dag_references(task, self._dag)
+        return task
+
+
+class _LazyTaskGroupChildren(collections.abc.MutableMapping):
+    """Children of a task group of a DAG deserialized with ``lazy=True``, resolving tasks on access."""
+
+    def __init__(self, task_dict: _LazyTaskDict):
+        self._task_dict = task_dict
+        self._children: dict[str, DAGNode | None] = {}
+        self._task_ids: dict[str, str] = {}
+
+    def add_task_ref(self, label: str, task_id: str) -> None:
+        self._children[label] = None
+        self._task_ids[label] = task_id
+
+    def __getitem__(self, label: str) -> DAGNode:
+        child = self._children[label]
+        if child is None:
+            child = self._children[label] = self._task_dict[self._task_ids.pop(label)]
+        return child
+
+    def __setitem__(self, label: str, child: DAGNode) -> None:
+        self._children[label] = child
+        self._task_ids.pop(label, None)
+
+    def __delitem__(self, label: str) -> None:
+        del self._children[label]
+        self._task_ids.pop(label, None)
+
+    def __iter__(self):
+        return iter(self._children)
+
+    def __len__(self) -> int:
+        return len(self._children)
+
+    def __contains__(self, label: object) -> bool:
+        return label in self._children
+
+    def __copy__(self) -> dict[str, DAGNode]:
+        return dict(self.items())
+
+
 class SerializedDAG(DAG, BaseSerialization):
     """
     A JSON serializable representation of DAG.
@@ -1475,6 +1638,9 @@ class SerializedDAG(DAG, BaseSerialization):
 
     _decorated_fields = {"schedule_interval", "default_args", "_access_control"}
 
+    # Edges of the Graph view stored at serialization time, as [source_id, target_id(, is_setup_teardown)]
+    _dag_edges: list[list] | None = None
+
     @staticmethod
     def __get_constructor_defaults():
         param_to_attr = {
@@ -1523,6 +1689,13 @@ class SerializedDAG(DAG, BaseSerialization):
 
             # Edge info in the JSON exactly matches our internal structure
             serialized_dag["edge_info"] = dag.edge_info
+            # The edges of the Graph view, so that they are not computed again when rendering it
+            serialized_dag["_dag_edges"] = [
+                [edge["source_id"], edge["target_id"], True]
+                if edge.get("is_setup_teardown")
+                else [edge["source_id"], edge["target_id"]]
+                for edge in dag_edges(dag)
+            ]
             serialized_dag["params"] = cls._serialize_params_dict(dag.params)
 
             # has_on_*_callback are only stored if the value is True, as the default is False
@@ -1537,24 +1710,33 @@ class SerializedDAG(DAG, BaseSerialization):
             raise SerializationError(f"Failed to serialize DAG {dag.dag_id!r}: {e}")
 
     @classmethod
-    def deserialize_dag(cls, encoded_dag: dict[str, Any]) -> SerializedDAG:
-        """Deserializes a DAG from a JSON object."""
+    def deserialize_dag(cls, encoded_dag: dict[str, Any], lazy: bool = False) -> SerializedDAG:
+        """
+        Deserializes a DAG from a JSON object.
+
+        :param encoded_dag: The encoded DAG.
+        :param lazy: Only deserialize operators when they are first accessed through ``task_dict``. The
+            upstream and downstream task IDs of each task are available through
+            :meth:`get_upstream_task_ids` and :meth:`get_downstream_task_ids` without deserializing them.
+        """
         dag = SerializedDAG(dag_id=encoded_dag["_dag_id"])
+        # Tasks of DAGs serialized before task groups were introduced are all needed to build the root group
+        lazy = lazy and "_task_group" in encoded_dag
 
         for k, v in encoded_dag.items():
             if k == "_downstream_task_ids":
                 v = set(v)
             elif k == "tasks":
-                SerializedBaseOperator._load_operator_extra_links = cls._load_operator_extra_links
-                tasks = {}
-                for obj in v:
-                    if obj.get(Encoding.TYPE) == DAT.OP:
-                        deser = SerializedBaseOperator.deserialize_operator(obj[Encoding.VAR])
-                        tasks[deser.task_id] = deser
-                    else:  # todo: remove in Airflow 3.0 (backcompat for pre-2.10)
-                        tasks[obj["task_id"]] = SerializedBaseOperator.deserialize_operator(obj)
                 k = "task_dict"
-                v = tasks
+                if lazy:
+                    v = _LazyTaskDict(dag, v)
+                else:
+                    SerializedBaseOperator._load_operator_extra_links = cls._load_operator_extra_links
+                    tasks = {}
+                    for obj in v:
+                        deser = SerializedBaseOperator.deserialize_operator(_get_encoded_operator(obj))
+                        tasks[deser.task_id] = deser
+                    v = tasks
             elif k == "timezone":
                 v = cls._deserialize_timezone(v)
             elif k == "dagrun_timeout":
@@ -1609,11 +1791,30 @@ class SerializedDAG(DAG, BaseSerialization):
         for k in keys_to_set_none:
             setattr(dag, k, None)
 
-        for task in dag.task_dict.values():
-            SerializedBaseOperator.set_task_dag_references(task, dag)
+        if not isinstance(dag.task_dict, _LazyTaskDict):
+            for task in dag.task_dict.values():
+                SerializedBaseOperator.set_task_dag_references(task, dag)
+
+        return dag
 
+    def partial_subset(self, *args, **kwargs):
+        dag = super().partial_subset(*args, **kwargs)
+        # The stored edges are the ones of the whole DAG
+        dag._dag_edges = None
         return dag
 
+    def get_upstream_task_ids(self, task_id: str) -> set[str]:
+        """Return the IDs of the tasks directly upstream of a task, without deserializing operators."""
+        if isinstance(self.task_dict, _LazyTaskDict):
+            return self.task_dict.get_upstream_task_ids(task_id)
+        return set(self.task_dict[task_id].upstream_task_ids)
+
+    def get_downstream_task_ids(self, task_id: str) -> set[str]:
+        """Return the IDs of the tasks directly downstream of a task, without deserializing operators."""
+        if isinstance(self.task_dict, _LazyTaskDict):
+            return self.task_dict.get_downstream_task_ids(task_id)
+        return set(self.task_dict[task_id].downstream_task_ids)
+
     @classmethod
     def _is_excluded(cls, var: Any, attrname: str, op: DAGNode):
         # {} is explicitly different from None in the case of DAG-level access control
@@ -1632,12 +1833,17 @@ class SerializedDAG(DAG, BaseSerialization):
         return json_dict
 
     @classmethod
-    def from_dict(cls, serialized_obj: dict) -> SerializedDAG:
-        """Deserializes a python dict in to the DAG and operators it contains."""
+    def from_dict(cls, serialized_obj: dict, lazy: bool = False) -> SerializedDAG:
+        """
+        Deserializes a python dict in to the DAG and operators it contains.
+
+        :param serialized_obj: The serialized DAG.
+        :param lazy: Only deserialize operators when they are first accessed, see :meth:`deserialize_dag`.
+        """
         ver = serialized_obj.get("__version", "<not present>")
         if ver != cls.SERIALIZER_VERSION:
             raise ValueError(f"Unsure how to deserialize version {ver!r}")
-        return cls.deserialize_dag(serialized_obj["dag"])
+        return cls.deserialize_dag(serialized_obj["dag"], lazy=lazy)
 
 
 class TaskGroupSerialization(BaseSerialization):
@@ -1675,6 +1881,10 @@ class TaskGroupSerialization(BaseSerialization):
             }
             encoded["is_mapped"] = True
 
+        # Stored so that the children are not sorted again when rendering the DAG
+        with contextlib.suppress(AirflowDagCycleException):
+            encoded["topological_order"] = [child.node_id for child in task_group.topological_sort()]
+
         return encoded
 
     @classmethod
@@ -1682,7 +1892,7 @@ class TaskGroupSerialization(BaseSerialization):
         cls,
         encoded_group: dict[str, Any],
         parent_group: TaskGroup | None,
-        task_dict: dict[str, Operator],
+        task_dict: Mapping[str, Operator],
         dag: SerializedDAG,
     ) -> TaskGroup:
         """Deserializes a TaskGroup from a JSON object."""
@@ -1708,18 +1918,36 @@ class TaskGroupSerialization(BaseSerialization):
             task.task_group = weakref.proxy(group)
             return task
 
-        group.children = {
-            label: (
-                set_ref(task_dict[val])
-                if _type == DAT.OP
-                else cls.deserialize_task_group(val, group, task_dict, dag=dag)
-            )
-            for label, (_type, val) in encoded_group["children"].items()
-        }
+        if isinstance(task_dict, _LazyTaskDict):
+            children = _LazyTaskGroupChildren(task_dict)
+            for label, (_type, val) in encoded_group["children"].items():
+                if _type == DAT.OP:
+                    task_dict.set_task_group(val, group)
+                    children.add_task_ref(label, val)
+                else:
+                    children[label] = cls.deserialize_task_group(val, group, task_dict, dag=dag)
+            group.children = children
+        else:
+            group.children = {
+                label: (
+                    set_ref(task_dict[val])
+                    if _type == DAT.OP
+                    else cls.deserialize_task_group(val, group, task_dict, dag=dag)
+                )
+                for label, (_type, val) in encoded_group["children"].items()
+            }
         group.upstream_group_ids.update(cls.deserialize(encoded_group["upstream_group_ids"]))
         group.downstream_group_ids.update(cls.deserialize(encoded_group["downstream_group_ids"]))
         group.upstream_task_ids.update(cls.deserialize(encoded_group["upstream_task_ids"]))
         group.downstream_task_ids.update(cls.deserialize(encoded_group["downstream_task_ids"]))
+        # The order is ignored if it does not match the children, which are then sorted again
+        topological_order = encoded_group.get("topological_order")
+        if (
+            topological_order is not None
+            and len(topological_order) == len(group.children)
+            and set(topological_order) == set(group.children)
+        ):
+            group._topological_order = topological_order
         return group
 
 
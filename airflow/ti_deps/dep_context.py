@@ -17,6 +17,7 @@
 # under the License.
 from __future__ import annotations
 
+from collections import defaultdict
 from typing import TYPE_CHECKING
 
 import attr
@@ -84,6 +85,9 @@ class DepContext:
     have_changed_ti_states: bool = False
     """Have any of the TIs state's been changed as a result of evaluating dependencies"""
 
+    _finished_tis_by_task_id: dict[str, list[TaskInstance]] | None = attr.ib(default=None, init=False)
+    _finished_tis_by_task_id_source: list[TaskInstance] | None = attr.ib(default=None, init=False)
+
     def ensure_finished_tis(self, dag_run: DagRun, session: Session) -> list[TaskInstance]:
         """
         Ensure finished_tis is populated if it's currently None, which allows running tasks without dag_run.
@@ -104,3 +108,25 @@ class DepContext:
         else:
             finished_tis = self.finished_tis
         return finished_tis
+
+    def ensure_finished_tis_by_task_id(
+        self, dag_run: DagRun, session: Session
+    ) -> dict[str, list[TaskInstance]]:
+        """
+        Ensure the finished task instances of the run are grouped by task_id.
+
+        The grouping is computed once per context, so that evaluating the upstream states of every
+        schedulable task instance of a run only looks at the finished task instances of its upstream tasks
+        instead of scanning all finished task instances of the run each time.
+
+        :param dag_run: The DagRun for which to find finished tasks
+        :return: A mapping of task_id to the finished task instances of that task
+        """
+        finished_tis = self.ensure_finished_tis(dag_run, session)
+        if self._finished_tis_by_task_id is None or self._finished_tis_by_task_id_source is not finished_tis:
+            finished_tis_by_task_id: dict[str, list[TaskInstance]] = defaultdict(list)
+            for ti in finished_tis:
+                finished_tis_by_task_id[ti.task_id].append(ti)
+            self._finished_tis_by_task_id = dict(finished_tis_by_task_id)
+            self._finished_tis_by_task_id_source = finished_tis
+        return self._finished_tis_by_task_id
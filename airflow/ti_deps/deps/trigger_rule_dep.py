@@ -196,6 +196,16 @@ class TriggerRuleDep(BaseTIDep):
                 return True
             return False
 
+        def _iter_finished_upstream_tis(relevant_ids: set[str] | KeysView[str]) -> Iterator[TaskInstance]:
+            """Iterate over the finished tis of the run that are relevant upstreams of the current ti."""
+            finished_tis_by_task_id = dep_context.ensure_finished_tis_by_task_id(
+                ti.get_dagrun(session), session
+            )
+            for upstream_id in relevant_ids:
+                for finished_ti in finished_tis_by_task_id.get(upstream_id, ()):
+                    if _is_relevant_upstream(upstream=finished_ti, relevant_ids=relevant_ids):
+                        yield finished_ti
+
         def _iter_upstream_conditions(relevant_tasks: dict) -> Iterator[ColumnOperators]:
             # Optimization: If the current task is not in a mapped task group,
             # it depends on all upstream task instances.
@@ -243,12 +253,9 @@ class TriggerRuleDep(BaseTIDep):
             task = ti.task
 
             indirect_setups = {k: v for k, v in relevant_setups.items() if k not in task.upstream_task_ids}
-            finished_upstream_tis = (
-                x
-                for x in dep_context.ensure_finished_tis(ti.get_dagrun(session), session)
-                if _is_relevant_upstream(upstream=x, relevant_ids=indirect_setups.keys())
+            upstream_states = _UpstreamTIStates.calculate(
+                _iter_finished_upstream_tis(relevant_ids=indirect_setups.keys())
             )
-            upstream_states = _UpstreamTIStates.calculate(finished_upstream_tis)
 
             # all of these counts reflect indirect setups which are relevant for this ti
             success = upstream_states.success
@@ -334,12 +341,9 @@ class TriggerRuleDep(BaseTIDep):
             upstream_tasks = {t.task_id: t for t in task.upstream_list}
             trigger_rule = task.trigger_rule
 
-            finished_upstream_tis = (
-                finished_ti
-                for finished_ti in dep_context.ensure_finished_tis(ti.get_dagrun(session), session)
-                if _is_relevant_upstream(upstream=finished_ti, relevant_ids=ti.task.upstream_task_ids)
+            upstream_states = _UpstreamTIStates.calculate(
+                _iter_finished_upstream_tis(relevant_ids=ti.task.upstream_task_ids)
             )
-            upstream_states = _UpstreamTIStates.calculate(finished_upstream_tis)
 
             success = upstream_states.success
             skipped = upstream_states.skipped
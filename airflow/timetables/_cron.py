@@ -16,8 +16,13 @@
 # under the License.
 from __future__ import annotations
 
+import bisect
 import datetime
-from typing import TYPE_CHECKING, Any
+import functools
+import itertools
+import math
+import threading
+from typing import TYPE_CHECKING, Any, Iterator
 
 from cron_descriptor import CasingTypeEnum, ExpressionDescriptor, FormatException, MissingFieldException
 from croniter import CroniterBadCronError, CroniterBadDateError, croniter
@@ -59,6 +64,216 @@ def _covers_every_hour(cron: croniter) -> bool:
     return cron.expanded[1] == ["*"]
 
 
+def _iter_croniter(cron: croniter) -> Iterator[datetime.datetime]:
+    while True:
+        yield cron.get_next(datetime.datetime)
+
+
+# How many days without a fire time before giving up, like croniter does for impossible dates.
+_MAX_DAYS_WITHOUT_FIRE_TIME = 366 * 50
+
+
+def _iter_fire_times(
+    expression: str, cron: croniter, start: datetime.datetime
+) -> Iterator[datetime.datetime]:
+    """
+    Iterate over the naive fire times of a cron expression, parsed as ``cron``, after ``start``.
+
+    Simple expressions are expanded day by day from the fields parsed by croniter, which is much faster
+    than asking croniter for each fire time. Expressions using ``L``, ``#`` or more than five fields are
+    left to croniter.
+
+    :raise CroniterBadDateError: If no fire time can be found.
+    """
+    minute_field, hour_field, dom_field, month_field, dow_field = (cron.expanded + [[]] * 5)[:5]
+    if len(cron.expanded) != 5 or cron.nth_weekday_of_month or "l" in dom_field:
+        yield from _iter_croniter(croniter(expression, start_time=start))
+        return
+
+    times = [
+        datetime.time(hour, minute)
+        for hour in (range(24) if hour_field == ["*"] else hour_field)
+        for minute in (range(60) if minute_field == ["*"] else minute_field)
+    ]
+    months = None if month_field == ["*"] else set(month_field)
+    days_of_month = None if dom_field == ["*"] else set(dom_field)
+    # croniter uses 0 for Sunday, Python uses 6
+    weekdays = None if dow_field == ["*"] else {(day - 1) % 7 for day in dow_field}
+
+    day = start.date()
+    # The times of the first day that are not after start are skipped
+    skipped = bisect.bisect_right(times, start.time())
+    days_without_fire_time = 0
+    one_day = datetime.timedelta(days=1)
+    while days_without_fire_time < _MAX_DAYS_WITHOUT_FIRE_TIME:
+        if months is None or day.month in months:
+            if days_of_month is None and weekdays is None:
+                matches = True
+            elif days_of_month is None:
+                matches = day.weekday() in weekdays  # type: ignore[operator]
+            elif weekdays is None:
+                matches = day.day in days_of_month
+            else:
+                # Like croniter and Vixie cron, a day matches either field when both are restricted
+                matches = day.day in days_of_month or day.weekday() in weekdays
+            if matches:
+                days_without_fire_time = 0
+                for time in itertools.islice(times, skipped, None):
+                    yield datetime.datetime.combine(day, time)
+        skipped = 0
+        days_without_fire_time += 1
+        day += one_day
+    raise CroniterBadDateError("failed to find next date")
+
+
+class _CronSegment:
+    """Consecutive fire times of a cron expression, all with the same UTC offset in the timezone."""
+
+    __slots__ = ("fire_times", "offset", "start", "timestamps", "times", "end", "chunk_size")
+
+    def __init__(
+        self, fire_times: Iterator[datetime.datetime], offset: datetime.timedelta | None, start: float
+    ) -> None:
+        self.fire_times: Iterator[datetime.datetime] | None = fire_times
+        self.offset = offset
+        # All the fire times from this timestamp on are in the segment.
+        self.start = start
+        self.timestamps: list[float] = []
+        self.times: list[DateTime] = []
+        # Once the segment cannot be extended, the timestamp of the fire time that follows it.
+        self.end = math.inf
+        # Start small for isolated lookups, and compute more at once as the segment is iterated over.
+        self.chunk_size = 4
+
+    def close(self, end: float) -> None:
+        self.fire_times = None
+        self.end = end
+
+
+class CronSchedule:
+    """
+    Fire times of a cron expression in a timezone, computed in bulk and cached.
+
+    Fire times are computed by chunks, and kept in segments of consecutive fire times that share the same
+    UTC offset. Within such a segment, wall clock and UTC times are in the same order, so the next or
+    previous fire time of a time with that offset is found by bisecting the cached timestamps. Lookups
+    next to a DST transition return None, and callers compute those fire times one at a time, with the
+    fold hour handling of :class:`CronMixin`.
+
+    Use :func:`get_cron_schedule` to get the instance shared by all the timetables with the same cron
+    expression and timezone.
+    """
+
+    max_chunk_size = 1024
+    max_segment_size = 16384
+    max_segments = 4
+
+    def __init__(self, expression: str, timezone: Timezone | FixedTimezone) -> None:
+        self._expression = expression
+        self._timezone = timezone
+        self._cron = croniter(expression)
+        self._segments: list[_CronSegment] = []
+        self._lock = threading.Lock()
+
+    def _extend(self, segment: _CronSegment) -> None:
+        if segment.fire_times is None:
+            return
+        chunk_size = segment.chunk_size
+        segment.chunk_size = min(chunk_size * 2, self.max_chunk_size)
+        try:
+            for fire_time in itertools.islice(segment.fire_times, chunk_size):
+                scheduled = make_aware(fire_time, self._timezone)
+                if scheduled.utcoffset() != segment.offset:
+                    # The next fire time is past a DST transition, the segment cannot go further.
+                    segment.close(scheduled.timestamp())
+                    return
+                segment.timestamps.append(scheduled.timestamp())
+                segment.times.append(convert_to_utc(scheduled))
+        except CroniterBadDateError:
+            segment.close(math.inf)
+            return
+        if len(segment.timestamps) > self.max_segment_size:
+            # Slide the segment forward, iterating over fire times usually goes forward.
+            del segment.timestamps[:chunk_size]
+            del segment.times[:chunk_size]
+            segment.start = segment.timestamps[0]
+
+    def _new_segment(self, current: DateTime, offset: datetime.timedelta | None, prev: bool) -> _CronSegment:
+        naive = make_naive(current, self._timezone)
+        if not prev:
+            segment = _CronSegment(
+                _iter_fire_times(self._expression, self._cron, naive), offset, current.timestamp()
+            )
+        else:
+            first = make_aware(
+                croniter(self._expression, start_time=naive).get_prev(datetime.datetime), self._timezone
+            )
+            segment = _CronSegment(
+                _iter_fire_times(self._expression, self._cron, make_naive(first, self._timezone)),
+                offset,
+                first.timestamp(),
+            )
+            if first.utcoffset() != offset:
+                segment.close(math.inf)
+            else:
+                segment.timestamps.append(first.timestamp())
+                segment.times.append(convert_to_utc(first))
+        self._extend(segment)
+        if len(self._segments) >= self.max_segments:
+            del self._segments[0]
+        self._segments.append(segment)
+        return segment
+
+    def _get_segment(self, current: DateTime, prev: bool) -> _CronSegment | None:
+        """Get a segment with the fire time after or before ``current``, or None if there is none."""
+        timestamp = current.timestamp()
+        offset = current.astimezone(self._timezone).utcoffset()
+        for segment in self._segments:
+            if segment.offset != offset or not segment.timestamps:
+                continue
+            if segment.timestamps[0] >= timestamp if prev else segment.start > timestamp:
+                continue
+            if timestamp >= segment.timestamps[-1]:
+                if segment.fire_times is None:
+                    if timestamp < segment.end:
+                        return None  # Between the last fire time before a DST transition and the next
+                    continue
+                if timestamp - segment.timestamps[-1] > segment.timestamps[-1] - segment.start:
+                    continue  # Too far from the segment, computing a new one is cheaper
+                self._extend(segment)
+                if timestamp >= segment.timestamps[-1]:
+                    continue
+            return segment
+        segment = self._new_segment(current, offset, prev)
+        if not segment.timestamps or not segment.start <= timestamp < segment.timestamps[-1]:
+            return None
+        if prev and segment.timestamps[0] >= timestamp:
+            return None
+        return segment
+
+    def get_next(self, current: DateTime) -> DateTime | None:
+        """Get the first fire time after ``current``, or None if it is not cached."""
+        with self._lock:
+            segment = self._get_segment(current, prev=False)
+            if segment is None:
+                return None
+            return segment.times[bisect.bisect_right(segment.timestamps, current.timestamp())]
+
+    def get_prev(self, current: DateTime) -> DateTime | None:
+        """Get the first fire time before ``current``, or None if it is not cached."""
+        with self._lock:
+            segment = self._get_segment(current, prev=True)
+            if segment is None:
+                return None
+            return segment.times[bisect.bisect_left(segment.timestamps, current.timestamp()) - 1]
+
+
+@functools.lru_cache(maxsize=256)
+def get_cron_schedule(expression: str, timezone: Timezone | FixedTimezone) -> CronSchedule:
+    """Get the cached fire times of a cron expression in a timezone."""
+    return CronSchedule(expression, timezone)
+
+
 class CronMixin:
     """Mixin to provide interface to work with croniter."""
 
@@ -103,6 +318,20 @@ class CronMixin:
 
     def _get_next(self, current: DateTime) -> DateTime:
         """Get the first schedule after specified time, with DST fixed."""
+        scheduled = get_cron_schedule(self._expression, self._timezone).get_next(current)
+        if scheduled is not None:
+            return scheduled
+        return self._compute_next(current)
+
+    def _get_prev(self, current: DateTime) -> DateTime:
+        """Get the first schedule before specified time, with DST fixed."""
+        scheduled = get_cron_schedule(self._expression, self._timezone).get_prev(current)
+        if scheduled is not None:
+            return scheduled
+        return self._compute_prev(current)
+
+    def _compute_next(self, current: DateTime) -> DateTime:
+        """Compute the first schedule after specified time, with DST fixed, without the cache."""
         naive = make_naive(current, self._timezone)
         cron = croniter(self._expression, start_time=naive)
         scheduled = cron.get_next(datetime.datetime)
@@ -111,8 +340,8 @@ class CronMixin:
         delta = scheduled - naive
         return convert_to_utc(current.in_timezone(self._timezone) + delta)
 
-    def _get_prev(self, current: DateTime) -> DateTime:
-        """Get the first schedule before specified time, with DST fixed."""
+    def _compute_prev(self, current: DateTime) -> DateTime:
+        """Compute the first schedule before specified time, with DST fixed, without the cache."""
         naive = make_naive(current, self._timezone)
         cron = croniter(self._expression, start_time=naive)
         scheduled = cron.get_prev(datetime.datetime)
@@ -51,6 +51,11 @@ def dag_edges(dag: DAG):
         upstream_join_id >> task5
         upstream_join_id >> task6
     """
+    # Edges of serialized DAGs are computed when they are serialized
+    stored_edges = getattr(dag, "_dag_edges", None)
+    if stored_edges is not None:
+        return [_edge_record(dag, *edge) for edge in stored_edges]
+
     # Edges to add between TaskGroup
     edges_to_add = set()
     # Edges to remove between individual tasks that are replaced by edges_to_add.
@@ -120,15 +125,18 @@ def dag_edges(dag: DAG):
                     tasks_to_trace_next.append(child)
         tasks_to_trace = tasks_to_trace_next
 
-    result = []
-    # Build result dicts with the two ends of the edge, plus any extra metadata
-    # if we have it.
-    for source_id, target_id in sorted(edges.union(edges_to_add) - edges_to_skip):
-        record = {"source_id": source_id, "target_id": target_id}
-        label = dag.get_edge_info(source_id, target_id).get("label")
-        if (source_id, target_id) in setup_teardown_edges:
-            record["is_setup_teardown"] = True
-        if label:
-            record["label"] = label
-        result.append(record)
-    return result
+    return [
+        _edge_record(dag, source_id, target_id, (source_id, target_id) in setup_teardown_edges)
+        for source_id, target_id in sorted(edges.union(edges_to_add) - edges_to_skip)
+    ]
+
+
+def _edge_record(dag: DAG, source_id: str, target_id: str, is_setup_teardown: bool = False) -> dict:
+    """Build the dict of an edge with its two ends, plus any extra metadata if we have it."""
+    record: dict = {"source_id": source_id, "target_id": target_id}
+    label = dag.get_edge_info(source_id, target_id).get("label")
+    if is_setup_teardown:
+        record["is_setup_teardown"] = True
+    if label:
+        record["label"] = label
+    return record
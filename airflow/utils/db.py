@@ -33,6 +33,7 @@ from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    ClassVar,
     Generator,
     Iterable,
     Iterator,
@@ -1974,9 +1975,16 @@ class LazySelectSequence(Sequence[T]):
       uses ``session.execute()`` to fetch rows from the database, and this
       method should know how to process each row into a value.
 
+    Iterating fetches rows in pages of ``_page_size``, one query per page, and
+    processes each page with ``_process_rows``, which subclasses can override to process a page of
+    rows in bulk rather than one row at a time.
+
     :meta private:
     """
 
+    # Number of rows fetched and processed at once when iterating.
+    _page_size: ClassVar[int] = 1000
+
     _select_asc: ClauseElement
     _select_desc: ClauseElement
     _session: Session = attrs.field(kw_only=True, factory=get_current_task_instance_session)
@@ -2012,6 +2020,21 @@ class LazySelectSequence(Sequence[T]):
         """Process a SELECT-ed row into the end value."""
         raise NotImplementedError
 
+    @classmethod
+    def _process_rows(cls, rows: Sequence[Row]) -> list[T]:
+        """Process SELECT-ed rows into the end values, by default calling ``_process_row`` on each row."""
+        return [cls._process_row(row) for row in rows]
+
+    def _iter_pages(self, stmt: ClauseElement) -> Iterator[T]:
+        # Each page is fetched whole by its own query before it is yielded, so the session can be used, or
+        # committed, while iterating, unlike with a server-side cursor kept open over the whole result
+        offset = 0
+        while rows := self._session.execute(stmt.slice(offset, offset + self._page_size)).all():
+            yield from self._process_rows(rows)
+            if len(rows) < self._page_size:
+                return
+            offset += self._page_size
+
     def __repr__(self) -> str:
         counter = "item" if (length := len(self)) == 1 else "items"
         return f"LazySelectSequence([{length} {counter}])"
@@ -2047,10 +2070,10 @@ class LazySelectSequence(Sequence[T]):
         return all(x == y for x, y in z)
 
     def __reversed__(self) -> Iterator[T]:
-        return iter(self._process_row(r) for r in self._session.execute(self._select_desc))
+        return self._iter_pages(self._select_desc)
 
     def __iter__(self) -> Iterator[T]:
-        return iter(self._process_row(r) for r in self._session.execute(self._select_asc))
+        return self._iter_pages(self._select_asc)
 
     def __len__(self) -> int:
         if self._len is None:
@@ -2085,7 +2108,7 @@ class LazySelectSequence(Sequence[T]):
                     stmt = self._select_asc.slice(start, stop)
                 else:
                     stmt = self._select_asc.slice(start, len(self) + stop)
-                rows = [self._process_row(row) for row in self._session.execute(stmt)]
+                rows = self._process_rows(self._session.execute(stmt).all())
                 if reverse:
                     rows.reverse()
             else:
@@ -2095,7 +2118,7 @@ class LazySelectSequence(Sequence[T]):
                     stmt = self._select_desc.slice(-stop, -start)
                 else:
                     stmt = self._select_desc.slice(len(self) - stop, -start)
-                rows = [self._process_row(row) for row in self._session.execute(stmt)]
+                rows = self._process_rows(self._session.execute(stmt).all())
                 if not reverse:
                     rows.reverse()
             return rows
@@ -19,15 +19,19 @@
 
 from __future__ import annotations
 
+import functools
+import heapq
 import inspect
 import logging
 import os
 import warnings
+from collections import deque
 from contextlib import suppress
+from datetime import datetime, timezone
 from enum import Enum
 from functools import cached_property
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable, Iterable
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, Optional, Tuple
 from urllib.parse import urljoin
 
 import pendulum
@@ -84,7 +88,7 @@ def _set_task_deferred_context_var():
         h.ctx_task_deferred = True
 
 
-def _fetch_logs_from_service(url, log_relative_path):
+def _fetch_logs_from_service(url, log_relative_path, byte_range: str | None = None):
     # Import occurs in function scope for perf. Ref: https://github.com/apache/airflow/pull/21438
     import requests
 
@@ -96,22 +100,166 @@ def _fetch_logs_from_service(url, log_relative_path):
         expiration_time_in_seconds=conf.getint("webserver", "log_request_clock_grace", fallback=30),
         audience="task-instance-logs",
     )
-    response = requests.get(
-        url,
-        timeout=timeout,
-        headers={"Authorization": signer.generate_signed_token({"filename": log_relative_path})},
-    )
+    headers = {"Authorization": signer.generate_signed_token({"filename": log_relative_path})}
+    if byte_range:
+        headers["Range"] = byte_range
+    response = requests.get(url, timeout=timeout, headers=headers)
     response.encoding = "utf-8"
     return response
 
 
+# Reads a byte range of a log, given its first and last byte positions like an HTTP range; a missing first
+# position means the last bytes of the log. Returns the bytes, the position of the first one and the size of
+# the log.
+ReadLogRange = Callable[[Optional[int], Optional[int]], Tuple[bytes, int, int]]
+
+
+def _get_range(size: int, first: int | None, last: int | None) -> tuple[int, int]:
+    """Get the start and end positions of a byte range in a log of the given size."""
+    if first is None:
+        return max(size - (last or 0), 0), size
+    start = min(first, size)
+    end = size if last is None else min(last + 1, size)
+    return start, max(end, start)
+
+
+def _read_local_log_range(path: Path, first: int | None, last: int | None) -> tuple[bytes, int, int]:
+    with open(path, "rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        start, end = _get_range(size, first, last)
+        file.seek(start)
+        return file.read(end - start), start, size
+
+
+def _read_served_log_range(
+    url: str, log_relative_path: str, first: int | None, last: int | None
+) -> tuple[bytes, int, int]:
+    byte_range = f"bytes=-{last}" if first is None else f"bytes={first}-{'' if last is None else last}"
+    response = _fetch_logs_from_service(url, log_relative_path, byte_range=byte_range)
+    if response.status_code == 416:
+        # Nothing was logged after the first position, the header is "bytes */<size>"
+        size = int(response.headers["Content-Range"].rsplit("/", 1)[1])
+        return b"", size, size
+    response.raise_for_status()
+    if response.status_code == 206:
+        # "bytes <start>-<end>/<size>"
+        positions, size = response.headers["Content-Range"].split(" ", 1)[1].split("/")
+        return response.content, int(positions.split("-")[0]), int(size)
+    # The server does not support ranges and sent the whole log
+    start, end = _get_range(len(response.content), first, last)
+    return response.content[start:end], start, len(response.content)
+
+
+# Size of the end of the log read first when reading its last lines, it grows until it has enough lines or
+# reaches the maximum size of a window.
+_TAIL_READ_SIZE = 64 * 1024
+
+
+def _read_log_tail(read_range: ReadLogRange, num_lines: int, max_bytes: int | None) -> tuple[bytes, int]:
+    """
+    Read the last lines of a log, and return them with the position of the end of the log.
+
+    At most the last ``max_bytes`` bytes are read when given, so the first line returned may only be the end
+    of a line.
+    """
+    length = _TAIL_READ_SIZE if max_bytes is None else min(_TAIL_READ_SIZE, max_bytes)
+    while True:
+        data, start, _ = read_range(None, length)
+        # A newline at the end terminates the last line, it does not start another one
+        position = len(data) - 1 if data.endswith(b"\n") else len(data)
+        for _ in range(num_lines):
+            position = data.rfind(b"\n", 0, position)
+            if position == -1:
+                break
+        if position != -1:
+            return data[position + 1 :], start + len(data)
+        if start == 0 or (max_bytes is not None and length >= max_bytes):
+            return data, start + len(data)
+        length = length * 4 if max_bytes is None else min(length * 4, max_bytes)
+
+
+class _LogWindow:
+    """
+    Part of the logs of a task try to read, requested in the log metadata.
+
+    Each log source, such as a local file or the log server, is only read from where the previous request
+    stopped, up to ``max_bytes`` bytes, or only its last ``tail_lines`` lines are read; so a window of a large
+    log is read without reading the whole log. The positions where the next window starts are updated as
+    sources are read, and returned in the log metadata.
+    """
+
+    METADATA_KEYS = ("log_offsets", "max_bytes", "tail_lines")
+
+    def __init__(
+        self,
+        offsets: dict[str, int] | None = None,
+        max_bytes: int | None = None,
+        tail_lines: int | None = None,
+    ) -> None:
+        self.offsets = dict(offsets or {})
+        self.max_bytes = max_bytes
+        self.tail_lines = tail_lines
+        # Whether some sources have more bytes than the window
+        self.has_more = False
+
+    @classmethod
+    def from_metadata(cls, metadata: dict[str, Any] | None) -> _LogWindow | None:
+        if not metadata or not any(key in metadata for key in cls.METADATA_KEYS):
+            return None
+        return cls(
+            offsets=metadata.get("log_offsets"),
+            max_bytes=metadata.get("max_bytes"),
+            tail_lines=metadata.get("tail_lines"),
+        )
+
+    @property
+    def is_continuation(self) -> bool:
+        """Whether this window follows one returned by a previous request."""
+        return bool(self.offsets)
+
+    def read(self, source: str, read_range: ReadLogRange) -> str:
+        """Read the window of a log source, and record where the next window starts."""
+        if self.tail_lines is not None and source not in self.offsets:
+            data, end = _read_log_tail(read_range, self.tail_lines, self.max_bytes)
+        else:
+            offset = self.offsets.get(source, 0)
+            last = None if self.max_bytes is None else offset + self.max_bytes - 1
+            data, start, size = read_range(offset, last)
+            # Only whole lines are returned, the rest of the last line is part of the next window
+            if b"\n" in data and not data.endswith(b"\n"):
+                data = data[: data.rfind(b"\n") + 1]
+            end = start + len(data)
+            self.has_more = self.has_more or end < size
+        self.offsets[source] = end
+        return data.decode("utf-8", errors="replace")
+
+    def to_metadata(self) -> dict[str, Any]:
+        metadata: dict[str, Any] = {"log_offsets": self.offsets}
+        if self.max_bytes is not None:
+            # Following requests keep reading windows of the same size
+            metadata["max_bytes"] = self.max_bytes
+        return metadata
+
+
 _parse_timestamp = conf.getimport("logging", "interleave_timestamp_parser", fallback=None)
 
 if not _parse_timestamp:
 
     def _parse_timestamp(line: str):
         timestamp_str, _ = line.split(" ", 1)
-        return pendulum.parse(timestamp_str.strip("[]"))
+        timestamp_str = timestamp_str.strip("[]")
+        if not timestamp_str[:1].isdigit():
+            return None
+        # The ISO 8601 timestamps of the default log format are parsed much faster by the standard library
+        # than by pendulum, which parses the other formats. Before Python 3.11, the offset needs a colon.
+        iso_str = timestamp_str
+        if "T" in iso_str and iso_str[-5:-4] in ("+", "-") and iso_str[-4:].isdigit():
+            iso_str = f"{iso_str[:-2]}:{iso_str[-2:]}"
+        try:
+            timestamp = datetime.fromisoformat(iso_str)
+        except ValueError:
+            return pendulum.parse(timestamp_str)
+        return timestamp if timestamp.tzinfo else timestamp.replace(tzinfo=timezone.utc)
 
 
 def _parse_timestamps_in_log_file(lines: Iterable[str]):
@@ -127,17 +275,38 @@ def _parse_timestamps_in_log_file(lines: Iterable[str]):
             yield timestamp, idx, line
 
 
-def _interleave_logs(*logs):
-    records = []
-    for log in logs:
-        records.extend(_parse_timestamps_in_log_file(log.splitlines()))
+# Sort key of the lines logged before the first timestamp of a log
+_NO_TIMESTAMP = pendulum.datetime(2000, 1, 1)
+
+
+def _interleave_logs(*logs: str | Iterable[str]) -> Iterator[str]:
+    """
+    Merge logs in the order of the timestamps of their lines, skipping lines repeated one after the other.
+
+    Each log is a string, or an iterable of lines without line endings, whose lines are in chronological
+    order, like in log files; lines without a timestamp keep the one of the line before them. The logs are
+    merged lazily, so merged lines are yielded as the logs are read, without keeping all lines in memory.
+    """
+
+    def records(log: str | Iterable[str], log_number: int):
+        lines = log.splitlines() if isinstance(log, str) else log
+        for timestamp, idx, line in _parse_timestamps_in_log_file(lines):
+            # The log number keeps lines with the same timestamp in the order of the logs, and stops the
+            # comparison before the lines
+            yield timestamp or _NO_TIMESTAMP, idx, log_number, line
+
     last = None
-    for _, _, v in sorted(
-        records, key=lambda x: (x[0], x[1]) if x[0] else (pendulum.datetime(2000, 1, 1), x[1])
-    ):
-        if v != last:  # dedupe
-            yield v
-        last = v
+    for _, _, _, line in heapq.merge(*(records(log, i) for i, log in enumerate(logs))):
+        if line != last:  # dedupe
+            yield line
+        last = line
+
+
+def _iter_local_log_lines(path: Path) -> Iterator[str]:
+    """Read the lines of a log file as they are consumed, without their line endings."""
+    with open(path, encoding="utf-8", errors="replace") as file:
+        for line in file:
+            yield line.rstrip("\n")
 
 
 def _ensure_ti(ti: TaskInstanceKey | TaskInstance | TaskInstancePydantic, session) -> TaskInstance:
@@ -345,12 +514,70 @@ class FileTaskHandler(logging.Handler):
                                   which was retrieved in previous calls, this
                                   part will be skipped and only following test
                                   returned to be added to tail.
+                         log_offsets: Byte position in each log source to which
+                                      the log was retrieved in previous calls,
+                                      only the following bytes are read.
+                         max_bytes: Maximum number of bytes to read from each
+                                    log source.
+                         tail_lines: Only read the last lines of the log, unless
+                                     log_offsets is given.
+                         log_offsets, max_bytes and tail_lines read a window of
+                         local or served logs without reading the whole log;
+                         they are ignored for remote and executor logs, and
+                         nothing more is read when remote or executor logs
+                         replace the local or served logs after log_offsets.
         :return: log message as a string and metadata.
                  Following attributes are used in metadata:
                  end_of_log: Boolean, True if end of log is reached or False
                              if further calls might get more log text.
                              This is determined by the status of the TaskInstance
                  log_pos: (absolute) Char position to which the log is retrieved
+                 log_offsets: Byte position in each log source to which the log
+                              is retrieved, instead of log_pos when a window of
+                              the log was read.
+                 max_bytes: The requested max_bytes, for the next window.
+        """
+        log_lines: Iterable[str]
+        messages_list, log_lines, log_window = self._read_log_lines(ti, try_number, metadata)
+        messages = "".join([f"*** {x}\n" for x in messages_list])
+        is_in_running_or_deferred = ti.state in (
+            TaskInstanceState.RUNNING,
+            TaskInstanceState.DEFERRED,
+        )
+        end_of_log = ti.try_number != try_number or not is_in_running_or_deferred
+        if log_window:
+            if log_window.tail_lines is not None and not log_window.is_continuation:
+                log_lines = deque(log_lines, maxlen=log_window.tail_lines)
+            logs = "\n".join(log_lines)
+            out_message = logs if metadata and metadata.get("log_offsets") else messages + logs
+            return out_message, {
+                "end_of_log": end_of_log and not log_window.has_more,
+                **log_window.to_metadata(),
+            }
+        if metadata and metadata.get("log_offsets"):
+            # Windows of the local or served logs were read until remote or executor logs replaced them,
+            # the whole log is not sent again after the lines already read
+            log_window = _LogWindow(metadata["log_offsets"], metadata.get("max_bytes"))
+            return "", {"end_of_log": True, **log_window.to_metadata()}
+        logs = "\n".join(log_lines)
+        log_pos = len(logs)
+        if metadata and "log_pos" in metadata:
+            previous_chars = metadata["log_pos"]
+            logs = logs[previous_chars:]  # Cut off previously passed log test as new tail
+        out_message = logs if "log_pos" in (metadata or {}) else messages + logs
+        return out_message, {"end_of_log": end_of_log, "log_pos": log_pos}
+
+    def _read_log_lines(
+        self,
+        ti: TaskInstance,
+        try_number: int,
+        metadata: dict[str, Any] | None = None,
+    ) -> tuple[list[str], Iterator[str], _LogWindow | None]:
+        """
+        Read the log sources of a task try, and merge their lines lazily.
+
+        :return: The messages about the log sources, the merged log lines, and the window of the log
+            read if the metadata asks for one.
         """
         # Task instance here might be different from task instance when
         # initializing the handler. Thus explicitly getting log location
@@ -358,7 +585,7 @@ class FileTaskHandler(logging.Handler):
         worker_log_rel_path = self._render_filename(ti, try_number)
         messages_list: list[str] = []
         remote_logs: list[str] = []
-        local_logs: list[str] = []
+        local_logs: list[str | Iterable[str]] = []
         executor_messages: list[str] = []
         executor_logs: list[str] = []
         served_logs: list[str] = []
@@ -376,39 +603,35 @@ class FileTaskHandler(logging.Handler):
                 executor_messages, executor_logs = response
             if executor_messages:
                 messages_list.extend(executor_messages)
+        # Remote and executor logs are read whole, a window is only read from local and served logs
+        log_window = None if remote_logs or executor_logs else _LogWindow.from_metadata(metadata)
         if not (remote_logs and ti.state not in State.unfinished):
             # when finished, if we have remote logs, no need to check local
             worker_log_full_path = Path(self.local_base, worker_log_rel_path)
-            local_messages, local_logs = self._read_from_local(worker_log_full_path)
+            if log_window:
+                local_messages, local_logs = self._read_from_local(worker_log_full_path, log_window)
+            else:
+                local_messages, local_logs = self._read_from_local(worker_log_full_path)
             messages_list.extend(local_messages)
         if (is_in_running_or_deferred or is_up_for_retry) and not executor_messages and not remote_logs:
             # While task instance is still running and we don't have either executor nor remote logs, look for served logs
             # This is for cases when users have not setup remote logging nor shared drive for logs
-            served_messages, served_logs = self._read_from_logs_server(ti, worker_log_rel_path)
+            served_messages, served_logs = self._read_from_logs_server(ti, worker_log_rel_path, log_window)
             messages_list.extend(served_messages)
         elif ti.state not in State.unfinished and not (local_logs or remote_logs):
             # ordinarily we don't check served logs, with the assumption that users set up
             # remote logging or shared drive for logs for persistence, but that's not always true
             # so even if task is done, if no local logs or remote logs are found, we'll check the worker
-            served_messages, served_logs = self._read_from_logs_server(ti, worker_log_rel_path)
+            served_messages, served_logs = self._read_from_logs_server(ti, worker_log_rel_path, log_window)
             messages_list.extend(served_messages)
 
-        logs = "\n".join(
-            _interleave_logs(
-                *local_logs,
-                *remote_logs,
-                *(executor_logs or []),
-                *served_logs,
-            )
+        log_lines = _interleave_logs(
+            *local_logs,
+            *remote_logs,
+            *(executor_logs or []),
+            *served_logs,
         )
-        log_pos = len(logs)
-        messages = "".join([f"*** {x}\n" for x in messages_list])
-        end_of_log = ti.try_number != try_number or not is_in_running_or_deferred
-        if metadata and "log_pos" in metadata:
-            previous_chars = metadata["log_pos"]
-            logs = logs[previous_chars:]  # Cut off previously passed log test as new tail
-        out_message = logs if "log_pos" in (metadata or {}) else messages + logs
-        return out_message, {"end_of_log": end_of_log, "log_pos": log_pos}
+        return messages_list, log_lines, log_window
 
     @staticmethod
     def _get_pod_namespace(ti: TaskInstance):
@@ -542,24 +765,62 @@ class FileTaskHandler(logging.Handler):
 
         return full_path
 
+    def read_log_lines(self, task_instance: TaskInstance, try_number: int) -> tuple[list[str], Iterator[str]]:
+        """
+        Read the log of a task try lazily.
+
+        Unlike with :meth:`read`, local log files are read as the returned lines are consumed, so a large log
+        is not loaded in memory at once.
+
+        :param task_instance: task instance object
+        :param try_number: task instance try_number to read logs from
+        :return: The messages about where the log was read from, and the lines of the log.
+        """
+        messages_list, log_lines, _ = self._read_log_lines(task_instance, try_number)
+        return messages_list, log_lines
+
     @staticmethod
-    def _read_from_local(worker_log_path: Path) -> tuple[list[str], list[str]]:
+    def _read_from_local(
+        worker_log_path: Path, log_window: _LogWindow | None = None
+    ) -> tuple[list[str], list[str | Iterable[str]]]:
         messages = []
         paths = sorted(worker_log_path.parent.glob(worker_log_path.name + "*"))
         if paths:
             messages.append("Found local files:")
             messages.extend(f"  * {x}" for x in paths)
-        logs = [file.read_text() for file in paths]
+        logs: list[str | Iterable[str]]
+        if log_window:
+            logs = [
+                log_window.read(file.name, functools.partial(_read_local_log_range, file)) for file in paths
+            ]
+        else:
+            logs = [_iter_local_log_lines(file) for file in paths]
         return messages, logs
 
-    def _read_from_logs_server(self, ti, worker_log_rel_path) -> tuple[list[str], list[str]]:
+    def _read_from_logs_server(
+        self, ti, worker_log_rel_path, log_window: _LogWindow | None = None
+    ) -> tuple[list[str], list[str]]:
         messages = []
         logs = []
         try:
             log_type = LogType.TRIGGER if ti.triggerer_job else LogType.WORKER
             url, rel_path = self._get_log_retrieval_url(ti, worker_log_rel_path, log_type=log_type)
-            response = _fetch_logs_from_service(url, rel_path)
-            if response.status_code == 403:
+            if log_window:
+                text = log_window.read(
+                    f"served:{rel_path}", functools.partial(_read_served_log_range, url, rel_path)
+                )
+            else:
+                response = _fetch_logs_from_service(url, rel_path)
+                # Check if the resource was properly fetched
+                response.raise_for_status()
+                text = response.text
+            if text:
+                messages.append(f"Found logs served from host {url}")
+                logs.append(text)
+        except Exception as e:
+            from requests.exceptions import HTTPError, InvalidSchema
+
+            if isinstance(e, HTTPError) and e.response is not None and e.response.status_code == 403:
                 messages.append(
                     "!!!! Please make sure that all your Airflow components (e.g. "
                     "schedulers, webservers, workers and triggerer) have "
@@ -568,13 +829,6 @@ class FileTaskHandler(logging.Handler):
                     "See more at https://airflow.apache.org/docs/apache-airflow/"
                     "stable/configurations-ref.html#secret-key"
                 )
-            # Check if the resource was properly fetched
-            response.raise_for_status()
-            if response.text:
-                messages.append(f"Found logs served from host {url}")
-                logs.append(response.text)
-        except Exception as e:
-            from requests.exceptions import InvalidSchema
 
             if isinstance(e, InvalidSchema) and ti.task.inherits_from_empty_operator is True:
                 messages.append(self.inherits_from_empty_operator_log_message)
@@ -19,7 +19,7 @@ from __future__ import annotations
 import logging
 import time
 from functools import cached_property
-from typing import TYPE_CHECKING, Iterator
+from typing import TYPE_CHECKING, Any, Iterator
 
 from airflow.configuration import conf
 from airflow.utils.helpers import render_log_filename
@@ -39,6 +39,9 @@ class TaskLogReader:
     STREAM_LOOP_SLEEP_SECONDS = 1
     """Time to sleep between loops while waiting for more logs"""
 
+    STREAM_CHUNK_SIZE = 64 * 1024
+    """Number of characters of log lines yielded at once when streaming a finished log"""
+
     def read_log_chunks(
         self, ti: TaskInstance, try_number: int | None, metadata
     ) -> tuple[list[tuple[tuple[str, str]]], dict[str, str]]:
@@ -69,6 +72,10 @@ class TaskLogReader:
         """
         Continuously read log to the end.
 
+        The logs of finished tries are streamed as their lines are read, when the log handler supports it.
+        Otherwise, local and served logs are read a window of at most ``[webserver] log_window_max_bytes``
+        bytes at a time, so that large logs are not read whole.
+
         :param ti: The Task Instance
         :param try_number: the task try number
         :param metadata: A dictionary containing information about how to read the task log
@@ -79,24 +86,104 @@ class TaskLogReader:
         else:
             try_numbers = [try_number]
         for current_try_number in try_numbers:
+            if self.supports_read_log_lines and (
+                current_try_number != ti.try_number
+                or ti.state not in (TaskInstanceState.RUNNING, TaskInstanceState.DEFERRED)
+            ):
+                yield from self._stream_log_lines(ti, current_try_number)
+                continue
             metadata.pop("end_of_log", None)
             metadata.pop("max_offset", None)
             metadata.pop("offset", None)
             metadata.pop("log_pos", None)
+            metadata.pop("log_offsets", None)
+            metadata.pop("tail_lines", None)
+            self.set_log_window(metadata, tail=False)
             while True:
+                # The host is not repeated before each window of a log
+                is_continuation = "log_offsets" in metadata
                 logs, metadata = self.read_log_chunks(ti, current_try_number, metadata)
-                for host, log in logs[0]:
-                    yield "\n".join([host or "", log]) + "\n"
-                if "end_of_log" not in metadata or (
-                    not metadata["end_of_log"]
-                    and ti.state not in (TaskInstanceState.RUNNING, TaskInstanceState.DEFERRED)
+                has_logs = any(log for _, log in logs[0])
+                yield self._format_logs(logs[0], is_continuation=is_continuation)
+                if metadata.get("end_of_log"):
+                    break
+                # Running tasks are only read to their current end; the following windows of a larger log
+                # are read first
+                if (
+                    "end_of_log" in metadata
+                    and ti.state in (TaskInstanceState.RUNNING, TaskInstanceState.DEFERRED)
+                    and not ("log_offsets" in metadata and has_logs)
                 ):
-                    if not logs[0]:
-                        # we did not receive any logs in this loop
-                        # sleeping to conserve resources / limit requests on external services
-                        time.sleep(self.STREAM_LOOP_SLEEP_SECONDS)
-                else:
                     break
+                if not has_logs:
+                    # we did not receive any logs in this loop
+                    # sleeping to conserve resources / limit requests on external services
+                    time.sleep(self.STREAM_LOOP_SLEEP_SECONDS)
+
+    def _stream_log_lines(self, ti: TaskInstance, try_number: int) -> Iterator[str]:
+        """Stream the log of a finished task try, in the format of :meth:`_format_logs`."""
+        messages, log_lines = self.log_handler.read_log_lines(ti, try_number)
+        chunk = [f"{ti.hostname or ''}\n", *(f"*** {message}\n" for message in messages)]
+        chunk_size = 0
+        has_lines = False
+        for line in log_lines:
+            has_lines = True
+            chunk.append(f"{line}\n")
+            chunk_size += len(line) + 1
+            if chunk_size >= self.STREAM_CHUNK_SIZE:
+                yield "".join(chunk)
+                chunk = []
+                chunk_size = 0
+        if not has_lines:
+            chunk.append("\n")
+        if chunk:
+            yield "".join(chunk)
+
+    def read_log_window(
+        self, ti: TaskInstance, try_number: int, metadata: dict
+    ) -> tuple[str, dict[str, Any]]:
+        """
+        Read the next window of the log of a task try, as text.
+
+        The first window holds the last lines of the log, the following ones the lines added after the
+        previous window; see :meth:`set_log_window`. The host of each log is only on the first window.
+
+        :param ti: The Task Instance
+        :param try_number: the task try number
+        :param metadata: The log metadata returned with the previous window, if any
+        :return: The log text and the metadata to read the next window with
+        """
+        is_continuation = "log_pos" in metadata or "log_offsets" in metadata
+        self.set_log_window(metadata)
+        logs, metadata = self.read_log_chunks(ti, try_number, metadata)
+        return self._format_logs(logs[0], is_continuation=is_continuation), metadata
+
+    @staticmethod
+    def set_log_window(metadata: dict, *, tail: bool = True) -> None:
+        """
+        Only read a window of the task log, unless the metadata already says which part of the log to read.
+
+        The first window holds the last ``[webserver] log_tail_lines`` lines of the log, or its start when
+        ``tail`` is False. Each window holds at most ``[webserver] log_window_max_bytes`` bytes of each log
+        source, and the log metadata returned by a read tells where the next window starts.
+
+        :param metadata: The log metadata, updated in place
+        :param tail: Whether the first window holds the last lines of the log
+        """
+        if any(key in metadata for key in ("log_pos", "log_offsets", "max_bytes", "tail_lines")):
+            return
+        max_bytes = conf.getint("webserver", "log_window_max_bytes", fallback=5242880)
+        tail_lines = conf.getint("webserver", "log_tail_lines", fallback=10000) if tail else 0
+        if max_bytes > 0:
+            metadata["max_bytes"] = max_bytes
+        if tail_lines > 0:
+            metadata["tail_lines"] = tail_lines
+
+    @staticmethod
+    def _format_logs(logs: list[tuple[str, str]], *, is_continuation: bool) -> str:
+        if is_continuation:
+            return "".join(f"{log}\n" for _, log in logs if log)
+        return "".join("\n".join([host or "", log]) + "\n" for host, log in logs)
 
     @cached_property
     def log_handler(self):
@@ -119,6 +206,18 @@ class TaskLogReader:
         """Checks if a read operation is supported by a current log handler."""
         return hasattr(self.log_handler, "read")
 
+    @property
+    def supports_read_log_lines(self) -> bool:
+        """Checks if the log handler can read the lines of a task log lazily."""
+        from airflow.utils.log.file_task_handler import FileTaskHandler
+
+        # Handlers that read logs their own way can not be read by the lines of FileTaskHandler
+        return (
+            isinstance(self.log_handler, FileTaskHandler)
+            and type(self.log_handler)._read is FileTaskHandler._read
+            and not self.log_handler._read_grouped_logs()
+        )
+
     @property
     def supports_external_link(self) -> bool:
         """Check if the logging handler supports external links (e.g. to Elasticsearch, Stackdriver, etc)."""
@@ -19,6 +19,7 @@
 from __future__ import annotations
 
 import collections.abc
+import functools
 import logging
 import sys
 from enum import Enum
@@ -96,11 +97,17 @@ def should_hide_value_for_key(name):
     from airflow import settings
 
     if isinstance(name, str) and settings.HIDE_SENSITIVE_VAR_CONN_FIELDS:
-        name = name.strip().lower()
-        return any(s in name for s in get_sensitive_variables_fields())
+        return _is_sensitive_name(name, get_sensitive_variables_fields())
     return False
 
 
+@functools.lru_cache(maxsize=4096)
+def _is_sensitive_name(name: str, sensitive_fields: frozenset[str]) -> bool:
+    # The same keys are checked over and over again when redacting logs.
+    name = name.strip().lower()
+    return any(s in name for s in sensitive_fields)
+
+
 def mask_secret(secret: str | dict | Iterable, name: str | None = None) -> None:
     """
     Mask a secret from appearing in the task logs.
@@ -153,15 +160,64 @@ def _is_v1_env_var(v: Any) -> TypeGuard[V1EnvVar]:
 class SecretsMasker(logging.Filter):
     """Redact secrets from logs."""
 
-    replacer: Pattern | None = None
     patterns: set[str]
 
     ALREADY_FILTERED_FLAG = "__SecretsMasker_filtered"
     MAX_RECURSION_DEPTH = 5
+    # Strings up to this length are remembered with their redacted value, as log messages and their
+    # arguments are often the same from one record to the next.
+    MAX_CACHED_STRING_LENGTH = 1024
+    MAX_CACHED_STRINGS = 4096
 
     def __init__(self):
         super().__init__()
         self.patterns = set()
+        self._replacer: Pattern | None = None
+        self._replacer_outdated = False
+        # Length of the secret of each pattern, strings shorter than every secret cannot contain one.
+        self._secret_lengths: dict[str, int] = {}
+        self._min_secret_length = 0
+        self._redacted_strings: dict[str, str] = {}
+
+    @property
+    def replacer(self) -> Pattern | None:
+        """
+        The regular expression matching all the secrets.
+
+        It is only compiled when it is used after masks were added, so adding many masks in a row does not
+        compile it every time.
+        """
+        if self._replacer_outdated:
+            self._replacer = self._compile_replacer(self.patterns)
+            self._replacer_outdated = False
+            # Patterns may also have been set from another masker, without their length.
+            self._min_secret_length = min(
+                (self._secret_lengths.get(pattern, 0) for pattern in self.patterns), default=0
+            )
+            self._redacted_strings.clear()
+        return self._replacer
+
+    @replacer.setter
+    def replacer(self, replacer: Pattern | None) -> None:
+        self._replacer = replacer
+        self._replacer_outdated = False
+        self._min_secret_length = 0
+        self._redacted_strings.clear()
+
+    @staticmethod
+    def _compile_replacer(patterns: Iterable[str]) -> Pattern | None:
+        pattern = "|".join(patterns)
+        if not pattern:
+            return None
+        options = re2.Options()
+        # Mask the longest secret when secrets overlap, whatever the order of the patterns.
+        options.longest_match = True
+        options.log_errors = False
+        # The automata matching many secrets do not fit in the default 8 MiB of memory, and RE2 then falls
+        # back to an engine that is orders of magnitude slower. This is a limit, their states are only
+        # allocated as the text being redacted needs them.
+        options.max_mem = max(8 << 20, len(pattern) << 12)
+        return re2.compile(pattern, options)
 
     @cached_property
     def _record_attrs_to_ignore(self) -> Iterable[str]:
@@ -258,12 +314,10 @@ class SecretsMasker(logging.Filter):
                     return self._redact(item=tmp, name=name, depth=depth, max_depth=max_depth)
                 return tmp
             elif isinstance(item, str):
-                if self.replacer:
-                    # We can't replace specific values, but the key-based redacting
-                    # can still happen, so we can't short-circuit, we need to walk
-                    # the structure.
-                    return self.replacer.sub("***", str(item))
-                return item
+                # We can't replace specific values, but the key-based redacting
+                # can still happen, so we can't short-circuit, we need to walk
+                # the structure.
+                return self._redact_str(item)
             elif isinstance(item, (tuple, set)):
                 # Turn set in to tuple!
                 return tuple(
@@ -289,6 +343,21 @@ class SecretsMasker(logging.Filter):
             )
             return item
 
+    def _redact_str(self, item: str) -> str:
+        replacer = self.replacer
+        if not replacer:
+            return item
+        if len(item) < self._min_secret_length:
+            return item
+        redacted = self._redacted_strings.get(item)
+        if redacted is None:
+            redacted = replacer.sub("***", str(item))
+            if len(item) <= self.MAX_CACHED_STRING_LENGTH:
+                if len(self._redacted_strings) >= self.MAX_CACHED_STRINGS:
+                    self._redacted_strings.clear()
+                self._redacted_strings[item] = redacted
+        return redacted
+
     def redact(self, item: Redactable, name: str | None = None, max_depth: int | None = None) -> Redacted:
         """Redact an any secrets found in ``item``, if it is a string.
 
@@ -340,16 +409,13 @@ class SecretsMasker(logging.Filter):
             if not secret or (self._test_mode and secret in SECRETS_TO_SKIP_MASKING_FOR_TESTS):
                 return
 
-            new_mask = False
             for s in self._adaptations(secret):
                 if s:
                     pattern = re2.escape(s)
                     if pattern not in self.patterns and (not name or should_hide_value_for_key(name)):
                         self.patterns.add(pattern)
-                        new_mask = True
-
-            if new_mask:
-                self.replacer = re2.compile("|".join(self.patterns))
+                        self._secret_lengths[pattern] = len(s)
+                        self._replacer_outdated = True
 
         elif isinstance(secret, collections.abc.Iterable):
             for v in secret:
@@ -0,0 +1,128 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Mapping whose items can be retrieved by priority without sorting it."""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+from typing import Any, Callable, Iterable, Iterator, MutableMapping, TypeVar
+
+KT = TypeVar("KT")
+VT = TypeVar("VT")
+
+# Marks the heap entries of items that were removed or whose priority changed
+_REMOVED = object()
+
+
+class PriorityDict(MutableMapping[KT, VT]):
+    """
+    Dict which keeps its items in a heap ordered by priority.
+
+    Membership, lookups, insertions and deletions behave like with a dict, and the items of highest
+    priority can be retrieved in ``O(k log n)`` with :meth:`peek`. Items of equal priority are retrieved in
+    the order they were inserted, like when sorting the items of a dict by priority.
+
+    Deleted items are only marked as removed in the heap, which is compacted when they outnumber the items.
+
+    :param priority: Function returning the priority of a value, higher priorities being retrieved first.
+    :param items: Initial items, as a mapping or an iterable of key-value pairs.
+    """
+
+    def __init__(self, priority: Callable[[VT], Any], items: Iterable = ()) -> None:
+        self._priority = priority
+        self._data: dict[KT, VT] = {}
+        # Heap entries are lists of [-priority, insertion order, entry number, key], the key being replaced
+        # by _REMOVED when the item is removed; entry numbers are unique, so keys are never compared.
+        self._entries: dict[KT, list] = {}
+        self._heap: list[list] = []
+        self._removed = 0
+        self._counter = itertools.count()
+        self.update(items)
+
+    def __getitem__(self, key: KT) -> VT:
+        return self._data[key]
+
+    def __setitem__(self, key: KT, value: VT) -> None:
+        sort_key = -self._priority(value)
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[0] == sort_key:
+                self._data[key] = value
+                return
+            # An updated item keeps its position among items of equal priority, like in a dict
+            order = entry[1]
+            self._invalidate(entry)
+        else:
+            order = next(self._counter)
+        entry = [sort_key, order, next(self._counter), key]
+        self._data[key] = value
+        self._entries[key] = entry
+        heapq.heappush(self._heap, entry)
+
+    def __delitem__(self, key: KT) -> None:
+        del self._data[key]
+        self._invalidate(self._entries.pop(key))
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __iter__(self) -> Iterator[KT]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._data!r})"
+
+    def _invalidate(self, entry: list) -> None:
+        entry[3] = _REMOVED
+        self._removed += 1
+        if self._removed > len(self._data):
+            self._heap = [entry for entry in self._heap if entry[3] is not _REMOVED]
+            heapq.heapify(self._heap)
+            self._removed = 0
+
+    def clear(self) -> None:
+        self._data.clear()
+        self._entries.clear()
+        self._heap.clear()
+        self._removed = 0
+
+    def copy(self) -> PriorityDict[KT, VT]:
+        """Return a shallow copy, with the same order for items of equal priority."""
+        return PriorityDict(self._priority, self.peek(len(self._data)))
+
+    def peek(self, count: int) -> list[tuple[KT, VT]]:
+        """
+        Get the items of highest priority, without removing them.
+
+        :param count: The maximum number of items returned.
+        :return: Key-value pairs, by decreasing priority.
+        """
+        entries = []
+        while self._heap and len(entries) < count:
+            entry = heapq.heappop(self._heap)
+            if entry[3] is _REMOVED:
+                self._removed -= 1
+            else:
+                entries.append(entry)
+        for entry in entries:
+            heapq.heappush(self._heap, entry)
+        return [(entry[3], self._data[entry[3]]) for entry in entries]
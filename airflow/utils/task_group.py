@@ -154,6 +154,8 @@ class TaskGroup(DAGNode):
         self._check_for_group_id_collisions(add_suffix_on_collision)
 
         self.children: dict[str, DAGNode] = {}
+        # Node IDs of the children in topological order, when they were stored by the DAG serialization
+        self._topological_order: list[str] | None = None
 
         if parent_group:
             parent_group.add(self)
@@ -259,6 +261,7 @@ class TaskGroup(DAGNode):
                 raise AirflowException("Cannot add a non-empty TaskGroup")
 
         self.children[key] = task
+        self._topological_order = None
         return task
 
     def _remove(self, task: DAGNode) -> None:
@@ -269,6 +272,7 @@ class TaskGroup(DAGNode):
 
         self.used_group_ids.remove(key)
         del self.children[key]
+        self._topological_order = None
 
     @property
     def group_id(self) -> str | None:
@@ -496,6 +500,9 @@ class TaskGroup(DAGNode):
 
         :return: list of tasks in topological order
         """
+        if self._topological_order is not None and not _include_subdag_tasks:
+            return [self.children[node_id] for node_id in self._topological_order]
+
         # This uses a modified version of Kahn's Topological Sort algorithm to
         # not have to pre-compute the "in-degree" of the nodes.
         from airflow.operators.subdag import SubDagOperator  # Avoid circular import
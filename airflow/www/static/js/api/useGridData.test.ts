@@ -19,8 +19,9 @@
 
 /* global describe, test, expect */
 
-import type { DagRun } from "src/types";
-import { areActiveRuns } from "./useGridData";
+import type { DagRun, TaskInstance } from "src/types";
+import { areActiveRuns, mergeGridData } from "./useGridData";
+import type { GridData } from "./useGridData";
 
 const commonDagRunParams = {
   runId: "runId",
@@ -62,3 +63,73 @@ describe("Test areActiveRuns()", () => {
     expect(result).toBe(false);
   });
 });
+
+const makeInstance = (
+  taskId: string,
+  runId: string,
+  state: TaskInstance["state"]
+) =>
+  ({ taskId, runId, state } as TaskInstance);
+
+const makeGridData = (
+  runIds: string[],
+  state: TaskInstance["state"],
+  changedRunIds?: string[]
+): GridData => ({
+  dagRuns: runIds.map((runId) => ({
+    ...commonDagRunParams,
+    runId,
+    state: "running",
+  })),
+  groups: {
+    id: null,
+    label: null,
+    instances: [],
+    children: [
+      {
+        id: "task",
+        label: "task",
+        instances: runIds.map((runId) => makeInstance("task", runId, state)),
+      },
+    ],
+  },
+  ordering: [],
+  version: "version",
+  changedRunIds,
+});
+
+describe("Test mergeGridData()", () => {
+  test("Replaces the instances of the changed runs", () => {
+    const previous = makeGridData(["run_1", "run_2"], "queued");
+    const delta = makeGridData(["run_2"], "success", ["run_2"]);
+    delta.dagRuns = previous.dagRuns;
+
+    const merged = mergeGridData(previous, delta);
+
+    expect(merged?.changedRunIds).toBeUndefined();
+    expect(merged?.groups.children?.[0].instances).toEqual([
+      makeInstance("task", "run_1", "queued"),
+      makeInstance("task", "run_2", "success"),
+    ]);
+  });
+
+  test("Drops the instances of the runs no longer shown", () => {
+    const previous = makeGridData(["run_1", "run_2"], "queued");
+    const delta = makeGridData(["run_3"], "success", ["run_3"]);
+    delta.dagRuns = [previous.dagRuns[1], ...delta.dagRuns];
+
+    const merged = mergeGridData(previous, delta);
+
+    expect(merged?.groups.children?.[0].instances).toEqual([
+      makeInstance("task", "run_2", "queued"),
+      makeInstance("task", "run_3", "success"),
+    ]);
+  });
+
+  test("Returns null when instances of unchanged runs are missing", () => {
+    const previous = makeGridData(["run_1"], "queued");
+    const delta = makeGridData(["run_2"], "success", []);
+
+    expect(mergeGridData(previous, delta)).toBeNull();
+  });
+});
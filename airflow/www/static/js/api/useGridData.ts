@@ -17,7 +17,7 @@
  * under the License.
  */
 
-import { useQuery } from "react-query";
+import { useQuery, useQueryClient } from "react-query";
 import axios, { AxiosResponse } from "axios";
 
 import { getMetaValue } from "src/utils";
@@ -47,6 +47,9 @@ export interface GridData {
   dagRuns: DagRun[];
   groups: Task;
   ordering: RunOrdering;
+  version?: string | null;
+  // Only set in delta responses, whose groups only have the instances of these runs
+  changedRunIds?: string[];
 }
 
 export const emptyGridData: GridData = {
@@ -67,6 +70,49 @@ const formatOrdering = (data: GridData) => ({
 export const areActiveRuns = (runs: DagRun[] = []) =>
   runs.filter((run) => ["queued", "running"].includes(run.state)).length > 0;
 
+const mergeInstances = (
+  previous: Task | undefined,
+  delta: Task,
+  keptRunIds: Set<string>
+): Task => ({
+  ...delta,
+  instances: [
+    ...(previous?.instances || []).filter(
+      (ti) => ti && keptRunIds.has(ti.runId)
+    ),
+    ...delta.instances,
+  ],
+  children: delta.children?.map((child, i) => {
+    const previousChild = previous?.children?.[i];
+    return mergeInstances(
+      previousChild?.id === child.id ? previousChild : undefined,
+      child,
+      keptRunIds
+    );
+  }),
+});
+
+// Apply a delta response to the previous grid data,
+// or return null if the instances of some runs are missing
+export const mergeGridData = (
+  previous: GridData,
+  delta: GridData
+): GridData | null => {
+  const changedRunIds = new Set(delta.changedRunIds);
+  const previousRunIds = new Set(previous.dagRuns.map((dr) => dr.runId));
+  const keptRunIds = new Set(
+    delta.dagRuns
+      .map((dr) => dr.runId)
+      .filter((runId) => !changedRunIds.has(runId))
+  );
+  if ([...keptRunIds].some((runId) => !previousRunIds.has(runId))) return null;
+  return {
+    ...delta,
+    changedRunIds: undefined,
+    groups: mergeInstances(previous.groups, delta.groups, keptRunIds),
+  };
+};
+
 const useGridData = () => {
   const { isRefreshOn, stopRefresh } = useAutoRefresh();
   const errorToast = useErrorToast();
@@ -86,6 +132,7 @@ const useGridData = () => {
     onSelect,
     selected: { taskId, runId },
   } = useSelection();
+  const queryClient = useQueryClient();
   const query = useQuery(
     [
       "gridData",
@@ -98,7 +145,7 @@ const useGridData = () => {
       filterDownstream,
       runId,
     ],
-    async () => {
+    async ({ queryKey }) => {
       const params = {
         [ROOT_PARAM]: root,
         [FILTER_UPSTREAM_PARAM]: filterUpstream,
@@ -109,9 +156,16 @@ const useGridData = () => {
         [RUN_TYPE_PARAM]: runType,
         [RUN_STATE_PARAM]: runState,
       };
-      const response = await axios.get<AxiosResponse, GridData>(gridDataUrl, {
-        params,
+      // When refreshing, only ask for the runs that changed since the previous response
+      const previous = queryClient.getQueryData<GridData>(queryKey);
+      let response = await axios.get<AxiosResponse, GridData>(gridDataUrl, {
+        params: { ...params, changed_since: previous?.version || undefined },
       });
+      if (response.changedRunIds) {
+        response =
+          (previous && mergeGridData(previous, response)) ||
+          (await axios.get<AxiosResponse, GridData>(gridDataUrl, { params }));
+      }
       if (runId && !response.dagRuns.find((dr) => dr.runId === runId)) {
         const dagRunUrl = getMetaValue("dag_run_url")
           .replace("__DAG_ID__", dagId)
@@ -17,8 +17,8 @@
  * under the License.
  */
 
-import { useState } from "react";
-import axios, { AxiosResponse } from "axios";
+import { useRef, useState } from "react";
+import axios from "axios";
 import { useQuery } from "react-query";
 import { useAutoRefresh } from "src/context/autorefresh";
 import type { API, TaskInstance } from "src/types";
@@ -27,10 +27,19 @@ import { getMetaValue } from "src/utils";
 
 const taskLogApi = getMetaValue("task_log_api");
 
+// Without the interceptors of the default instance, which drop the headers
+const logClient = axios.create();
+
 interface Props extends API.GetLogVariables {
   state?: TaskInstance["state"];
 }
 
+interface LogWindow {
+  key: string;
+  text: string;
+  token?: string;
+}
+
 const useTaskLog = ({
   dagId,
   dagRunId,
@@ -42,6 +51,8 @@ const useTaskLog = ({
 }: Props) => {
   let url: string = "";
   const [isPreviousStatePending, setPrevState] = useState(true);
+  // The log read so far, and the token to read the lines added after it
+  const logWindow = useRef<LogWindow>({ key: "", text: "" });
   if (taskLogApi) {
     url = taskLogApi
       .replace("_DAG_RUN_ID_", dagRunId)
@@ -66,12 +77,33 @@ const useTaskLog = ({
 
   return useQuery(
     ["taskLogs", dagId, dagRunId, taskId, mapIndex, taskTryNumber, fullContent],
-    () => {
+    async () => {
       setPrevState(isStatePending);
-      return axios.get<AxiosResponse, string>(url, {
+      const key = `${url}/${mapIndex}/${fullContent}`;
+      const previous: LogWindow =
+        logWindow.current.key === key ? logWindow.current : { key, text: "" };
+      // The first request reads the last lines of the log, and the
+      // following ones the lines added after the previous request.
+      const response = await logClient.get<string>(url, {
         headers: { Accept: "text/plain" },
-        params: { map_index: mapIndex, full_content: fullContent },
+        params: {
+          map_index: mapIndex,
+          full_content: fullContent,
+          token: previous.token,
+          log_window: true,
+        },
+        responseType: "text",
       });
+      // Full logs are read whole, without continuation token
+      const text = previous.token
+        ? previous.text + response.data
+        : response.data;
+      logWindow.current = {
+        key,
+        text,
+        token: response.headers["airflow-continuation-token"],
+      };
+      return text;
     },
     {
       refetchInterval:
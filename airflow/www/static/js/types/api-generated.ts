@@ -663,6 +663,13 @@ export interface paths {
          * If passed, it will specify the location from which the download should be continued.
          */
         token?: components["parameters"]["ContinuationToken"];
+        /**
+         * Only the last lines of the log will be returned, then the lines added after them
+         * with the continuation token. Ignored when `full_content` is set.
+         *
+         * *New in version 2.10.0*
+         */
+        log_window?: components["parameters"]["LogWindow"];
       };
     };
   };
@@ -2522,6 +2529,13 @@ export interface components {
      * If passed, it will specify the location from which the download should be continued.
      */
     ContinuationToken: string;
+    /**
+     * @description Only the last lines of the log will be returned, then the lines added after them
+     * with the continuation token. Ignored when `full_content` is set.
+     *
+     * *New in version 2.10.0*
+     */
+    LogWindow: boolean;
     /** @description The XCom key. */
     XComKey: string;
     /**
@@ -4525,6 +4539,13 @@ export interface operations {
          * If passed, it will specify the location from which the download should be continued.
          */
         token?: components["parameters"]["ContinuationToken"];
+        /**
+         * Only the last lines of the log will be returned, then the lines added after them
+         * with the continuation token. Ignored when `full_content` is set.
+         *
+         * *New in version 2.10.0*
+         */
+        log_window?: components["parameters"]["LogWindow"];
       };
     };
     responses: {
@@ -28,6 +28,7 @@ import math
 import operator
 import os
 import sys
+import threading
 import traceback
 import warnings
 from bisect import insort_left
@@ -76,6 +77,7 @@ from pendulum.parsing.exceptions import ParserError
 from sqlalchemy import and_, case, desc, func, inspect, or_, select, union_all
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import joinedload
+from werkzeug.http import quote_etag
 from wtforms import BooleanField, validators
 
 import airflow
@@ -88,7 +90,6 @@ from airflow.api.common.mark_tasks import (
     set_state,
 )
 from airflow.auth.managers.models.resource_details import AccessView, DagAccessEntity, DagDetails
-from airflow.compat.functools import cache
 from airflow.configuration import AIRFLOW_CONFIG, conf
 from airflow.datasets import Dataset
 from airflow.exceptions import (
@@ -124,6 +125,7 @@ from airflow.utils.airflow_flask_app import get_airflow_app
 from airflow.utils.dag_edges import dag_edges
 from airflow.utils.db import get_query_count
 from airflow.utils.docs import get_doc_url_for_provider, get_docs_url
+from airflow.utils.hashlib_wrapper import md5
 from airflow.utils.helpers import exactly_one
 from airflow.utils.log import secrets_masker
 from airflow.utils.log.log_reader import TaskLogReader
@@ -335,12 +337,166 @@ def node_dict(node_id, label, node_class):
     }
 
 
-def dag_to_grid(dag: DagModel, dag_runs: Sequence[DagRun], session: Session) -> dict[str, Any]:
+# The grid skeletons of the DAGs recently shown, see get_grid_skeleton
+_grid_skeletons: collections.OrderedDict[tuple, dict[str, Any]] = collections.OrderedDict()
+_grid_skeletons_lock = threading.Lock()
+GRID_SKELETON_CACHE_SIZE = 64
+
+
+def _get_task_group_children_getter() -> operator.methodcaller:
+    sort_order = conf.get("webserver", "grid_view_sorting_order", fallback="topological")
+    if sort_order == "topological":
+        return operator.methodcaller("topological_sort")
+    if sort_order == "hierarchical_alphabetical":
+        return operator.methodcaller("hierarchical_alphabetical_sort")
+    raise AirflowConfigException(f"Unsupported grid_view_sorting_order: {sort_order}")
+
+
+def build_grid_skeleton(dag: DAG) -> dict[str, Any]:
+    """
+    Create a nested dict representation of the DAG's TaskGroup and its children, without their instances.
+
+    This is the part of the grid data that only depends on the DAG, it is filled by ``dag_to_grid``.
+    """
+    children_getter = _get_task_group_children_getter()
+
+    def task_group_to_skeleton(item: Operator | TaskGroup) -> dict[str, Any]:
+        if not isinstance(item, TaskGroup):
+            item_is_mapped = item.get_needs_expansion()
+            setup_teardown_type = {}
+            if item.is_setup is True:
+                setup_teardown_type["setupTeardownType"] = "setup"
+            elif item.is_teardown is True:
+                setup_teardown_type["setupTeardownType"] = "teardown"
+            return {
+                "node": {
+                    "id": item.task_id,
+                    "label": item.label,
+                    "extra_links": item.extra_links,
+                    "is_mapped": item_is_mapped,
+                    "has_outlet_datasets": any(isinstance(i, Dataset) for i in (item.outlets or [])),
+                    "operator": item.operator_name,
+                    "trigger_rule": item.trigger_rule,
+                    **setup_teardown_type,
+                },
+                "is_mapped": item_is_mapped,
+            }
+
+        children = [task_group_to_skeleton(child) for child in children_getter(item)]
+        # We don't need to calculate summaries for the root
+        if item.group_id is None:
+            return {"node": {"id": item.group_id, "label": item.label}, "children": children, "kind": "root"}
+        node = {"id": item.group_id, "label": item.label, "tooltip": item.tooltip}
+        if next(item.iter_mapped_task_groups(), None) is not None:
+            return {"node": {**node, "is_mapped": True}, "children": children, "kind": "mapped"}
+        return {"node": node, "children": children, "kind": "group"}
+
+    return task_group_to_skeleton(dag.task_group)
+
+
+def get_grid_skeleton(dag: DAG, version_key: tuple | None) -> dict[str, Any]:
+    """
+    Get the grid skeleton of a DAG, from the skeletons recently shown if it has the same version.
+
+    :param dag: The DAG, or the part of it shown in the grid.
+    :param version_key: The DAG ID, the hash of the serialized DAG and the arguments selecting the part
+        of the DAG shown, or None if the version of the DAG is not known; the skeleton is then not cached.
+    """
+    if version_key is None:
+        return build_grid_skeleton(dag)
+    # The order of the children depends on the configuration
+    key = (*version_key, conf.get("webserver", "grid_view_sorting_order", fallback="topological"))
+    with _grid_skeletons_lock:
+        skeleton = _grid_skeletons.get(key)
+        if skeleton is not None:
+            _grid_skeletons.move_to_end(key)
+            return skeleton
+    skeleton = build_grid_skeleton(dag)
+    with _grid_skeletons_lock:
+        _grid_skeletons[key] = skeleton
+        while len(_grid_skeletons) > GRID_SKELETON_CACHE_SIZE:
+            _grid_skeletons.popitem(last=False)
+    return skeleton
+
+
+# Overlap of the deltas of the grid data, for changes committed after the previous response but made
+# before it, or made by machines whose clock is behind.
+GRID_DELTA_OVERLAP = datetime.timedelta(seconds=30)
+
+
+def _get_grid_etag(dag_id: str, skeleton_digest: str, encoded_runs: list, *, session: Session) -> str:
+    """
+    Get the ETag of the full grid data, from the runs and a summary of the task instances shown.
+
+    The task instances are summarized by state, with the last time they or their notes were updated,
+    so that updates committed out of order still change the summary. The version of the response is
+    left out: a client revalidating an older response gets deltas since an earlier time, which still
+    include the latest changes.
+    """
+    ti_summary = session.execute(
+        select(
+            TaskInstance.state,
+            func.count(),
+            func.max(TaskInstance.updated_at),
+            func.max(TaskInstanceNote.updated_at),
+        )
+        .join(TaskInstance.task_instance_note, isouter=True)
+        .where(
+            TaskInstance.dag_id == dag_id,
+            TaskInstance.run_id.in_([encoded_run["run_id"] for encoded_run in encoded_runs]),
+        )
+        .group_by(TaskInstance.state)
+    ).all()
+    summary = sorted(
+        (str(state), count, str(ti_updated_at), str(note_updated_at))
+        for state, count, ti_updated_at, note_updated_at in ti_summary
+    )
+    return md5(json.dumps([skeleton_digest, encoded_runs, summary], default=str).encode()).hexdigest()
+
+
+def _get_changed_run_ids(
+    dag_id: str, dag_runs: Sequence[DagRun], changed_since: datetime.datetime, *, session: Session
+) -> set[str]:
+    """
+    Get the IDs of the DAG runs whose task instances may have changed since the given time.
+
+    Runs that are not finished are always considered changed.
+    """
+    threshold = changed_since - GRID_DELTA_OVERLAP
+    changed_run_ids = {
+        dr.run_id
+        for dr in dag_runs
+        if dr.state in State.unfinished_dr_states or dr.updated_at is None or dr.updated_at >= threshold
+    }
+    other_run_ids = [dr.run_id for dr in dag_runs if dr.run_id not in changed_run_ids]
+    if other_run_ids:
+        changed_run_ids.update(
+            session.scalars(
+                select(TaskInstance.run_id)
+                .join(TaskInstance.task_instance_note, isouter=True)
+                .where(
+                    TaskInstance.dag_id == dag_id,
+                    TaskInstance.run_id.in_(other_run_ids),
+                    or_(TaskInstance.updated_at >= threshold, TaskInstanceNote.updated_at >= threshold),
+                )
+                .distinct()
+            )
+        )
+    return changed_run_ids
+
+
+def dag_to_grid(
+    dag: DagModel, dag_runs: Sequence[DagRun], session: Session, skeleton: dict[str, Any] | None = None
+) -> dict[str, Any]:
     """
     Create a nested dict representation of the DAG's TaskGroup and its children.
 
     Used to construct the Graph and Grid views.
+
+    :param skeleton: The grid skeleton of the DAG, built if not given; see ``get_grid_skeleton``.
     """
+    if skeleton is None:
+        skeleton = build_grid_skeleton(dag)
     query = session.execute(
         select(
             TaskInstance.task_id,
@@ -367,71 +523,60 @@ def dag_to_grid(dag: DagModel, dag_runs: Sequence[DagRun], session: Session) ->
         ((task_id, list(tis)) for task_id, tis in itertools.groupby(query, key=lambda ti: ti.task_id)),
     )
 
-    @cache
-    def get_task_group_children_getter() -> operator.methodcaller:
-        sort_order = conf.get("webserver", "grid_view_sorting_order", fallback="topological")
-        if sort_order == "topological":
-            return operator.methodcaller("topological_sort")
-        if sort_order == "hierarchical_alphabetical":
-            return operator.methodcaller("hierarchical_alphabetical_sort")
-        raise AirflowConfigException(f"Unsupported grid_view_sorting_order: {sort_order}")
-
-    def task_group_to_grid(item: Operator | TaskGroup) -> dict[str, Any]:
-        if not isinstance(item, TaskGroup):
-
-            def _mapped_summary(ti_summaries: list[TaskInstance]) -> Iterator[dict[str, Any]]:
-                run_id = ""
-                record: dict[str, Any] = {}
-
-                def set_overall_state(record):
-                    for state in wwwutils.priority:
-                        if state in record["mapped_states"]:
-                            record["state"] = state
-                            break
-                    # When turning the dict into JSON we can't have None as a key,
-                    # so use the string that the UI does.
-                    with contextlib.suppress(KeyError):
-                        record["mapped_states"]["no_status"] = record["mapped_states"].pop(None)
-
-                for ti_summary in ti_summaries:
-                    if run_id != ti_summary.run_id:
-                        run_id = ti_summary.run_id
-                        if record:
-                            set_overall_state(record)
-                            yield record
-                        record = {
-                            "task_id": ti_summary.task_id,
-                            "run_id": run_id,
-                            "queued_dttm": ti_summary.queued_dttm,
-                            "start_date": ti_summary.start_date,
-                            "end_date": ti_summary.end_date,
-                            "mapped_states": {ti_summary.state: ti_summary.state_count},
-                            "state": None,  # We change this before yielding
-                        }
-                        continue
-                    record["queued_dttm"] = min(
-                        filter(None, [record["queued_dttm"], ti_summary.queued_dttm]), default=None
-                    )
-                    record["start_date"] = min(
-                        filter(None, [record["start_date"], ti_summary.start_date]), default=None
-                    )
-                    # Sometimes the start date of a group might be before the queued date of the group
-                    if (
-                        record["queued_dttm"]
-                        and record["start_date"]
-                        and record["queued_dttm"] > record["start_date"]
-                    ):
-                        record["queued_dttm"] = None
-                    record["end_date"] = max(
-                        filter(None, [record["end_date"], ti_summary.end_date]), default=None
-                    )
-                    record["mapped_states"][ti_summary.state] = ti_summary.state_count
+    def _mapped_summary(ti_summaries: list[TaskInstance]) -> Iterator[dict[str, Any]]:
+        run_id = ""
+        record: dict[str, Any] = {}
+
+        def set_overall_state(record):
+            for state in wwwutils.priority:
+                if state in record["mapped_states"]:
+                    record["state"] = state
+                    break
+            # When turning the dict into JSON we can't have None as a key,
+            # so use the string that the UI does.
+            with contextlib.suppress(KeyError):
+                record["mapped_states"]["no_status"] = record["mapped_states"].pop(None)
+
+        for ti_summary in ti_summaries:
+            if run_id != ti_summary.run_id:
+                run_id = ti_summary.run_id
                 if record:
                     set_overall_state(record)
                     yield record
-
-            if item_is_mapped := item.get_needs_expansion():
-                instances = list(_mapped_summary(grouped_tis[item.task_id]))
+                record = {
+                    "task_id": ti_summary.task_id,
+                    "run_id": run_id,
+                    "queued_dttm": ti_summary.queued_dttm,
+                    "start_date": ti_summary.start_date,
+                    "end_date": ti_summary.end_date,
+                    "mapped_states": {ti_summary.state: ti_summary.state_count},
+                    "state": None,  # We change this before yielding
+                }
+                continue
+            record["queued_dttm"] = min(
+                filter(None, [record["queued_dttm"], ti_summary.queued_dttm]), default=None
+            )
+            record["start_date"] = min(
+                filter(None, [record["start_date"], ti_summary.start_date]), default=None
+            )
+            # Sometimes the start date of a group might be before the queued date of the group
+            if (
+                record["queued_dttm"]
+                and record["start_date"]
+                and record["queued_dttm"] > record["start_date"]
+            ):
+                record["queued_dttm"] = None
+            record["end_date"] = max(filter(None, [record["end_date"], ti_summary.end_date]), default=None)
+            record["mapped_states"][ti_summary.state] = ti_summary.state_count
+        if record:
+            set_overall_state(record)
+            yield record
+
+    def skeleton_to_grid(item: dict[str, Any]) -> dict[str, Any]:
+        node = item["node"]
+        if "children" not in item:
+            if item["is_mapped"]:
+                instances = list(_mapped_summary(grouped_tis[node["id"]]))
             else:
                 instances = [
                     {
@@ -444,30 +589,13 @@ def dag_to_grid(dag: DagModel, dag_runs: Sequence[DagRun], session: Session) ->
                         "try_number": task_instance.try_number,
                         "note": task_instance.note,
                     }
-                    for task_instance in grouped_tis[item.task_id]
+                    for task_instance in grouped_tis[node["id"]]
                 ]
-
-            setup_teardown_type = {}
-            if item.is_setup is True:
-                setup_teardown_type["setupTeardownType"] = "setup"
-            elif item.is_teardown is True:
-                setup_teardown_type["setupTeardownType"] = "teardown"
-
-            return {
-                "id": item.task_id,
-                "instances": instances,
-                "label": item.label,
-                "extra_links": item.extra_links,
-                "is_mapped": item_is_mapped,
-                "has_outlet_datasets": any(isinstance(i, Dataset) for i in (item.outlets or [])),
-                "operator": item.operator_name,
-                "trigger_rule": item.trigger_rule,
-                **setup_teardown_type,
-            }
+            return {**node, "instances": instances}
 
         # Task Group
-        task_group = item
-        children = [task_group_to_grid(child) for child in get_task_group_children_getter()(item)]
+        group_id = node["id"]
+        children = [skeleton_to_grid(child) for child in item["children"]]
 
         def get_summary(dag_run: DagRun):
             child_instances = [
@@ -492,7 +620,7 @@ def dag_to_grid(dag: DagModel, dag_runs: Sequence[DagRun], session: Session) ->
                 group_queued_dttm = None
 
             return {
-                "task_id": task_group.group_id,
+                "task_id": group_id,
                 "run_id": dag_run.run_id,
                 "state": group_state,
                 "queued_dttm": group_queued_dttm,
@@ -546,7 +674,7 @@ def dag_to_grid(dag: DagModel, dag_runs: Sequence[DagRun], session: Session) ->
                 group_end_date = max(filter(None, children_end_dates), default=None)
 
                 return {
-                    "task_id": task_group.group_id,
+                    "task_id": group_id,
                     "run_id": run_id,
                     "state": group_state,
                     "queued_dttm": group_queued_dttm,
@@ -557,36 +685,13 @@ def dag_to_grid(dag: DagModel, dag_runs: Sequence[DagRun], session: Session) ->
 
             return [get_mapped_group_summary(run_id, tis) for run_id, tis in mapped_tis.items()]
 
-        # We don't need to calculate summaries for the root
-        if task_group.group_id is None:
-            return {
-                "id": task_group.group_id,
-                "label": task_group.label,
-                "children": children,
-                "instances": [],
-            }
-
-        if next(task_group.iter_mapped_task_groups(), None) is not None:
-            return {
-                "id": task_group.group_id,
-                "label": task_group.label,
-                "children": children,
-                "tooltip": task_group.tooltip,
-                "instances": get_mapped_group_summaries(),
-                "is_mapped": True,
-            }
-
-        group_summaries = [get_summary(dr) for dr in dag_runs]
-
-        return {
-            "id": task_group.group_id,
-            "label": task_group.label,
-            "children": children,
-            "tooltip": task_group.tooltip,
-            "instances": group_summaries,
-        }
+        if item["kind"] == "root":
+            return {**node, "children": children, "instances": []}
+        if item["kind"] == "mapped":
+            return {**node, "children": children, "instances": get_mapped_group_summaries()}
+        return {**node, "children": children, "instances": [get_summary(dr) for dr in dag_runs]}
 
-    return task_group_to_grid(dag.task_group)
+    return skeleton_to_grid(skeleton)
 
 
 def get_key_paths(input_dict):
@@ -1725,6 +1830,8 @@ class Airflow(AirflowBaseView):
                 ti.task = dag.get_task(ti.task_id)
 
             if response_format == "json":
+                # Only the last lines of the log are read first, then the lines added after each request
+                task_log_reader.set_log_window(metadata)
                 logs, metadata = task_log_reader.read_log_chunks(ti, try_number, metadata)
                 message = logs[0] if try_number is not None else logs
                 return {"message": message, "metadata": metadata}
@@ -3317,16 +3424,23 @@ class Airflow(AirflowBaseView):
     @auth.has_access_dag("GET", DagAccessEntity.TASK_INSTANCE)
     def grid_data(self):
         """Return grid data."""
+        # Changes committed after this are returned by the next delta response
+        version_time = timezone.utcnow()
         dag_id = request.args.get("dag_id")
-        dag = get_airflow_app().dag_bag.get_dag(dag_id)
+        dag_bag = get_airflow_app().dag_bag
+        dag = dag_bag.get_dag(dag_id)
 
         if not dag:
             return {"error": f"can't find dag {dag_id}"}, 404
 
         root = request.args.get("root")
+        filter_upstream = request.args.get("filter_upstream") == "true"
+        filter_downstream = request.args.get("filter_downstream") == "true"
+        dag_hash = dag_bag.dags_hash.get(dag.dag_id)
+        version_key = (
+            None if dag_hash is None else (dag.dag_id, dag_hash, root, filter_upstream, filter_downstream)
+        )
         if root:
-            filter_upstream = request.args.get("filter_upstream") == "true"
-            filter_downstream = request.args.get("filter_downstream") == "true"
             dag = dag.partial_subset(
                 task_ids_or_regex=root, include_upstream=filter_upstream, include_downstream=filter_downstream
             )
@@ -3356,16 +3470,36 @@ class Airflow(AirflowBaseView):
         )
 
         encoded_runs = [wwwutils.encode_dag_run(dr, json_encoder=utils_json.WebEncoder) for dr in dag_runs]
-        data = {
-            "groups": dag_to_grid(dag, dag_runs, session),
-            "dag_runs": encoded_runs,
-            "ordering": dag.timetable.run_ordering,
-        }
+        skeleton = get_grid_skeleton(dag, version_key)
+        headers = {"Content-Type": "application/json; charset=utf-8"}
+        version = None
+        changed_since = None
+        if version_key is not None:
+            skeleton_digest = md5(json.dumps(version_key).encode()).hexdigest()
+            version = f"{skeleton_digest}@{version_time.isoformat()}"
+            # Deltas are only computed for the same version of the DAG as the previous response
+            since_digest, _, since = request.args.get("changed_since", "").partition("@")
+            if since_digest == skeleton_digest:
+                with contextlib.suppress(ValueError):
+                    changed_since = timezone.parse(since, strict=True)
+            # The URL of each delta request is different, so there is never a response to revalidate
+            if changed_since is None:
+                etag = _get_grid_etag(dag.dag_id, skeleton_digest, encoded_runs, session=session)
+                # Browsers revalidate the response each time, so the grid is only built when it changed
+                headers.update({"ETag": quote_etag(etag), "Cache-Control": "no-cache"})
+                if request.if_none_match.contains(etag):
+                    return "", 304, headers
+
+        data = {"dag_runs": encoded_runs, "ordering": dag.timetable.run_ordering, "version": version}
+        if changed_since is None:
+            data["groups"] = dag_to_grid(dag, dag_runs, session, skeleton=skeleton)
+        else:
+            changed_run_ids = _get_changed_run_ids(dag.dag_id, dag_runs, changed_since, session=session)
+            changed_runs = [dr for dr in dag_runs if dr.run_id in changed_run_ids]
+            data["groups"] = dag_to_grid(dag, changed_runs, session, skeleton=skeleton)
+            data["changed_run_ids"] = [dr.run_id for dr in changed_runs]
         # avoid spaces to reduce payload size
-        return (
-            htmlsafe_json_dumps(data, separators=(",", ":"), dumps=flask.json.dumps),
-            {"Content-Type": "application/json; charset=utf-8"},
-        )
+        return htmlsafe_json_dumps(data, separators=(",", ":"), dumps=flask.json.dumps), headers
 
     @expose("/object/historical_metrics_data")
     @auth.has_access_view(AccessView.CLUSTER_ACTIVITY)
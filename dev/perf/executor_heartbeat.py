@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Measure the cost of the heartbeat of an executor depending on the number of queued tasks.
+
+Each heartbeat triggers the queued tasks of highest priority, up to the number of open slots, which are
+then replaced by newly queued tasks, so the size of the queue stays the same. This compares the
+``PriorityDict`` of ``BaseExecutor.queued_tasks`` with the previous implementation, which sorted a dict
+of all the queued tasks on every heartbeat.
+"""
+
+from __future__ import annotations
+
+import itertools
+import random
+import statistics
+import time
+from unittest import mock
+
+import rich_click as click
+from tabulate import tabulate
+
+
+class SortingExecutorMixin:
+    """Order the queued tasks like ``BaseExecutor`` did before they were kept in a heap."""
+
+    def order_queued_tasks_by_priority(self, limit=None):
+        return sorted(self.queued_tasks.items(), key=lambda x: x[1][1], reverse=True)[:limit]
+
+
+def make_executor(sort: bool, parallelism: int):
+    from airflow.executors.base_executor import BaseExecutor
+
+    class NoopExecutor(BaseExecutor):
+        def execute_async(self, key, command, queue=None, executor_config=None):
+            pass
+
+        def sync(self):
+            # Every task finishes right away, so all the slots are open on the next heartbeat
+            self.running.clear()
+
+    if sort:
+        executor = type("SortingExecutor", (SortingExecutorMixin, NoopExecutor), {})(parallelism)
+        executor.queued_tasks = {}
+        return executor
+    return NoopExecutor(parallelism)
+
+
+def queue_tasks(executor, count: int, counter, rng: random.Random) -> None:
+    from airflow.models.taskinstancekey import TaskInstanceKey
+
+    for _ in range(count):
+        key = TaskInstanceKey("dag", f"task_{next(counter)}", "run", 1)
+        ti = mock.Mock(key=key, executor_config=None)
+        executor.queued_tasks[key] = (["airflow"], rng.randint(1, 100), None, ti)
+
+
+@click.command()
+@click.option(
+    "--queue-sizes",
+    default="1000,10000,50000,100000",
+    help="comma-separated numbers of queued tasks to measure",
+)
+@click.option("--parallelism", default=32, help="number of tasks triggered by each heartbeat")
+@click.option("--heartbeats", default=50, help="number of heartbeats per measurement")
+def main(queue_sizes: str, parallelism: int, heartbeats: int):
+    rows = []
+    for size in (int(n) for n in queue_sizes.split(",")):
+        row = [f"{size:,}"]
+        for sort in (True, False):
+            rng = random.Random(42)
+            counter = itertools.count()
+            executor = make_executor(sort, parallelism)
+            queue_tasks(executor, size, counter, rng)
+            times = []
+            with mock.patch("airflow.executors.base_executor.Stats"):
+                for _ in range(heartbeats):
+                    start = time.perf_counter()
+                    executor.heartbeat()
+                    times.append(time.perf_counter() - start)
+                    queue_tasks(executor, size - len(executor.queued_tasks), counter, rng)
+            row.append(f"{statistics.mean(times) * 1000:.2f}ms")
+        rows.append(row)
+
+    print(f"{parallelism} tasks triggered per heartbeat, {heartbeats} heartbeats per measurement")
+    print()
+    print(tabulate(rows, headers=["queued tasks", "sorted dict", "priority dict"]))
+
+
+if __name__ == "__main__":
+    main()
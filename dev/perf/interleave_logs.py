@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Measure how fast the logs of a task read from several sources are merged by ``_interleave_logs``.
+
+The logs of a task can come from several sources (local files, served logs, remote logs, the triggerer), and
+their lines are merged in the order of their timestamps. This compares the streaming merge with the
+previous implementation, which parsed the timestamps of all lines with pendulum and sorted them; for both,
+it measures the time until the first merged line is available, the total time, and optionally the peak
+memory allocated while merging.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+
+import rich_click as click
+from tabulate import tabulate
+
+
+def sort_interleave_logs(*logs):
+    """Merge logs like ``_interleave_logs`` did before it streamed the merge."""
+    import pendulum
+
+    def parse_timestamp(line: str):
+        timestamp_str, _ = line.split(" ", 1)
+        return pendulum.parse(timestamp_str.strip("[]"))
+
+    records = []
+    for log in logs:
+        timestamp = None
+        for idx, line in enumerate(log.splitlines()):
+            try:
+                timestamp = parse_timestamp(line) or timestamp
+            except Exception:
+                pass
+            records.append((timestamp, idx, line))
+    last = None
+    for _, _, v in sorted(
+        records, key=lambda x: (x[0], x[1]) if x[0] else (pendulum.datetime(2000, 1, 1), x[1])
+    ):
+        if v != last:
+            yield v
+        last = v
+
+
+def make_logs(num_sources: int, num_lines: int, rng: random.Random) -> list[str]:
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    logs = []
+    for source in range(num_sources):
+        lines = []
+        timestamp = start
+        for i in range(num_lines):
+            timestamp += timedelta(microseconds=rng.randint(0, 2000))
+            if i % 10 == 9:
+                # Multi-line messages, like tracebacks, have lines without timestamp
+                lines.append(f"    continuation of message {i} of source {source}")
+            else:
+                lines.append(
+                    f"[{timestamp.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3]}+0000] {{module.py:{i % 500}}} "
+                    f"INFO - message {i} of source {source}"
+                )
+        logs.append("\n".join(lines))
+    return logs
+
+
+def measure(interleave, logs: list[str], memory: bool) -> list[str]:
+    if memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    merged = interleave(*logs)
+    next(merged)
+    first_line = time.perf_counter() - start
+    count = 1 + sum(1 for _ in merged)
+    total = time.perf_counter() - start
+    row = [f"{first_line:.3f}s", f"{total:.2f}s", f"{count / total:,.0f}"]
+    if memory:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        row.append(f"{peak / 1024 / 1024:,.0f}MiB")
+    return row
+
+
+@click.command()
+@click.option("--num-sources", default=3, help="number of logs merged")
+@click.option("--num-lines", default=1_000_000, help="number of lines of each log")
+@click.option("--memory/--no-memory", default=False, help="measure the peak memory, which is slower")
+@click.option("--reference/--no-reference", default=True, help="also measure the sort-based merge")
+def main(num_sources: int, num_lines: int, memory: bool, reference: bool):
+    from airflow.utils.log.file_task_handler import _interleave_logs
+
+    logs = make_logs(num_sources, num_lines, random.Random(42))
+    implementations = {"streaming merge": _interleave_logs}
+    if reference:
+        implementations["parse and sort"] = sort_interleave_logs
+
+    rows = [[name, *measure(interleave, logs, memory)] for name, interleave in implementations.items()]
+
+    print(f"{num_sources} logs of {num_lines:,} lines")
+    print()
+    headers = ["merge", "first line", "total", "lines/s"]
+    if memory:
+        headers.append("peak memory")
+    print(tabulate(rows, headers=headers))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Measure the time the scheduler takes to create the DAG runs of many DAGs due at the same time.
+
+This reproduces the "midnight thundering herd": many ``@daily`` DAGs become due in the same scheduling
+loop, and ``SchedulerJobRunner._create_dag_runs`` has to create a DAG run and its task instances for
+each of them. It is measured with and without ``[scheduler] bulk_create_dag_runs``.
+
+The DAGs are written to the configured metadata database, which must be initialized, and removed at the
+end. Each measurement is rolled back, so the same DAG runs are created every time.
+"""
+
+from __future__ import annotations
+
+import statistics
+import time
+from datetime import datetime
+
+import rich_click as click
+from tabulate import tabulate
+
+DAG_ID_PREFIX = "perf_dag_run_creation_"
+
+
+def make_dags(num_dags: int, num_tasks: int, num_mapped: int) -> list:
+    from airflow.models.dag import DAG
+    from airflow.operators.bash import BashOperator
+
+    dags = []
+    for i in range(num_dags):
+        with DAG(f"{DAG_ID_PREFIX}{i}", start_date=datetime(2024, 1, 1), schedule="@daily") as dag:
+            previous = None
+            for j in range(num_tasks):
+                task = BashOperator(task_id=f"task_{j}", bash_command=f"echo {j}")
+                if previous:
+                    previous >> task
+                previous = task
+            if num_mapped:
+                BashOperator.partial(task_id="mapped").expand(
+                    bash_command=[f"echo {k}" for k in range(num_mapped)]
+                )
+        dags.append(dag)
+    return dags
+
+
+def delete_dags(session) -> None:
+    from sqlalchemy import delete
+
+    from airflow.models.dag import DagModel, DagTag
+    from airflow.models.dagrun import DagRun
+    from airflow.models.serialized_dag import SerializedDagModel
+    from airflow.models.taskinstance import TaskInstance
+
+    for model in (TaskInstance, DagRun, SerializedDagModel, DagTag, DagModel):
+        session.execute(
+            delete(model)
+            .where(model.dag_id.startswith(DAG_ID_PREFIX))
+            .execution_options(synchronize_session=False)
+        )
+    session.commit()
+
+
+@click.command()
+@click.option("--num-dags", default=500, help="number of DAGs due at the same time")
+@click.option("--num-tasks", default=20, help="number of tasks in each DAG")
+@click.option("--num-mapped", default=0, help="number of mapped task instances of a mapped task in each DAG")
+@click.option("--repeat", default=3, help="number of times to run each measurement, to reduce variance")
+def main(num_dags: int, num_tasks: int, num_mapped: int, repeat: int):
+    from sqlalchemy import select
+
+    from airflow.jobs.job import Job
+    from airflow.jobs.scheduler_job_runner import SchedulerJobRunner
+    from airflow.models.dag import DAG, DagModel
+    from airflow.models.serialized_dag import SerializedDagModel
+    from airflow.utils.session import create_session
+
+    dags = make_dags(num_dags, num_tasks, num_mapped)
+    with create_session() as session:
+        delete_dags(session)
+        DAG.bulk_write_to_db(dags, session=session)
+        for dag in dags:
+            SerializedDagModel.write_dag(dag, session=session)
+
+    job = Job()
+    job_runner = SchedulerJobRunner(job=job, subdir="/dev/null")
+
+    rows = []
+    try:
+        for bulk in (False, True):
+            job_runner._bulk_create_dag_runs = bulk
+            times = []
+            for _ in range(repeat):
+                with create_session() as session:
+                    dag_models = session.scalars(
+                        select(DagModel).where(DagModel.dag_id.startswith(DAG_ID_PREFIX))
+                    ).all()
+                    start = time.perf_counter()
+                    job_runner._create_dag_runs(dag_models, session)
+                    session.flush()
+                    times.append(time.perf_counter() - start)
+                    session.rollback()
+            total = statistics.mean(times)
+            rows.append(
+                [
+                    "bulk" if bulk else "one at a time",
+                    f"{total * 1000:.1f}ms"
+                    + (f" (±{statistics.stdev(times) * 1000:.1f}ms)" if repeat > 1 else ""),
+                    f"{total / num_dags * 1000:.2f}ms",
+                ]
+            )
+    finally:
+        with create_session() as session:
+            delete_dags(session)
+
+    print(
+        f"{num_dags} DAGs with {num_tasks} tasks"
+        + (f" and {num_mapped} mapped task instances" if num_mapped else "")
+        + f", {repeat} runs per measurement"
+    )
+    print()
+    print(tabulate(rows, headers=["DAG run creation", "total", "per DAG"]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Measure the throughput of the ``SecretsMasker`` log filter depending on the number of masked secrets.
+
+For each number of secrets, this measures the time to add the masks, and how many log records per second
+the filter handles for:
+
+* short records: a message template with a few arguments, some of them in a dict,
+* long records: a message of several kilobytes, as logged by tasks dumping command output,
+* records with secrets: long records where some secrets appear and must be masked.
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import string
+import time
+
+import rich_click as click
+from tabulate import tabulate
+
+
+def make_secret(rng: random.Random) -> str:
+    return "".join(rng.choices(string.ascii_letters + string.digits + "-_", k=rng.randint(12, 40)))
+
+
+def make_records(kind: str, num_records: int, secrets: list[str], rng: random.Random) -> list:
+    records = []
+    for i in range(num_records):
+        if kind == "short":
+            msg, args = "Processing item %s of %s with value %r", (i, num_records, {"key": f"value {i}"})
+        else:
+            words = ["".join(rng.choices(string.ascii_lowercase, k=8)) for _ in range(500)]
+            if kind == "with secrets" and secrets:
+                for position in rng.sample(range(len(words)), 5):
+                    words[position] = rng.choice(secrets)
+            msg, args = " ".join(words), ()
+        records.append(logging.LogRecord("airflow.task", logging.INFO, __file__, 1, msg, args, None))
+    return records
+
+
+@click.command()
+@click.option(
+    "--num-secrets",
+    default="0,10,100,1000,5000",
+    help="comma-separated numbers of masked secrets to measure",
+)
+@click.option("--num-records", default=5000, help="number of log records filtered per measurement")
+def main(num_secrets: str, num_records: int):
+    from airflow import settings
+    from airflow.utils.log.secrets_masker import SecretsMasker
+
+    settings.MASK_SECRETS_IN_LOGS = True
+    rng = random.Random(42)
+    rows = []
+    for count in (int(n) for n in num_secrets.split(",")):
+        masker = SecretsMasker()
+        secrets = [make_secret(rng) for _ in range(count)]
+        start = time.perf_counter()
+        for secret in secrets:
+            masker.add_mask(secret)
+        # Masks are compiled when they are first used
+        masker.redact("")
+        add_time = time.perf_counter() - start
+
+        row = [count, f"{add_time * 1000:.1f}ms"]
+        for kind in ("short", "long", "with secrets"):
+            records = make_records(kind, num_records, secrets, rng)
+            start = time.perf_counter()
+            for record in records:
+                masker.filter(record)
+            row.append(f"{num_records / (time.perf_counter() - start):,.0f}")
+        rows.append(row)
+
+    print(f"{num_records} records per measurement")
+    print()
+    print(
+        tabulate(
+            rows,
+            headers=["secrets", "add masks", "short records/s", "long records/s", "records with secrets/s"],
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Compare the size and read time of the serialized DAG storage formats.
+
+For each of ``json``, ``json`` compressed (``[core] compress_serialized_dags``) and ``indexed``
+(``[core] serialized_dag_storage_format``), this measures the size of the stored data and the time to:
+
+* load the whole serialized DAG dict,
+* deserialize the whole DAG,
+* deserialize a single task with a lazily deserialized DAG,
+* read the DAG dependencies.
+"""
+
+from __future__ import annotations
+
+import statistics
+import time
+import zlib
+from datetime import datetime
+from typing import Any, Callable
+
+import rich_click as click
+from tabulate import tabulate
+
+
+def make_dag(num_tasks: int, fan_out: int):
+    from airflow.models.dag import DAG
+    from airflow.operators.bash import BashOperator
+    from airflow.utils.task_group import TaskGroup
+
+    with DAG("perf_serialized_dag_storage", start_date=datetime(2024, 1, 1), schedule="@daily") as dag:
+        previous: list = []
+        group_size = max(num_tasks // 10, 1)
+        for group_index in range(0, num_tasks, group_size):
+            with TaskGroup(f"group_{group_index // group_size}"):
+                for i in range(group_index, min(group_index + group_size, num_tasks)):
+                    task = BashOperator(task_id=f"task_{i}", bash_command=f"echo {i}", retries=i % 3)
+                    if previous:
+                        previous[i % len(previous)] >> task
+                    previous.append(task)
+                    previous = previous[-fan_out:]
+    return dag
+
+
+def timeit(func: Callable[[], Any], repeat: int) -> str:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    if repeat > 1:
+        return f"{statistics.mean(times) * 1000:.1f}ms (±{statistics.stdev(times) * 1000:.1f}ms)"
+    return f"{times[0] * 1000:.1f}ms"
+
+
+@click.command()
+@click.option("--num-tasks", default=5000, help="number of tasks in the benchmarked DAG")
+@click.option("--fan-out", default=5, help="number of recent tasks a new task can depend on")
+@click.option("--repeat", default=5, help="number of times to run each measurement, to reduce variance")
+def main(num_tasks: int, fan_out: int, repeat: int):
+    from airflow.serialization.indexed_dag_data import IndexedDagData, encode_indexed_dag_data
+    from airflow.serialization.serialized_objects import SerializedDAG
+    from airflow.settings import json
+
+    dag_data = SerializedDAG.to_dict(make_dag(num_tasks, fan_out))
+    task_id = f"group_0.task_{num_tasks // 20}"
+
+    json_text = json.dumps(dag_data)
+    compressed = zlib.compress(json_text.encode("utf-8"))
+    indexed = encode_indexed_dag_data(dag_data)
+
+    def load_json() -> dict:
+        return json.loads(json_text)
+
+    def load_compressed() -> dict:
+        return json.loads(zlib.decompress(compressed))
+
+    loaders: dict[str, tuple[int, Callable[[], dict], Callable[[], list | None]]] = {
+        "json": (
+            len(json_text.encode("utf-8")),
+            load_json,
+            lambda: load_json()["dag"].get("dag_dependencies"),
+        ),
+        "json (compressed)": (
+            len(compressed),
+            load_compressed,
+            lambda: load_compressed()["dag"].get("dag_dependencies"),
+        ),
+        "indexed": (
+            len(indexed),
+            lambda: IndexedDagData(indexed).to_dict(),
+            lambda: IndexedDagData(indexed).dag_dependencies,
+        ),
+    }
+
+    def lazy_indexed_task():
+        data = IndexedDagData(indexed).to_dict(decode_tasks=False)
+        return SerializedDAG.from_dict(data, lazy=True).get_task(task_id)
+
+    rows = []
+    for name, (size, load, read_dependencies) in loaders.items():
+        if name == "indexed":
+            read_one_task = lazy_indexed_task
+        else:
+
+            def read_one_task(load=load):
+                return SerializedDAG.from_dict(load(), lazy=True).get_task(task_id)
+
+        rows.append(
+            [
+                name,
+                f"{size / 1024:.1f}KiB",
+                timeit(load, repeat),
+                timeit(lambda load=load: SerializedDAG.from_dict(load()), repeat),
+                timeit(read_one_task, repeat),
+                timeit(read_dependencies, repeat),
+            ]
+        )
+
+    print(f"DAG with {num_tasks} tasks, {repeat} runs per measurement")
+    print()
+    print(
+        tabulate(
+            rows,
+            headers=["format", "size", "load dict", "deserialize DAG", "deserialize one task", "read deps"],
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
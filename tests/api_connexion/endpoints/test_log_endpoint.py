@@ -34,6 +34,7 @@ from airflow.security import permissions
 from airflow.utils import timezone
 from airflow.utils.types import DagRunType
 from tests.test_utils.api_connexion_utils import assert_401, create_user, delete_user
+from tests.test_utils.config import conf_vars
 from tests.test_utils.db import clear_db_runs
 
 pytestmark = pytest.mark.db_test
@@ -173,6 +174,54 @@ class TestGetLog:
         assert info == {"end_of_log": True, "log_pos": 16}
         assert 200 == response.status_code
 
+    @conf_vars({("webserver", "log_tail_lines"): "2"})
+    @pytest.mark.parametrize("accept", ["application/json", "text/plain"])
+    def test_should_read_tail_then_new_lines(self, accept):
+        log = self.log_dir / f"dag_id={self.DAG_ID}/run_id={self.RUN_ID}/task_id={self.TASK_ID}/attempt=1.log"
+        log.write_text("line 1\nline 2\nline 3\n")
+        request_url = f"api/v1/dags/{self.DAG_ID}/dagRuns/{self.RUN_ID}/taskInstances/{self.TASK_ID}/logs/1"
+
+        def get_log(token=None):
+            response = self.client.get(
+                request_url,
+                query_string={"log_window": True, **({"token": token} if token else {})},
+                headers={"Accept": accept},
+                environ_overrides={"REMOTE_USER": "test"},
+            )
+            assert response.status_code == 200
+            if accept == "application/json":
+                return response.json["content"], response.json["continuation_token"]
+            return response.data.decode("utf-8"), response.headers["Airflow-Continuation-Token"]
+
+        content, token = get_log()
+        assert "line 1" not in content
+        assert "line 2" in content
+        assert "line 3" in content
+
+        with log.open("a") as f:
+            f.write("line 4\n")
+        content, token = get_log(token)
+        if accept == "application/json":
+            assert content == "[('localhost', 'line 4')]"
+        else:
+            assert content == "line 4\n"
+
+        content, _ = get_log(token)
+        assert "line" not in content
+
+    @conf_vars({("webserver", "log_tail_lines"): "2"})
+    def test_should_read_whole_log_without_log_window(self):
+        log = self.log_dir / f"dag_id={self.DAG_ID}/run_id={self.RUN_ID}/task_id={self.TASK_ID}/attempt=1.log"
+        log.write_text("line 1\nline 2\nline 3\n")
+        response = self.client.get(
+            f"api/v1/dags/{self.DAG_ID}/dagRuns/{self.RUN_ID}/taskInstances/{self.TASK_ID}/logs/1",
+            headers={"Accept": "text/plain"},
+            environ_overrides={"REMOTE_USER": "test"},
+        )
+        assert response.status_code == 200
+        assert "Airflow-Continuation-Token" not in response.headers
+        assert "line 1\nline 2\nline 3" in response.data.decode("utf-8")
+
     @pytest.mark.parametrize(
         "request_url, expected_filename, extra_query_string",
         [
@@ -266,6 +315,7 @@ class TestGetLog:
             "type": EXCEPTIONS_LINK_MAP[404],
         }
 
+    @mock.patch("airflow.utils.log.log_reader.TaskLogReader.supports_read_log_lines", False)
     def test_get_logs_with_metadata_as_download_large_file(self):
         with mock.patch("airflow.utils.log.file_task_handler.FileTaskHandler.read") as read_mock:
             first_return = ([[("", "1st line")]], [{}])
@@ -685,6 +685,85 @@ class TestDagProcessorJobRunner:
             )
             assert serialized_dag_count == 0
 
+    @conf_vars(
+        {
+            ("core", "load_examples"): "False",
+            ("scheduler", "skip_unchanged_dag_files"): "True",
+            ("scheduler", "min_file_process_interval"): "0",
+        }
+    )
+    def test_skip_unchanged_dag_files(self, tmp_path):
+        dag_file = tmp_path / "dag.py"
+        dag_file.write_text(
+            textwrap.dedent(
+                """
+                import datetime
+
+                from airflow.models.dag import DAG
+                from airflow.operators.empty import EmptyOperator
+
+                with DAG(dag_id="test_skip_unchanged", schedule=None, start_date=datetime.datetime(2024, 1, 1)):
+                    EmptyOperator(task_id="task")
+                """
+            )
+        )
+        dag_path = str(dag_file)
+        manager = DagFileProcessorManager(
+            dag_directory=tmp_path,
+            max_runs=-1,
+            processor_timeout=timedelta(days=365),
+            signal_conn=MagicMock(),
+            dag_ids=[],
+            pickle_dags=False,
+            async_mode=True,
+        )
+        manager.set_file_paths([dag_path])
+
+        # Never parsed, so it is queued.
+        manager.prepare_file_path_queue()
+        assert manager._file_path_queue == deque([dag_path])
+        manager._file_path_queue.clear()
+
+        # Parse it and record the result, as if a processor had run.
+        dagbag = DagBag(dag_path, read_dags_from_db=False, include_examples=False)
+        last_parsed_time = timezone.datetime(2024, 1, 1)
+        with create_session() as session:
+            dagbag.sync_to_db(processor_subdir=str(tmp_path), session=session)
+            session.query(DagModel).filter(DagModel.fileloc == dag_path).update(
+                {DagModel.last_parsed_time: last_parsed_time}
+            )
+        manager._processor_fingerprints[dag_path] = manager._parse_cache.fingerprint(dag_path)
+        processor = MagicMock(file_path=dag_path, result=(1, 0), start_time=timezone.utcnow())
+        manager._collect_results_from_processor(processor)
+        assert manager._file_stats[dag_path].run_count == 1
+
+        # Nothing changed: not queued, but counted as parsed.
+        manager.prepare_file_path_queue()
+        assert manager._file_path_queue == deque()
+        assert manager._file_stats[dag_path].run_count == 2
+        with create_session() as session:
+            dag_model = session.query(DagModel).filter(DagModel.fileloc == dag_path).one()
+            assert dag_model.last_parsed_time > last_parsed_time
+
+            # The DAG was deleted, so the file needs to be parsed again.
+            dag_model.is_active = False
+        manager.prepare_file_path_queue()
+        assert manager._file_path_queue == deque([dag_path])
+        manager._file_path_queue.clear()
+
+        manager._processor_fingerprints[dag_path] = manager._parse_cache.fingerprint(dag_path)
+        manager._collect_results_from_processor(processor)
+        with create_session() as session:
+            session.query(DagModel).filter(DagModel.fileloc == dag_path).update({DagModel.is_active: True})
+        manager.prepare_file_path_queue()
+        assert manager._file_path_queue == deque()
+
+        # The file changed.
+        with open(dag_file, "a") as f:
+            f.write("# changed\n")
+        manager.prepare_file_path_queue()
+        assert manager._file_path_queue == deque([dag_path])
+
     @conf_vars(
         {
             ("core", "load_examples"): "False",
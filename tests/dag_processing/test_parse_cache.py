@@ -0,0 +1,105 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import pytest
+
+from airflow.dag_processing.parse_cache import DagFileParseCache
+
+
+@pytest.fixture
+def dag_folder(tmp_path):
+    (tmp_path / "common").mkdir()
+    (tmp_path / "common" / "__init__.py").write_text("")
+    (tmp_path / "common" / "utils.py").write_text("DEFAULT_ARGS = {}\n")
+    (tmp_path / "team").mkdir()
+    (tmp_path / "team" / "settings.py").write_text("OWNER = 'team'\n")
+    (tmp_path / "team" / "dag.py").write_text(
+        "from airflow import DAG\n"
+        "from common.utils import DEFAULT_ARGS\n"
+        "from .settings import OWNER\n"
+        "import os\n"
+    )
+    (tmp_path / "unrelated.py").write_text("X = 1\n")
+    return tmp_path
+
+
+class TestDagFileParseCache:
+    def test_fingerprint_is_stable(self, dag_folder):
+        cache = DagFileParseCache(dag_folder)
+        dag_file = str(dag_folder / "team" / "dag.py")
+
+        assert cache.fingerprint(dag_file) is not None
+        assert cache.fingerprint(dag_file) == DagFileParseCache(dag_folder).fingerprint(dag_file)
+
+    @pytest.mark.parametrize(
+        "changed_file",
+        [
+            pytest.param("team/dag.py", id="dag-file"),
+            pytest.param("common/utils.py", id="absolute-import"),
+            pytest.param("common/__init__.py", id="parent-package"),
+            pytest.param("team/settings.py", id="relative-import"),
+        ],
+    )
+    def test_fingerprint_changes_with_local_imports(self, dag_folder, changed_file):
+        cache = DagFileParseCache(dag_folder)
+        dag_file = str(dag_folder / "team" / "dag.py")
+        fingerprint = cache.fingerprint(dag_file)
+
+        with open(dag_folder / changed_file, "a") as f:
+            f.write("# changed\n")
+
+        assert cache.fingerprint(dag_file) != fingerprint
+
+    def test_fingerprint_ignores_other_files(self, dag_folder):
+        cache = DagFileParseCache(dag_folder)
+        dag_file = str(dag_folder / "team" / "dag.py")
+        fingerprint = cache.fingerprint(dag_file)
+
+        (dag_folder / "unrelated.py").write_text("X = 2\n")
+
+        assert cache.fingerprint(dag_file) == fingerprint
+
+    def test_dynamic_marker(self, dag_folder):
+        cache = DagFileParseCache(dag_folder)
+        dag_file = str(dag_folder / "team" / "dag.py")
+        (dag_folder / "common" / "utils.py").write_text("# airflow-dynamic-dag\nDEFAULT_ARGS = {}\n")
+
+        assert cache.fingerprint(dag_file) is None
+        cache.record(dag_file, cache.fingerprint(dag_file))
+        assert not cache.is_unchanged(dag_file)
+
+    def test_missing_file(self, dag_folder):
+        cache = DagFileParseCache(dag_folder)
+        assert cache.fingerprint(str(dag_folder / "missing.py")) is None
+
+    def test_is_unchanged(self, dag_folder):
+        cache = DagFileParseCache(dag_folder)
+        dag_file = str(dag_folder / "team" / "dag.py")
+
+        assert not cache.is_unchanged(dag_file)
+        cache.record(dag_file, cache.fingerprint(dag_file))
+        assert cache.is_unchanged(dag_file)
+
+        (dag_folder / "team" / "settings.py").write_text("OWNER = 'other team'\n")
+        assert not cache.is_unchanged(dag_file)
+
+        cache.record(dag_file, cache.fingerprint(dag_file))
+        assert cache.is_unchanged(dag_file)
+        cache.retain([])
+        assert not cache.is_unchanged(dag_file)
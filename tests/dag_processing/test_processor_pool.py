@@ -0,0 +1,173 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import sys
+import textwrap
+import time
+import types
+from datetime import timedelta
+from unittest import mock
+
+import pytest
+
+from airflow.dag_processing.manager import DagFileProcessorManager
+from airflow.dag_processing.processor_pool import (
+    DagFileProcessorWorkerPool,
+    PooledDagFileProcessorProcess,
+    _unload_dag_folder_modules,
+)
+from tests.test_utils.config import conf_vars
+from tests.test_utils.db import clear_db_dags, clear_db_serialized_dags
+
+pytestmark = pytest.mark.db_test
+
+DAG_FILE_CONTENTS = textwrap.dedent(
+    """
+    import datetime
+
+    from airflow.models.dag import DAG
+    from airflow.operators.empty import EmptyOperator
+
+    with DAG(dag_id="{dag_id}", schedule=None, start_date=datetime.datetime(2024, 1, 1)):
+        EmptyOperator(task_id="task")
+    """
+)
+
+
+def _wait(processor: PooledDagFileProcessorProcess, timeout: float = 60):
+    deadline = time.monotonic() + timeout
+    while not processor.done:
+        assert time.monotonic() < deadline, "Timed out waiting for the worker"
+        time.sleep(0.05)
+    return processor.result
+
+
+def _process(pool: DagFileProcessorWorkerPool, file_path, dag_directory) -> PooledDagFileProcessorProcess:
+    processor = pool.create_processor(
+        file_path=str(file_path),
+        pickle_dags=False,
+        dag_ids=None,
+        dag_directory=str(dag_directory),
+        callback_requests=[],
+    )
+    processor.start()
+    _wait(processor)
+    return processor
+
+
+class TestDagFileProcessorWorkerPool:
+    @pytest.fixture(autouse=True)
+    def clean_db(self):
+        clear_db_dags()
+        clear_db_serialized_dags()
+        yield
+        clear_db_dags()
+        clear_db_serialized_dags()
+
+    @pytest.fixture
+    def dag_files(self, tmp_path):
+        paths = []
+        for i in range(3):
+            path = tmp_path / f"dag_{i}.py"
+            path.write_text(DAG_FILE_CONTENTS.format(dag_id=f"test_worker_pool_{i}"))
+            paths.append(path)
+        return paths
+
+    def test_workers_are_reused_and_recycled(self, tmp_path, dag_files):
+        pool = DagFileProcessorWorkerPool(max_files=2)
+        try:
+            first = _process(pool, dag_files[0], tmp_path)
+            second = _process(pool, dag_files[1], tmp_path)
+            third = _process(pool, dag_files[2], tmp_path)
+        finally:
+            pool.terminate()
+
+        assert [p.result for p in (first, second, third)] == [(1, 0), (1, 0), (1, 0)]
+        # The first worker parsed two files and then retired, so the third file ran on a new one.
+        assert first.pid == second.pid
+        assert third.pid != first.pid
+        assert pool.get_all_pids() == []
+
+    def test_worker_exiting_during_parse_is_replaced(self, tmp_path, dag_files):
+        exiting_file = tmp_path / "exiting.py"
+        exiting_file.write_text("import sys\n# airflow DAG\nsys.exit(-1)\n")
+        pool = DagFileProcessorWorkerPool()
+        try:
+            failed = _process(pool, exiting_file, tmp_path)
+            succeeded = _process(pool, dag_files[0], tmp_path)
+        finally:
+            pool.terminate()
+
+        assert failed.result is None
+        assert failed.exit_code is not None
+        assert succeeded.result == (1, 0)
+        assert succeeded.pid != failed.pid
+
+    def test_kill_discards_worker(self, tmp_path):
+        slow_file = tmp_path / "slow.py"
+        slow_file.write_text("import time\n# airflow DAG\ntime.sleep(60)\n")
+        pool = DagFileProcessorWorkerPool()
+        processor = pool.create_processor(str(slow_file), False, None, str(tmp_path), [])
+        processor.start()
+        try:
+            assert not processor.done
+            processor.kill()
+        finally:
+            pool.terminate()
+        assert processor.done
+        assert processor.result is None
+        assert pool.get_all_pids() == []
+
+
+def test_unload_dag_folder_modules(tmp_path):
+    dag_folder_module = types.ModuleType("dag_folder_helper")
+    dag_folder_module.__file__ = str(tmp_path / "dag_folder_helper.py")
+    other_module = types.ModuleType("other_helper")
+    other_module.__file__ = str(tmp_path.parent / "other_helper.py")
+
+    modules_before = set(sys.modules)
+    with mock.patch.dict(sys.modules, {"dag_folder_helper": dag_folder_module, "other_helper": other_module}):
+        _unload_dag_folder_modules(str(tmp_path), modules_before)
+        assert "dag_folder_helper" not in sys.modules
+        assert "other_helper" in sys.modules
+
+
+@conf_vars({("scheduler", "parsing_worker_pool"): "True", ("core", "load_examples"): "False"})
+def test_manager_starts_processors_on_worker_pool(tmp_path):
+    manager = DagFileProcessorManager(
+        dag_directory=tmp_path,
+        max_runs=1,
+        processor_timeout=timedelta(days=365),
+        signal_conn=None,
+        dag_ids=[],
+        pickle_dags=False,
+        async_mode=True,
+    )
+    assert manager._worker_pool is not None
+
+    manager._file_path_queue.append(str(tmp_path / "dag.py"))
+    with mock.patch.object(PooledDagFileProcessorProcess, "start"), mock.patch.object(
+        PooledDagFileProcessorProcess, "pid", new_callable=mock.PropertyMock, return_value=1234
+    ), mock.patch.object(
+        PooledDagFileProcessorProcess, "waitable_handle", new_callable=mock.PropertyMock
+    ), mock.patch.object(DagFileProcessorManager, "_create_process") as mock_create_process:
+        manager.start_new_processes()
+
+    mock_create_process.assert_not_called()
+    assert isinstance(manager._processors[str(tmp_path / "dag.py")], PooledDagFileProcessorProcess)
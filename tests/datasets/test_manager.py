@@ -57,7 +57,7 @@ class TestDatasetManager:
 
         mock_session = mock.Mock()
         # Gotta mock up the query results
-        mock_session.scalar.return_value = None
+        mock_session.scalars.return_value.unique.return_value = []
 
         dsem.register_dataset_change(task_instance=mock_task_instance, dataset=dataset, session=mock_session)
 
@@ -131,3 +131,86 @@ class TestDatasetManager:
         # Ensure the listener was notified
         assert len(dataset_listener.created) == 1
         assert dataset_listener.created[0].uri == dsm.uri
+
+    def test_register_dataset_changes(self, session, mock_task_instance):
+        dsem = DatasetManager()
+        dataset_listener.clear()
+        get_listener_manager().add_listener(dataset_listener)
+
+        dags = [DagModel(dag_id=f"dag{i}", is_active=True) for i in range(3)]
+        session.add_all(dags)
+        dsm1 = DatasetModel(uri="test_dataset_uri_1")
+        dsm2 = DatasetModel(uri="test_dataset_uri_2")
+        session.add_all([dsm1, dsm2])
+        dsm1.consuming_dags = [DagScheduleDatasetReference(dag_id=dag.dag_id) for dag in dags[:2]]
+        dsm2.consuming_dags = [DagScheduleDatasetReference(dag_id=dag.dag_id) for dag in dags[1:]]
+        session.flush()
+        # A queued dagrun already exists for one of the consuming DAGs
+        session.add(DatasetDagRunQueue(dataset_id=dsm1.id, target_dag_id="dag0"))
+        session.flush()
+
+        dataset_events = dsem.register_dataset_changes(
+            task_instance=mock_task_instance,
+            dataset_changes=[
+                (Dataset(uri="test_dataset_uri_1"), {"a": 1}),
+                (Dataset(uri="dataset_doesnt_exist"), None),
+                (Dataset(uri="test_dataset_uri_2"), {}),
+            ],
+            session=session,
+        )
+
+        assert [(event.dataset_id, event.extra) for event in dataset_events] == [
+            (dsm1.id, {"a": 1}),
+            (dsm2.id, {}),
+        ]
+        assert all(event.source_task_id == "5" for event in dataset_events)
+        assert session.query(DatasetEvent).count() == 2
+        assert sorted(
+            session.query(DatasetDagRunQueue.dataset_id, DatasetDagRunQueue.target_dag_id).all()
+        ) == sorted(
+            [(dsm1.id, "dag0"), (dsm1.id, "dag1"), (dsm2.id, "dag1"), (dsm2.id, "dag2")],
+        )
+        assert [dataset.uri for dataset in dataset_listener.changed] == [
+            "test_dataset_uri_1",
+            "test_dataset_uri_2",
+        ]
+
+    def test_register_dataset_changes_without_datasets(self):
+        mock_session = mock.Mock()
+
+        assert DatasetManager.register_dataset_changes(dataset_changes=[], session=mock_session) == []
+        mock_session.scalars.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "dialect_name, expected_clause",
+        [
+            ("postgresql", "ON CONFLICT DO NOTHING"),
+            ("mysql", "ON DUPLICATE KEY UPDATE target_dag_id = dataset_dag_run_queue.target_dag_id"),
+            ("sqlite", "ON CONFLICT DO NOTHING"),
+        ],
+    )
+    def test_queue_dagruns_in_one_statement(self, dialect_name, expected_clause):
+        from sqlalchemy.dialects import mysql, postgresql, sqlite
+
+        dialects = {"postgresql": postgresql, "mysql": mysql, "sqlite": sqlite}
+        dags = [mock.Mock(dag_id=f"dag{i}", is_active=True, is_paused=False) for i in range(3)]
+        dags.append(mock.Mock(dag_id="paused", is_active=True, is_paused=True))
+        datasets = [
+            mock.Mock(id=1, consuming_dags=[mock.Mock(dag=dag) for dag in dags]),
+            mock.Mock(id=2, consuming_dags=[mock.Mock(dag=dags[0])]),
+        ]
+        mock_session = mock.Mock()
+        mock_session.bind.dialect.name = dialect_name
+
+        DatasetManager._queue_dagruns_for_datasets(datasets, mock_session)
+
+        mock_session.execute.assert_called_once()
+        stmt, values = mock_session.execute.call_args.args
+        assert expected_clause in str(stmt.compile(dialect=dialects[dialect_name].dialect()))
+        assert values == [
+            {"target_dag_id": "dag0", "dataset_id": 1},
+            {"target_dag_id": "dag0", "dataset_id": 2},
+            {"target_dag_id": "dag1", "dataset_id": 1},
+            {"target_dag_id": "dag2", "dataset_id": 1},
+        ]
+        mock_session.begin_nested.assert_not_called()
@@ -184,6 +184,29 @@ def test_trigger_queued_tasks(dag_maker, open_slots):
     assert executor.execute_async.call_count == open_slots
 
 
+def test_trigger_tasks_by_priority():
+    executor = BaseExecutor()
+    executor.execute_async = mock.Mock()
+    priorities = [3, 1, 5, 3, 2, 5]
+    for i, priority in enumerate(priorities):
+        ti = mock.Mock(key=TaskInstanceKey("dag", f"task_{i}", "run", 1), executor_config={})
+        executor.queue_command(ti, ["airflow"], priority=priority)
+
+    executor.trigger_tasks(3)
+    executor.trigger_tasks(3)
+
+    # Tasks of equal priority are triggered in the order they were queued
+    assert [call.kwargs["key"].task_id for call in executor.execute_async.call_args_list] == [
+        "task_2",
+        "task_5",
+        "task_0",
+        "task_3",
+        "task_4",
+        "task_1",
+    ]
+    assert not executor.queued_tasks
+
+
 @pytest.mark.db_test
 @pytest.mark.parametrize(
     "can_try_num, change_state_num, second_exec",
@@ -32,6 +32,7 @@ import psutil
 import pytest
 import time_machine
 from sqlalchemy import func, select, update
+from sqlalchemy.exc import OperationalError
 
 import airflow.example_dags
 from airflow import settings
@@ -51,7 +52,7 @@ from airflow.jobs.local_task_job_runner import LocalTaskJobRunner
 from airflow.jobs.scheduler_job_runner import SchedulerJobRunner
 from airflow.models.dag import DAG, DagModel
 from airflow.models.dagbag import DagBag
-from airflow.models.dagrun import DagRun
+from airflow.models.dagrun import DagRun, DagTaskDiff
 from airflow.models.dataset import DatasetDagRunQueue, DatasetEvent, DatasetModel
 from airflow.models.db_callback_request import DbCallbackRequest
 from airflow.models.pool import Pool
@@ -82,7 +83,7 @@ from tests.test_utils.db import (
     set_default_pool_slots,
 )
 from tests.test_utils.mock_executor import MockExecutor
-from tests.test_utils.mock_operators import CustomOperator
+from tests.test_utils.mock_operators import CustomOperator, MockOperator
 from tests.utils.test_timezone import UTC
 
 pytestmark = pytest.mark.db_test
@@ -864,6 +865,76 @@ class TestSchedulerJob:
 
         session.rollback()
 
+    @conf_vars({("scheduler", "use_incremental_ready_queue"): "True"})
+    def test_find_executable_task_instances_with_incremental_ready_queue(self, dag_maker):
+        session = settings.Session()
+        session.add(Pool(pool="pool1", slots=32, include_deferred=False))
+        session.add(Pool(pool="pool2", slots=32, include_deferred=False))
+
+        with dag_maker(
+            dag_id="SchedulerJobTest.test_find_executable_task_instances_with_incremental_ready_queue",
+            max_active_tasks=16,
+            session=session,
+        ):
+            op1 = EmptyOperator(task_id="dummy1", priority_weight=1, pool="pool1")
+            op2 = EmptyOperator(task_id="dummy2", priority_weight=2, pool="pool2")
+            op3 = EmptyOperator(task_id="dummy3", priority_weight=3, pool="pool1")
+        dag_run = dag_maker.create_dagrun(run_type=DagRunType.SCHEDULED)
+
+        scheduler_job = Job()
+        self.job_runner = SchedulerJobRunner(job=scheduler_job, subdir=os.devnull)
+        assert self.job_runner._ready_queue is not None
+
+        ti1, ti2, ti3 = (dag_run.get_task_instance(op.task_id, session) for op in (op1, op2, op3))
+        ti2.state = State.SCHEDULED
+        ti3.state = State.SCHEDULED
+        session.flush()
+
+        res = self.job_runner._executable_task_instances_to_queued(max_tis=1, session=session)
+        assert [ti.key for ti in res] == [ti3.key]
+        assert ti3.key.primary not in self.job_runner._ready_queue
+
+        # ti1 becomes schedulable after the queue was loaded and is picked up as a delta.
+        ti1.state = State.SCHEDULED
+        session.flush()
+        res = self.job_runner._executable_task_instances_to_queued(max_tis=32, session=session)
+        assert [ti.key for ti in res] == [ti2.key, ti1.key]
+        assert len(self.job_runner._ready_queue) == 0
+
+        session.rollback()
+
+    @conf_vars({("scheduler", "use_incremental_ready_queue"): "True"})
+    def test_incremental_ready_queue_drops_unconfirmed_candidates(self, dag_maker):
+        session = settings.Session()
+        with dag_maker(
+            dag_id="SchedulerJobTest.test_incremental_ready_queue_drops_unconfirmed_candidates",
+            max_active_tasks=16,
+            session=session,
+        ):
+            op1 = EmptyOperator(task_id="dummy1", priority_weight=2)
+            op2 = EmptyOperator(task_id="dummy2", priority_weight=1)
+        dag_run = dag_maker.create_dagrun(run_type=DagRunType.SCHEDULED)
+
+        scheduler_job = Job()
+        self.job_runner = SchedulerJobRunner(job=scheduler_job, subdir=os.devnull)
+
+        ti1 = dag_run.get_task_instance(op1.task_id, session)
+        ti2 = dag_run.get_task_instance(op2.task_id, session)
+        ti1.state = State.SCHEDULED
+        ti2.state = State.SCHEDULED
+        session.flush()
+        self.job_runner._ready_queue.refresh(session=session)
+
+        # Another component moves ti1 out of SCHEDULED without the queue seeing a delta for it.
+        session.execute(update(TaskInstance).where(TaskInstance.task_id == op1.task_id).values(state=None))
+        with mock.patch.object(self.job_runner._ready_queue, "refresh"):
+            res = self.job_runner._executable_task_instances_to_queued(max_tis=1, session=session)
+
+        assert [ti.key for ti in res] == [ti2.key]
+        assert ti1.key.primary not in self.job_runner._ready_queue
+
+        session.rollback()
+
     def test_find_executable_task_instances_order_execution_date_and_priority(self, dag_maker):
         dag_id_1 = "SchedulerJobTest.test_find_executable_task_instances_order_execution_date_and_priority-a"
         dag_id_2 = "SchedulerJobTest.test_find_executable_task_instances_order_execution_date_and_priority-b"
@@ -1133,6 +1204,80 @@ class TestSchedulerJob:
         assert 0 == len(res)
         session.rollback()
 
+    @conf_vars({("scheduler", "concurrency_map_refresh_interval"): "3600"})
+    def test_find_executable_task_instances_cached_concurrency_map(self, dag_maker):
+        dag_id = "SchedulerJobTest.test_find_executable_task_instances_cached_concurrency_map"
+        session = settings.Session()
+        with dag_maker(dag_id=dag_id, max_active_tasks=2, session=session):
+            EmptyOperator(task_id="dummy")
+
+        executor = MockExecutor(do_update=False)
+        scheduler_job = Job(executor=executor)
+        self.job_runner = SchedulerJobRunner(job=scheduler_job, subdir=os.devnull)
+        self.job_runner.processor_agent = mock.MagicMock()
+
+        dr1 = dag_maker.create_dagrun(run_type=DagRunType.SCHEDULED)
+        dr2 = dag_maker.create_dagrun_after(dr1, run_type=DagRunType.SCHEDULED)
+        dr3 = dag_maker.create_dagrun_after(dr2, run_type=DagRunType.SCHEDULED)
+        ti1, ti2, ti3 = (dr.task_instances[0] for dr in (dr1, dr2, dr3))
+        ti1.state = State.RUNNING
+        ti2.state = State.SCHEDULED
+        ti3.state = State.SCHEDULED
+        session.flush()
+
+        res = self.job_runner._executable_task_instances_to_queued(max_tis=32, session=session)
+        assert [ti.key for ti in res] == [ti2.key]
+        # The queued TI is only counted in the cached map once it is committed
+        assert self.job_runner._cached_concurrency_map.dag_active_tasks_map[dag_id] == 1
+        self.job_runner._apply_queued_concurrency_map()
+        assert self.job_runner._cached_concurrency_map.dag_active_tasks_map[dag_id] == 2
+
+        # The map is not recomputed, so a TI finishing behind the scheduler's back is not noticed...
+        session.execute(update(TaskInstance).where(TaskInstance.run_id == dr1.run_id).values(state="success"))
+        with mock.patch.object(
+            SchedulerJobRunner, "_SchedulerJobRunner__get_concurrency_maps"
+        ) as mock_get_concurrency_maps:
+            res = self.job_runner._executable_task_instances_to_queued(max_tis=32, session=session)
+            assert res == []
+
+            # ...until the executor reports it.
+            executor.event_buffer[ti1.key] = State.SUCCESS, None
+            self.job_runner._process_executor_events(session=session)
+            assert self.job_runner._cached_concurrency_map.dag_active_tasks_map[dag_id] == 1
+
+            res = self.job_runner._executable_task_instances_to_queued(max_tis=32, session=session)
+            assert [ti.key for ti in res] == [ti3.key]
+        mock_get_concurrency_maps.assert_not_called()
+        session.rollback()
+
+    @conf_vars({("scheduler", "concurrency_map_refresh_interval"): "3600"})
+    def test_cached_concurrency_map_is_kept_when_critical_section_is_rolled_back(self, dag_maker, session):
+        dag_id = "SchedulerJobTest.test_cached_concurrency_map_is_kept_when_critical_section_is_rolled_back"
+        with dag_maker(dag_id=dag_id, max_active_tasks=2, session=session):
+            EmptyOperator(task_id="dummy")
+        dr = dag_maker.create_dagrun(run_type=DagRunType.SCHEDULED)
+        dr.task_instances[0].state = State.SCHEDULED
+        session.commit()
+
+        scheduler_job = Job(executor=MockExecutor(do_update=False))
+        self.job_runner = SchedulerJobRunner(job=scheduler_job, subdir=os.devnull)
+        self.job_runner.processor_agent = mock.MagicMock(spec=DagFileProcessorAgent)
+
+        def queue_then_time_out(session):
+            # The task instance is counted, then its update times out waiting for a lock
+            assert len(self.job_runner._executable_task_instances_to_queued(max_tis=32, session=session)) == 1
+            raise OperationalError("Lock wait timeout exceeded", params=None, orig=RuntimeError(1205))
+
+        with mock.patch.object(
+            self.job_runner, "_critical_section_enqueue_task_instances", side_effect=queue_then_time_out
+        ):
+            assert self.job_runner._do_scheduling(session) == 0
+        assert self.job_runner._cached_concurrency_map.dag_active_tasks_map[dag_id] == 0
+
+        with mock.patch.object(self.job_runner, "_enqueue_task_instances_with_queued_state"):
+            assert self.job_runner._do_scheduling(session) == 1
+        assert self.job_runner._cached_concurrency_map.dag_active_tasks_map[dag_id] == 1
+
     def test_find_executable_task_instances_concurrency_queued(self, dag_maker):
         dag_id = "SchedulerJobTest.test_find_executable_task_instances_concurrency_queued"
         with dag_maker(dag_id=dag_id, max_active_tasks=3):
@@ -3157,6 +3302,35 @@ class TestSchedulerJob:
         session.rollback()
         session.close()
 
+    @conf_vars({("scheduler", "verify_integrity_from_task_diff"): "True"})
+    def test_verify_integrity_from_task_diff(self, dag_maker, session):
+        with dag_maker(dag_id="test_verify_integrity_from_task_diff", session=session) as dag:
+            BashOperator(task_id="dummy", bash_command="echo hi")
+
+        scheduler_job = Job()
+        self.job_runner = SchedulerJobRunner(job=scheduler_job, subdir=os.devnull)
+        self.job_runner.processor_agent = mock.MagicMock()
+        dag = self.job_runner.dagbag.get_dag("test_verify_integrity_from_task_diff", session=session)
+        self.job_runner._create_dag_runs([dag_maker.dag_model], session)
+        dr = DagRun.find(dag_id=dag.dag_id, session=session)[0]
+
+        # Now let's say the DAG got updated (new task got added)
+        with DAG(dag.dag_id, start_date=dag.start_date, schedule=dag.schedule_interval) as new_dag:
+            BashOperator(task_id="dummy", bash_command="echo hi")
+            BashOperator(task_id="bash_task_1", bash_command="echo hi")
+        SerializedDagModel.write_dag(dag=new_dag, session=session)
+        session.flush()
+
+        with mock.patch.object(
+            DagRun, "verify_integrity", autospec=True
+        ) as mock_verify_integrity, mock.patch("airflow.settings.MIN_SERIALIZED_DAG_FETCH_INTERVAL", 0):
+            self.job_runner._schedule_dag_run(dr, session)
+
+        mock_verify_integrity.assert_called_once_with(
+            dr, task_diff=DagTaskDiff(added={"bash_task_1"}, removed=set(), changed=set()), session=session
+        )
+        assert dr.dag_hash == SerializedDagModel.get_latest_version_hash(dr.dag_id, session=session)
+
     def test_verify_integrity_if_dag_disappeared(self, dag_maker, caplog):
         # CleanUp
         with create_session() as session:
@@ -3780,6 +3954,91 @@ class TestSchedulerJob:
 
         assert dag.get_last_dagrun().creating_job_id == scheduler_job.id
 
+    @conf_vars({("scheduler", "bulk_create_dag_runs"): "True"})
+    def test_bulk_create_dag_runs(self, dag_maker, session):
+        with dag_maker(dag_id="test_bulk_create_dag_runs_1", session=session):
+            EmptyOperator(task_id="dummy")
+            MockOperator.partial(task_id="mapped").expand(arg2=[1, 2, 3])
+        dag_model_1 = dag_maker.dag_model
+        with dag_maker(dag_id="test_bulk_create_dag_runs_2", session=session):
+            EmptyOperator(task_id="dummy")
+            EmptyOperator(task_id="not_started", start_date=DEFAULT_DATE + timedelta(days=1))
+        dag_model_2 = dag_maker.dag_model
+        next_dagruns = {dm.dag_id: dm.next_dagrun for dm in (dag_model_1, dag_model_2)}
+
+        scheduler_job = Job(executor=self.null_exec)
+        self.job_runner = SchedulerJobRunner(job=scheduler_job)
+        self.job_runner.processor_agent = mock.MagicMock()
+
+        self.job_runner._create_dag_runs([dag_model_1, dag_model_2], session)
+        session.flush()
+
+        drs = session.scalars(select(DagRun).order_by(DagRun.dag_id)).all()
+        assert [(dr.dag_id, dr.execution_date) for dr in drs] == list(next_dagruns.items())
+        assert all(dr.state == State.QUEUED and dr.creating_job_id == scheduler_job.id for dr in drs)
+        assert sorted(session.execute(select(TaskInstance.task_id, TaskInstance.map_index)).all()) == [
+            ("dummy", -1),
+            ("dummy", -1),
+            ("mapped", 0),
+            ("mapped", 1),
+            ("mapped", 2),
+        ]
+        assert all(dm.next_dagrun > next_dagruns[dm.dag_id] for dm in (dag_model_1, dag_model_2))
+
+    @pytest.mark.parametrize("failure", ["mutation_hook", "duplicate_run"])
+    @conf_vars({("scheduler", "bulk_create_dag_runs"): "True"})
+    def test_bulk_create_dag_runs_isolates_failures(self, failure, dag_maker, session):
+        dag_models = []
+        for i in range(3):
+            with dag_maker(dag_id=f"test_bulk_create_dag_runs_{i}", session=session):
+                EmptyOperator(task_id="dummy")
+            dag_models.append(dag_maker.dag_model)
+        next_dagruns = {dm.dag_id: dm.next_dagrun for dm in dag_models}
+        bad_dag_id = "test_bulk_create_dag_runs_1"
+        if failure == "duplicate_run":
+            # A run with the run ID of the next scheduled run, but another logical date
+            dag_maker.dagbag.get_dag(bad_dag_id).create_dagrun(
+                run_id=DagRun.generate_run_id(DagRunType.SCHEDULED, next_dagruns[bad_dag_id]),
+                execution_date=next_dagruns[bad_dag_id] - timedelta(days=10),
+                data_interval=(next_dagruns[bad_dag_id] - timedelta(days=10),) * 2,
+                state=State.SUCCESS,
+                session=session,
+            )
+
+        def mutation_hook(ti):
+            if failure == "mutation_hook" and ti.dag_id == bad_dag_id:
+                raise ValueError("Bad task instance")
+
+        scheduler_job = Job(executor=self.null_exec)
+        self.job_runner = SchedulerJobRunner(job=scheduler_job)
+        self.job_runner.processor_agent = mock.MagicMock()
+
+        with mock.patch("airflow.settings.task_instance_mutation_hook", mutation_hook):
+            self.job_runner._create_dag_runs(dag_models, session)
+        session.flush()
+
+        created = session.execute(
+            select(DagRun.dag_id, DagRun.execution_date)
+            .where(DagRun.state == State.QUEUED)
+            .order_by(DagRun.dag_id)
+        ).all()
+        good_dag_ids = ["test_bulk_create_dag_runs_0", "test_bulk_create_dag_runs_2"]
+        assert created == [(dag_id, next_dagruns[dag_id]) for dag_id in good_dag_ids]
+        assert (
+            session.scalars(
+                select(TaskInstance.dag_id)
+                .where(TaskInstance.dag_id != bad_dag_id)
+                .order_by(TaskInstance.dag_id)
+            ).all()
+            == good_dag_ids
+        )
+        # The run of the bad DAG is created again by the next scheduling loop
+        for dag_model in dag_models:
+            if dag_model.dag_id == bad_dag_id:
+                assert dag_model.next_dagrun == next_dagruns[dag_model.dag_id]
+            else:
+                assert dag_model.next_dagrun > next_dagruns[dag_model.dag_id]
+
     @pytest.mark.need_serialized_dag
     def test_create_dag_runs_datasets(self, session, dag_maker):
         """
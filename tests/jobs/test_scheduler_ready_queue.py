@@ -0,0 +1,145 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+from datetime import timedelta
+
+import pytest
+
+from airflow.jobs.scheduler_ready_queue import ReadyTaskInstance, SchedulerReadyQueue
+from airflow.operators.empty import EmptyOperator
+from airflow.utils import timezone
+from airflow.utils.state import DagRunState, TaskInstanceState
+from airflow.utils.types import DagRunType
+from tests.test_utils.db import clear_db_dags, clear_db_runs
+
+pytestmark = pytest.mark.db_test
+
+DEFAULT_DATE = timezone.datetime(2024, 1, 1)
+
+
+def _entry(task_id, priority_weight=1, pool="default_pool", dag_id="dag", run_id="run", hours=0):
+    return ReadyTaskInstance(
+        dag_id=dag_id,
+        task_id=task_id,
+        run_id=run_id,
+        map_index=-1,
+        pool=pool,
+        pool_slots=1,
+        priority_weight=priority_weight,
+        execution_date=DEFAULT_DATE + timedelta(hours=hours),
+    )
+
+
+class TestSchedulerReadyQueue:
+    def test_candidates_are_priority_ordered_across_pools(self):
+        queue = SchedulerReadyQueue(reconcile_interval=60)
+        queue.add(_entry("a", priority_weight=1, pool="p1"))
+        queue.add(_entry("b", priority_weight=3, pool="p2"))
+        queue.add(_entry("c", priority_weight=2, pool="p1"))
+        queue.add(_entry("d", priority_weight=2, pool="p2", hours=-1))
+
+        assert [e.task_id for e in queue.candidates(10)] == ["b", "d", "c", "a"]
+        assert [e.task_id for e in queue.candidates(2)] == ["b", "d"]
+
+    def test_candidates_skip_starved(self):
+        queue = SchedulerReadyQueue(reconcile_interval=60)
+        queue.add(_entry("a", pool="p1"))
+        queue.add(_entry("b", pool="p2"))
+        queue.add(_entry("c", dag_id="other"))
+        queue.add(_entry("d", run_id="other_run"))
+        queue.add(_entry("e"))
+
+        candidates = queue.candidates(
+            10,
+            starved_pools={"p1"},
+            starved_dags={"other"},
+            starved_tasks={("dag", "b")},
+            starved_tasks_task_dagrun_concurrency={("dag", "other_run", "d")},
+        )
+        assert [e.task_id for e in candidates] == ["e"]
+
+    def test_add_replaces_and_discard_removes(self):
+        queue = SchedulerReadyQueue(reconcile_interval=60)
+        queue.add(_entry("a", priority_weight=1))
+        queue.add(_entry("b", priority_weight=2))
+        queue.add(_entry("a", priority_weight=5, pool="p2"))
+
+        assert len(queue) == 2
+        assert [(e.task_id, e.pool) for e in queue.candidates(10)] == [("a", "p2"), ("b", "default_pool")]
+
+        queue.discard(("dag", "a", "run", -1))
+        queue.discard(("dag", "missing", "run", -1))
+        assert ("dag", "a", "run", -1) not in queue
+        assert [e.task_id for e in queue.candidates(10)] == ["b"]
+
+    def test_compaction_keeps_live_entries(self):
+        queue = SchedulerReadyQueue(reconcile_interval=60)
+        for i in range(3000):
+            queue.add(_entry(f"t{i}", priority_weight=i))
+        for i in range(2500):
+            queue.discard(("dag", f"t{i}", "run", -1))
+
+        assert len(queue) == 500
+        assert len(queue._pools["default_pool"]) < 3000
+        assert [e.task_id for e in queue.candidates(2)] == ["t2999", "t2998"]
+
+
+class TestSchedulerReadyQueueRefresh:
+    @pytest.fixture(autouse=True)
+    def clean_db(self):
+        clear_db_runs()
+        clear_db_dags()
+        yield
+        clear_db_runs()
+        clear_db_dags()
+
+    def test_refresh_loads_only_schedulable_tis(self, dag_maker, session):
+        with dag_maker(dag_id="test_refresh_loads_only_schedulable_tis", session=session):
+            EmptyOperator(task_id="op1")
+            EmptyOperator(task_id="op2")
+        dr = dag_maker.create_dagrun(run_type=DagRunType.SCHEDULED, state=DagRunState.RUNNING)
+        ti1, ti2 = sorted(dr.task_instances, key=lambda ti: ti.task_id)
+        ti1.state = TaskInstanceState.SCHEDULED
+        session.flush()
+
+        queue = SchedulerReadyQueue(reconcile_interval=60)
+        queue.refresh(session=session)
+        assert [e.task_id for e in queue.candidates(10)] == ["op1"]
+
+        ti2.state = TaskInstanceState.SCHEDULED
+        session.flush()
+        queue.refresh(session=session)
+        assert sorted(e.task_id for e in queue.candidates(10)) == ["op1", "op2"]
+
+    def test_refresh_reconciles_after_interval(self, dag_maker, session):
+        with dag_maker(dag_id="test_refresh_reconciles_after_interval", session=session):
+            EmptyOperator(task_id="op1")
+        dr = dag_maker.create_dagrun(run_type=DagRunType.SCHEDULED, state=DagRunState.RUNNING)
+        ti = dr.task_instances[0]
+        ti.state = TaskInstanceState.SCHEDULED
+        session.flush()
+
+        queue = SchedulerReadyQueue(reconcile_interval=0)
+        queue.refresh(session=session)
+        assert len(queue) == 1
+
+        dag_maker.dag_model.is_paused = True
+        session.flush()
+        queue.refresh(session=session)
+        assert len(queue) == 0
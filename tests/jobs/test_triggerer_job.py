@@ -47,6 +47,7 @@ from airflow.utils.session import create_session
 from airflow.utils.state import State, TaskInstanceState
 from airflow.utils.types import DagRunType
 from tests.core.test_logging_config import reset_logging
+from tests.test_utils.config import conf_vars
 from tests.test_utils.db import clear_db_dags, clear_db_runs
 
 pytestmark = pytest.mark.db_test
@@ -377,7 +378,7 @@ async def test_trigger_create_race_condition_38599(session, tmp_path):
     # job1.latest_heartbeat = timezone.utcnow() - datetime.timedelta(hours=1)
     # session.commit()
 
-    # This calls Trigger.submit_event, which will unlink the trigger from the task instance
+    # This calls Trigger.submit_events, which will unlink the trigger from the task instance
     job_runner1.handle_events()
 
     # Simulate the second TriggererJobRunner picking up the trigger
@@ -389,6 +390,88 @@ async def test_trigger_create_race_condition_38599(session, tmp_path):
     assert path.read_text() == "hi\n"
 
 
+def make_runner_trigger(trigger_id, trigger):
+    trigger.trigger_id = trigger_id
+    trigger.task_instance = MagicMock(
+        dag_id="dag",
+        run_id="run",
+        task_id=f"task_{trigger_id}",
+        map_index=-1,
+        try_number=1,
+        trigger_timeout=None,
+    )
+    return trigger_id, trigger
+
+
+@pytest.mark.asyncio
+async def test_trigger_runner_deduplicates_identical_triggers():
+    """Identical triggers share one running task, which fires its events to all of them."""
+    trigger_runner = TriggerRunner()
+    trigger_runner.deduplicate_triggers = True
+    soon = timezone.utcnow() + datetime.timedelta(seconds=0.5)
+    trigger_runner.to_create.extend(
+        [
+            make_runner_trigger(1, DateTimeTrigger(soon)),
+            make_runner_trigger(2, DateTimeTrigger(soon)),
+            make_runner_trigger(3, DateTimeTrigger(soon + datetime.timedelta(seconds=1))),
+        ]
+    )
+
+    with patch("airflow.jobs.triggerer_job_runner.Stats") as mock_stats:
+        await trigger_runner.create_triggers()
+    mock_stats.incr.assert_called_once_with("triggers.deduplicated")
+
+    tasks = {trigger_id: details["task"] for trigger_id, details in trigger_runner.triggers.items()}
+    assert tasks[1] is tasks[2]
+    assert tasks[1] is not tasks[3]
+    await asyncio.gather(tasks[1], tasks[3])
+
+    assert sorted(trigger_runner.events) == [
+        (1, TriggerEvent(soon)),
+        (2, TriggerEvent(soon)),
+        (3, TriggerEvent(soon + datetime.timedelta(seconds=1))),
+    ]
+    # A trigger does not join a task that already fired its event
+    trigger_runner.to_create.append(make_runner_trigger(4, DateTimeTrigger(soon)))
+    await trigger_runner.create_triggers()
+    assert trigger_runner.triggers[4]["task"] is not tasks[1]
+    await trigger_runner.triggers[4]["task"]
+
+    await trigger_runner.cleanup_finished_triggers()
+    assert not trigger_runner.triggers
+    assert not trigger_runner.failed_triggers
+    assert not trigger_runner.trigger_groups
+    assert not trigger_runner.trigger_keys
+
+
+@pytest.mark.asyncio
+async def test_trigger_runner_cancels_shared_trigger_with_last_subscriber():
+    """The shared task of identical triggers is only cancelled once all of them are cancelled."""
+    trigger_runner = TriggerRunner()
+    trigger_runner.deduplicate_triggers = True
+    future = timezone.utcnow() + datetime.timedelta(hours=1)
+    trigger_runner.to_create.extend(
+        [make_runner_trigger(1, DateTimeTrigger(future)), make_runner_trigger(2, DateTimeTrigger(future))]
+    )
+    await trigger_runner.create_triggers()
+    task = trigger_runner.triggers[1]["task"]
+
+    trigger_runner.to_cancel.append(1)
+    await trigger_runner.cancel_triggers()
+    await trigger_runner.cleanup_finished_triggers()
+    assert list(trigger_runner.triggers) == [2]
+    assert not task.done()
+
+    trigger_runner.to_cancel.append(2)
+    await trigger_runner.cancel_triggers()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    await trigger_runner.cleanup_finished_triggers()
+    assert not trigger_runner.triggers
+    assert not trigger_runner.failed_triggers
+    assert not trigger_runner.trigger_groups
+
+
 def test_trigger_create_race_condition_18392(session, tmp_path):
     """
     This verifies the resolution of race condition documented in github issue #18392.
@@ -633,6 +716,74 @@ def test_trigger_firing(session):
         job_runner.trigger_runner.join(30)
 
 
+@conf_vars({("triggerer", "max_events_per_transaction"): "2"})
+@patch("airflow.jobs.triggerer_job_runner.Stats")
+@patch("airflow.models.trigger.Trigger.submit_events")
+def test_handle_events_in_batches(mock_submit_events, mock_stats):
+    """Checks that events are submitted in batches of up to max_events_per_transaction."""
+    job_runner = TriggererJobRunner(Job())
+    events = [(trigger_id, TriggerEvent(trigger_id)) for trigger_id in range(5)]
+    job_runner.trigger_runner.events.extend(events)
+
+    job_runner.handle_events()
+
+    assert not job_runner.trigger_runner.events
+    assert [call.kwargs["events"] for call in mock_submit_events.call_args_list] == [
+        events[:2],
+        events[2:4],
+        events[4:],
+    ]
+    mock_stats.gauge.assert_called_once_with("triggers.event_queue_size", 5)
+    assert mock_stats.timer.call_count == 3
+    assert [call.args for call in mock_stats.incr.call_args_list] == [
+        ("triggers.succeeded", 2),
+        ("triggers.succeeded", 2),
+        ("triggers.succeeded", 1),
+    ]
+
+
+@patch("airflow.jobs.triggerer_job_runner.Stats")
+@patch("airflow.models.trigger.Trigger.submit_failure")
+@patch("airflow.models.trigger.Trigger.submit_event")
+@patch("airflow.models.trigger.Trigger.submit_events", side_effect=ValueError("bad payload"))
+def test_handle_events_isolates_failing_event(
+    mock_submit_events, mock_submit_event, mock_submit_failure, mock_stats
+):
+    """Checks that when a batch fails, its events are submitted one by one and only the bad one fails."""
+    error = ValueError("bad payload")
+    mock_submit_event.side_effect = [None, error, None]
+    job_runner = TriggererJobRunner(Job())
+    events = [(trigger_id, TriggerEvent(trigger_id)) for trigger_id in range(3)]
+    job_runner.trigger_runner.events.extend(events)
+
+    job_runner.handle_events()
+
+    assert not job_runner.trigger_runner.events
+    mock_submit_events.assert_called_once_with(events=events)
+    assert [call.kwargs["trigger_id"] for call in mock_submit_event.call_args_list] == [0, 1, 2]
+    mock_submit_failure.assert_called_once_with(trigger_id=1, exc=error)
+    assert [call.args for call in mock_stats.incr.call_args_list] == [
+        ("triggers.succeeded",),
+        ("triggers.failed",),
+        ("triggers.succeeded",),
+    ]
+
+
+@patch("airflow.models.trigger.Trigger.submit_failure", side_effect=OSError("database unavailable"))
+@patch("airflow.models.trigger.Trigger.submit_event", side_effect=[None, OSError("database unavailable")])
+@patch("airflow.models.trigger.Trigger.submit_events", side_effect=OSError("database unavailable"))
+def test_handle_events_requeues_events_not_submitted(mock_submit_events, mock_submit_event, _):
+    """Checks that the events not submitted are kept in the queue when they can not be failed either."""
+    job_runner = TriggererJobRunner(Job())
+    events = [(trigger_id, TriggerEvent(trigger_id)) for trigger_id in range(4)]
+    job_runner.trigger_runner.events.extend(events)
+
+    with pytest.raises(OSError, match="database unavailable"):
+        job_runner.handle_events()
+
+    assert list(job_runner.trigger_runner.events) == events[1:]
+
+
 def test_trigger_failing(session):
     """
     Checks that when a trigger fails, it correctly makes it into the
@@ -16,6 +16,7 @@
 # under the License.
 from __future__ import annotations
 
+import gc
 import inspect
 import logging
 import os
@@ -40,6 +41,7 @@ from airflow.exceptions import RemovedInAirflow3Warning, SerializationError
 from airflow.models.dag import DAG, DagModel
 from airflow.models.dagbag import DagBag
 from airflow.models.serialized_dag import SerializedDagModel
+from airflow.operators.empty import EmptyOperator
 from airflow.serialization.serialized_objects import SerializedDAG
 from airflow.utils.dates import timezone as tz
 from airflow.utils.session import create_session
@@ -1007,6 +1009,27 @@ class TestDagBag:
         assert set(updated_ser_dag_1.tags) == {"example", "example2", "new_tag"}
         assert updated_ser_dag_1_update_time > ser_dag_1_update_time
 
+    @patch("airflow.models.dagbag.settings.MIN_SERIALIZED_DAG_FETCH_INTERVAL", 0)
+    def test_get_dag_version_keeps_previous_version(self):
+        dag = DAG("test_get_dag_version", start_date=tz.datetime(2020, 1, 1))
+        EmptyOperator(task_id="task_1", dag=dag)
+        SerializedDagModel.write_dag(dag=dag)
+
+        dag_bag = DagBag(read_dags_from_db=True, keep_previous_versions=True)
+        old_dag = dag_bag.get_dag(dag.dag_id)
+        old_hash = dag_bag.dags_hash[dag.dag_id]
+
+        EmptyOperator(task_id="task_2", dag=dag)
+        SerializedDagModel.write_dag(dag=dag)
+        new_dag = dag_bag.get_dag(dag.dag_id)
+        new_hash = dag_bag.dags_hash[dag.dag_id]
+
+        assert new_hash != old_hash
+        assert dag_bag.get_dag_version(dag.dag_id, new_hash) is new_dag
+        assert dag_bag.get_dag_version(dag.dag_id, old_hash) is old_dag
+        assert dag_bag.get_dag_version(dag.dag_id, "unknown") is None
+        db.clear_db_serialized_dags()
+
     @patch("airflow.models.dagbag.settings.MIN_SERIALIZED_DAG_UPDATE_INTERVAL", 5)
     @patch("airflow.models.dagbag.settings.MIN_SERIALIZED_DAG_FETCH_INTERVAL", 5)
     def test_get_dag_refresh_race_condition(self):
@@ -1055,6 +1078,44 @@ class TestDagBag:
         assert set(updated_ser_dag.tags) == {"example", "example2", "new_tag"}
         assert updated_ser_dag_update_time > ser_dag_update_time
 
+    @pytest.fixture
+    def shared_dag_cache(self):
+        from airflow.models.serialized_dag_cache import get_serialized_dag_cache
+
+        get_serialized_dag_cache.cache_clear()
+        with conf_vars({("core", "serialized_dag_cache_max_memory_mb"): "64"}):
+            yield get_serialized_dag_cache()
+        get_serialized_dag_cache.cache_clear()
+
+    def test_get_dag_with_shared_cache(self, shared_dag_cache):
+        """DagBags reading from the DB share the deserialized DAGs."""
+        example_bash_op_dag = DagBag(include_examples=True).dags.get("example_bash_operator")
+        SerializedDagModel.write_dag(dag=example_bash_op_dag)
+
+        dag = DagBag(read_dags_from_db=True).get_dag("example_bash_operator")
+        with mock.patch.object(SerializedDagModel, "dag", new_callable=mock.PropertyMock) as mock_dag:
+            assert DagBag(read_dags_from_db=True).get_dag("example_bash_operator") is dag
+        mock_dag.assert_not_called()
+        # Operator extra links are not loaded by the scheduler, so that version is cached separately
+        assert DagBag(read_dags_from_db=True, load_op_links=False).get_dag("example_bash_operator") is not dag
+
+        stats = shared_dag_cache.stats
+        assert (stats.hits, stats.misses, stats.size) == (1, 2, 2)
+
+    def test_get_dag_evicted_from_shared_cache(self, shared_dag_cache):
+        """Once evicted from the shared cache, DAGs are not kept alive by the DagBag."""
+        example_bash_op_dag = DagBag(include_examples=True).dags.get("example_bash_operator")
+        SerializedDagModel.write_dag(dag=example_bash_op_dag)
+
+        dag_bag = DagBag(read_dags_from_db=True)
+        dag_bag.get_dag("example_bash_operator")
+        shared_dag_cache.clear()
+        gc.collect()  # DAGs and their tasks reference each other
+        assert "example_bash_operator" not in dag_bag.dags
+
+        assert dag_bag.get_dag("example_bash_operator").dag_id == "example_bash_operator"
+        assert shared_dag_cache.stats.size == 1
+
     def test_collect_dags_from_db(self):
         """DAGs are collected from Database"""
         db.clear_db_dags()
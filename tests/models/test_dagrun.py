@@ -25,6 +25,7 @@ from unittest.mock import call
 
 import pendulum
 import pytest
+from sqlalchemy import select
 
 from airflow import settings
 from airflow.callbacks.callback_requests import DagCallbackRequest
@@ -32,7 +33,7 @@ from airflow.decorators import setup, task, task_group, teardown
 from airflow.exceptions import AirflowException
 from airflow.models.baseoperator import BaseOperator
 from airflow.models.dag import DAG, DagModel
-from airflow.models.dagrun import DagRun, DagRunNote
+from airflow.models.dagrun import DagRun, DagRunNote, DagTaskDiff
 from airflow.models.taskinstance import TaskInstance, TaskInstanceNote, clear_task_instances
 from airflow.models.taskmap import TaskMap
 from airflow.models.taskreschedule import TaskReschedule
@@ -998,6 +999,50 @@ def test_verify_integrity_task_start_and_end_date(Stats_incr, session, run_type,
     )
 
 
+def test_dag_task_diff():
+    with DAG("test", start_date=DEFAULT_DATE) as old_dag:
+        EmptyOperator(task_id="unchanged")
+        EmptyOperator(task_id="removed")
+        MockOperator.partial(task_id="mapped").expand(arg2=[1, 2])
+        EmptyOperator(task_id="start_date")
+
+    with DAG("test", start_date=DEFAULT_DATE) as new_dag:
+        EmptyOperator(task_id="unchanged")
+        EmptyOperator(task_id="added")
+        MockOperator.partial(task_id="mapped").expand(arg2=[1, 2, 3])
+        EmptyOperator(task_id="start_date", start_date=DEFAULT_DATE + datetime.timedelta(1))
+
+    diff = DagTaskDiff.from_dags(old_dag, new_dag)
+
+    assert diff == DagTaskDiff(added={"added"}, removed={"removed"}, changed={"mapped", "start_date"})
+    assert diff.task_ids == {"added", "removed", "mapped", "start_date"}
+    assert not DagTaskDiff.from_dags(new_dag, new_dag).task_ids
+
+
+def test_verify_integrity_with_task_diff(dag_maker, session):
+    with dag_maker("test_verify_integrity_with_task_diff", session=session, serialized=True):
+        EmptyOperator(task_id="unchanged")
+        EmptyOperator(task_id="removed")
+    old_dag = dag_maker.dag
+    dr = dag_maker.create_dagrun(state=DagRunState.QUEUED)
+
+    with dag_maker("test_verify_integrity_with_task_diff", session=session, serialized=True):
+        EmptyOperator(task_id="unchanged")
+        EmptyOperator(task_id="added")
+    new_dag = dag_maker.dag
+    dr.dag = new_dag
+    # Only the tasks in the diff are verified, so the missing TI of "unchanged" is not created
+    session.delete(dr.get_task_instance("unchanged", session=session))
+    session.flush()
+
+    dr.verify_integrity(task_diff=DagTaskDiff.from_dags(old_dag, new_dag), session=session)
+
+    assert {ti.task_id: ti.state for ti in dr.get_task_instances(session=session)} == {
+        "removed": TaskInstanceState.REMOVED,
+        "added": None,
+    }
+
+
 @pytest.mark.parametrize("is_noop", [True, False])
 def test_expand_mapped_task_instance_at_create(is_noop, dag_maker, session):
     with mock.patch("airflow.settings.task_instance_mutation_hook") as mock_mut:
@@ -1016,6 +1061,40 @@ def test_expand_mapped_task_instance_at_create(is_noop, dag_maker, session):
         assert indices == [(0,), (1,), (2,), (3,)]
 
 
+@pytest.mark.parametrize("is_noop", [True, False])
+def test_create_dag_runs_with_task_instances(is_noop, dag_maker, session):
+    with mock.patch("airflow.settings.task_instance_mutation_hook") as mock_mut:
+        mock_mut.is_noop = is_noop
+        with dag_maker(session=session, dag_id="test_dag") as dag:
+            EmptyOperator(task_id="task_1")
+            MockOperator.partial(task_id="task_2").expand(arg2=[1, 2])
+
+        dag_runs = []
+        for days in range(2):
+            execution_date = DEFAULT_DATE + datetime.timedelta(days=days)
+            dag_run = DagRun(
+                dag_id=dag.dag_id,
+                run_id=DagRun.generate_run_id(DagRunType.SCHEDULED, execution_date),
+                run_type=DagRunType.SCHEDULED,
+                execution_date=execution_date,
+                state=DagRunState.QUEUED,
+            )
+            dag_run.dag = dag
+            dag_runs.append(dag_run)
+
+        DagRun.create_dag_runs_with_task_instances(dag_runs, session=session)
+
+        tis = session.execute(
+            select(TI.run_id, TI.task_id, TI.map_index).order_by(TI.run_id, TI.task_id)
+        ).all()
+        assert tis == [
+            (dag_run.run_id, task_id, map_index)
+            for dag_run in dag_runs
+            for task_id, map_index in (("task_1", -1), ("task_2", 0), ("task_2", 1))
+        ]
+        assert mock_mut.call_count == (0 if is_noop else 6)
+
+
 @pytest.mark.need_serialized_dag
 @pytest.mark.parametrize("is_noop", [True, False])
 def test_expand_mapped_task_instance_task_decorator(is_noop, dag_maker, session):
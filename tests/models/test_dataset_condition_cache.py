@@ -0,0 +1,106 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import itertools
+from unittest import mock
+
+import pytest
+
+from airflow.datasets import Dataset, DatasetAll, DatasetAny
+from airflow.models.dataset_condition_cache import (
+    DatasetConditionCache,
+    compile_dataset_condition,
+    get_dataset_condition_cache,
+)
+from airflow.models.serialized_dag import SerializedDagModel
+from airflow.operators.empty import EmptyOperator
+from tests.test_utils.db import clear_db_dags, clear_db_serialized_dags
+
+URIS = ["a", "b", "c", "d"]
+
+
+@pytest.mark.parametrize(
+    "condition",
+    [
+        Dataset("a"),
+        DatasetAny(Dataset("a"), Dataset("b")),
+        DatasetAll(Dataset("a"), Dataset("b")),
+        DatasetAny(Dataset("a"), DatasetAll(Dataset("b"), Dataset("c"))),
+        DatasetAll(DatasetAny(Dataset("a"), Dataset("b")), DatasetAny(Dataset("c"), Dataset("d"))),
+        DatasetAny(),
+        DatasetAll(),
+    ],
+)
+def test_compile_dataset_condition(condition):
+    evaluate = compile_dataset_condition(condition)
+    for size in range(len(URIS) + 1):
+        for uris in itertools.combinations(URIS, size):
+            assert evaluate(set(uris)) == condition.evaluate(dict.fromkeys(uris, True)), uris
+
+
+@pytest.mark.db_test
+class TestDatasetConditionCache:
+    @pytest.fixture(autouse=True)
+    def clean_db(self):
+        clear_db_serialized_dags()
+        clear_db_dags()
+        yield
+        clear_db_serialized_dags()
+        clear_db_dags()
+
+    def test_get_ready_dag_ids(self, dag_maker, session):
+        for dag_id, schedule in [
+            ("any", DatasetAny(Dataset("a"), Dataset("b"))),
+            ("all", DatasetAll(Dataset("a"), Dataset("b"))),
+        ]:
+            with dag_maker(dag_id, schedule=schedule, serialized=True, session=session):
+                EmptyOperator(task_id="task")
+        session.flush()
+        cache = DatasetConditionCache()
+
+        queued_uris = {"any": {"a"}, "all": {"a"}, "not_serialized": {"a"}}
+        assert cache.get_ready_dag_ids(queued_uris, session=session) == {"any", "not_serialized"}
+        queued_uris = {"any": {"a", "b"}, "all": {"a", "b"}}
+        assert cache.get_ready_dag_ids(queued_uris, session=session) == {"any", "all"}
+
+    def test_condition_is_compiled_once_per_version(self, dag_maker, session):
+        with dag_maker("dag", schedule=[Dataset("a")], serialized=True, session=session):
+            EmptyOperator(task_id="task")
+        session.flush()
+        cache = DatasetConditionCache()
+
+        with mock.patch(
+            "airflow.models.dataset_condition_cache.compile_dataset_condition",
+            wraps=compile_dataset_condition,
+        ) as mock_compile:
+            assert cache.get_ready_dag_ids({"dag": {"a"}}, session=session) == {"dag"}
+            assert cache.get_ready_dag_ids({"dag": {"b"}}, session=session) == set()
+            assert mock_compile.call_count == 1
+
+            # A new version of the DAG is scheduled on another dataset
+            with dag_maker("dag", schedule=[Dataset("b")], serialized=True, session=session):
+                EmptyOperator(task_id="task")
+            SerializedDagModel.write_dag(dag_maker.dag, session=session)
+            session.flush()
+            assert cache.get_ready_dag_ids({"dag": {"b"}}, session=session) == {"dag"}
+            assert mock_compile.call_count == 2
+
+    def test_get_dataset_condition_cache(self):
+        assert isinstance(get_dataset_condition_cache(), DatasetConditionCache)
+        assert get_dataset_condition_cache() is get_dataset_condition_cache()
@@ -31,6 +31,11 @@ from airflow.models.dagbag import DagBag
 from airflow.models.dagcode import DagCode
 from airflow.models.serialized_dag import SerializedDagModel as SDM
 from airflow.operators.bash import BashOperator
+from airflow.serialization.indexed_dag_data import (
+    IndexedTasks,
+    encode_indexed_dag_data,
+    is_indexed_dag_data,
+)
 from airflow.serialization.serialized_objects import SerializedDAG
 from airflow.settings import json
 from airflow.utils.hashlib_wrapper import md5
@@ -54,13 +59,17 @@ class TestSerializedDagModel:
     @pytest.fixture(
         autouse=True,
         params=[
-            pytest.param(False, id="raw-serialized_dags"),
-            pytest.param(True, id="compress-serialized_dags"),
+            pytest.param((False, "json"), id="raw-serialized_dags"),
+            pytest.param((True, "json"), id="compress-serialized_dags"),
+            pytest.param((False, "indexed"), id="indexed-serialized_dags"),
         ],
     )
     def setup_test_cases(self, request, monkeypatch):
         db.clear_db_serialized_dags()
-        with mock.patch("airflow.models.serialized_dag.COMPRESS_SERIALIZED_DAGS", request.param):
+        compress, storage_format = request.param
+        with mock.patch("airflow.models.serialized_dag.COMPRESS_SERIALIZED_DAGS", compress), mock.patch(
+            "airflow.models.serialized_dag.SERIALIZED_DAG_STORAGE_FORMAT", storage_format
+        ):
             yield
         db.clear_db_serialized_dags()
 
@@ -199,8 +208,11 @@ class TestSerializedDagModel:
             sdms = [SDM(dag) for dag in example_dags.values()]
             # Simulate pre-2.1.0 format.
             for sdm in sdms:
-                del sdm.data["dag"]["dag_dependencies"]
-                sdm.data["dag"].update(dag_dependencies_fields)
+                data = sdm.data
+                del data["dag"]["dag_dependencies"]
+                data["dag"].update(dag_dependencies_fields)
+                if is_indexed_dag_data(sdm._data_compressed):
+                    sdm._data_compressed = encode_indexed_dag_data(data)
             session.bulk_save_objects(sdms)
 
         expected_dependencies = {dag_id: [] for dag_id in example_dags}
@@ -261,3 +273,92 @@ class TestSerializedDagModel:
 
             # dag hash should not change without change in structure (we're in a loop)
             assert this_dag_hash == first_dag_hash
+
+
+class TestSerializedDagModelIndexedFormat:
+    """Tests specific to serialized DAGs stored in the indexed format."""
+
+    @pytest.fixture(autouse=True)
+    def setup_test_cases(self):
+        db.clear_db_serialized_dags()
+        with mock.patch("airflow.models.serialized_dag.SERIALIZED_DAG_STORAGE_FORMAT", "indexed"):
+            yield
+        db.clear_db_serialized_dags()
+
+    def test_get_dag_dependencies(self):
+        example_dags = make_example_dags(example_dags_module)
+        for dag in example_dags.values():
+            SDM.write_dag(dag)
+
+        dependencies = SDM.get_dag_dependencies()
+
+        assert dependencies.keys() == example_dags.keys()
+        for dag_id, dag in example_dags.items():
+            expected = SerializedDAG.serialize_dag(dag)["dag_dependencies"]
+            assert [dep.__dict__ for dep in dependencies[dag_id]] == expected
+        assert dependencies["dataset_consumes_1"]
+
+    @pytest.mark.parametrize("prefix_size", [4096, 20], ids=["prefix", "full_data"])
+    @pytest.mark.parametrize("storage_format", ["indexed", "json"])
+    def test_get_dag_dependencies_reads_only_dependencies(self, storage_format, prefix_size):
+        example_dags = make_example_dags(example_dags_module)
+        dag = example_dags["dataset_consumes_1"]
+        SDM.write_dag(dag)
+        expected = SerializedDAG.serialize_dag(dag)["dag_dependencies"]
+
+        with mock.patch(
+            "airflow.models.serialized_dag.SERIALIZED_DAG_STORAGE_FORMAT", storage_format
+        ), mock.patch("airflow.models.serialized_dag._DAG_DEPENDENCIES_PREFIX_SIZE", prefix_size), mock.patch(
+            "airflow.models.serialized_dag.IndexedDagData"
+        ) as mock_indexed_dag_data:
+            dependencies = SDM.get_dag_dependencies()
+
+        assert [dep.__dict__ for dep in dependencies[dag.dag_id]] == expected
+        mock_indexed_dag_data.assert_not_called()
+
+    def test_lazy_dag_only_decodes_accessed_tasks(self):
+        example_dags = make_example_dags(example_dags_module)
+        dag = example_dags["example_bash_operator"]
+        SDM.write_dag(dag)
+
+        with create_session() as session:
+            row = session.get(SDM, dag.dag_id)
+            assert is_indexed_dag_data(row._data_compressed)
+            assert row.data == json.loads(json.dumps(SerializedDAG.to_dict(dag)))
+
+            with mock.patch(
+                "airflow.serialization.indexed_dag_data.IndexedTasks.get",
+                autospec=True,
+                side_effect=IndexedTasks.get,
+            ) as mock_get:
+                lazy_dag = row.lazy_dag
+                assert lazy_dag.task_ids == dag.task_ids
+                assert lazy_dag.get_downstream_task_ids("run_this_last") == set()
+                mock_get.assert_not_called()
+
+                task = lazy_dag.get_task("runme_0")
+                mock_get.assert_called_once_with(mock.ANY, "runme_0")
+            assert task.downstream_task_ids == {"run_after_loop"}
+
+        assert SDM.get_serialized_dag(dag.dag_id, "runme_0").task_id == "runme_0"
+
+    def test_rows_in_other_formats_are_readable(self):
+        example_dags = make_example_dags(example_dags_module)
+        dag = example_dags["example_bash_operator"]
+        with mock.patch("airflow.models.serialized_dag.SERIALIZED_DAG_STORAGE_FORMAT", "json"):
+            SDM.write_dag(dag)
+
+        with create_session() as session:
+            row = session.get(SDM, dag.dag_id)
+            assert row._data is not None
+            assert row.lazy_dag.task_ids == row.dag.task_ids == dag.task_ids
+
+            # The row is converted the next time the DAG changes.
+            dag.tags.append("converted")
+            assert SDM.write_dag(dag, session=session)
+            session.flush()
+            session.expire_all()
+            row = session.get(SDM, dag.dag_id)
+            assert row._data is None
+            assert is_indexed_dag_data(row._data_compressed)
+            assert "converted" in row.dag.tags
@@ -0,0 +1,122 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+from datetime import datetime
+from unittest import mock
+
+import pytest
+
+from airflow.models.dag import DAG
+from airflow.models.serialized_dag_cache import (
+    SerializedDagCache,
+    SerializedDagCacheStats,
+    estimate_dag_size,
+    get_serialized_dag_cache,
+)
+from airflow.operators.empty import EmptyOperator
+from tests.test_utils.config import conf_vars
+
+
+def make_dag(dag_id: str, num_tasks: int = 1) -> DAG:
+    with DAG(dag_id, start_date=datetime(2024, 1, 1), schedule=None) as dag:
+        for i in range(num_tasks):
+            EmptyOperator(task_id=f"task_{i}")
+    return dag
+
+
+@pytest.fixture
+def clear_cache_singleton():
+    get_serialized_dag_cache.cache_clear()
+    yield
+    get_serialized_dag_cache.cache_clear()
+
+
+class TestSerializedDagCache:
+    def test_estimate_dag_size_grows_with_tasks(self):
+        assert estimate_dag_size(make_dag("small", 1)) < estimate_dag_size(make_dag("big", 20))
+
+    def test_get_and_put(self):
+        cache = SerializedDagCache(max_memory=10 * 1024 * 1024)
+        dag = make_dag("dag")
+
+        assert cache.get("dag", "hash") is None
+        cache.put("dag", "hash", dag)
+        assert cache.get("dag", "hash") is dag
+        assert cache.get("dag", "other_hash") is None
+        assert cache.get("dag", "hash", load_op_links=False) is None
+
+        assert cache.stats == SerializedDagCacheStats(
+            hits=1, misses=3, evictions=0, size=1, memory=estimate_dag_size(dag)
+        )
+
+    def test_put_replaces_same_version(self):
+        cache = SerializedDagCache(max_memory=10 * 1024 * 1024)
+        cache.put("dag", "hash", make_dag("dag"))
+        dag = make_dag("dag")
+        cache.put("dag", "hash", dag)
+
+        assert cache.get("dag", "hash") is dag
+        assert cache.stats.size == 1
+        assert cache.stats.memory == estimate_dag_size(dag)
+
+    def test_evicts_least_recently_used(self):
+        dags = {dag_id: make_dag(dag_id) for dag_id in ("a", "b", "c")}
+        cache = SerializedDagCache(max_memory=2 * max(estimate_dag_size(dag) for dag in dags.values()))
+        cache.put("a", "hash", dags["a"])
+        cache.put("b", "hash", dags["b"])
+        cache.get("a", "hash")
+
+        with mock.patch("airflow.models.serialized_dag_cache.Stats") as mock_stats:
+            cache.put("c", "hash", dags["c"])
+
+        assert cache.get("a", "hash") is dags["a"]
+        assert cache.get("b", "hash") is None
+        assert cache.get("c", "hash") is dags["c"]
+        assert cache.stats.evictions == 1
+        mock_stats.incr.assert_called_once_with("serialized_dag_cache.evictions", 1)
+        mock_stats.gauge.assert_any_call("serialized_dag_cache.size", 2)
+
+    def test_keeps_dag_larger_than_limit(self):
+        cache = SerializedDagCache(max_memory=1)
+        cache.put("a", "hash", make_dag("a"))
+        dag = make_dag("b")
+        cache.put("b", "hash", dag)
+
+        assert cache.get("a", "hash") is None
+        assert cache.get("b", "hash") is dag
+
+    def test_clear(self):
+        cache = SerializedDagCache(max_memory=10 * 1024 * 1024)
+        cache.put("dag", "hash", make_dag("dag"))
+        cache.get("dag", "hash")
+        cache.clear()
+
+        assert cache.stats == SerializedDagCacheStats(hits=0, misses=0, evictions=0, size=0, memory=0)
+
+    @pytest.mark.usefixtures("clear_cache_singleton")
+    def test_get_serialized_dag_cache_disabled_by_default(self):
+        assert get_serialized_dag_cache() is None
+
+    @pytest.mark.usefixtures("clear_cache_singleton")
+    @conf_vars({("core", "serialized_dag_cache_max_memory_mb"): "2"})
+    def test_get_serialized_dag_cache(self):
+        cache = get_serialized_dag_cache()
+        assert cache is not None
+        assert cache.max_memory == 2 * 1024 * 1024
+        assert get_serialized_dag_cache() is cache
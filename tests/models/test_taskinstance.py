@@ -2260,6 +2260,36 @@ class TestTaskInstance:
         )
         assert all([event.timestamp < ddrq_timestamp for (ddrq_timestamp,) in ddrq_timestamps])
 
+    @pytest.mark.parametrize("custom_manager", [False, True])
+    def test_register_dataset_changes(self, custom_manager, create_task_instance, session):
+        from airflow.datasets import Dataset
+        from airflow.datasets.manager import DatasetManager
+        from airflow.utils.context import OutletEventAccessors
+
+        registered = []
+
+        class CustomDatasetManager(DatasetManager):
+            @classmethod
+            def register_dataset_change(cls, *, task_instance=None, dataset, extra=None, **kwargs):
+                registered.append((dataset, extra))
+
+        datasets = [Dataset("s3://bucket/a"), Dataset("s3://bucket/b")]
+        ti = create_task_instance(dag_id="test_register_dataset_changes", session=session)
+        ti.task.outlets = datasets
+        manager = CustomDatasetManager() if custom_manager else DatasetManager()
+        with mock.patch("airflow.models.taskinstance.dataset_manager", manager), mock.patch.object(
+            DatasetManager, "register_dataset_changes"
+        ) as register_dataset_changes:
+            ti._register_dataset_changes(events=OutletEventAccessors(), session=session)
+
+        if custom_manager:
+            register_dataset_changes.assert_not_called()
+            assert registered == [(datasets[0], {}), (datasets[1], {})]
+        else:
+            register_dataset_changes.assert_called_once_with(
+                task_instance=ti, dataset_changes=[(datasets[0], {}), (datasets[1], {})], session=session
+            )
+
     def test_outlet_datasets_failed(self, create_task_instance):
         """
         Verify that when we have an outlet dataset on a task, and the task
@@ -4483,8 +4513,8 @@ def test_lazy_xcom_access_does_not_pickle_session(dag_maker, session):
     assert list(processed) == [123]
 
 
-@mock.patch("airflow.models.taskinstance.XCom.deserialize_value", side_effect=XCom.deserialize_value)
-def test_ti_xcom_pull_on_mapped_operator_return_lazy_iterable(mock_deserialize_value, dag_maker, session):
+@mock.patch("airflow.models.taskinstance.XCom.deserialize_values", side_effect=XCom.deserialize_values)
+def test_ti_xcom_pull_on_mapped_operator_return_lazy_iterable(mock_deserialize_values, dag_maker, session):
     """Ensure we access XCom lazily when pulling from a mapped operator."""
     with dag_maker(dag_id="test_xcom", session=session):
         # Use the private _expand() method to avoid the empty kwargs check.
@@ -4507,16 +4537,25 @@ def test_ti_xcom_pull_on_mapped_operator_return_lazy_iterable(mock_deserialize_v
     # Simply pulling the joined XCom value should not deserialize.
     joined = ti_2.xcom_pull("task_1", session=session)
     assert isinstance(joined, LazyXComSelectSequence)
-    assert mock_deserialize_value.call_count == 0
-
-    # Only when we go through the iterable does deserialization happen.
-    it = iter(joined)
-    assert next(it) == "a"
-    assert mock_deserialize_value.call_count == 1
-    assert next(it) == "b"
-    assert mock_deserialize_value.call_count == 2
-    with pytest.raises(StopIteration):
-        next(it)
+    assert mock_deserialize_values.call_count == 0
+
+    # Only when we go through the iterable does deserialization happen, a page of values at a time.
+    with mock.patch.object(LazyXComSelectSequence, "_page_size", 1), mock.patch.object(
+        session, "execute", side_effect=session.execute
+    ) as mock_execute:
+        it = iter(joined)
+        assert next(it) == "a"
+        # Each page is fetched by its own query
+        assert mock_execute.call_count == 1
+        assert mock_deserialize_values.call_count == 1
+        assert next(it) == "b"
+        assert mock_execute.call_count == 2
+        assert mock_deserialize_values.call_count == 2
+        with pytest.raises(StopIteration):
+            next(it)
+        assert mock_execute.call_count == 3
+    assert list(joined) == ["a", "b"]
+    assert mock_deserialize_values.call_count == 3
 
 
 def test_ti_mapped_depends_on_mapped_xcom_arg(dag_maker, session):
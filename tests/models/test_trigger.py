@@ -23,6 +23,7 @@ from typing import Any, AsyncIterator
 import pytest
 import pytz
 from cryptography.fernet import Fernet
+from sqlalchemy import select
 
 from airflow.jobs.job import Job
 from airflow.jobs.triggerer_job_runner import TriggererJobRunner
@@ -33,6 +34,7 @@ from airflow.triggers.base import BaseTrigger, TriggerEvent
 from airflow.utils import timezone
 from airflow.utils.session import create_session
 from airflow.utils.state import State
+from tests.test_utils.asserts import assert_queries_count
 from tests.test_utils.config import conf_vars
 
 pytestmark = pytest.mark.db_test
@@ -120,6 +122,53 @@ def test_submit_event(session, create_task_instance):
     assert updated_task_instance.next_kwargs == {"event": 42, "cheesecake": True}
 
 
+def test_submit_events(session, dag_maker):
+    """
+    Tests that a batch of events re-wakes the task instances of all their triggers,
+    using the first event of a trigger that fired several times.
+    """
+    triggers = [Trigger(classpath="airflow.triggers.testing.SuccessTrigger", kwargs={}) for _ in range(3)]
+    session.add_all(triggers)
+    session.flush()
+    with dag_maker(session=session):
+        for i in range(4):
+            EmptyOperator(task_id=f"task_{i}")
+    dag_run = dag_maker.create_dagrun()
+    task_instances = sorted(dag_run.task_instances, key=lambda ti: ti.task_id)
+    for task_instance, trigger in zip(task_instances, [*triggers, triggers[0]]):
+        task_instance.state = State.DEFERRED
+        task_instance.trigger_id = trigger.id
+    task_instances[0].next_kwargs = {"cheesecake": True}
+    # This task instance is not deferred anymore, so it must not be resumed
+    task_instances[2].state = State.SUCCESS
+    session.commit()
+
+    with assert_queries_count(2):
+        Trigger.submit_events(
+            [
+                (triggers[0].id, TriggerEvent(1)),
+                (triggers[1].id, TriggerEvent(2)),
+                (triggers[2].id, TriggerEvent(3)),
+                (triggers[0].id, TriggerEvent(4)),
+            ],
+            session=session,
+        )
+        session.flush()
+    session.expunge_all()
+
+    updated = {ti.task_id: ti for ti in session.scalars(select(TaskInstance))}
+    assert {task_id: ti.state for task_id, ti in updated.items()} == {
+        "task_0": State.SCHEDULED,
+        "task_1": State.SCHEDULED,
+        "task_2": State.SUCCESS,
+        "task_3": State.SCHEDULED,
+    }
+    assert updated["task_0"].next_kwargs == {"event": 1, "cheesecake": True}
+    assert updated["task_1"].next_kwargs == {"event": 2}
+    assert updated["task_3"].next_kwargs == {"event": 1}
+    assert all(ti.trigger_id is None for ti in updated.values() if ti.task_id != "task_2")
+
+
 def test_submit_failure(session, create_task_instance):
     """
     Tests that failures submitted to a trigger fail their dependent
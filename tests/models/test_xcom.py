@@ -121,6 +121,39 @@ class TestXCom:
         assert issubclass(cls, BaseXCom)
         assert cls.serialize_value([1]) == b"[1]"
 
+    @conf_vars({("core", "enable_xcom_pickling"): "False"})
+    def test_deserialize_values(self):
+        values = [{"key": "value"}, None, [1, 2], "a", datetime.timedelta(seconds=1)]
+        results = [MagicMock(value=None if v is None else BaseXCom.serialize_value(v)) for v in values]
+
+        with mock.patch.object(BaseXCom, "_deserialize_value") as mock_deserialize:
+            assert BaseXCom.deserialize_values(results) == values
+        mock_deserialize.assert_not_called()
+        assert BaseXCom.deserialize_values([]) == []
+
+    @conf_vars({("core", "enable_xcom_pickling"): "False"})
+    def test_deserialize_values_reports_malformed_value(self):
+        results = [MagicMock(value=b"1"), MagicMock(value=b"not json")]
+        with pytest.raises(ValueError):
+            BaseXCom.deserialize_values(results)
+        # Several documents in one value must not shift the other values
+        results = [MagicMock(value=b"1, 2"), MagicMock(value=b"3")]
+        with pytest.raises(ValueError):
+            BaseXCom.deserialize_values(results)
+
+    @pytest.mark.parametrize(
+        "xcom_class, pickling",
+        [pytest.param(BaseXCom, "True", id="pickling"), pytest.param(CustomXCom, "False", id="custom")],
+    )
+    def test_deserialize_values_one_by_one(self, xcom_class, pickling):
+        with conf_vars({("core", "enable_xcom_pickling"): pickling}):
+            results = [MagicMock(value=xcom_class.serialize_value(v)) for v in ("a", "b")]
+            with mock.patch.object(
+                xcom_class, "deserialize_value", side_effect=["a", "b"]
+            ) as mock_deserialize:
+                assert xcom_class.deserialize_values(results) == ["a", "b"]
+        assert mock_deserialize.call_count == 2
+
     def test_xcom_deserialize_with_json_to_pickle_switch(self, task_instance, session):
         ti_key = TaskInstanceKey(
             dag_id=task_instance.dag_id,
@@ -16,15 +16,18 @@
 # under the License.
 from __future__ import annotations
 
+import json
+import queue
 import random
 import re
 import string
+import threading
 from datetime import datetime, timedelta
 from unittest import mock
 
 import pytest
 import yaml
-from kubernetes.client import models as k8s
+from kubernetes.client import ApiClient, models as k8s
 from kubernetes.client.rest import ApiException
 from urllib3 import HTTPResponse
 
@@ -39,10 +42,13 @@ from airflow.providers.cncf.kubernetes.executors.kubernetes_executor import (
 )
 from airflow.providers.cncf.kubernetes.executors.kubernetes_executor_types import (
     ADOPTED,
+    POD_CACHE_SYNCED,
 )
 from airflow.providers.cncf.kubernetes.executors.kubernetes_executor_utils import (
     AirflowKubernetesScheduler,
+    CachedPod,
     KubernetesJobWatcher,
+    PodCache,
     ResourceVersion,
     get_base_pod_from_template,
 )
@@ -224,6 +230,78 @@ class TestAirflowKubernetesScheduler:
         finally:
             kube_executor.end()
 
+    @staticmethod
+    def _make_kube_scheduler(concurrency: int) -> AirflowKubernetesScheduler:
+        kube_config = mock.MagicMock(
+            multi_namespace_mode=False, kube_namespace="airflow", worker_pods_creation_concurrency=concurrency
+        )
+        with mock.patch(
+            "airflow.providers.cncf.kubernetes.executors.kubernetes_executor_utils.KubernetesJobWatcher"
+        ):
+            return AirflowKubernetesScheduler(
+                kube_config=kube_config,
+                result_queue=mock.MagicMock(),
+                kube_client=mock.MagicMock(),
+                scheduler_job_id="123",
+            )
+
+    @staticmethod
+    def _make_jobs(count: int) -> list:
+        return [(TaskInstanceKey("dag", f"task_{i}", "run_id", 1), [], None, None) for i in range(count)]
+
+    def test_create_pods_concurrently(self):
+        kube_scheduler = self._make_kube_scheduler(concurrency=4)
+        # Only passes if the 4 pods are created at the same time
+        barrier = threading.Barrier(4, timeout=10)
+        try:
+            with mock.patch.object(kube_scheduler, "run_next", side_effect=lambda job: barrier.wait()):
+                assert kube_scheduler.create_pods(self._make_jobs(4)) == [None] * 4
+        finally:
+            kube_scheduler.terminate()
+
+    def test_create_pods_one_at_a_time(self):
+        kube_scheduler = self._make_kube_scheduler(concurrency=1)
+        jobs = self._make_jobs(3)
+        threads = set()
+        try:
+            with mock.patch.object(
+                kube_scheduler, "run_next", side_effect=lambda job: threads.add(threading.get_ident())
+            ) as run_next:
+                assert kube_scheduler.create_pods(jobs) == [None] * 3
+            assert run_next.call_args_list == [mock.call(job) for job in jobs]
+            assert threads == {threading.get_ident()}
+            assert kube_scheduler._pod_creation_pool is None
+        finally:
+            kube_scheduler.terminate()
+
+    @pytest.mark.parametrize(
+        "side_effect, expected_calls, expected_error",
+        [
+            pytest.param([ApiException(status=429), None], 2, None, id="retry-429"),
+            pytest.param([ApiException(status=409), ApiException(status=429), None], 3, None, id="retry-409"),
+            pytest.param([ApiException(status=409)] * 3, 3, 409, id="retries-exhausted"),
+            pytest.param([ApiException(status=403)], 1, 403, id="not-retried"),
+        ],
+    )
+    @mock.patch("airflow.providers.cncf.kubernetes.executors.kubernetes_executor_utils.Stats")
+    @mock.patch("tenacity.nap.time.sleep")
+    def test_create_pods_retries(self, mock_sleep, mock_stats, side_effect, expected_calls, expected_error):
+        kube_scheduler = self._make_kube_scheduler(concurrency=2)
+        try:
+            with mock.patch.object(kube_scheduler, "run_next", side_effect=side_effect) as run_next:
+                (error,) = kube_scheduler.create_pods(self._make_jobs(1))
+        finally:
+            kube_scheduler.terminate()
+
+        assert run_next.call_count == expected_calls
+        if expected_error:
+            assert isinstance(error, ApiException)
+            assert error.status == expected_error
+        else:
+            assert error is None
+        assert mock_stats.incr.call_count == mock_sleep.call_count == expected_calls - 1
+        mock_stats.timer.assert_called_once_with("kubernetes_executor.pod_creation.duration")
+
     def test_running_pod_log_lines(self):
         # default behaviour
         kube_executor = KubernetesExecutor()
@@ -532,6 +610,54 @@ class TestKubernetesExecutor:
             finally:
                 kubernetes_executor.end()
 
+    def test_sync_creates_pods_in_batches(self):
+        executor = self.kubernetes_executor
+        executor.kube_config.worker_pods_creation_batch_size = 3
+        executor.scheduler_job_id = "5"
+        executor.kube_scheduler = mock.MagicMock()
+        executor.event_scheduler = mock.MagicMock()
+        keys = [TaskInstanceKey("dag", f"task_{i}", "run_id", 1) for i in range(4)]
+        jobs = [(key, ["airflow", "tasks", "run"], None, None) for key in keys]
+        for job in jobs:
+            executor.task_queue.put(job)
+        error = ApiException(http_resp=HTTPResponse(body='{"message": "any message"}', status=400))
+        executor.kube_scheduler.create_pods.return_value = [None, error, None]
+
+        executor.sync()
+
+        executor.kube_scheduler.create_pods.assert_called_once_with(jobs[:3])
+        assert executor.event_buffer == {keys[1]: (State.FAILED, error)}
+        # The task queue is not waiting for the created pods
+        executor.task_queue.get_nowait()
+        executor.task_queue.task_done()
+        executor.task_queue.join()
+
+    def test_sync_handles_all_pod_creation_results_before_raising(self):
+        executor = self.kubernetes_executor
+        executor.kube_config.worker_pods_creation_batch_size = 3
+        executor.scheduler_job_id = "5"
+        executor.kube_scheduler = mock.MagicMock()
+        executor.event_scheduler = mock.MagicMock()
+        keys = [TaskInstanceKey("dag", f"task_{i}", "run_id", 1) for i in range(3)]
+        jobs = [(key, ["airflow", "tasks", "run"], None, None) for key in keys]
+        for job in jobs:
+            executor.task_queue.put(job)
+        unexpected_error = ValueError("unexpected")
+        quota_error = ApiException(http_resp=HTTPResponse(body='{"message": "exceeded quota"}', status=403))
+        executor.kube_scheduler.create_pods.return_value = [unexpected_error, quota_error, None]
+        executor.task_publish_max_retries = 1
+        executor.task_publish_retries[keys[2]] = 1
+
+        with pytest.raises(ValueError, match="unexpected"):
+            executor.sync()
+
+        assert executor.event_buffer == {keys[0]: (State.FAILED, unexpected_error)}
+        # The jobs after the unexpected error are still handled
+        assert executor.task_queue.get_nowait() == jobs[1]
+        assert executor.task_publish_retries == {keys[1]: 1}
+        executor.task_queue.task_done()
+        executor.task_queue.join()
+
     @mock.patch("airflow.providers.cncf.kubernetes.executors.kubernetes_executor.KubeConfig")
     @mock.patch("airflow.providers.cncf.kubernetes.executors.kubernetes_executor.KubernetesExecutor.sync")
     @mock.patch("airflow.executors.base_executor.BaseExecutor.trigger_tasks")
@@ -1417,6 +1543,54 @@ class TestKubernetesExecutor:
         assert ti0.state == State.SCHEDULED
         assert ti1.state == State.QUEUED
 
+    @pytest.mark.db_test
+    @mock.patch("airflow.providers.cncf.kubernetes.executors.kubernetes_executor.DynamicClient")
+    def test_clear_not_launched_queued_tasks_from_pod_cache(
+        self, mock_kube_dynamic_client, dag_maker, create_dummy_dag, session
+    ):
+        """Once the pod cache is synced, the pods are not listed"""
+        pod_cache = PodCache(["default"])
+        pod_cache.apply(
+            (
+                POD_CACHE_SYNCED,
+                "default",
+                [
+                    CachedPod(
+                        namespace="default",
+                        name="launched",
+                        labels={
+                            "dag_id": "test_clear",
+                            "task_id": "launched",
+                            "airflow-worker": "1",
+                            "run_id": "test",
+                        },
+                        annotations={},
+                        phase="Pending",
+                        resource_version="100",
+                    )
+                ],
+            )
+        )
+
+        with dag_maker(dag_id="test_clear"):
+            EmptyOperator(task_id="launched")
+            EmptyOperator(task_id="not_launched")
+        dag_run = dag_maker.create_dagrun(run_id="test")
+        for ti in dag_run.task_instances:
+            ti.state = State.QUEUED
+            ti.queued_by_job_id = 1
+        session.flush()
+
+        executor = self.kubernetes_executor
+        executor.job_id = 1
+        executor.kube_client = mock.MagicMock()
+        executor.kube_scheduler = mock.MagicMock(pod_cache=pod_cache)
+        executor.clear_not_launched_queued_tasks(session=session)
+
+        states = {ti.task_id: ti.state for ti in dag_run.get_task_instances(session=session)}
+        assert states == {"launched": State.QUEUED, "not_launched": State.SCHEDULED}
+        mock_kube_dynamic_client.assert_not_called()
+
     @pytest.mark.db_test
     @mock.patch("airflow.providers.cncf.kubernetes.kube_client.get_kube_client")
     def test_get_task_log(self, mock_get_kube_client, create_task_instance_of_operator):
@@ -1884,3 +2058,204 @@ class TestKubernetesJobWatcher:
                 self.watcher.run()
 
             mock_underscore_run.assert_called_once_with(mock.ANY, "0", mock.ANY, mock.ANY)
+
+
+class FakeWatchResponse:
+    """The streamed response of a watch request, with one JSON event per line."""
+
+    def __init__(self, events: list[dict]):
+        self.events = events
+
+    def stream(self, amt=None, decode_content=False):
+        for event in self.events:
+            yield json.dumps(event).encode() + b"\n"
+
+    def close(self):
+        pass
+
+    def release_conn(self):
+        pass
+
+
+class FakeKubeClient:
+    """A fake ``CoreV1Api`` listing the pods of a namespace, and streaming the given events when watching."""
+
+    def __init__(self, pods: list[k8s.V1Pod], resource_version: str, events: list[tuple[str, k8s.V1Pod]]):
+        self.api_client = ApiClient()
+        self.pods = pods
+        self.resource_version = resource_version
+        self.events = events
+        self.calls: list[dict] = []
+
+    def list_namespaced_pod(self, namespace, **kwargs):
+        """
+        List or watch the pods of a namespace.
+
+        :param bool watch: Watch for changes.
+        :return: V1PodList
+        """
+        self.calls.append({"namespace": namespace, **kwargs})
+        if kwargs.get("watch"):
+            return FakeWatchResponse(
+                [
+                    {"type": event_type, "object": self.api_client.sanitize_for_serialization(pod)}
+                    for event_type, pod in self.events
+                ]
+            )
+        return k8s.V1PodList(
+            items=[pod for pod in self.pods if pod.metadata.namespace == namespace],
+            metadata=k8s.V1ListMeta(resource_version=self.resource_version),
+        )
+
+
+def make_pod(name: str, phase: str, resource_version: str, **labels) -> k8s.V1Pod:
+    return k8s.V1Pod(
+        metadata=k8s.V1ObjectMeta(
+            name=name,
+            namespace="airflow",
+            annotations={"dag_id": "dag", "task_id": name, "run_id": "run_id", "try_number": "1"},
+            labels={"airflow-worker": "123", "dag_id": "dag", "task_id": name, **labels},
+            resource_version=resource_version,
+        ),
+        status=k8s.V1PodStatus(phase=phase),
+    )
+
+
+class TestPodCache:
+    def setup_method(self):
+        self.watcher_queue = queue.Queue()
+        self.pod_cache_queue = queue.Queue()
+        self.watcher = KubernetesJobWatcher(
+            namespace="airflow",
+            watcher_queue=self.watcher_queue,
+            resource_version="0",
+            scheduler_job_id="123",
+            kube_config=mock.MagicMock(kube_client_request_args={}),
+            pod_cache_queue=self.pod_cache_queue,
+        )
+        self.pod_cache = PodCache(["airflow"])
+
+    def _sync(self):
+        while not self.pod_cache_queue.empty():
+            self.pod_cache.apply(self.pod_cache_queue.get_nowait())
+
+    def _watcher_states(self):
+        states = []
+        while not self.watcher_queue.empty():
+            pod_name, _, state, _, _ = self.watcher_queue.get_nowait()
+            states.append((pod_name, state))
+        return states
+
+    def test_watcher_lists_then_watches(self):
+        kube_client = FakeKubeClient(
+            pods=[make_pod("running", "Running", "90"), make_pod("succeeded", "Succeeded", "95")],
+            resource_version="100",
+            events=[
+                ("MODIFIED", make_pod("running", "Succeeded", "101")),
+                # Marked as done, so no longer selected by the watch
+                ("DELETED", make_pod("succeeded", "Succeeded", "102", airflow_executor_done="True")),
+                ("ADDED", make_pod("pending", "Pending", "103")),
+            ],
+        )
+
+        assert self.watcher._run(kube_client, "0", "123", self.watcher.kube_config) == "103"
+
+        list_call, watch_call = kube_client.calls
+        assert list_call == {
+            "namespace": "airflow",
+            "label_selector": "airflow-worker=123,airflow_executor_done!=True",
+            "resource_version": "0",
+        }
+        assert watch_call["watch"] is True
+        assert watch_call["resource_version"] == "100"
+
+        # The listed pods are processed like the first events of a watch from resource version 0
+        assert self._watcher_states() == [
+            ("succeeded", None),
+            ("running", None),
+            ("succeeded", ADOPTED),
+        ]
+
+        assert not self.pod_cache.synced
+        self._sync()
+        assert self.pod_cache.synced
+        assert {(pod.name, pod.phase, pod.resource_version) for pod in self.pod_cache.pods()} == {
+            ("running", "Succeeded", "101"),
+            ("pending", "Pending", "103"),
+        }
+
+    def test_resumed_watch_does_not_list(self):
+        kube_client = FakeKubeClient(
+            pods=[make_pod("running", "Running", "90")], resource_version="100", events=[]
+        )
+        self.watcher._run(kube_client, "0", "123", self.watcher.kube_config)
+        self._sync()
+        assert len(self.pod_cache.pods()) == 1
+
+        kube_client.calls.clear()
+        kube_client.events = [
+            ("DELETED", make_pod("running", "Running", "101", airflow_executor_done="True")),
+        ]
+        self.watcher._run(kube_client, "101", "123", self.watcher.kube_config)
+        self._sync()
+
+        (watch_call,) = kube_client.calls
+        assert watch_call["resource_version"] == "101"
+        assert self.pod_cache.synced
+        assert self.pod_cache.pods() == []
+
+    def test_watcher_without_pod_cache_does_not_list(self):
+        self.watcher.pod_cache_queue = None
+        kube_client = FakeKubeClient(
+            pods=[make_pod("running", "Running", "90")], resource_version="100", events=[]
+        )
+
+        self.watcher._run(kube_client, "0", "123", self.watcher.kube_config)
+
+        (watch_call,) = kube_client.calls
+        assert watch_call["watch"] is True
+        assert watch_call["resource_version"] == "0"
+
+    def test_events_before_snapshot_are_ignored(self):
+        pod = CachedPod.from_pod(make_pod("running", "Running", "90"))
+        self.pod_cache.apply(("ADDED", "airflow", pod))
+        assert not self.pod_cache.synced
+
+        self.pod_cache.apply((POD_CACHE_SYNCED, "airflow", []))
+        assert self.pod_cache.synced
+        assert self.pod_cache.pods() == []
+
+    def test_synced_when_all_namespaces_are_listed(self):
+        pod_cache = PodCache(["ns1", "ns2"])
+        pod_cache.apply((POD_CACHE_SYNCED, "ns1", []))
+        assert not pod_cache.synced
+        pod_cache.apply((POD_CACHE_SYNCED, "ns2", []))
+        assert pod_cache.synced
+
+        pod_cache.invalidate("ns1")
+        assert not pod_cache.synced
+
+    @mock.patch("airflow.providers.cncf.kubernetes.executors.kubernetes_executor_utils.KubernetesJobWatcher")
+    def test_scheduler_invalidates_namespace_of_dead_watcher(self, mock_watcher):
+        kube_config = mock.MagicMock(multi_namespace_mode=False, kube_namespace="airflow")
+        kube_scheduler = AirflowKubernetesScheduler(
+            kube_config=kube_config,
+            result_queue=mock.MagicMock(),
+            kube_client=mock.MagicMock(),
+            scheduler_job_id="123",
+        )
+        try:
+            _, kwargs = mock_watcher.call_args
+            assert kwargs["pod_cache_queue"] is kube_scheduler.pod_cache_queue
+
+            kube_scheduler.pod_cache_queue.put((POD_CACHE_SYNCED, "airflow", []))
+            kube_scheduler.sync()
+            assert kube_scheduler.pod_cache.synced
+
+            # Updates sent before the watcher died are applied before the cache is invalidated
+            kube_scheduler.pod_cache_queue.put((POD_CACHE_SYNCED, "airflow", []))
+            mock_watcher.return_value.is_alive.return_value = False
+            kube_scheduler.sync()
+            assert not kube_scheduler.pod_cache.synced
+        finally:
+            kube_scheduler._manager.shutdown()
@@ -17,6 +17,9 @@
 # under the License.
 from __future__ import annotations
 
+import json
+from unittest import mock
+
 import pytest
 
 from tests.test_utils.compat import AIRFLOW_V_2_9_PLUS, ignore_provider_compatibility_error
@@ -35,6 +38,7 @@ with ignore_provider_compatibility_error("2.8.0", __file__):
     from airflow.providers.common.io.xcom.backend import XComObjectStorageBackend
 
 from airflow.utils import timezone
+from airflow.utils.json import XComEncoder
 from airflow.utils.xcom import XCOM_RETURN_KEY
 from tests.test_utils import db
 from tests.test_utils.config import conf_vars
@@ -57,10 +61,12 @@ def reset_cache():
     backend._get_base_path.cache_clear()
     backend._get_compression.cache_clear()
     backend._get_threshold.cache_clear()
+    backend._get_streaming.cache_clear()
     yield
     backend._get_base_path.cache_clear()
     backend._get_compression.cache_clear()
     backend._get_threshold.cache_clear()
+    backend._get_streaming.cache_clear()
 
 
 @pytest.fixture
@@ -237,3 +243,111 @@ class TestXComObjectStorageBackend:
         )
 
         assert value == {"key": "superlargevalue" * 100}
+
+
+class TestXComObjectStorageBackendStreaming:
+    @pytest.fixture(autouse=True)
+    def setup_test_cases(self, tmp_path):
+        xcom_path = tmp_path / "xcom"
+        xcom_path.mkdir()
+        self.path = f"file://{xcom_path.as_posix()}"
+        configuration = {
+            ("core", "xcom_backend"): "airflow.providers.common.io.xcom.backend.XComObjectStorageBackend",
+            ("common.io", "xcom_objectstorage_path"): self.path,
+            ("common.io", "xcom_objectstorage_threshold"): "50",
+            ("common.io", "xcom_objectstorage_streaming"): "True",
+        }
+        with conf_vars(configuration):
+            yield
+
+    def _set_and_get_row(self, task_instance, session, value):
+        XCom = resolve_xcom_backend()
+        airflow.models.xcom.XCom = XCom
+        XCom.set(
+            key=XCOM_RETURN_KEY,
+            value=value,
+            dag_id=task_instance.dag_id,
+            task_id=task_instance.task_id,
+            run_id=task_instance.run_id,
+            session=session,
+        )
+        row = (
+            XCom.get_many(
+                key=XCOM_RETURN_KEY,
+                dag_ids=task_instance.dag_id,
+                task_ids=task_instance.task_id,
+                run_id=task_instance.run_id,
+                session=session,
+            )
+            .with_entities(BaseXCom.value)
+            .first()
+        )
+        return XCom, row
+
+    @pytest.mark.parametrize(
+        "value",
+        [pytest.param([1, "a"], id="empty"), pytest.param([{"key": [1, 2]}, None, "a" * 10], id="below")],
+    )
+    def test_small_list_in_db(self, task_instance, session, value):
+        XCom, row = self._set_and_get_row(task_instance, session, value)
+
+        assert row.value == json.dumps(value).encode("utf-8")
+        assert XComObjectStorageBackend.get_stored_value(row) is None
+        assert XCom.get_value(key=XCOM_RETURN_KEY, ti_key=task_instance.key, session=session) == value
+
+    @pytest.mark.parametrize("compression", [None, "gzip"])
+    def test_large_list_as_ndjson(self, task_instance, session, compression):
+        value = [{"index": i, "value": "x" * i} for i in range(20)]
+        with conf_vars({("common.io", "xcom_objectstorage_compression"): compression}):
+            XCom, row = self._set_and_get_row(task_instance, session, value)
+
+            stored = XComObjectStorageBackend.get_stored_value(row)
+            assert stored.format == "ndjson"
+            assert ".ndjson" in stored.path.suffixes
+            with stored.open() as f:
+                assert len(f.readlines()) == 20
+            assert list(stored.iter_items()) == value
+            assert XCom.get_value(key=XCOM_RETURN_KEY, ti_key=task_instance.key, session=session) == value
+
+    def test_list_is_encoded_one_item_at_a_time(self, task_instance, session):
+        value = ["x" * 10] * 20
+        encode = XComEncoder.encode
+
+        def encode_no_list(self, o):
+            assert not isinstance(o, list), "list encoded at once"
+            return encode(self, o)
+
+        with mock.patch.object(XComEncoder, "encode", encode_no_list):
+            XCom, row = self._set_and_get_row(task_instance, session, value)
+        assert XComObjectStorageBackend.get_stored_value(row).format == "ndjson"
+
+    def test_bytes(self, task_instance, session):
+        XCom, row = self._set_and_get_row(task_instance, session, b"\x00\x01")
+
+        stored = XComObjectStorageBackend.get_stored_value(row)
+        assert stored.format == "bytes"
+        assert stored.path.suffix == ".bin"
+        assert XCom.get_value(key=XCOM_RETURN_KEY, ti_key=task_instance.key, session=session) == b"\x00\x01"
+        with pytest.raises(TypeError):
+            next(stored.iter_items())
+
+    def test_other_values_as_json(self, task_instance, session):
+        value = {"key": "bigvaluebigvaluebigvalue" * 100}
+        XCom, row = self._set_and_get_row(task_instance, session, value)
+
+        stored = XComObjectStorageBackend.get_stored_value(row)
+        assert stored.format == "json"
+        assert stored.load() == value
+
+    def test_dataframe_as_parquet(self, task_instance, session):
+        pd = pytest.importorskip("pandas")
+        pytest.importorskip("pyarrow")
+        value = pd.DataFrame({"a": range(100), "b": ["x" * 10] * 100})
+        XCom, row = self._set_and_get_row(task_instance, session, value)
+
+        stored = XComObjectStorageBackend.get_stored_value(row)
+        assert stored.format == "parquet"
+        assert stored.read_arrow().num_rows == 100
+        pd.testing.assert_frame_equal(
+            XCom.get_value(key=XCOM_RETURN_KEY, ti_key=task_instance.key, session=session), value
+        )
@@ -74,6 +74,8 @@ from airflow.ti_deps.deps.base_ti_dep import BaseTIDep
 from airflow.timetables.simple import NullTimetable, OnceTimetable
 from airflow.triggers.base import StartTriggerArgs
 from airflow.utils import timezone
+from airflow.utils.dag_edges import dag_edges
+from airflow.utils.edgemodifier import Label
 from airflow.utils.operator_resources import Resources
 from airflow.utils.task_group import TaskGroup
 from airflow.utils.xcom import XCOM_RETURN_KEY
@@ -154,6 +156,7 @@ serialized_simple_dag_ground_truth = {
             "downstream_group_ids": [],
             "upstream_task_ids": [],
             "downstream_task_ids": [],
+            "topological_order": ["bash_task", "custom_task"],
         },
         "is_paused_upon_creation": False,
         "_dag_id": "simple_dag",
@@ -244,6 +247,7 @@ serialized_simple_dag_ground_truth = {
             },
         },
         "edge_info": {},
+        "_dag_edges": [],
         "dag_dependencies": [],
         "params": [],
     },
@@ -511,6 +515,8 @@ class TestStringifiedDAGs:
                 task["__var"] = dict(sorted(task["__var"].items(), key=lambda x: x[0]))
                 tasks.append(task)
             dag_dict["dag"]["tasks"] = tasks
+            # The tasks are independent, so their topological order is the order they were added in
+            dag_dict["dag"]["_task_group"]["topological_order"].sort()
             dag_dict["dag"]["_access_control"]["__var"]["test_role"]["__var"] = sorted(
                 dag_dict["dag"]["_access_control"]["__var"]["test_role"]["__var"]
             )
@@ -614,6 +620,12 @@ class TestStringifiedDAGs:
         assert serialized_dag.timetable.serialize() == dag.timetable.serialize()
         assert serialized_dag.timezone.name == dag.timezone.name
 
+        # The stored graph structure matches the one computed from the tasks
+        assert dag_edges(serialized_dag) == dag_edges(dag), f"{dag.dag_id} edges do not match"
+        assert [node.node_id for node in serialized_dag.task_group.topological_sort()] == [
+            node.node_id for node in dag.task_group.topological_sort()
+        ], f"{dag.dag_id} topological order does not match"
+
         for task_id in dag.task_ids:
             self.validate_deserialized_task(serialized_dag.get_task(task_id), dag.get_task(task_id))
 
@@ -1253,6 +1265,7 @@ class TestStringifiedDAGs:
             "tasks",
             "has_on_success_callback",
             "has_on_failure_callback",
+            "_dag_edges",
             "dag_dependencies",
             "params",
         }
@@ -1436,6 +1449,170 @@ class TestStringifiedDAGs:
 
         check_task_group(serialized_dag.task_group)
 
+    def test_task_group_graph_is_stored(self):
+        """The topological orders and the edges of the Graph view are stored when serializing the DAG."""
+        execution_date = datetime(2020, 1, 1)
+        with DAG("test_task_group_graph_is_stored", start_date=execution_date) as dag:
+            setup = EmptyOperator(task_id="setup").as_setup()
+            teardown = EmptyOperator(task_id="teardown").as_teardown(setups=setup)
+            with TaskGroup("group234") as group234:
+                task2 = EmptyOperator(task_id="task2")
+                with TaskGroup("group34") as group34:
+                    task4 = EmptyOperator(task_id="task4")
+                    task3 = EmptyOperator(task_id="task3")
+                    task3 >> task4
+                task2 >> group34
+            task5 = EmptyOperator(task_id="task5")
+            task1 = EmptyOperator(task_id="task1")
+            task5 << group234 << Label("after task1") << task1
+            setup >> task1
+            task5 >> teardown
+
+        encoded_dag = SerializedDAG.serialize_dag(dag)
+        serialized_dag = SerializedDAG.deserialize_dag(encoded_dag)
+        expected_orders = {
+            group_id: [node.node_id for node in group.topological_sort()]
+            for group_id, group in dag.task_group.get_task_group_dict().items()
+        }
+
+        assert serialized_dag._dag_edges is not None
+        assert dag_edges(serialized_dag) == dag_edges(dag)
+        assert {"source_id": "task1", "target_id": "group234.upstream_join_id", "label": "after task1"} in (
+            dag_edges(serialized_dag)
+        )
+        for group_id, group in serialized_dag.task_group.get_task_group_dict().items():
+            assert group._topological_order == expected_orders[group_id]
+            with mock.patch.object(
+                SerializedBaseOperator, "upstream_list", new_callable=mock.PropertyMock
+            ) as upstream_list:
+                assert [node.node_id for node in group.topological_sort()] == expected_orders[group_id]
+            upstream_list.assert_not_called()
+
+        # DAGs serialized before the graph was stored are sorted when they are rendered
+        for group_dict in (encoded_dag["_task_group"], encoded_dag["_task_group"]["children"]["group234"][1]):
+            del group_dict["topological_order"]
+        del encoded_dag["_dag_edges"]
+        old_serialized_dag = SerializedDAG.deserialize_dag(encoded_dag)
+        assert old_serialized_dag._dag_edges is None
+        assert old_serialized_dag.task_group._topological_order is None
+        assert dag_edges(old_serialized_dag) == dag_edges(dag)
+        assert [node.node_id for node in old_serialized_dag.task_group.topological_sort()] == (
+            expected_orders[None]
+        )
+
+    def test_task_group_order_does_not_depend_on_key_order(self):
+        """The stored order survives databases that sort the keys of JSON objects, like MySQL."""
+        with DAG("test_task_group_order_key_order", start_date=datetime(2020, 1, 1)) as dag:
+            with TaskGroup("g"):
+                zz_long_first_task = EmptyOperator(task_id="zz_long_first_task")
+                m2 = EmptyOperator(task_id="m2")
+                a = EmptyOperator(task_id="a")
+                zz_long_first_task >> m2 >> a
+
+        def sort_keys(obj):
+            if isinstance(obj, dict):
+                return {key: sort_keys(obj[key]) for key in sorted(obj)}
+            if isinstance(obj, list):
+                return [sort_keys(item) for item in obj]
+            return obj
+
+        encoded_dag = sort_keys(json.loads(json.dumps(SerializedDAG.to_dict(dag))))
+        group = SerializedDAG.from_dict(encoded_dag).task_group.children["g"]
+
+        assert list(group.children) == ["g.a", "g.m2", "g.zz_long_first_task"]
+        assert [node.node_id for node in group.topological_sort()] == [
+            "g.zz_long_first_task",
+            "g.m2",
+            "g.a",
+        ]
+
+    def test_task_group_order_not_matching_children_is_ignored(self):
+        with DAG("test_task_group_order_not_matching", start_date=datetime(2020, 1, 1)) as dag:
+            with TaskGroup("g"):
+                EmptyOperator(task_id="task1") >> EmptyOperator(task_id="task2")
+
+        encoded_dag = SerializedDAG.serialize_dag(dag)
+        encoded_group = encoded_dag["_task_group"]["children"]["g"][1]
+        encoded_group["topological_order"] = ["g.task2", "g.other"]
+        group = SerializedDAG.deserialize_dag(encoded_dag).task_group.children["g"]
+
+        assert group._topological_order is None
+        assert [node.node_id for node in group.topological_sort()] == ["g.task1", "g.task2"]
+
+    def test_task_group_graph_of_partial_subset(self):
+        """The graph stored for the whole DAG is not used for its subsets."""
+        with DAG("test_task_group_graph_of_partial_subset", start_date=datetime(2020, 1, 1)) as dag:
+            with TaskGroup("group") as group:
+                task1 = EmptyOperator(task_id="task1")
+                task2 = EmptyOperator(task_id="task2")
+                task1 >> task2
+            group >> EmptyOperator(task_id="task3")
+
+        serialized_dag = SerializedDAG.deserialize_dag(SerializedDAG.serialize_dag(dag))
+        subset = serialized_dag.partial_subset("group.task2", include_upstream=False)
+
+        assert subset._dag_edges is None
+        assert subset.task_group.children["group"]._topological_order is None
+        assert dag_edges(subset) == dag_edges(dag.partial_subset("group.task2", include_upstream=False))
+        assert [node.node_id for node in subset.task_group.children["group"].topological_sort()] == [
+            "group.task2"
+        ]
+
+    def test_lazy_deserialization(self):
+        """Operators of a lazily deserialized DAG are only deserialized when accessed."""
+        execution_date = datetime(2020, 1, 1)
+        with DAG("test_lazy_deserialization", start_date=execution_date) as dag:
+            task1 = EmptyOperator(task_id="task1")
+            with TaskGroup("group234") as group234:
+                _ = EmptyOperator(task_id="task2")
+
+                with TaskGroup("group34") as group34:
+                    _ = EmptyOperator(task_id="task3")
+                    _ = EmptyOperator(task_id="task4")
+
+            task5 = EmptyOperator(task_id="task5")
+            task1 >> group234
+            group34 >> task5
+
+        serialized_dag = SerializedDAG.from_dict(SerializedDAG.to_dict(dag), lazy=True)
+
+        assert serialized_dag.task_ids == dag.task_ids
+        assert serialized_dag.task_dict.num_deserialized_tasks == 0
+        for task_id in dag.task_ids:
+            assert serialized_dag.get_upstream_task_ids(task_id) == dag.task_dict[task_id].upstream_task_ids
+            assert (
+                serialized_dag.get_downstream_task_ids(task_id) == dag.task_dict[task_id].downstream_task_ids
+            )
+        assert serialized_dag.task_group.children.keys() == dag.task_group.children.keys()
+        assert serialized_dag.task_dict.num_deserialized_tasks == 0
+
+        task3 = serialized_dag.get_task("group234.group34.task3")
+        assert serialized_dag.task_dict.num_deserialized_tasks == 1
+        assert task3.dag is serialized_dag
+        assert task3.start_date == dag.start_date
+        assert task3.upstream_task_ids == {"task1"}
+        assert task3.downstream_task_ids == {"task5"}
+        assert task3.task_group.group_id == "group234.group34"
+        assert (
+            serialized_dag.task_group.get_task_group_dict()["group234.group34"].children[
+                "group234.group34.task3"
+            ]
+            is task3
+        )
+
+        self.validate_deserialized_dag(serialized_dag, dag)
+        assert serialized_dag.task_dict.num_deserialized_tasks == len(dag.task_ids)
+
+    @pytest.mark.db_test
+    def test_lazy_deserialization_of_example_dags(self):
+        dags = collect_dags("airflow/example_dags")
+
+        for dag in dags.values():
+            serialized_dag = SerializedDAG.from_dict(SerializedDAG.to_dict(dag), lazy=True)
+            self.validate_deserialized_dag(serialized_dag, dag)
+            for task in serialized_dag.tasks:
+                assert task.task_group.group_id == dag.get_task(task.task_id).task_group.group_id
+
     @staticmethod
     def assert_taskgroup_children(se_task_group, dag_task_group, expected_children):
         assert se_task_group.children.keys() == dag_task_group.children.keys() == expected_children
@@ -2773,6 +2950,7 @@ def test_mapped_task_group_serde():
             "ui_fgcolor": "#000",
             "upstream_group_ids": [],
             "upstream_task_ids": [],
+            "topological_order": ["tg.op1"],
         },
     )
 
@@ -2781,6 +2959,12 @@ def test_mapped_task_group_serde():
     assert isinstance(serde_tg, MappedTaskGroup)
     assert serde_tg._expand_input == DictOfListsExpandInput({"a": [".", ".."]})
 
+    lazy_dag = SerializedDAG.deserialize_dag(ser_dag[Encoding.VAR], lazy=True)
+    lazy_tg = lazy_dag.task_group.children["tg"]
+    assert isinstance(lazy_tg, MappedTaskGroup)
+    assert lazy_tg._expand_input == DictOfListsExpandInput({"a": [".", ".."]})
+    assert lazy_dag.get_task("tg.op1").task_group.group_id == "tg"
+
 
 @pytest.mark.db_test
 def test_mapped_task_with_operator_extra_links_property():
@@ -0,0 +1,117 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import zlib
+from datetime import datetime
+
+import pytest
+
+from airflow.models.dag import DAG
+from airflow.operators.empty import EmptyOperator
+from airflow.serialization.indexed_dag_data import (
+    IndexedDagData,
+    decode_dag_dependencies,
+    encode_indexed_dag_data,
+    get_dag_dependencies_end,
+    is_indexed_dag_data,
+)
+from airflow.serialization.serialized_objects import SerializedDAG
+from airflow.settings import json
+
+
+@pytest.fixture
+def dag_data():
+    with DAG("test_indexed_dag_data", start_date=datetime(2024, 1, 1), schedule=None) as dag:
+        start = EmptyOperator(task_id="start")
+        end = EmptyOperator(task_id="end")
+        for i in range(3):
+            start >> EmptyOperator(task_id=f"middle_{i}") >> end
+    return SerializedDAG.to_dict(dag)
+
+
+def test_roundtrip(dag_data):
+    blob = encode_indexed_dag_data(dag_data)
+
+    assert is_indexed_dag_data(blob)
+    # Like when stored as JSON, tuples come back as lists.
+    assert IndexedDagData(blob).to_dict() == json.loads(json.dumps(dag_data))
+
+
+def test_read_parts(dag_data):
+    indexed = IndexedDagData(encode_indexed_dag_data(dag_data))
+
+    assert indexed.dag_dependencies == dag_data["dag"]["dag_dependencies"]
+    dag_attributes = indexed.dag_attributes
+    assert "tasks" not in dag_attributes
+    assert "dag_dependencies" not in dag_attributes
+    assert dag_attributes["_dag_id"] == "test_indexed_dag_data"
+
+    tasks = indexed.tasks
+    assert len(tasks) == 5
+    assert tasks.task_ids == [task["__var"]["task_id"] for task in dag_data["dag"]["tasks"]]
+    assert tasks.get("middle_1")["__var"]["task_id"] == "middle_1"
+    assert dict(tasks.iter_downstream_task_ids())["start"] == ["middle_0", "middle_1", "middle_2"]
+
+
+def test_decode_dag_dependencies_from_prefix(dag_data):
+    dag_data["dag"]["dag_dependencies"] = [
+        {"source": "upstream", "target": "test_indexed_dag_data", "dependency_type": "trigger"}
+    ]
+    blob = encode_indexed_dag_data(dag_data)
+
+    end = get_dag_dependencies_end(blob[:20])
+    assert end < len(blob)
+    assert decode_dag_dependencies(blob[:end]) == dag_data["dag"]["dag_dependencies"]
+    with pytest.raises(ValueError, match="truncated"):
+        decode_dag_dependencies(blob[: end - 1])
+
+
+def test_lazy_deserialization(dag_data):
+    indexed = IndexedDagData(encode_indexed_dag_data(dag_data))
+
+    dag = SerializedDAG.from_dict(indexed.to_dict(decode_tasks=False), lazy=True)
+
+    assert dag.get_upstream_task_ids("end") == {"middle_0", "middle_1", "middle_2"}
+    assert dag.task_dict.num_deserialized_tasks == 0
+    assert dag.get_task("end").upstream_task_ids == {"middle_0", "middle_1", "middle_2"}
+    assert dag.task_dict.num_deserialized_tasks == 1
+
+
+def test_eager_deserialization(dag_data):
+    indexed = IndexedDagData(encode_indexed_dag_data(dag_data))
+
+    dag = SerializedDAG.from_dict(indexed.to_dict(decode_tasks=False))
+
+    assert dag.get_task("end").upstream_task_ids == {"middle_0", "middle_1", "middle_2"}
+
+
+@pytest.mark.parametrize(
+    "blob",
+    [None, b"", zlib.compress(b"{}"), json.dumps({"dag": {}}).encode()],
+)
+def test_is_not_indexed_dag_data(blob):
+    assert not is_indexed_dag_data(blob)
+
+
+def test_unknown_format_version(dag_data):
+    blob = bytearray(encode_indexed_dag_data(dag_data))
+    blob[4] = 99
+
+    with pytest.raises(ValueError, match="format version 99"):
+        IndexedDagData(bytes(blob))
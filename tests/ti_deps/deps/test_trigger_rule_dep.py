@@ -1066,6 +1066,38 @@ class TestTriggerRuleDep:
         dr.update_state(session=session)
         assert dr.state == DagRunState.SUCCESS
 
+    def test_finished_tis_grouped_once_per_dep_context(self, session, dag_maker):
+        """All tis evaluated with the same dep context share one grouping of the finished tis."""
+        with dag_maker(session=session):
+            op1 = EmptyOperator(task_id="op1")
+            op2 = EmptyOperator(task_id="op2")
+            op3 = EmptyOperator(task_id="op3")
+            op4 = EmptyOperator(task_id="op4", trigger_rule=TriggerRule.ONE_FAILED)
+            op1 >> op2 >> [op3, op4]
+
+        dr = dag_maker.create_dagrun()
+        tis = {ti.task_id: ti for ti in dr.get_task_instances(session=session)}
+        tis["op1"].state = FAILED
+        tis["op2"].state = SUCCESS
+        session.flush()
+
+        dep_context = DepContext(finished_tis=[tis["op1"], tis["op2"]])
+        statuses = {
+            task_id: list(
+                TriggerRuleDep()._evaluate_trigger_rule(
+                    ti=tis[task_id], dep_context=dep_context, session=session
+                )
+            )
+            for task_id in ("op3", "op4")
+        }
+        assert statuses["op3"] == []
+        assert len(statuses["op4"]) == 1
+        assert not statuses["op4"][0].passed
+
+        finished_tis_by_task_id = dep_context.ensure_finished_tis_by_task_id(dr, session)
+        assert finished_tis_by_task_id == {"op1": [tis["op1"]], "op2": [tis["op2"]]}
+        assert dep_context.ensure_finished_tis_by_task_id(dr, session) is finished_tis_by_task_id
+
     @pytest.mark.parametrize("flag_upstream_failed, expected_ti_state", [(True, REMOVED), (False, None)])
     def test_mapped_task_upstream_removed_with_all_success_trigger_rules(
         self,
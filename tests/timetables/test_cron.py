@@ -0,0 +1,110 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import datetime
+from unittest import mock
+
+import pendulum
+import pytest
+from croniter import croniter
+
+from airflow.timetables._cron import CronMixin, CronSchedule, get_cron_schedule
+from airflow.utils.timezone import utc
+
+# Both sides of the DST transitions of 2023 in Europe, and the one of Australia/Lord_Howe (30 minutes).
+DST_START = pendulum.DateTime(2023, 3, 25, 12, tzinfo=utc)
+DST_END = pendulum.DateTime(2023, 10, 28, 12, tzinfo=utc)
+LORD_HOWE_DST_START = pendulum.DateTime(2023, 9, 30, 0, tzinfo=utc)
+
+EXPRESSIONS = [
+    "*/5 * * * *",
+    "30 * * * *",
+    "30 2 * * *",
+    "15 1,2,3 * * *",
+    "0 */2 * * *",
+    "0 0 1,15 * 1-5",
+    "0 3 L * *",
+    "0 2 * * 0#4",
+]
+
+
+@pytest.fixture(autouse=True)
+def clear_cron_schedules():
+    get_cron_schedule.cache_clear()
+    yield
+    get_cron_schedule.cache_clear()
+
+
+@pytest.mark.parametrize("expression", EXPRESSIONS)
+@pytest.mark.parametrize(
+    "timezone, start",
+    [
+        pytest.param("UTC", DST_START, id="utc"),
+        pytest.param("Europe/Zurich", DST_START, id="dst-start"),
+        pytest.param("Europe/Zurich", DST_END, id="dst-end"),
+        pytest.param("Australia/Lord_Howe", LORD_HOWE_DST_START, id="half-hour-dst"),
+    ],
+)
+def test_cached_fire_times_match_computed_ones(expression, timezone, start):
+    cron = CronMixin(expression, timezone)
+
+    # Iterating over fire times, as catchup does
+    current = start
+    for _ in range(50):
+        scheduled = cron._get_next(current)
+        assert scheduled == cron._compute_next(current), current
+        current = scheduled
+
+    # Looking up arbitrary times, on and off fire times
+    for minutes in range(0, 2 * 24 * 60, 97):
+        current = start + datetime.timedelta(minutes=minutes)
+        assert cron._get_next(current) == cron._compute_next(current), current
+        assert cron._get_prev(current) == cron._compute_prev(current), current
+        scheduled = cron._compute_next(current)
+        assert cron._get_next(scheduled) == cron._compute_next(scheduled), scheduled
+        assert cron._get_prev(scheduled) == cron._compute_prev(scheduled), scheduled
+
+
+def test_iterating_uses_one_croniter():
+    cron = CronMixin("*/5 * * * *", "UTC")
+    current = DST_START
+    with mock.patch("airflow.timetables._cron.croniter", wraps=croniter) as mock_croniter:
+        for _ in range(1000):
+            current = cron._get_next(current)
+
+    assert current == DST_START + datetime.timedelta(minutes=5 * 1000)
+    # The expression is parsed once, fire times are then expanded from its fields
+    assert mock_croniter.call_count == 1
+
+
+def test_cron_schedule_is_shared():
+    assert get_cron_schedule("0 0 * * *", utc) is get_cron_schedule("0 0 * * *", utc)
+    assert get_cron_schedule("0 0 * * *", utc) is not get_cron_schedule("0 1 * * *", utc)
+
+
+def test_segments_are_bounded():
+    schedule = CronSchedule("* * * * *", utc)
+    schedule.max_chunk_size = 16
+    schedule.max_segment_size = 64
+    current = DST_START
+    for _ in range(3 * schedule.max_segment_size):
+        current = schedule.get_next(current)
+
+    assert current == DST_START + datetime.timedelta(minutes=3 * schedule.max_segment_size)
+    assert len(schedule._segments) == 1
+    assert len(schedule._segments[0].timestamps) <= schedule.max_segment_size + schedule.max_chunk_size
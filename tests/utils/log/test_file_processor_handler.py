@@ -107,5 +107,19 @@ class TestFileProcessorHandler:
         with time_machine.travel(date1, tick=False):
             handler.set_context(filename=os.path.join(self.dag_dir, "log1"))
 
+    def test_set_context_closes_previous_file(self):
+        handler = FileProcessorHandler(base_log_folder=self.base_log_folder, filename_template=self.filename)
+        handler.dag_dir = self.dag_dir
+
+        handler.set_context(filename=os.path.join(self.dag_dir, "log1"))
+        first_handler = handler.handler
+        assert first_handler.stream is not None
+
+        handler.set_context(filename=os.path.join(self.dag_dir, "log2"))
+        assert first_handler.stream is None
+        assert handler.handler is not first_handler
+        assert handler.handler.stream is not None
+        handler.close()
+
     def teardown_method(self):
         shutil.rmtree(self.base_log_folder, ignore_errors=True)
@@ -199,6 +199,26 @@ class TestLogView:
             "\n",
         ]
 
+    @mock.patch.object(TaskLogReader, "STREAM_CHUNK_SIZE", 1)
+    @mock.patch("airflow.utils.log.file_task_handler.FileTaskHandler.read")
+    def test_read_log_stream_should_stream_lines_of_finished_try(self, mock_read):
+        log_path = f"{self.log_dir}/dag_log_reader/task_log_reader/2017-09-01T00.00.00+00.00/1.log"
+        with open(log_path, "a") as f:
+            f.write("second line\n")
+        task_log_reader = TaskLogReader()
+        assert task_log_reader.supports_read_log_lines
+        ti = copy.copy(self.ti)
+        ti.state = TaskInstanceState.SUCCESS
+
+        stream = task_log_reader.read_log_stream(ti=ti, try_number=1, metadata={})
+
+        assert list(stream) == [
+            f"localhost\n*** Found local files:\n***   * {log_path}\ntry_number=1.\n",
+            "second line\n",
+        ]
+        mock_read.assert_not_called()
+
+    @mock.patch.object(TaskLogReader, "supports_read_log_lines", False)
     @mock.patch("airflow.utils.log.file_task_handler.FileTaskHandler.read")
     def test_read_log_stream_should_support_multiple_chunks(self, mock_read):
         first_return = ([[("", "1st line")]], [{}])
@@ -214,13 +234,14 @@ class TestLogView:
 
         mock_read.assert_has_calls(
             [
-                mock.call(self.ti, 1, metadata={}),
+                mock.call(self.ti, 1, metadata={"max_bytes": 5242880}),
                 mock.call(self.ti, 1, metadata={}),
                 mock.call(self.ti, 1, metadata={"end_of_log": False}),
             ],
             any_order=False,
         )
 
+    @mock.patch.object(TaskLogReader, "supports_read_log_lines", False)
     @mock.patch("airflow.utils.log.file_task_handler.FileTaskHandler.read")
     def test_read_log_stream_should_read_each_try_in_turn(self, mock_read):
         first_return = ([[("", "try_number=1.")]], [{"end_of_log": True}])
@@ -235,9 +256,9 @@ class TestLogView:
 
         mock_read.assert_has_calls(
             [
-                mock.call(self.ti, 1, metadata={}),
-                mock.call(self.ti, 2, metadata={}),
-                mock.call(self.ti, 3, metadata={}),
+                mock.call(self.ti, 1, metadata={"max_bytes": 5242880}),
+                mock.call(self.ti, 2, metadata={"max_bytes": 5242880}),
+                mock.call(self.ti, 3, metadata={"max_bytes": 5242880}),
             ],
             any_order=False,
         )
@@ -278,6 +278,52 @@ class TestSecretsMasker:
 
         assert filt.redact(value, name) == expected
 
+    def test_redact_overlapping_secrets(self):
+        filt = SecretsMasker()
+        # Whatever the order of the patterns, the longest secret is masked
+        for val in ("abc", "abcdef", "cdefgh"):
+            filt.add_mask(val)
+
+        assert filt.redact("xabcdefy abc abcdefgh") == "x***y *** ***gh"
+
+    def test_redact_many_secrets(self):
+        filt = SecretsMasker()
+        secrets = [f"secret-{i}-{'x' * (i % 7)}" for i in range(2000)]
+        with patch.object(
+            SecretsMasker, "_compile_replacer", wraps=SecretsMasker._compile_replacer
+        ) as mock_compile:
+            for secret in secrets:
+                filt.add_mask(secret)
+            mock_compile.assert_not_called()
+
+            assert filt.redact(f"a {secrets[1234]} b {secrets[42]}") == "a *** b ***"
+            assert filt.redact("not a secret") == "not a secret"
+            # The secrets are compiled once, when they are first used
+            assert mock_compile.call_count == 1
+
+    def test_redact_after_adding_mask(self):
+        filt = SecretsMasker()
+        filt.add_mask("password")
+        assert filt.redact("user:password") == "user:***"
+        assert filt.redact("user:pw") == "user:pw"
+
+        # Strings shorter than the previous secrets and already redacted strings are checked again
+        filt.add_mask("pw")
+        assert filt.redact("user:pw") == "user:***"
+        filt.add_mask("user")
+        assert filt.redact("user:password") == "***:***"
+
+    def test_redact_with_replacer_of_other_masker(self):
+        other = SecretsMasker()
+        other.add_mask("pw")
+        filt = SecretsMasker()
+        filt.add_mask("password")
+        assert filt.redact("pw") == "pw"
+
+        filt.patterns = other.patterns
+        filt.replacer = other.replacer
+        assert filt.redact("pw") == "***"
+
     def test_redact_filehandles(self, caplog):
         filt = SecretsMasker()
         with open("/dev/null", "w") as handle:
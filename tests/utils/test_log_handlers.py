@@ -17,9 +17,11 @@
 # under the License.
 from __future__ import annotations
 
+import itertools
 import logging
 import logging.config
 import os
+import random
 import re
 from http import HTTPStatus
 from importlib import reload
@@ -47,7 +49,10 @@ from airflow.utils.log.file_task_handler import (
     LogType,
     _fetch_logs_from_service,
     _interleave_logs,
+    _parse_timestamp,
     _parse_timestamps_in_log_file,
+    _read_log_tail,
+    _read_served_log_range,
 )
 from airflow.utils.log.logging_mixin import set_context
 from airflow.utils.net import get_hostname
@@ -282,14 +287,91 @@ class TestFileTaskLogHandler:
         path1.write_text("file1 content")
         path2.write_text("file2 content")
         fth = FileTaskHandler("")
-        assert fth._read_from_local(path1) == (
-            [
-                "Found local files:",
-                f"  * {path1}",
-                f"  * {path2}",
-            ],
-            ["file1 content", "file2 content"],
+        messages, logs = fth._read_from_local(path1)
+        assert messages == [
+            "Found local files:",
+            f"  * {path1}",
+            f"  * {path2}",
+        ]
+        # The files are read as their lines are consumed
+        assert [list(log) for log in logs] == [["file1 content"], ["file2 content"]]
+
+    @pytest.fixture
+    def large_local_log(self, create_task_instance, tmp_path):
+        ti = create_task_instance(
+            dag_id="dag_for_testing_local_log_window_read",
+            task_id="task_for_testing_local_log_window_read",
+            run_type=DagRunType.SCHEDULED,
+            execution_date=DEFAULT_DATE,
         )
+        ti.state = TaskInstanceState.SUCCESS
+        fth = FileTaskHandler(str(tmp_path))
+        lines = [f"[2024-01-01T00:00:{i // 1000:02d}.{i % 1000:03d}+00:00] line {i}" for i in range(5000)]
+        path = tmp_path / fth._render_filename(ti, 1)
+        path.parent.mkdir(parents=True)
+        path.write_text("\n".join(lines) + "\n")
+        return fth, ti, lines, path
+
+    def test__read_tail_lines(self, large_local_log):
+        fth, ti, lines, path = large_local_log
+
+        log, metadata = fth._read(ti=ti, try_number=1, metadata={"tail_lines": 3})
+
+        assert log.splitlines()[-3:] == lines[-3:]
+        assert log.splitlines()[0] == "*** Found local files:"
+        assert len(log.splitlines()) == 5
+        assert metadata == {"end_of_log": True, "log_offsets": {path.name: path.stat().st_size}}
+
+    def test__read_window_by_window(self, large_local_log):
+        fth, ti, lines, path = large_local_log
+        metadata = {"max_bytes": 10_000}
+        windows = []
+        while True:
+            log, metadata = fth._read(ti=ti, try_number=1, metadata=metadata)
+            windows.append(log)
+            if metadata["end_of_log"]:
+                break
+
+        assert len(windows) == path.stat().st_size // 10_000 + 1
+        assert windows[0].startswith("*** Found local files:")
+        assert "\n".join(windows[1:]).splitlines() == lines[len(windows[0].splitlines()) - 2 :]
+
+    def test__read_window_only_reads_the_window(self, large_local_log):
+        fth, ti, lines, path = large_local_log
+        offset = path.read_text().index(lines[-3])
+        with mock.patch.object(Path, "read_text") as mock_read_text:
+            log, metadata = fth._read(
+                ti=ti, try_number=1, metadata={"log_offsets": {path.name: offset}, "max_bytes": 1000}
+            )
+
+        mock_read_text.assert_not_called()
+        assert log == path.read_text()[offset:].rstrip("\n")
+        assert metadata == {
+            "end_of_log": True,
+            "log_offsets": {path.name: path.stat().st_size},
+            "max_bytes": 1000,
+        }
+
+    def test__read_window_ignored_with_remote_logs(self, large_local_log):
+        fth, ti, lines, path = large_local_log
+        fth._read_remote_logs = mock.Mock(return_value=(["found remote logs"], ["remote\nlog\ncontent"]))
+
+        log, metadata = fth._read(ti=ti, try_number=1, metadata={"tail_lines": 3})
+
+        assert log == "*** found remote logs\nremote\nlog\ncontent"
+        assert metadata == {"end_of_log": True, "log_pos": 18}
+
+    def test__read_window_continuation_after_remote_logs_are_uploaded(self, large_local_log):
+        fth, ti, lines, path = large_local_log
+        log, metadata = fth._read(ti=ti, try_number=1, metadata={"tail_lines": 3})
+        assert log.splitlines()[-3:] == lines[-3:]
+
+        # The local log was uploaded to the remote storage after the first window was read
+        fth._read_remote_logs = mock.Mock(return_value=(["found remote logs"], ["\n".join(lines)]))
+        log, next_metadata = fth._read(ti=ti, try_number=1, metadata=metadata)
+
+        assert log == ""
+        assert next_metadata == {"end_of_log": True, "log_offsets": metadata["log_offsets"]}
 
     @mock.patch(
         "airflow.providers.cncf.kubernetes.executors.kubernetes_executor.KubernetesExecutor.get_task_log"
@@ -764,6 +846,70 @@ def test_interleave_logs_correct_ordering():
     assert sample_with_dupe == "\n".join(_interleave_logs(sample_with_dupe, "", sample_with_dupe))
 
 
+@pytest.mark.parametrize(
+    "timestamp",
+    [
+        "[2022-11-16T00:05:54.278-0800]",
+        "[2022-11-16T00:05:54.278+0530]",
+        "[2022-11-16T00:05:54.278+05:30]",
+        "[2022-11-16T00:05:54.278123Z]",
+        "[2022-11-16T00:05:54]",
+        "2022-11-16T00:05:54.278",
+        "2022-11-16",
+    ],
+)
+def test_parse_timestamp_like_pendulum(timestamp):
+    assert _parse_timestamp(f"{timestamp} INFO - message") == pendulum.parse(timestamp.strip("[]"))
+
+
+@pytest.mark.parametrize(
+    "line", ["now INFO - message", "[] INFO - message", " [2022-11-16T00:05:54.278-0800]"]
+)
+def test_parse_timestamp_without_timestamp(line):
+    assert not _parse_timestamp(line)
+
+
+def test_interleave_logs_like_sorting():
+    rng = random.Random(42)
+    logs = []
+    for i in range(5):
+        lines = [f"no timestamp {i}"]
+        for j in range(200):
+            second = j * 5 + rng.randint(0, 4)
+            lines.append(f"[2024-01-01T00:{second // 60:02d}:{second % 60:02d}.000+0000] log {i} line {j}")
+            lines.extend(["repeated line"] * rng.randint(0, 2))
+        logs.append("\n".join(lines))
+    records = []
+    for log in logs:
+        records.extend(_parse_timestamps_in_log_file(log.splitlines()))
+    expected = [
+        line
+        for line, _ in itertools.groupby(
+            line
+            for _, _, line in sorted(
+                records, key=lambda x: (x[0], x[1]) if x[0] else (pendulum.datetime(2000, 1, 1), x[1])
+            )
+        )
+    ]
+
+    assert list(_interleave_logs(*logs)) == expected
+
+
+def test_interleave_logs_streams():
+    def endless_log(name):
+        for i in itertools.count():
+            yield f"[2024-01-01T00:00:00.{i:06d}+00:00] {name} {i}"
+
+    merged = _interleave_logs(endless_log("a"), endless_log("b"))
+
+    assert list(itertools.islice(merged, 4)) == [
+        "[2024-01-01T00:00:00.000000+00:00] a 0",
+        "[2024-01-01T00:00:00.000000+00:00] b 0",
+        "[2024-01-01T00:00:00.000001+00:00] a 1",
+        "[2024-01-01T00:00:00.000001+00:00] b 1",
+    ]
+
+
 def test_permissions_for_new_directories(tmp_path):
     # Set umask to 0o027: owner rwx, group rx-w, other -rwx
     old_umask = os.umask(0o027)
@@ -826,3 +972,64 @@ def test_fetch_logs_from_service_with_cidr_no_proxy(mock_send, monkeypatch):
     proxies = kwargs["proxies"]
     assert "http" not in proxies.keys()
     assert "no" not in proxies.keys()
+
+
+@pytest.mark.parametrize("num_lines", [0, 1, 10, 4999, 5000, 6000])
+@pytest.mark.parametrize("trailing_newline", [True, False])
+def test_read_log_tail(num_lines, trailing_newline):
+    lines = [f"line {i}".encode() for i in range(5000)]
+    data = b"\n".join(lines) + (b"\n" if trailing_newline else b"")
+    read_sizes = []
+
+    def read_range(first, last):
+        assert first is None
+        read_sizes.append(last)
+        start = max(len(data) - last, 0)
+        return data[start:], start, len(data)
+
+    with mock.patch("airflow.utils.log.file_task_handler._TAIL_READ_SIZE", 200):
+        tail, end = _read_log_tail(read_range, num_lines, None)
+
+    assert tail.splitlines() == (lines[max(len(lines) - num_lines, 0) :] if num_lines else [])
+    assert end == len(data)
+    # Only the end of the log is read
+    if num_lines <= 10:
+        assert read_sizes == [200]
+
+
+def test_read_log_tail_reads_at_most_max_bytes():
+    data = b"first line\n" + b"x" * 100_000 + b"\nlast line\n"
+    read_sizes = []
+
+    def read_range(first, last):
+        read_sizes.append(last)
+        start = max(len(data) - last, 0)
+        return data[start:], start, len(data)
+
+    with mock.patch("airflow.utils.log.file_task_handler._TAIL_READ_SIZE", 200):
+        tail, end = _read_log_tail(read_range, 3, 1000)
+
+    # The line before the last one is longer than max_bytes, only its end is returned
+    assert tail == data[-1000:]
+    assert end == len(data)
+    assert read_sizes == [200, 800, 1000]
+
+
+@pytest.mark.parametrize(
+    "status_code, headers, content, expected",
+    [
+        pytest.param(206, {"Content-Range": "bytes 10-14/20"}, b"01234", (b"01234", 10, 20), id="partial"),
+        pytest.param(416, {"Content-Range": "bytes */20"}, b"", (b"", 20, 20), id="nothing-new"),
+        pytest.param(200, {}, b"0123456789" * 2, (b"01234", 10, 20), id="ranges-not-supported"),
+    ],
+)
+@mock.patch("airflow.utils.log.file_task_handler._fetch_logs_from_service")
+def test_read_served_log_range(mock_fetch, status_code, headers, content, expected):
+    response = Response()
+    response.status_code = status_code
+    response.headers.update(headers)
+    response._content = content
+    mock_fetch.return_value = response
+
+    assert _read_served_log_range(log_url, log_location, 10, 14) == expected
+    mock_fetch.assert_called_once_with(log_url, log_location, byte_range="bytes=10-14")
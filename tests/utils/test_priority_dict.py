@@ -0,0 +1,96 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import operator
+import random
+
+import pytest
+
+from airflow.utils.priority_dict import PriorityDict
+
+
+def make_priority_dict(items=()):
+    return PriorityDict(priority=operator.itemgetter(0), items=items)
+
+
+def sort_by_priority(items):
+    return sorted(items, key=lambda item: item[1][0], reverse=True)
+
+
+class TestPriorityDict:
+    def test_mapping(self):
+        queue = make_priority_dict({"a": (1, "a"), "b": (2, "b")})
+        queue["c"] = (0, "c")
+        del queue["a"]
+
+        assert "a" not in queue
+        assert "b" in queue
+        assert queue["c"] == (0, "c")
+        assert len(queue) == 2
+        assert dict(queue) == {"b": (2, "b"), "c": (0, "c")}
+        assert queue.pop("b") == (2, "b")
+        with pytest.raises(KeyError):
+            del queue["b"]
+
+    def test_peek(self):
+        queue = make_priority_dict({"a": (1, "a"), "b": (3, "b"), "c": (2, "c")})
+
+        assert queue.peek(2) == [("b", (3, "b")), ("c", (2, "c"))]
+        # Peeking does not remove the items
+        assert queue.peek(5) == [("b", (3, "b")), ("c", (2, "c")), ("a", (1, "a"))]
+        assert queue.peek(0) == []
+
+    def test_update_priority(self):
+        queue = make_priority_dict({"a": (1, "a"), "b": (1, "b"), "c": (1, "c")})
+        queue["a"] = (0, "a")
+        queue["c"] = (2, "c")
+        queue["b"] = (1, "updated")
+
+        assert queue.peek(3) == [("c", (2, "c")), ("b", (1, "updated")), ("a", (0, "a"))]
+
+    def test_clear_and_copy(self):
+        queue = make_priority_dict({"a": (1, "a"), "b": (1, "b")})
+        copy = queue.copy()
+        queue.clear()
+        queue["c"] = (0, "c")
+
+        assert queue.peek(3) == [("c", (0, "c"))]
+        assert copy.peek(3) == [("a", (1, "a")), ("b", (1, "b"))]
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_sorted_dict(self, seed):
+        rng = random.Random(seed)
+        queue = make_priority_dict()
+        reference = {}
+        for i in range(2000):
+            operation = rng.random()
+            if operation < 0.5 or not reference:
+                key = rng.randrange(300)
+                value = (rng.randrange(10), i)
+                queue[key] = value
+                reference[key] = value
+            elif operation < 0.8:
+                key = rng.choice(list(reference))
+                del queue[key]
+                del reference[key]
+            else:
+                count = rng.randrange(20)
+                assert queue.peek(count) == sort_by_priority(reference.items())[:count]
+            assert len(queue._heap) <= 2 * len(queue) + 1
+
+        assert queue.peek(len(reference)) == sort_by_priority(reference.items())
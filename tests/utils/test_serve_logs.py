@@ -113,6 +113,34 @@ class TestServeLogs:
         assert response.data.decode() == LOG_DATA
         assert response.status_code == 200
 
+    @pytest.mark.parametrize(
+        "byte_range, expected_status, expected_data, expected_content_range",
+        [
+            ("bytes=2-5", 206, LOG_DATA[2:6], f"bytes 2-5/{len(LOG_DATA)}"),
+            (
+                "bytes=-3",
+                206,
+                LOG_DATA[-3:],
+                f"bytes {len(LOG_DATA) - 3}-{len(LOG_DATA) - 1}/{len(LOG_DATA)}",
+            ),
+            (f"bytes={len(LOG_DATA)}-", 416, None, f"bytes */{len(LOG_DATA)}"),
+        ],
+    )
+    def test_should_serve_file_range(
+        self, client: FlaskClient, signer, byte_range, expected_status, expected_data, expected_content_range
+    ):
+        response = client.get(
+            "/log/sample.log",
+            headers={
+                "Authorization": signer.generate_signed_token({"filename": "sample.log"}),
+                "Range": byte_range,
+            },
+        )
+        assert response.status_code == expected_status
+        assert response.headers["Content-Range"] == expected_content_range
+        if expected_data is not None:
+            assert response.data.decode() == expected_data
+
     def test_forbidden_different_logname(self, client: FlaskClient, signer):
         response = client.get(
             "/log/sample.log",
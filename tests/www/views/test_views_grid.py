@@ -18,22 +18,26 @@
 from __future__ import annotations
 
 from datetime import timedelta
-from typing import TYPE_CHECKING
+from unittest import mock
 
 import pendulum
 import pytest
 from dateutil.tz import UTC
+from sqlalchemy import update
 
 from airflow.datasets import Dataset
 from airflow.decorators import task_group
 from airflow.lineage.entities import File
 from airflow.models import DagBag
+from airflow.models.dagrun import DagRun
 from airflow.models.dataset import DatasetDagRunQueue, DatasetEvent, DatasetModel
+from airflow.models.taskinstance import TaskInstance
 from airflow.operators.empty import EmptyOperator
 from airflow.utils import timezone
 from airflow.utils.state import DagRunState, TaskInstanceState
 from airflow.utils.task_group import TaskGroup
 from airflow.utils.types import DagRunType
+from airflow.www import views
 from airflow.www.views import dag_to_grid
 from tests.test_utils.asserts import assert_queries_count
 from tests.test_utils.db import clear_db_datasets, clear_db_runs
@@ -41,9 +45,6 @@ from tests.test_utils.mock_operators import MockOperator
 
 pytestmark = pytest.mark.db_test
 
-if TYPE_CHECKING:
-    from airflow.models.dagrun import DagRun
-
 DAG_ID = "test"
 
 
@@ -57,9 +58,11 @@ def examples_dag_bag():
 def clean():
     clear_db_runs()
     clear_db_datasets()
+    views._grid_skeletons.clear()
     yield
     clear_db_runs()
     clear_db_datasets()
+    views._grid_skeletons.clear()
 
 
 @pytest.fixture
@@ -160,6 +163,7 @@ def test_no_runs(admin_client, dag_without_runs):
             "label": None,
         },
         "ordering": ["data_interval_end", "execution_date"],
+        "version": None,
     }
 
 
@@ -406,6 +410,7 @@ def test_one_run(admin_client, dag_with_runs: list[DagRun], session):
             "label": None,
         },
         "ordering": ["data_interval_end", "execution_date"],
+        "version": None,
     }
 
 
@@ -415,6 +420,101 @@ def test_query_count(dag_with_runs, session):
         dag_to_grid(run1.dag, (run1, run2), session)
 
 
+@pytest.fixture
+def versioned_dag_with_runs(dag_without_runs, dag_with_runs, session):
+    # The DAG bag of the webserver reads the DAGs from the database, with the hash of their version
+    dag_without_runs.dagbag.dags_hash[DAG_ID] = dag_without_runs.serialized_model.dag_hash
+    # Nothing changed recently
+    long_ago = timezone.utcnow() - timedelta(days=1)
+    session.execute(update(TaskInstance).values(updated_at=long_ago))
+    session.execute(update(DagRun).values(updated_at=long_ago))
+    session.commit()
+    return dag_with_runs
+
+
+def test_not_modified(admin_client, versioned_dag_with_runs, session):
+    url = f"/object/grid_data?dag_id={DAG_ID}"
+    resp = admin_client.get(url)
+    assert resp.status_code == 200, resp.json
+    assert resp.headers["Cache-Control"] == "no-cache"
+    etag = resp.headers["ETag"]
+
+    with mock.patch.object(views, "dag_to_grid") as mock_dag_to_grid:
+        resp = admin_client.get(url, headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+    mock_dag_to_grid.assert_not_called()
+
+    session.execute(
+        update(TaskInstance).where(TaskInstance.task_id == "task1").values(state=TaskInstanceState.FAILED)
+    )
+    session.commit()
+    resp = admin_client.get(url, headers={"If-None-Match": etag})
+    assert resp.status_code == 200, resp.json
+    assert resp.headers["ETag"] != etag
+
+
+def test_delta(admin_client, versioned_dag_with_runs):
+    url = "/object/grid_data"
+    full = admin_client.get(url, query_string={"dag_id": DAG_ID}).json
+    assert "changed_run_ids" not in full
+
+    with mock.patch.object(views, "_get_grid_etag") as mock_get_grid_etag:
+        resp = admin_client.get(url, query_string={"dag_id": DAG_ID, "changed_since": full["version"]})
+    # Delta requests are never revalidated, so they are not summarized
+    mock_get_grid_etag.assert_not_called()
+    assert "ETag" not in resp.headers
+    delta = resp.json
+
+    # Only the running run is sent again
+    assert delta["changed_run_ids"] == ["run_2"]
+    assert delta["dag_runs"] == full["dag_runs"]
+    assert delta["version"] > full["version"]
+    task1 = delta["groups"]["children"][0]
+    assert task1["id"] == "task1"
+    assert [instance["run_id"] for instance in task1["instances"]] == ["run_2"]
+    assert task1["instances"] == [
+        instance for instance in full["groups"]["children"][0]["instances"] if instance["run_id"] == "run_2"
+    ]
+
+
+def test_delta_with_changed_run(admin_client, versioned_dag_with_runs, session):
+    url = "/object/grid_data"
+    full = admin_client.get(url, query_string={"dag_id": DAG_ID}).json
+
+    session.execute(
+        update(TaskInstance)
+        .where(TaskInstance.run_id == "run_1", TaskInstance.task_id == "task1")
+        .values(state=TaskInstanceState.FAILED)
+    )
+    session.commit()
+    delta = admin_client.get(url, query_string={"dag_id": DAG_ID, "changed_since": full["version"]}).json
+
+    assert delta["changed_run_ids"] == ["run_1", "run_2"]
+    assert delta["groups"]["children"][0]["instances"][0]["state"] == "failed"
+
+
+@pytest.mark.parametrize("changed_since", ["invalid", "0123@2024-01-01T00:00:00+00:00"])
+def test_delta_for_other_version_is_full(admin_client, versioned_dag_with_runs, changed_since):
+    resp = admin_client.get(
+        "/object/grid_data", query_string={"dag_id": DAG_ID, "changed_since": changed_since}
+    )
+
+    assert resp.status_code == 200, resp.json
+    assert "changed_run_ids" not in resp.json
+    assert len(resp.json["groups"]["children"][0]["instances"]) == 2
+
+
+def test_skeleton_is_cached(admin_client, versioned_dag_with_runs):
+    with mock.patch.object(views, "build_grid_skeleton", wraps=views.build_grid_skeleton) as mock_build:
+        first = admin_client.get(f"/object/grid_data?dag_id={DAG_ID}").json
+        second = admin_client.get(f"/object/grid_data?dag_id={DAG_ID}").json
+        admin_client.get(f"/object/grid_data?dag_id={DAG_ID}&root=task1")
+
+    assert first["groups"] == second["groups"]
+    # The subset of the DAG shown has its own skeleton
+    assert mock_build.call_count == 2
+
+
 def test_has_outlet_dataset_flag(admin_client, dag_maker, session, app, monkeypatch):
     with monkeypatch.context() as m:
         # Remove global operator links for this test
@@ -459,6 +559,7 @@ def test_has_outlet_dataset_flag(admin_client, dag_maker, session, app, monkeypa
             "label": None,
         },
         "ordering": ["data_interval_end", "execution_date"],
+        "version": None,
     }
 
 
@@ -18,6 +18,7 @@
 from __future__ import annotations
 
 import copy
+import json
 import logging
 import logging.config
 import pathlib
@@ -323,6 +324,7 @@ def test_get_logs_for_changed_filename_format_db(
     assert expected_filename in content_disposition
 
 
+@unittest.mock.patch("airflow.utils.log.log_reader.TaskLogReader.supports_read_log_lines", False)
 @unittest.mock.patch(
     "airflow.utils.log.file_task_handler.FileTaskHandler.read",
     side_effect=[
@@ -379,6 +381,36 @@ def test_get_logs_with_metadata(log_admin_client, metadata, create_expected_log_
     assert "Log for testing." in data
 
 
+@conf_vars({("webserver", "log_tail_lines"): "1"})
+def test_get_logs_with_metadata_reads_tail_then_new_lines(
+    log_admin_client, log_path, create_expected_log_file
+):
+    create_expected_log_file(1)
+    (log_file,) = log_path.glob("**/*.log")
+    url_template = "get_logs_with_metadata?dag_id={}&task_id={}&execution_date={}&try_number=1&metadata={}"
+
+    def get_logs(metadata):
+        response = log_admin_client.get(
+            url_template.format(
+                DAG_ID,
+                TASK_ID,
+                urllib.parse.quote_plus(DEFAULT_DATE.isoformat()),
+                urllib.parse.quote_plus(json.dumps(metadata)),
+            )
+        )
+        assert response.status_code == 200
+        return response.json["message"][0][1], response.json["metadata"]
+
+    message, metadata = get_logs(None)
+    assert "Log for testing." in message
+    assert "max_bytes" in metadata
+    assert "log_offsets" in metadata
+
+    log_file.write_text(log_file.read_text() + "New line\n")
+    message, metadata = get_logs(metadata)
+    assert message == "New line"
+
+
 def test_get_logs_with_invalid_metadata(log_admin_client):
     """Test invalid metadata JSON returns error message"""
     metadata = "invalid"